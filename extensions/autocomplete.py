@@ -1,16 +1,158 @@
+import bisect
+import heapq
+import itertools
+
 from utils.mongo import MongoClient
 import lightbulb
-from utils.classes import Clan
-import time
 
-# Simple cache storage
-_cache = {
-    "clan_types": {"data": None, "timestamp": 0},
-    "th_attribute": {"data": None, "timestamp": 0},
-    "clans": {"data": None, "timestamp": 0},
-    "fwa_clans": {"data": None, "timestamp": 0}
-}
-CACHE_DURATION = 300  # 5 minutes
+# Every clan document by tag, the clans' lowercased names in sorted order (a
+# prefix is a bisect away), and an index from each 1-3 character substring of
+# a name or tag to the clans containing it. A keystroke reads the prefix run,
+# then checks only the clans in the query's smallest gram set, so nothing
+# scans the collection (or the whole list) inside Discord's 3-second
+# autocomplete budget. The index is built once by preload_autocomplete_cache
+# and kept current by the clan write paths through index_clan / update_clan /
+# drop_clan.
+GRAM_SIZE = 3
+MAX_CHOICES = 25  # Discord's limit per autocomplete response
+EXTRA_CHOICES = ["Demo", "Stuff"]
+
+_clans: dict[str, dict] = {}
+_lowered: dict[str, tuple[str, str]] = {}
+_by_name: list[tuple[str, str]] = []
+_grams: dict[str, set[str]] = {}
+_loaded = False
+
+
+def _name(clan: dict) -> str:
+    return (clan.get("name") or "").lower()
+
+
+def _clan_grams(clan: dict) -> set[str]:
+    grams = set()
+    for text in (_name(clan), (clan.get("tag") or "").lower()):
+        for size in range(1, GRAM_SIZE + 1):
+            grams.update(text[start:start + size] for start in range(len(text) - size + 1))
+    return grams
+
+
+def _unindex(tag: str) -> None:
+    clan = _clans.pop(tag, None)
+    if clan is None:
+        return
+    del _lowered[tag]
+    entry = (_name(clan), tag)
+    position = bisect.bisect_left(_by_name, entry)
+    if position < len(_by_name) and _by_name[position] == entry:
+        del _by_name[position]
+    for gram in _clan_grams(clan):
+        tags = _grams.get(gram)
+        if tags is not None:
+            tags.discard(tag)
+            if not tags:
+                del _grams[gram]
+
+
+def index_clan(clan: dict) -> None:
+    """Add a clan document to the index, replacing any held copy."""
+    tag = clan.get("tag")
+    if not tag:
+        return
+    _unindex(tag)
+    _clans[tag] = dict(clan)
+    _lowered[tag] = (_name(clan), tag.lower())
+    bisect.insort(_by_name, (_name(clan), tag))
+    for gram in _clan_grams(clan):
+        _grams.setdefault(gram, set()).add(tag)
+
+
+def update_clan(tag: str, fields: dict) -> None:
+    """Mirror a `$set` on one clan document."""
+    clan = _clans.get(tag)
+    if clan is not None:
+        index_clan({**clan, **fields})
+
+
+def drop_clan(tag: str) -> None:
+    """Forget a deleted clan."""
+    _unindex(tag)
+
+
+def load_index(clans_data: list[dict]) -> None:
+    """Replace the index with these clan documents."""
+    global _loaded
+    reset_index()
+    for clan in clans_data:
+        tag = clan.get("tag")
+        if tag:
+            _clans[tag] = dict(clan)
+            _lowered[tag] = (_name(clan), tag.lower())
+            for gram in _clan_grams(clan):
+                _grams.setdefault(gram, set()).add(tag)
+    _by_name.extend(sorted((_name(clan), tag) for tag, clan in _clans.items()))
+    _loaded = True
+
+
+def reset_index() -> None:
+    """Empty the index so the next lookup reloads it (tests)."""
+    global _loaded
+    _clans.clear()
+    _lowered.clear()
+    _by_name.clear()
+    _grams.clear()
+    _loaded = False
+
+
+async def _ensure_loaded(mongo: MongoClient) -> None:
+    """Load the index now if startup never did."""
+    if not _loaded:
+        load_index(await mongo.clans.find().to_list(length=None))
+
+
+def search(query: str, *, clan_type: str | None = None, limit: int = MAX_CHOICES) -> list[dict]:
+    """Clans whose name or tag contains `query`: name prefixes first, then
+    other name matches, then tag matches, each by name."""
+    query = query.lower()
+
+    def wanted(tag: str) -> bool:
+        return clan_type is None or _clans[tag].get("type") == clan_type
+
+    found = []
+    start = bisect.bisect_left(_by_name, (query, ""))
+    for name, tag in itertools.islice(_by_name, start, None):
+        if len(found) == limit or not name.startswith(query):
+            break
+        if wanted(tag):
+            found.append(tag)
+    if len(found) == limit or not query:
+        return [_clans[tag] for tag in found]
+
+    candidates = min(
+        (_grams.get(query[start:start + GRAM_SIZE], set())
+         for start in range(max(1, len(query) - GRAM_SIZE + 1))),
+        key=len,
+    )
+    others = []
+    for tag in candidates:
+        name, lowered_tag = _lowered[tag]
+        if name.startswith(query) or not wanted(tag):
+            continue
+        if query in name:
+            others.append((0, name, tag))
+        elif query in lowered_tag:
+            others.append((1, name, tag))
+    found.extend(tag for _, _, tag in heapq.nsmallest(limit - len(found), others))
+    return [_clans[tag] for tag in found]
+
+
+def _distinct(field: str) -> list[str]:
+    values = set()
+    for clan in _clans.values():
+        value = clan.get(field)
+        for item in value if isinstance(value, list) else [value]:
+            if isinstance(item, str):
+                values.add(item)
+    return sorted(values) + EXTRA_CHOICES
 
 
 @lightbulb.di.with_di
@@ -19,15 +161,8 @@ async def clan_types(
         mongo: MongoClient
 ) -> None:
     query = ctx.focused.value or ""
-
-    # Check cache
-    now = time.time()
-    if _cache["clan_types"]["data"] is None or (now - _cache["clan_types"]["timestamp"]) > CACHE_DURATION:
-        _cache["clan_types"]["data"] = (await mongo.clans.distinct("type")) + ["Demo", "Stuff"]
-        _cache["clan_types"]["timestamp"] = now
-
-    distinct = _cache["clan_types"]["data"]
-    await ctx.respond([d for d in distinct if query.lower() in d.lower()])
+    await _ensure_loaded(mongo)
+    await ctx.respond([d for d in _distinct("type") if query.lower() in d.lower()][:MAX_CHOICES])
 
 
 @lightbulb.di.with_di
@@ -36,15 +171,8 @@ async def th_attribute(
         mongo: MongoClient
 ) -> None:
     query = ctx.focused.value or ""
-
-    # Check cache
-    now = time.time()
-    if _cache["th_attribute"]["data"] is None or (now - _cache["th_attribute"]["timestamp"]) > CACHE_DURATION:
-        _cache["th_attribute"]["data"] = (await mongo.clans.distinct("th_attribute")) + ["Demo", "Stuff"]
-        _cache["th_attribute"]["timestamp"] = now
-
-    distinct = _cache["th_attribute"]["data"]
-    await ctx.respond([d for d in distinct if query.lower() in d.lower()])
+    await _ensure_loaded(mongo)
+    await ctx.respond([d for d in _distinct("th_attribute") if query.lower() in d.lower()][:MAX_CHOICES])
 
 
 @lightbulb.di.with_di
@@ -53,16 +181,8 @@ async def clans(
         mongo: MongoClient
 ) -> None:
     query = ctx.focused.value or ""
-
-    # Check cache
-    now = time.time()
-    if _cache["clans"]["data"] is None or (now - _cache["clans"]["timestamp"]) > CACHE_DURATION:
-        clans_data = await mongo.clans.find().to_list(length=None)
-        _cache["clans"]["data"] = [Clan(data=data) for data in clans_data]
-        _cache["clans"]["timestamp"] = now
-
-    clans = _cache["clans"]["data"]
-    await ctx.respond([f"{c.name} | {c.tag}" for c in clans if query.lower() in c.name.lower()])
+    await _ensure_loaded(mongo)
+    await ctx.respond([f"{c['name']} | {c['tag']}" for c in search(query)])
 
 
 @lightbulb.di.with_di
@@ -72,24 +192,11 @@ async def fwa_clans(
 ) -> None:
     """Autocomplete for FWA clans only"""
     query = ctx.focused.value or ""
-
-    # Check cache
-    now = time.time()
-    if _cache["fwa_clans"]["data"] is None or (now - _cache["fwa_clans"]["timestamp"]) > CACHE_DURATION:
-        _cache["fwa_clans"]["data"] = await mongo.clans.find({"type": "FWA"}).to_list(length=None)
-        _cache["fwa_clans"]["timestamp"] = now
-
-    clans = _cache["fwa_clans"]["data"]
-
-    # Filter clans based on query
-    filtered_clans = []
-    for clan in clans:
-        if query.lower() in clan['name'].lower() or query.lower() in clan['tag'].lower():
-            filtered_clans.append(clan)
+    await _ensure_loaded(mongo)
 
     # Create list of tuples for clean display
     choices = []
-    for clan in filtered_clans[:25]:
+    for clan in search(query, clan_type="FWA"):
         # Display format: Just the clan name for simplicity
         display = clan['name']
         # Value format: "Name|Tag|RoleID" (what the command receives)
@@ -101,21 +208,8 @@ async def fwa_clans(
 
 # Simple preload function to call on bot startup
 async def preload_autocomplete_cache(mongo: MongoClient):
-    """Call this once when your bot starts to preload all caches"""
+    """Build the clan index once at startup; write paths keep it current."""
     print("[Autocomplete] Preloading caches...")
-
-    # Preload each cache
-    _cache["clan_types"]["data"] = (await mongo.clans.distinct("type")) + ["Demo", "Stuff"]
-    _cache["clan_types"]["timestamp"] = time.time()
-
-    _cache["th_attribute"]["data"] = (await mongo.clans.distinct("th_attribute")) + ["Demo", "Stuff"]
-    _cache["th_attribute"]["timestamp"] = time.time()
-
-    clans_data = await mongo.clans.find().to_list(length=None)
-    _cache["clans"]["data"] = [Clan(data=data) for data in clans_data]
-    _cache["clans"]["timestamp"] = time.time()
-
-    _cache["fwa_clans"]["data"] = await mongo.clans.find({"type": "FWA"}).to_list(length=None)
-    _cache["fwa_clans"]["timestamp"] = time.time()
-
-    print(f"[Autocomplete] Loaded {len(_cache['clans']['data'])} clans, {len(_cache['fwa_clans']['data'])} FWA clans")
\ No newline at end of file
+    load_index(await mongo.clans.find().to_list(length=None))
+    fwa_count = sum(1 for clan in _clans.values() if clan.get("type") == "FWA")
+    print(f"[Autocomplete] Indexed {len(_clans)} clans, {fwa_count} FWA clans")
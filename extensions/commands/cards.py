@@ -37,16 +37,6 @@ from extensions.commands.accounts import (
 from extensions.commands.recruit.perms import guild_permissions
 from extensions.components import register_action
 from utils import bot_data
-from utils.card_board import (
-    CARD_ARTWORK_DIR,
-    CATEGORY_ACCENTS,
-    OWNED_SPARE_UNVERIFIED,
-    SPARE_FLOOR,
-    render_card_thumbnail,
-    render_category_strip,
-    render_inventory_card_board,
-    render_trade_strip,
-)
 from utils.cards import (
     CARD_BY_ID,
     CARD_BY_NAME,
@@ -73,11 +63,16 @@ from utils.cards import (
     reciprocal_trade_error,
 )
 from utils import cards_config
+from utils import cards_deadline_queue
 from utils.component_state import delete_state, get_state, insert_state, update_state
 from utils import troop_emoji
 from utils.emoji import EmojiType, emojis
+from utils import image_encoding
+from utils.lazy_imports import lazy_import
 from utils.constants import GOLD_ACCENT, GREEN_ACCENT, RED_ACCENT
 from utils.mongo import MongoClient
+from utils.concurrency import run_concurrently
+from utils.startup import profile_hook
 
 from hikari.impl import (
     ContainerComponentBuilder as Container,
@@ -95,6 +90,9 @@ from hikari.impl import (
     ThumbnailComponentBuilder as Thumbnail,
 )
 
+# Pillow plus the bundled artwork: loaded by the first board, tile or strip
+# rendered, not by registering /cards. See utils/lazy_imports.py.
+card_board = lazy_import("utils.card_board")
 
 loader = lightbulb.Loader()
 _log = logging.getLogger(__name__)
@@ -2321,11 +2319,11 @@ def _card_board_media(
     player_name: object,
     rendered_board=None,
 ) -> Media:
-    board = rendered_board or render_inventory_card_board(
+    board = rendered_board or card_board.render_inventory_card_board(
         values, player_name=str(player_name or "Player")
     )
     return Media(items=[MediaItem(
-        media=hikari.Bytes(board.png_bytes, board.filename, "image/png"),
+        media=hikari.Bytes(board.png_bytes, board.filename, board.content_type),
         description=board.alt_text,
     )])
 
@@ -2492,7 +2490,7 @@ def _inventory_board_values(inventory: dict) -> dict:
         # Exactly two, and the member never said so: the scanner proved a spare
         # exists but not how many, so this reads "x2+" rather than "x2".
         if state == DUPLICATE and card_id not in confirmed:
-            values[card_id] = SPARE_FLOOR
+            values[card_id] = card_board.SPARE_FLOOR
     for card_id in _scan_unverified_ids(inventory):
         values[card_id] = "owned_spare_unverified"
     return values
@@ -2525,7 +2523,7 @@ def _scan_board_values(draft: dict) -> dict:
 
 async def _render_inventory_board_async(account, inventory: dict):
     return await asyncio.to_thread(
-        render_inventory_card_board,
+        card_board.render_inventory_card_board,
         _inventory_board_values(inventory),
         player_name=str(account.name or "Player"),
     )
@@ -2895,9 +2893,9 @@ def _card_focus(
     state = normalize_cards(inventory.get("cards")).get(card.id, OWNED)
     possible_spare = card.id in set(_scan_unverified_ids(inventory))
     reserved = card.id in _card_reservations(inventory)
-    tile = rendered_tile or render_card_thumbnail(
+    tile = rendered_tile or card_board.render_card_thumbnail(
         card.id,
-        OWNED_SPARE_UNVERIFIED if possible_spare else state,
+        card_board.OWNED_SPARE_UNVERIFIED if possible_spare else state,
     )
 
     unconfirmed = (
@@ -2919,7 +2917,9 @@ def _card_focus(
         # this is where the artwork is actually legible.
         body.append(Media(items=[MediaItem(
             media=hikari.Bytes(
-                rendered_strip.png_bytes, rendered_strip.filename, "image/png"
+                rendered_strip.png_bytes,
+                rendered_strip.filename,
+                rendered_strip.content_type,
             ),
             description=rendered_strip.alt_text,
         )]))
@@ -2933,7 +2933,7 @@ def _card_focus(
                 )),
             ],
             accessory=Thumbnail(
-                media=hikari.Bytes(tile.png_bytes, tile.filename, "image/png"),
+                media=hikari.Bytes(tile.png_bytes, tile.filename, tile.content_type),
                 description=tile.alt_text,
             ),
         ),
@@ -3009,7 +3009,7 @@ def _card_focus(
         ]),
     ])
     return [Container(
-        accent_color=CATEGORY_ACCENTS[card.category],
+        accent_color=card_board.CATEGORY_ACCENTS[card.category],
         components=body,
     )]
 
@@ -3162,7 +3162,7 @@ def _hidden_badge_review(
                 "Does Clash show **×2 or more** for this card?"
             ))],
             accessory=Thumbnail(
-                media=str(CARD_ARTWORK_DIR / f"{card.id}.webp"),
+                media=str(card_board.CARD_ARTWORK_DIR / f"{card.id}.webp"),
                 description=f"{card.name} — possible spare check",
             ),
         ),
@@ -3565,7 +3565,7 @@ def _quantity_editor(
         )]),
     ])
     return [Container(
-        accent_color=CATEGORY_ACCENTS[category_id],
+        accent_color=card_board.CATEGORY_ACCENTS[category_id],
         components=body,
     )]
 
@@ -3765,20 +3765,20 @@ async def _card_focus_view(
     state = normalize_cards(inventory.get("cards")).get(card_id, OWNED)
     card = CARD_BY_ID.get(card_id) or CARDS[0]
     if possible_spare:
-        tile_state: object = OWNED_SPARE_UNVERIFIED
+        tile_state: object = card_board.OWNED_SPARE_UNVERIFIED
     elif state == DUPLICATE and card_id not in _confirmed_count_ids(inventory):
         # Same "at least two" the board shows, so the tile and the strip beside
         # it never disagree.
-        tile_state = SPARE_FLOOR
+        tile_state = card_board.SPARE_FLOOR
     else:
         tile_state = state
     tile = await asyncio.to_thread(
-        render_card_thumbnail,
+        card_board.render_card_thumbnail,
         card_id,
         tile_state,
     )
     strip = await asyncio.to_thread(
-        render_category_strip,
+        card_board.render_category_strip,
         card.category,
         _inventory_board_values(inventory),
         highlight_card_id=card.id,
@@ -6115,6 +6115,7 @@ async def _accept_trade_reservation(
     )
     if not getattr(started, "modified_count", 0):
         return "changed", str(trade.get("status") or "changed")
+    cards_deadline_queue.note(now + SWAP_BACKSTOP_FOR, key=trade["_id"])
     trade = dict(trade)
     trade.update({
         "status": "reserving",
@@ -6461,6 +6462,7 @@ async def _create_trade_request(
     except Exception:
         await _release_proposal_slots(mongo, trade)
         raise
+    cards_deadline_queue.note_document(trade)
     if not await _finalize_proposal_slots(mongo, trade):
         await mongo.card_trades.delete_many({
             "_id": trade["_id"],
@@ -6652,6 +6654,7 @@ async def _create_open_request(
             f"You already have an open request for **{card.name}**. Close "
             "it in **My trades** first."
         )
+    cards_deadline_queue.note_document(request)
     return request, None
 
 
@@ -6830,14 +6833,14 @@ def _trade_strip_attachment(trade: dict):
             for card_id in (trade.get("compatible_card_ids") or ())
             if str(card_id) != str(trade.get("given_card_id") or "")
         ]
-        strip = render_trade_strip(
+        strip = card_board.render_trade_strip(
             str(trade.get("wanted_card_id") or ""),
             str(trade.get("given_card_id") or ""),
             compatible,
             requester_name=str(trade.get("requester_name") or "A family member"),
             holder_name=str(trade.get("holder_name") or "the holder"),
         )
-        return hikari.Bytes(strip.png_bytes, strip.filename, "image/png")
+        return hikari.Bytes(strip.png_bytes, strip.filename, strip.content_type)
     except Exception:
         _log.exception("card trade visual render failed trade=%s", trade.get("_id"))
         return None
@@ -7632,15 +7635,21 @@ async def _post_spares_channel(
         key=f"spares {tag}",
     )
     try:
+        # The post stands for weeks and nobody is waiting on this render, so
+        # it takes the slower, smaller encode off the event loop.
         board = await asyncio.to_thread(
-            render_inventory_card_board,
+            card_board.render_inventory_card_board,
             _inventory_board_values(inventory),
             player_name=str(inventory.get("player_name") or "Player"),
+            encoding=image_encoding.OPTIMIZED_PNG,
         )
         board_media = Media(items=[MediaItem(
-            media=hikari.Bytes(board.png_bytes, board.filename, "image/png"),
+            media=hikari.Bytes(board.png_bytes, board.filename, board.content_type),
             description=board.alt_text,
         )])
+        # Every card render since boot, not just this one, so the cost of the
+        # interactive encodes shows up next to the boards that use the slow one.
+        _log.info("card image encodes %s", image_encoding.summary())
     except Exception:
         # The words carry the same facts; delivery never depends on a render.
         _log.exception("spares board render failed tag=%s", tag)
@@ -9339,6 +9348,9 @@ async def _record_swap_confirmation(
             updated = current or dict(latest)
             if current is None:
                 updated.update(fields)
+            cards_deadline_queue.note(
+                updated.get("confirm_deadline_at"), key=trade["_id"]
+            )
             if updated.get("status") == "completed":
                 await _finish_trade_cleanup(
                     mongo, updated, owner=_reservation_owner(latest)
@@ -9388,6 +9400,7 @@ async def _record_swap_confirmation(
     )
     updated = dict(trade)
     updated.update(fields)
+    cards_deadline_queue.note(fields["confirm_deadline_at"], key=trade["_id"])
     if finished:
         await _finish_trade_cleanup(mongo, updated, owner=_reservation_owner(trade))
     return updated
@@ -10970,6 +10983,7 @@ async def cards_scan_dm_upload(
 
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
+@profile_hook
 async def prepare_card_inventory_storage(
     _: hikari.StartedEvent,
     mongo: MongoClient = lightbulb.di.INJECTED,
@@ -10990,68 +11004,72 @@ async def prepare_card_inventory_storage(
         # only visible in the wrong channel.
         _log.info("Card Hub trade board and sticky notice: #%s", channel_id)
     try:
-        await mongo.component_state.create_index(
-            [("type", 1), ("user_id", 1), ("created_at", -1)],
-            name="idx_component_card_upload_user",
-        )
-        await mongo.card_inventories.create_index(
-            [("guild_id", 1), ("confirmed_at", -1)],
-            name="idx_card_inventories_guild_confirmed",
-        )
-        await mongo.card_inventories.create_index(
-            "discord_id",
-            name="idx_card_inventories_discord",
-        )
-        await mongo.card_trades.create_index(
-            "lease_expires_at",
-            expireAfterSeconds=0,
-            name="ttl_card_trade_leases",
-        )
-        await mongo.card_trades.create_index(
-            [("kind", 1), ("guild_id", 1), ("requester_tag", 1),
-             ("status", 1), ("updated_at", -1)],
-            name="idx_card_trades_requester",
-        )
-        await mongo.card_trades.create_index(
-            [("kind", 1), ("guild_id", 1), ("holder_tag", 1),
-             ("status", 1), ("updated_at", -1)],
-            name="idx_card_trades_holder",
-        )
-        await mongo.card_trades.create_index(
-            "open_proposal_key",
-            unique=True,
-            sparse=True,
-            name="uniq_open_card_proposal",
-        )
-        await mongo.card_trades.create_index(
-            [("kind", 1), ("guild_id", 1), ("status", 1), ("expires_at", 1)],
-            name="idx_card_trades_open_requests",
-        )
-        await mongo.card_trades.create_index(
-            "open_request_key",
-            unique=True,
-            sparse=True,
-            name="uniq_open_card_request",
-        )
-        await mongo.card_trades.create_index(
-            [("kind", 1), ("status", 1), ("reservation_until", 1)],
-            name="idx_card_trades_reserving",
-        )
-        await mongo.card_trades.create_index(
-            [("kind", 1), ("status", 1), ("expires_at", 1)],
-            name="idx_card_trades_completing",
-        )
-        await mongo.card_trades.create_index(
-            [("kind", 1), ("trade_id", 1), ("owner_token", 1)],
-            name="idx_card_trade_lease_owner",
-        )
-        await mongo.card_trades.create_index(
-            [("kind", 1), ("guild_id", 1), ("player_tag", 1)],
-            name="idx_card_proposal_slots",
-        )
-        await mongo.card_trades.create_index(
-            [("kind", 1), ("guild_id", 1), ("cleanup_pending", 1)],
-            name="idx_card_trade_cleanup",
+        # Independent builds, so they go to Mongo together rather than one
+        # round trip after another; this hook sits on every restart's path.
+        await run_concurrently(
+            mongo.component_state.create_index(
+                [("type", 1), ("user_id", 1), ("created_at", -1)],
+                name="idx_component_card_upload_user",
+            ),
+            mongo.card_inventories.create_index(
+                [("guild_id", 1), ("confirmed_at", -1)],
+                name="idx_card_inventories_guild_confirmed",
+            ),
+            mongo.card_inventories.create_index(
+                "discord_id",
+                name="idx_card_inventories_discord",
+            ),
+            mongo.card_trades.create_index(
+                "lease_expires_at",
+                expireAfterSeconds=0,
+                name="ttl_card_trade_leases",
+            ),
+            mongo.card_trades.create_index(
+                [("kind", 1), ("guild_id", 1), ("requester_tag", 1),
+                 ("status", 1), ("updated_at", -1)],
+                name="idx_card_trades_requester",
+            ),
+            mongo.card_trades.create_index(
+                [("kind", 1), ("guild_id", 1), ("holder_tag", 1),
+                 ("status", 1), ("updated_at", -1)],
+                name="idx_card_trades_holder",
+            ),
+            mongo.card_trades.create_index(
+                "open_proposal_key",
+                unique=True,
+                sparse=True,
+                name="uniq_open_card_proposal",
+            ),
+            mongo.card_trades.create_index(
+                [("kind", 1), ("guild_id", 1), ("status", 1), ("expires_at", 1)],
+                name="idx_card_trades_open_requests",
+            ),
+            mongo.card_trades.create_index(
+                "open_request_key",
+                unique=True,
+                sparse=True,
+                name="uniq_open_card_request",
+            ),
+            mongo.card_trades.create_index(
+                [("kind", 1), ("status", 1), ("reservation_until", 1)],
+                name="idx_card_trades_reserving",
+            ),
+            mongo.card_trades.create_index(
+                [("kind", 1), ("status", 1), ("expires_at", 1)],
+                name="idx_card_trades_completing",
+            ),
+            mongo.card_trades.create_index(
+                [("kind", 1), ("trade_id", 1), ("owner_token", 1)],
+                name="idx_card_trade_lease_owner",
+            ),
+            mongo.card_trades.create_index(
+                [("kind", 1), ("guild_id", 1), ("player_tag", 1)],
+                name="idx_card_proposal_slots",
+            ),
+            mongo.card_trades.create_index(
+                [("kind", 1), ("guild_id", 1), ("cleanup_pending", 1)],
+                name="idx_card_trade_cleanup",
+            ),
         )
     except Exception:
         # A temporary/no-index-permission Mongo problem must not stop the rest
@@ -12939,7 +12957,7 @@ def _bulk_progress_view(
         if note:
             detail += f"\n\n{_escape_markdown(note, limit=300)}"
     return [Container(
-        accent_color=CATEGORY_ACCENTS[state["category_id"]],
+        accent_color=card_board.CATEGORY_ACCENTS[state["category_id"]],
         components=[
             Text(content=(
                 (
@@ -14356,6 +14374,7 @@ async def _claim_swap_leg(
         raise
     if not getattr(result, "modified_count", 0):
         return None
+    cards_deadline_queue.note(fields["expires_at"], key=trade["_id"])
     current = await mongo.card_trades.find_one({"_id": trade["_id"]})
     if current is not None:
         return current
@@ -16352,6 +16371,9 @@ async def _perform_open_request_claim(
             "Two of you tapped at nearly the same time and they were first. "
             "Watch the board for the next request.",
         )
+    cards_deadline_queue.note(
+        now + OPEN_REQUEST_CLAIM_FOR, key=request["_id"]
+    )
     live_clans = await _live_family_clans(
         mongo, coc_client, request["requester_tag"], claimer_tag
     )
@@ -17443,6 +17465,7 @@ async def cards_trade_complete(
             "Completion is already being saved",
             "Wait a moment, then reopen **My trades**. Do not click completion twice.",
         )
+    cards_deadline_queue.note(completing_until, key=trade["_id"])
     trade = await mongo.card_trades.find_one({"_id": trade["_id"]}) or trade
 
     try:
@@ -24,18 +24,22 @@ from hikari.impl import (
     LinkButtonBuilder as LinkButton
 )
 
+from extensions import autocomplete
 from extensions.components import register_action
 from io import BytesIO
-from PIL import Image
 
 from utils.constants import RED_ACCENT
 from utils.classes import Clan
 from utils.emoji import emojis
 from utils.mongo import MongoClient
 from utils.url_safety import is_safe_public_url, MAX_IMAGE_BYTES
+from utils.lazy_imports import lazy_import
 from extensions.commands.clan.dashboard import dashboard_page
 from extensions.commands.clan.dashboard import update_clan_info_general
 
+# Pillow is only needed once somebody uploads a logo or emoji image.
+Image = lazy_import("PIL.Image")
+
 CLAN_MANAGEMENT_ROLE_ID = 993015846442127420
 
 IMG_RE = re.compile(r"^https?://\S+\.(?:png|jpe?g|gif|webp)$", re.IGNORECASE)
@@ -221,7 +225,7 @@ async def add_clan_modal(
         return await ctx.respond("⚠️ You must enter a clan tag!", ephemeral=True)
 
     clan = await coc_client.get_clan(tag=clan_tag)
-    await mongo.clans.insert_one({
+    clan_doc = {
         "announcement_id": 0,
         "chat_channel_id": 0,
         "emoji": "",
@@ -238,7 +242,9 @@ async def add_clan_modal(
         "thread_id": 0,
         "thread_message_id": 0,
         "type": "",
-    })
+    }
+    await mongo.clans.insert_one(clan_doc)
+    autocomplete.index_clan(clan_doc)
 
     await ctx.interaction.create_initial_response(hikari.ResponseType.DEFERRED_MESSAGE_UPDATE)
     new_components = await clan_edit_menu(ctx, action_id=clan.tag, mongo=mongo, tag=clan.tag)
@@ -370,6 +376,7 @@ async def on_remove_clan_field(
 
         # Delete clan from database
         await mongo.clans.delete_one({"tag": tag})
+        autocomplete.drop_clan(tag)
 
         return [
             Container(
@@ -586,6 +593,7 @@ async def on_edit_clan_field(
     selected = int(raw_val) if raw_val.isdigit() else raw_val
 
     await mongo.clans.update_one({"tag": tag}, {"$set": {field: selected}})
+    autocomplete.update_clan(tag, {field: selected})
 
     # Determine which menu to return to based on the field
     if field in ["leader_id", "leader_role_id", "role_id"]:
@@ -678,6 +686,7 @@ async def on_edit_thread_field(
             # Continue even if deletion fails
 
     await mongo.clans.update_one({"tag": tag}, {"$set": {"thread_id": thread.id}})
+    autocomplete.update_clan(tag, {"thread_id": thread.id})
 
     # 5) Rebuild the edit menu
     return await clan_edit_menu(
@@ -919,6 +928,7 @@ async def update_logo_modal(
             {"tag": tag},
             {"$set": {"logo": new_logo_url}}
         )
+        autocomplete.update_clan(tag, {"logo": new_logo_url})
 
         # Return to the clan edit menu
         new_components = await clan_edit_menu(ctx, action_id=tag, mongo=mongo, tag=tag)
@@ -1467,6 +1477,7 @@ async def process_emoji_upload(
             {"tag": tag},
             {"$set": {"emoji": new_emoji.mention}}
         )
+        autocomplete.update_clan(tag, {"emoji": new_emoji.mention})
 
         # Success message
         success_components = [
@@ -5,7 +5,6 @@ import pymongo
 import hikari
 import coc
 import re
-from PIL import Image
 from io import BytesIO
 import requests
 
@@ -27,6 +26,7 @@ from hikari.impl import (
 from lightbulb import channel
 from lightbulb.components import MenuContext, ModalContext
 from utils.emoji import EmojiType
+from extensions import autocomplete
 from extensions.autocomplete import clan_types
 from utils.constants import RED_ACCENT ,CLAN_TYPES ,TH_LEVELS
 from utils.emoji import emojis
@@ -118,6 +118,7 @@ async def on_edit_general(
     selected = ctx.interaction.values[0]
 
     await mongo.clans.update_one({"tag": tag}, {"$set": {field: selected}})
+    autocomplete.update_clan(tag, {field: selected})
 
     new_components = await update_general_info_panel(
         ctx=ctx,
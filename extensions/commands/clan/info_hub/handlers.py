@@ -24,7 +24,7 @@ from extensions.components import register_action
 from utils.mongo import MongoClient
 from utils.classes import Clan
 from utils.constants import RED_ACCENT, GOLD_ACCENT, BLUE_ACCENT, GREEN_ACCENT, MAGENTA_ACCENT
-from .helpers import get_clans_by_type, format_th_requirement, get_league_emoji
+from .helpers import get_clans_by_type, get_clan_summaries, format_th_requirement, get_league_emoji
 from utils.emoji import emojis
 
 # League order for sorting
@@ -61,21 +61,15 @@ async def build_clan_list_components(
     clans = await get_clans_by_type(mongo, clan_type)
 
     # Fetch API data for all clans
-    clan_api_data = {}
-    for clan in clans:
-        try:
-            api_clan = await coc_client.get_clan(tag=clan.tag)
-            clan_api_data[clan.tag] = api_clan
-        except:
-            clan_api_data[clan.tag] = None
+    summaries = await get_clan_summaries(coc_client, [clan.tag for clan in clans])
 
     # Sort clans by league
     def get_league_rank(clan: Clan) -> int:
-        api_clan = clan_api_data.get(clan.tag)
-        if not api_clan or not hasattr(api_clan, 'war_league'):
+        summary = summaries.get(clan.tag)
+        if not summary or not summary.war_league:
             return len(LEAGUE_ORDER) - 1  # Put unranked at the end
 
-        league_name = api_clan.war_league.name
+        league_name = summary.war_league
         try:
             return LEAGUE_ORDER.index(league_name)
         except ValueError:
@@ -103,11 +97,11 @@ async def build_clan_list_components(
     clan_components = []
 
     for clan in sorted_clans:
-        api_clan = clan_api_data.get(clan.tag)
+        summary = summaries.get(clan.tag)
 
         # Get league info
-        if api_clan and hasattr(api_clan, 'war_league'):
-            league_name = api_clan.war_league.name
+        if summary and summary.war_league:
+            league_name = summary.war_league
             league_emoji = get_league_emoji(league_name)
         else:
             league_name = "Unranked"
@@ -262,21 +256,15 @@ async def show_trial_clans(
     clans = [Clan(data=data) for data in clans]
 
     # Fetch API data
-    clan_api_data = {}
-    for clan in clans:
-        try:
-            api_clan = await coc_client.get_clan(tag=clan.tag)
-            clan_api_data[clan.tag] = api_clan
-        except:
-            clan_api_data[clan.tag] = None
+    summaries = await get_clan_summaries(coc_client, [clan.tag for clan in clans])
 
     # Sort by league
     def get_league_rank(clan: Clan) -> int:
-        api_clan = clan_api_data.get(clan.tag)
-        if not api_clan or not hasattr(api_clan, 'war_league'):
+        summary = summaries.get(clan.tag)
+        if not summary or not summary.war_league:
             return len(LEAGUE_ORDER) - 1
 
-        league_name = api_clan.war_league.name
+        league_name = summary.war_league
         try:
             return LEAGUE_ORDER.index(league_name)
         except ValueError:
@@ -304,11 +292,11 @@ async def show_trial_clans(
     clan_components = []
 
     for clan in sorted_clans:
-        api_clan = clan_api_data.get(clan.tag)
+        summary = summaries.get(clan.tag)
 
         # Get league info
-        if api_clan and hasattr(api_clan, 'war_league'):
-            league_name = api_clan.war_league.name
+        if summary and summary.war_league:
+            league_name = summary.war_league
             league_emoji = get_league_emoji(league_name)
         else:
             league_name = "Unranked"
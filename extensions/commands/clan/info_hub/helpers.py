@@ -1,10 +1,36 @@
 # extensions/commands/clan/info_hub/helpers.py
 
-from typing import List, Optional
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+import coc
+
 from utils.mongo import MongoClient
 from utils.classes import Clan
 from utils.emoji import emojis
 
+# The info hub pages only show a clan's league, so every opening used to pay
+# one get_clan per clan, one after another. Summaries are now fetched together
+# (at most CLAN_FETCH_CONCURRENCY in flight) and shared between users for
+# CLAN_SUMMARY_TTL_SECONDS; a tag already being fetched is awaited, not
+# fetched twice.
+CLAN_SUMMARY_TTL_SECONDS = 60
+CLAN_FETCH_CONCURRENCY = 8
+CAPITAL_PEAK = "Capital Peak"
+
+
+@dataclass(frozen=True, slots=True)
+class ClanSummary:
+    member_count: int
+    war_league: Optional[str]
+    capital_level: Optional[int]
+
+
+_summaries: Dict[str, tuple[float, ClanSummary]] = {}
+_inflight: Dict[str, asyncio.Task] = {}
+
 
 async def get_clans_by_type(mongo: MongoClient, clan_type: str) -> List[Clan]:
     """Get all clans of a specific type from MongoDB"""
@@ -77,4 +103,67 @@ async def get_clans_by_status(mongo: MongoClient, status: str) -> List[Clan]:
     # Convert to Clan objects
     clans = [Clan(data=data) for data in clan_data]
 
-    return clans
\ No newline at end of file
+    return clans
+
+
+def summarize_clan(api_clan: coc.Clan) -> ClanSummary:
+    """Keep only what the listings render from a fetched clan"""
+    capital_level = next(
+        (district.hall_level for district in getattr(api_clan, "capital_districts", None) or []
+         if district.name == CAPITAL_PEAK),
+        None
+    )
+    return ClanSummary(
+        member_count=getattr(api_clan, "member_count", 0) or 0,
+        war_league=getattr(getattr(api_clan, "war_league", None), "name", None),
+        capital_level=capital_level,
+    )
+
+
+async def _fetch_summary(coc_client: coc.Client, tag: str, limit: asyncio.Semaphore) -> Optional[ClanSummary]:
+    try:
+        async with limit:
+            api_clan = await coc_client.get_clan(tag=tag)
+    except Exception as e:
+        print(f"[Info Hub] Could not fetch clan {tag}: {e}")
+        return None
+    summary = summarize_clan(api_clan)
+    _summaries[tag] = (time.monotonic(), summary)
+    return summary
+
+
+async def get_clan_summaries(coc_client: coc.Client, tags: Iterable[str]) -> Dict[str, Optional[ClanSummary]]:
+    """Summaries for these tags, None where the API call failed.
+
+    Fresh entries are served from memory; the rest are fetched concurrently.
+    Failures are not cached, so the next opening tries again.
+    """
+    now = time.monotonic()
+    results: Dict[str, Optional[ClanSummary]] = {}
+    waiting: Dict[str, asyncio.Task] = {}
+    limit = asyncio.Semaphore(CLAN_FETCH_CONCURRENCY)
+
+    for tag in dict.fromkeys(tags):
+        hit = _summaries.get(tag)
+        if hit is not None and now - hit[0] < CLAN_SUMMARY_TTL_SECONDS:
+            results[tag] = hit[1]
+            continue
+        task = _inflight.get(tag)
+        if task is None:
+            task = asyncio.create_task(_fetch_summary(coc_client, tag, limit))
+            _inflight[tag] = task
+            task.add_done_callback(
+                lambda done, tag=tag: _inflight.pop(tag) if _inflight.get(tag) is done else None
+            )
+        waiting[tag] = task
+
+    if waiting:
+        fetched = await asyncio.gather(*(asyncio.shield(task) for task in waiting.values()))
+        results.update(zip(waiting, fetched))
+    return results
+
+
+def reset_clan_summaries() -> None:
+    """Forget every held summary (tests)."""
+    _summaries.clear()
+    _inflight.clear()
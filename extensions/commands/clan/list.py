@@ -5,6 +5,7 @@ import coc
 
 from extensions.commands.clan   import loader, clan
 from extensions.components      import register_action
+from utils                      import discord_lookup
 from utils.mongo                import MongoClient
 from utils.classes              import Clan
 from utils.constants            import RED_ACCENT
@@ -94,7 +95,7 @@ async def on_clan_chosen(
 ):
     ctx: lightbulb.components.MenuContext = kwargs["ctx"]
     _, user_id = action_id.rsplit("_", 1)
-    user = await bot.rest.fetch_member(ctx.guild_id, int(user_id))
+    user = await discord_lookup.fetch_member(bot, ctx.guild_id, int(user_id))
 
     tag = ctx.interaction.values[0]
     raw = await mongo.clans.find_one({"tag": tag})
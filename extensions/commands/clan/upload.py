@@ -10,6 +10,7 @@ import lightbulb
 
 # Project-specific imports
 from extensions.commands.clan import loader, clan
+from extensions import autocomplete
 from extensions.autocomplete import clans
 from utils.mongo import MongoClient
 from utils.cloudinary_client import CloudinaryClient
@@ -181,6 +182,7 @@ class UploadImages(
                     {"tag": clan_tag},
                     {"$set": update_data}  # $set only updates specified fields
                 )
+                autocomplete.update_clan(clan_tag, update_data)
 
             # Create a visually appealing success embed
             embed = hikari.Embed(
@@ -16,11 +16,12 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import io
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 
 import hikari
 import lightbulb
-from PIL import Image
 
 from hikari.impl import (
     ContainerComponentBuilder as Container,
@@ -28,20 +29,32 @@ from hikari.impl import (
 )
 
 from utils import troop_emoji
-from utils.card_board import CARD_ARTWORK_DIR
 from utils.cards import CARDS
 from utils.constants import GREEN_ACCENT, RED_ACCENT
+from utils.lazy_imports import ensure_loaded, lazy_import
 from utils.mongo import MongoClient
+from utils.startup import profile_hook
+
+# Both are only needed while an owner runs a sync.
+Image = lazy_import("PIL.Image")
+card_board = lazy_import("utils.card_board")
 
 OWNER_ID = 505227988229554179
 
-# Discord publishes no numeric limit for POST /applications/{id}/emojis, so
-# self-throttling is the only guard. main.py sets max_rate_limit=120.0, which
-# is what raises RateLimitTooLongError instead of hanging; max_retries=1 covers
-# connection errors and 5xx, NOT 429s.
-CADENCE_SECONDS = 1.6
-# Interaction tokens last 15 minutes. Stop cleanly before that and let a re-run
-# resume rather than dying on an expired token.
+# Discord publishes no numeric limit for POST /applications/{id}/emojis, but
+# it does send X-RateLimit-* headers on every response, and hikari's bucket
+# manager queues each request on them (and sleeps out any 429 within
+# main.py's max_rate_limit=120.0; a longer one raises RateLimitTooLongError).
+# So the sync no longer paces itself with a fixed sleep: it keeps this many
+# uploads in flight and lets the real bucket decide when each one goes.
+UPLOAD_CONCURRENCY = 4
+# Threads re-encoding the bundled WebP art. Pillow releases the GIL while it
+# resamples and compresses, so this is real parallelism, and none of it runs
+# on the event loop.
+ENCODE_WORKERS = 4
+# Interaction tokens last 15 minutes. A full sync finishes well inside that
+# now; this stays as the backstop that stops cleanly, resumable, if Discord
+# ever throttles hard enough to need it.
 RUN_BUDGET = timedelta(minutes=12)
 EMOJI_EDGE = 128
 MAX_EMOJI_BYTES = 256 * 1024
@@ -65,22 +78,194 @@ def _payload(path) -> bytes:
     return buffer.getvalue()
 
 
+def _source(slug: str) -> bytes | None:
+    """One card's upload-ready bytes, or None when it has no usable art."""
+    path = card_board.CARD_ARTWORK_DIR / f"{slug}.webp"
+    if not path.is_file():
+        return None
+    try:
+        data = _payload(path)
+    except (OSError, ValueError):
+        return None
+    return data if len(data) <= MAX_EMOJI_BYTES else None
+
+
 def collect_sources() -> dict[str, bytes]:
     """Every catalog slug that has bundled artwork, as upload-ready bytes."""
     sources: dict[str, bytes] = {}
     for card in CARDS:
-        path = CARD_ARTWORK_DIR / f"{card.id}.webp"
-        if not path.is_file():
-            continue
-        try:
-            data = _payload(path)
-        except (OSError, ValueError):
-            continue
-        if len(data) <= MAX_EMOJI_BYTES:
+        data = _source(card.id)
+        if data is not None:
             sources[card.id] = data
     return sources
 
 
+async def encode_sources() -> dict[str, bytes]:
+    """`collect_sources`, encoded across a worker pool off the event loop."""
+    loop = asyncio.get_running_loop()
+    # Finish the deferred imports here, not racing inside the workers.
+    ensure_loaded(Image, card_board)
+    with ThreadPoolExecutor(
+        max_workers=ENCODE_WORKERS, thread_name_prefix="emoji-encode"
+    ) as pool:
+        encoded = await asyncio.gather(*(
+            loop.run_in_executor(pool, _source, card.id) for card in CARDS
+        ))
+    return {
+        card.id: data
+        for card, data in zip(CARDS, encoded)
+        if data is not None
+    }
+
+
+@dataclass
+class SyncPlan:
+    """What a sync would do, decided by content hash before anything runs."""
+
+    # (slug, data, digest, live emoji or None)
+    uploads: list[tuple[str, bytes, str, object]] = field(default_factory=list)
+    skipped: int = 0
+    foreign: list[str] = field(default_factory=list)
+
+
+def plan_sync(
+    sources: dict[str, bytes], live: dict, registry: dict[str, dict]
+) -> SyncPlan:
+    """Diff the bundled art against what is uploaded and recorded.
+
+    An emoji is current only when the registry row's digest matches the art
+    AND its recorded id is the live emoji; anything else is re-uploaded. A
+    live name with no registry row was not made by this bot and is refused.
+    """
+    plan = SyncPlan()
+    for slug in sorted(sources):
+        data = sources[slug]
+        name = troop_emoji.managed_name(slug)
+        digest = hashlib.sha256(data).hexdigest()
+        current = live.get(name.lower())
+        record = registry.get(slug)
+        if (
+            current is not None
+            and record is not None
+            and record.get("digest") == digest
+            and str(record.get("emoji_id")) == str(current.id)
+        ):
+            plan.skipped += 1
+            continue
+        if current is not None and record is None:
+            # Right name, but this bot never recorded creating it. Refuse.
+            plan.foreign.append(name)
+            continue
+        plan.uploads.append((slug, data, digest, current))
+    return plan
+
+
+@dataclass
+class SyncTally:
+    done: int = 0
+    created: int = 0
+    replaced: int = 0
+    failed: int = 0
+    stopped: str | None = None
+
+
+async def run_sync(
+    rest,
+    mongo: MongoClient,
+    application_id,
+    uploads: list[tuple[str, bytes, str, object]],
+    *,
+    on_progress=None,
+) -> SyncTally:
+    """Upload every planned emoji, UPLOAD_CONCURRENCY at a time.
+
+    Each finished emoji is recorded in the registry as it lands, so a run that
+    stops early resumes from where it got to. Once Discord asks for a wait
+    longer than hikari will sit out, or the run budget is spent, no worker
+    starts another upload; the ones already in flight finish.
+    """
+    tally = SyncTally()
+    queue: asyncio.Queue = asyncio.Queue()
+    for upload in uploads:
+        queue.put_nowait(upload)
+    deadline = datetime.now(timezone.utc) + RUN_BUDGET
+    progress_lock = asyncio.Lock()
+
+    async def _upload(slug, data, digest, current) -> bool:
+        name = troop_emoji.managed_name(slug)
+        try:
+            if current is not None:
+                # There is no image parameter on edit_application_emoji, so
+                # changing art means delete then create.
+                await rest.delete_application_emoji(
+                    application=application_id, emoji=current.id
+                )
+            emoji = await rest.create_application_emoji(
+                application=application_id, name=name, image=data
+            )
+        except hikari.RateLimitTooLongError as exc:
+            tally.stopped = (
+                f"Discord asked for a {exc.retry_after:.0f}s wait. "
+                "Re-run to resume; finished emojis are skipped."
+            )
+            return False
+        except (
+            hikari.BadRequestError,
+            hikari.ForbiddenError,
+            hikari.InternalServerError,
+        ) as exc:
+            tally.failed += 1
+            print(f"[EmojiSync] {slug}: {type(exc).__name__}: {exc}")
+            return True
+
+        await mongo.emoji_registry.update_one(
+            {"_id": f"troop:{slug}"},
+            {"$set": {
+                "kind": "troop",
+                "slug": slug,
+                "name": name,
+                "emoji_id": int(emoji.id),
+                "digest": digest,
+                "updated_at": datetime.now(timezone.utc),
+            }},
+            upsert=True,
+        )
+        if current is not None:
+            tally.replaced += 1
+        else:
+            tally.created += 1
+        return True
+
+    async def _worker() -> None:
+        while not queue.empty() and tally.stopped is None:
+            if datetime.now(timezone.utc) > deadline:
+                tally.stopped = "Twelve-minute budget reached. Re-run to resume."
+                return
+            upload = queue.get_nowait()
+            if not await _upload(*upload):
+                return
+            tally.done += 1
+            if on_progress is not None and tally.done % PROGRESS_EVERY == 0:
+                # One progress edit at a time; a slow one must not let a
+                # later count land before an earlier one.
+                async with progress_lock:
+                    await on_progress(tally, len(uploads))
+
+    workers = [
+        asyncio.create_task(_worker())
+        for _ in range(min(UPLOAD_CONCURRENCY, len(uploads)))
+    ]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        # A worker that raised (or a cancelled sync) must not leave its
+        # siblings uploading in the background.
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+    return tally
+
+
 async def _load_registry(mongo: MongoClient) -> dict[str, dict]:
     rows = await mongo.emoji_registry.find({"kind": "troop"}).to_list(length=None)
     return {str(row.get("slug")): row for row in rows if row.get("slug")}
@@ -93,6 +278,7 @@ async def refresh_cache(mongo: MongoClient) -> int:
 
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
+@profile_hook
 async def _prime_troop_emojis(
     _: hikari.StartedEvent,
     mongo: MongoClient = lightbulb.di.INJECTED,
@@ -145,11 +331,11 @@ class EmojiSync(
             return
 
         await ctx.defer(ephemeral=True)
-        sources = collect_sources()
+        sources = await encode_sources()
         if not sources:
             await ctx.respond(components=_panel(
                 "No artwork found",
-                f"Nothing usable in `{CARD_ARTWORK_DIR}`.",
+                f"Nothing usable in `{card_board.CARD_ARTWORK_DIR}`.",
                 ok=False,
             ))
             return
@@ -166,37 +352,17 @@ class EmojiSync(
             return
         live = {emoji.name.lower(): emoji for emoji in live_list}
         registry = await _load_registry(mongo)
-
-        planned: list[tuple[str, bytes, str, object, dict | None]] = []
-        skipped = 0
-        foreign: list[str] = []
-        for slug in sorted(sources):
-            data = sources[slug]
-            name = troop_emoji.managed_name(slug)
-            digest = hashlib.sha256(data).hexdigest()
-            current = live.get(name.lower())
-            record = registry.get(slug)
-            if (
-                current is not None
-                and record is not None
-                and record.get("digest") == digest
-                and str(record.get("emoji_id")) == str(current.id)
-            ):
-                skipped += 1
-                continue
-            if current is not None and record is None:
-                # Right name, but this bot never recorded creating it. Refuse.
-                foreign.append(name)
-                continue
-            planned.append((slug, data, digest, current, record))
+        plan = plan_sync(sources, live, registry)
+        foreign = plan.foreign
 
         if self.dry_run:
             lines = [
                 f"**{len(sources)}** troop icons found in the bundled set.",
-                f"**{len(planned)}** would be uploaded or replaced.",
-                f"**{skipped}** already match and would be skipped.",
+                f"**{len(plan.uploads)}** would be uploaded or replaced.",
+                f"**{plan.skipped}** already match and would be skipped.",
                 f"Existing application emojis: **{len(live_list)}** of 2000.",
-                f"Estimated run time: about **{int(len(planned) * CADENCE_SECONDS)}s**.",
+                f"Uploads run **{UPLOAD_CONCURRENCY}** at a time, paced by "
+                "Discord's rate-limit headers.",
             ]
             if foreign:
                 lines.append(
@@ -210,71 +376,22 @@ class EmojiSync(
             ))
             return
 
-        created = replaced = failed = 0
-        stopped: str | None = None
-        started = datetime.now(timezone.utc)
-
-        for index, (slug, data, digest, current, _record) in enumerate(planned, 1):
-            if datetime.now(timezone.utc) - started > RUN_BUDGET:
-                stopped = "Twelve-minute budget reached. Re-run to resume."
-                break
-            name = troop_emoji.managed_name(slug)
-            try:
-                if current is not None:
-                    # There is no image parameter on edit_application_emoji, so
-                    # changing art means delete then create.
-                    await bot.rest.delete_application_emoji(
-                        application=application.id, emoji=current.id
-                    )
-                    await asyncio.sleep(CADENCE_SECONDS)
-                emoji = await bot.rest.create_application_emoji(
-                    application=application.id, name=name, image=data
-                )
-            except hikari.RateLimitTooLongError as exc:
-                stopped = (
-                    f"Discord asked for a {exc.retry_after:.0f}s wait. "
-                    "Re-run to resume; finished emojis are skipped."
-                )
-                break
-            except (
-                hikari.BadRequestError,
-                hikari.ForbiddenError,
-                hikari.InternalServerError,
-            ) as exc:
-                failed += 1
-                print(f"[EmojiSync] {slug}: {type(exc).__name__}: {exc}")
-                await asyncio.sleep(CADENCE_SECONDS)
-                continue
-
-            await mongo.emoji_registry.update_one(
-                {"_id": f"troop:{slug}"},
-                {"$set": {
-                    "kind": "troop",
-                    "slug": slug,
-                    "name": name,
-                    "emoji_id": int(emoji.id),
-                    "digest": digest,
-                    "updated_at": datetime.now(timezone.utc),
-                }},
-                upsert=True,
-            )
-            if current is not None:
-                replaced += 1
-            else:
-                created += 1
-
-            if index % PROGRESS_EVERY == 0:
-                await ctx.respond(components=_panel(
-                    "Uploading troop emojis",
-                    f"{index}/{len(planned)} · {created} new · {replaced} "
-                    f"replaced · {failed} failed",
-                ))
-            await asyncio.sleep(CADENCE_SECONDS)
+        async def _progress(tally: SyncTally, total: int) -> None:
+            await ctx.respond(components=_panel(
+                "Uploading troop emojis",
+                f"{tally.done}/{total} · {tally.created} new · "
+                f"{tally.replaced} replaced · {tally.failed} failed",
+            ))
+
+        tally = await run_sync(
+            bot.rest, mongo, application.id, plan.uploads,
+            on_progress=_progress,
+        )
 
         loaded = await refresh_cache(mongo)
         summary = [
-            f"**{created}** created, **{replaced}** replaced, "
-            f"**{skipped}** already current, **{failed}** failed.",
+            f"**{tally.created}** created, **{tally.replaced}** replaced, "
+            f"**{plan.skipped}** already current, **{tally.failed}** failed.",
             f"**{loaded}** troop emojis are now usable in any server.",
         ]
         if foreign:
@@ -282,8 +399,8 @@ class EmojiSync(
                 f"Left alone because this bot did not create them: "
                 + ", ".join(f"`{n}`" for n in foreign[:10])
             )
-        if stopped:
-            summary.append(f"\n**Stopped early.** {stopped}")
+        if tally.stopped:
+            summary.append(f"\n**Stopped early.** {tally.stopped}")
         await ctx.respond(components=_panel(
-            "Emoji sync finished", "\n".join(summary), ok=not stopped
+            "Emoji sync finished", "\n".join(summary), ok=not tally.stopped
         ))
@@ -3,6 +3,7 @@ import hikari
 import lightbulb
 
 from extensions.components import register_action
+from utils import discord_lookup
 from utils.component_state import insert_state
 from utils.mongo import MongoClient
 from extensions.commands.fwa import loader, fwa
@@ -171,7 +172,7 @@ async def fwa_bases_th_select(
         ctx: lightbulb.components.MenuContext = kwargs["ctx"]
 
         # Get the user from the user_id that was stored in MongoDB
-        user = await bot.rest.fetch_member(ctx.guild_id, user_id)
+        user = await discord_lookup.fetch_member(bot, ctx.guild_id, user_id)
 
         # Get the selected TH level
         choice = ctx.interaction.values[0]
@@ -6,6 +6,7 @@ Train ⇨ Join ⇨ Attack ⇨ Return (15-30min tops)
 """
 
 import asyncio
+import time
 import uuid
 import aiohttp
 import hikari
@@ -25,6 +26,7 @@ from utils.startup_reconciler import StartupReconciler
 from utils.constants import RED_ACCENT, GOLD_ACCENT, BLUE_ACCENT, GREEN_ACCENT
 from utils.emoji import emojis
 from utils.classes import Clan
+from utils.startup import profile_hook
 
 from hikari.impl import (
     MessageActionRowBuilder as ActionRow,
@@ -50,6 +52,9 @@ AUTOPING_JOB_DEFAULTS = {
     "misfire_grace_time": 300,
 }
 ACTIVE_SNAPSHOT_INDEX = "one_active_lazy_cwl_snapshot_per_clan"
+# Auto-ping jobs firing within this many seconds of each other run as one batch.
+AUTOPING_BATCH_WINDOW_SECONDS = 2
+AUTOPING_FETCH_CONCURRENCY = 5
 
 
 def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
@@ -61,6 +66,92 @@ def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
     return value.astimezone(timezone.utc)
 
 
+# Active-snapshot registry. Menus only show names, tags, dates and counts, so
+# the headers of active snapshots are held here without their rosters and
+# rendering a menu reads nothing from Mongo; a roster is only loaded when one
+# snapshot is opened. Every write path keeps the registry in step, and
+# ensure_snapshot_invariants rebuilds it from Mongo at startup.
+SNAPSHOT_HEADER_FIELDS = (
+    "_id", "clan_tag", "clan_name", "snapshot_date", "created_by", "active",
+    "auto_ping_enabled", "auto_ping_started_at", "auto_ping_interval_minutes",
+    "last_auto_ping_at", "auto_ping_count",
+)
+_active_headers: Dict[object, dict] = {}
+_headers_loaded = False
+
+
+def snapshot_header(snapshot: dict) -> dict:
+    """A snapshot without its roster, plus the roster counts menus show."""
+    header = {field: snapshot[field] for field in SNAPSHOT_HEADER_FIELDS if field in snapshot}
+    players = snapshot.get("players", [])
+    header["player_count"] = len(players)
+    header["linked_count"] = sum(1 for player in players if player.get("discord_id"))
+    return header
+
+
+def load_snapshot_registry(snapshots: List[dict]) -> None:
+    """Replace the registry with these active snapshots."""
+    global _headers_loaded
+    _active_headers.clear()
+    for snapshot in snapshots:
+        remember_snapshot(snapshot)
+    _headers_loaded = True
+
+
+def remember_snapshot(snapshot: dict) -> None:
+    """Hold the header of a snapshot just written; drop it once inactive."""
+    if snapshot.get("active"):
+        _active_headers[snapshot["_id"]] = snapshot_header(snapshot)
+    else:
+        _active_headers.pop(snapshot["_id"], None)
+
+
+def note_snapshot(snapshot_id, **fields) -> None:
+    """Mirror a `$set` on one snapshot into its held header."""
+    header = _active_headers.get(snapshot_id)
+    if header is None:
+        return
+    header.update(fields)
+    if not header.get("active"):
+        _active_headers.pop(snapshot_id, None)
+
+
+def forget_active_snapshots() -> None:
+    """Every active snapshot was just deactivated."""
+    _active_headers.clear()
+
+
+def reset_snapshot_registry() -> None:
+    """Drop held headers so the next menu reloads them (tests)."""
+    global _headers_loaded
+    _active_headers.clear()
+    _headers_loaded = False
+
+
+async def active_snapshot_headers(
+    mongo: MongoClient,
+    *,
+    auto_ping: Optional[bool] = None,
+    newest_by: str = "snapshot_date",
+) -> List[dict]:
+    """Headers of active snapshots, newest first by `newest_by`.
+
+    `auto_ping` keeps only snapshots with auto-ping on (True) or off (False).
+    Mongo is read only if startup never loaded the registry.
+    """
+    if not _headers_loaded:
+        load_snapshot_registry(
+            await mongo.lazy_cwl_snapshots.find({"active": True}).to_list(length=None)
+        )
+    headers = [
+        dict(header) for header in _active_headers.values()
+        if auto_ping is None or bool(header.get("auto_ping_enabled")) is auto_ping
+    ]
+    oldest = datetime.min.replace(tzinfo=timezone.utc)
+    headers.sort(key=lambda header: _as_utc(header.get(newest_by)) or oldest, reverse=True)
+    return headers
+
+
 def calculate_next_autoping_run(
     snapshot: dict,
     now: Optional[datetime] = None,
@@ -97,6 +188,7 @@ async def rollback_failed_autoping_start(mongo: MongoClient, snapshot_id) -> Non
             "$unset": {"auto_ping_job_id": ""},
         },
     )
+    note_snapshot(snapshot_id, auto_ping_enabled=False)
 
 
 async def ensure_snapshot_invariants(mongo: MongoClient) -> None:
@@ -105,7 +197,8 @@ async def ensure_snapshot_invariants(mongo: MongoClient) -> None:
     Older data can contain inactive snapshots with auto-ping still enabled and
     more than one active snapshot for the same clan. Keep the newest active
     snapshot deterministically, deactivate the rest, then let MongoDB enforce
-    the invariant for concurrent command invocations.
+    the invariant for concurrent command invocations. The surviving snapshots
+    become the active-snapshot registry.
     """
     await mongo.lazy_cwl_snapshots.update_many(
         {"active": {"$ne": True}, "auto_ping_enabled": True},
@@ -120,6 +213,7 @@ async def ensure_snapshot_invariants(mongo: MongoClient) -> None:
     for snapshot in active_snapshots:
         by_clan.setdefault(snapshot["clan_tag"].upper(), []).append(snapshot)
 
+    winners = []
     for clan_snapshots in by_clan.values():
         def snapshot_order(snapshot: dict) -> tuple[datetime, str]:
             created = _as_utc(snapshot.get("snapshot_date")) or datetime.min.replace(
@@ -141,6 +235,9 @@ async def ensure_snapshot_invariants(mongo: MongoClient) -> None:
                 {"_id": winner["_id"]},
                 {"$set": {"clan_tag": normalized_tag}},
             )
+        winners.append({**winner, "clan_tag": normalized_tag})
+
+    load_snapshot_registry(winners)
 
     await mongo.lazy_cwl_snapshots.create_index(
         [("clan_tag", 1)],
@@ -357,9 +454,7 @@ class LazyCwlPing(
         await ctx.defer(ephemeral=True)
 
         # Get active snapshots
-        snapshots = await mongo.lazy_cwl_snapshots.find({
-            "active": True
-        }).to_list(length=None)
+        snapshots = await active_snapshot_headers(mongo)
 
         if not snapshots:
             components = [
@@ -393,7 +488,7 @@ class LazyCwlPing(
         ]
 
         for snapshot in snapshots:
-            player_count = len(snapshot.get("players", []))
+            player_count = snapshot["player_count"]
             options.append(
                 SelectOption(
                     label=snapshot["clan_name"],
@@ -442,9 +537,7 @@ class LazyCwlStatus(
     ) -> None:
         await ctx.defer(ephemeral=True)
 
-        snapshots = await mongo.lazy_cwl_snapshots.find({
-            "active": True
-        }).sort("snapshot_date", -1).to_list(length=None)
+        snapshots = await active_snapshot_headers(mongo)
 
         if not snapshots:
             components = [
@@ -468,10 +561,10 @@ class LazyCwlStatus(
 
         total_players = 0
         for i, snapshot in enumerate(snapshots, 1):
-            player_count = len(snapshot.get("players", []))
+            player_count = snapshot["player_count"]
             total_players += player_count
 
-            discord_ids = sum(1 for player in snapshot.get("players", []) if player.get("discord_id"))
+            discord_ids = snapshot["linked_count"]
             coverage = f"{discord_ids}/{player_count}" if player_count > 0 else "0/0"
 
             components.extend([
@@ -513,9 +606,7 @@ class LazyCwlRoster(
         await ctx.defer(ephemeral=True)
 
         # Get all active snapshots
-        snapshots = await mongo.lazy_cwl_snapshots.find({
-            "active": True
-        }).sort("snapshot_date", -1).to_list(length=None)
+        snapshots = await active_snapshot_headers(mongo)
 
         if not snapshots:
             components = [
@@ -542,7 +633,7 @@ class LazyCwlRoster(
         # Build dropdown options
         options = []
         for snapshot in snapshots:
-            player_count = len(snapshot.get("players", []))
+            player_count = snapshot["player_count"]
             options.append(
                 SelectOption(
                     label=snapshot["clan_name"],
@@ -592,9 +683,7 @@ class LazyCwlReset(
         await ctx.defer(ephemeral=True)
 
         # Get all active snapshots
-        snapshots = await mongo.lazy_cwl_snapshots.find({
-            "active": True
-        }).sort("snapshot_date", -1).to_list(length=None)
+        snapshots = await active_snapshot_headers(mongo)
 
         if not snapshots:
             components = [
@@ -629,7 +718,7 @@ class LazyCwlReset(
 
         # Add individual snapshot options
         for snapshot in snapshots:
-            player_count = len(snapshot.get("players", []))
+            player_count = snapshot["player_count"]
             auto_ping_indicator = " 🔔" if snapshot.get("auto_ping_enabled") else ""
 
             options.append(
@@ -681,13 +770,7 @@ class LazyCwlAutopingsStart(
         await ctx.defer(ephemeral=True)
 
         # Get active snapshots without auto-ping enabled
-        snapshots = await mongo.lazy_cwl_snapshots.find({
-            "active": True,
-            "$or": [
-                {"auto_ping_enabled": {"$exists": False}},
-                {"auto_ping_enabled": False}
-            ]
-        }).sort("snapshot_date", -1).to_list(length=None)
+        snapshots = await active_snapshot_headers(mongo, auto_ping=False)
 
         if not snapshots:
             components = [
@@ -714,7 +797,7 @@ class LazyCwlAutopingsStart(
         # Build dropdown options
         options = []
         for snapshot in snapshots:
-            player_count = len(snapshot.get("players", []))
+            player_count = snapshot["player_count"]
             options.append(
                 SelectOption(
                     label=snapshot["clan_name"],
@@ -774,10 +857,7 @@ class LazyCwlAutopingsStop(
         await ctx.defer(ephemeral=True)
 
         # Get snapshots with auto-ping enabled
-        snapshots = await mongo.lazy_cwl_snapshots.find({
-            "active": True,
-            "auto_ping_enabled": True
-        }).sort("snapshot_date", -1).to_list(length=None)
+        snapshots = await active_snapshot_headers(mongo, auto_ping=True)
 
         if not snapshots:
             components = [
@@ -865,10 +945,9 @@ class LazyCwlAutopingsStatus(
 
         # Get all snapshots with auto-ping enabled
         try:
-            snapshots = await mongo.lazy_cwl_snapshots.find({
-                "active": True,
-                "auto_ping_enabled": True
-            }).sort("auto_ping_started_at", -1).to_list(length=None)
+            snapshots = await active_snapshot_headers(
+                mongo, auto_ping=True, newest_by="auto_ping_started_at"
+            )
         except Exception as exc:
             recovery_status = (
                 startup_reconciler.status_text()
@@ -999,9 +1078,7 @@ class LazyCwlRemovePlayer(
         await ctx.defer(ephemeral=True)
 
         # Get all active snapshots
-        snapshots = await mongo.lazy_cwl_snapshots.find({
-            "active": True
-        }).sort("snapshot_date", -1).to_list(length=None)
+        snapshots = await active_snapshot_headers(mongo)
 
         if not snapshots:
             components = [
@@ -1028,7 +1105,7 @@ class LazyCwlRemovePlayer(
         # Build snapshot options
         options = []
         for snapshot in snapshots:
-            player_count = len(snapshot.get("players", []))
+            player_count = snapshot["player_count"]
             snapshot_date = snapshot.get("snapshot_date")
             date_str = snapshot_date.strftime("%m/%d %I:%M%p") if snapshot_date else "Unknown"
             auto_ping_status = "🔔 Auto-ping ON" if snapshot.get("auto_ping_enabled") else ""
@@ -1173,6 +1250,7 @@ async def process_single_clan_snapshot(
 
         # Insert into database
         await mongo.lazy_cwl_snapshots.insert_one(snapshot)
+        remember_snapshot(snapshot)
 
         # Return success
         coverage_percent = (discord_coverage / len(players) * 100) if players else 0
@@ -1217,7 +1295,6 @@ async def process_single_clan_snapshot(
 async def process_single_autoping_start(
     snapshot: dict,
     interval_minutes: int,
-    jitter_index: int,
     mongo: MongoClient,
     scheduler_instance: Optional[AsyncIOScheduler]
 ) -> dict:
@@ -1227,11 +1304,11 @@ async def process_single_autoping_start(
     process_single_snapshot_reset returns, so the ALL summary renderer is
     identical for both and there is no second reporting format to drift.
 
-    JITTER. Seven jobs created in the same second fire together forever after,
-    and EVERY LazyCWL ping goes to one hardcoded channel (the constant inside
-    perform_lazy_cwl_ping), so they land in the same
-    POST /channels/{id}/messages bucket rather than spreading across clans.
-    Staggering the first run 5s per clan keeps that bucket off the ropes.
+    NO JITTER. Jobs started together fire together forever after, which is
+    what auto_ping_job wants: they join one batching window and run as a
+    single tick. EVERY LazyCWL ping still goes to one hardcoded channel, so
+    run_autoping_batch sends them one after another rather than staggering
+    the jobs themselves.
     """
     snapshot_id = snapshot["_id"]
     clan_name = snapshot.get("clan_name", "Unknown")
@@ -1267,6 +1344,14 @@ async def process_single_autoping_start(
                 }
             }
         )
+        note_snapshot(
+            snapshot_id,
+            auto_ping_enabled=True,
+            auto_ping_started_at=now,
+            auto_ping_interval_minutes=interval_minutes,
+            last_auto_ping_at=None,
+            auto_ping_count=0,
+        )
 
         try:
             scheduler_instance.add_job(
@@ -1275,7 +1360,7 @@ async def process_single_autoping_start(
                 args=[snapshot_id],
                 id=f"autopings_{snapshot_id}",
                 replace_existing=True,
-                next_run_time=now + timedelta(seconds=jitter_index * 5),
+                next_run_time=now,
                 **AUTOPING_JOB_DEFAULTS,
             )
         except Exception:
@@ -1283,7 +1368,7 @@ async def process_single_autoping_start(
             raise
 
         print(f"[LazyCWL AutoPing] Started auto-ping for {clan_name} "
-              f"(interval: {interval_minutes}min, first run +{jitter_index * 5}s)")
+              f"(interval: {interval_minutes}min)")
 
         return {'success': True, 'clan_name': clan_name, 'clan_tag': clan_tag}
 
@@ -1314,6 +1399,7 @@ async def process_single_autoping_stop(
             {"_id": snapshot_id},
             {"$set": {"auto_ping_enabled": False}}
         )
+        note_snapshot(snapshot_id, auto_ping_enabled=False)
 
         if scheduler_instance:
             try:
@@ -1377,6 +1463,7 @@ async def process_single_snapshot_reset(
             {"_id": snapshot_id},
             {"$set": {"active": False, "auto_ping_enabled": False}}
         )
+        note_snapshot(snapshot_id, active=False, auto_ping_enabled=False)
 
         if result.modified_count == 0:
             return {
@@ -1560,10 +1647,15 @@ async def process_single_snapshot_ping(
     snapshot: dict,
     bot: hikari.GatewayBot,
     coc_client: coc.Client,
-    mongo: MongoClient
+    mongo: MongoClient,
+    *,
+    clan: Optional[coc.Clan] = None,
+    clan_data: Optional[dict] = None,
 ) -> dict:
     """
     Process a single snapshot and send ping if needed.
+    `clan` and `clan_data` skip the CoC and Mongo lookups when the caller
+    already fetched them (the auto-ping batch does, once per clan).
     Returns dict with results: {
         'success': bool,
         'clan_name': str,
@@ -1577,13 +1669,15 @@ async def process_single_snapshot_ping(
         announcement_channel = 1424256751913668770
 
         # Fetch clan data to get role ID for mentions
-        clan_data = await mongo.clans.find_one({"tag": snapshot["clan_tag"]})
+        if clan_data is None:
+            clan_data = await mongo.clans.find_one({"tag": snapshot["clan_tag"]})
 
         # Get clan role ID for mentions (optional)
         clan_role_id = clan_data.get("role_id") if clan_data else None
 
         # Get current clan members
-        clan = await coc_client.get_clan(snapshot["clan_tag"])
+        if clan is None:
+            clan = await coc_client.get_clan(snapshot["clan_tag"])
         if not clan:
             return {
                 'success': False,
@@ -1679,129 +1773,268 @@ async def process_single_snapshot_ping(
         }
 
 
+class _AutopingWindow:
+    """Snapshot ids whose jobs fired inside one batching window."""
+
+    def __init__(self):
+        self.snapshot_ids: list = []
+        self.done = asyncio.Event()
+
+
+_autoping_window: Optional[_AutopingWindow] = None
+
+
 async def auto_ping_job(snapshot_id: str):
     """
     Periodic job to check and ping missing players automatically.
     Runs at configured interval until 7 days elapsed or snapshot reset.
+
+    The first job to fire opens a window of AUTOPING_BATCH_WINDOW_SECONDS;
+    every job firing inside it joins, and the window runs as one
+    run_autoping_batch tick. Each job returns when its batch has finished,
+    so max_instances still means one check per snapshot at a time.
     """
-    global bot_instance, coc_client, mongo_client, scheduler
+    global _autoping_window
 
     if not all([bot_instance, coc_client, mongo_client, scheduler]):
         print(f"[LazyCWL AutoPing] ERROR: Missing required clients for job {snapshot_id}")
         return
 
+    window = _autoping_window
+    if window is not None:
+        window.snapshot_ids.append(snapshot_id)
+        await window.done.wait()
+        return
+
+    window = _autoping_window = _AutopingWindow()
+    window.snapshot_ids.append(snapshot_id)
     try:
-        # Fetch snapshot from MongoDB
-        snapshot = await mongo_client.lazy_cwl_snapshots.find_one({"_id": snapshot_id})
+        await asyncio.sleep(AUTOPING_BATCH_WINDOW_SECONDS)
+        _autoping_window = None
+        await run_autoping_batch(window.snapshot_ids)
+    except Exception as e:
+        print(f"[LazyCWL AutoPing] Error in batch {window.snapshot_ids}: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        if _autoping_window is window:
+            _autoping_window = None
+        window.done.set()
 
-        if not snapshot:
-            print(f"[LazyCWL AutoPing] Snapshot {snapshot_id} not found, cancelling job")
-            try:
-                scheduler.remove_job(f"autopings_{snapshot_id}")
-            except:
-                pass
-            return
 
-        # Check if still active and enabled
-        if not snapshot.get("active") or not snapshot.get("auto_ping_enabled"):
-            print(f"[LazyCWL AutoPing] Snapshot {snapshot_id} no longer active/enabled, cancelling job")
-            if not snapshot.get("active") and snapshot.get("auto_ping_enabled"):
-                await mongo_client.lazy_cwl_snapshots.update_one(
-                    {"_id": snapshot_id},
-                    {"$set": {"auto_ping_enabled": False}},
-                )
-            try:
-                scheduler.remove_job(f"autopings_{snapshot_id}")
-            except:
-                pass
-            return
+async def _retire_autoping(snapshot_id, snapshot: Optional[dict], now: datetime) -> bool:
+    """Cancel the job of a snapshot that should no longer ping.
 
-        # Check 7-day limit
-        started_at = snapshot.get("auto_ping_started_at")
-        if started_at:
-            if started_at.tzinfo is None:
-                started_at = started_at.replace(tzinfo=timezone.utc)
-
-            now = datetime.now(timezone.utc)
-            elapsed = now - started_at
-
-            if elapsed > timedelta(days=7):
-                print(f"[LazyCWL AutoPing] 7-day limit reached for {snapshot['clan_name']}, disabling")
-
-                # Disable auto-ping
-                await mongo_client.lazy_cwl_snapshots.update_one(
-                    {"_id": snapshot_id},
-                    {
-                        "$set": {
-                            "auto_ping_enabled": False,
-                        }
-                    }
-                )
+    Returns True when the snapshot is gone, inactive, disabled or past its
+    7-day limit; the expiry notice is sent here for the last case.
+    """
+    if not snapshot:
+        print(f"[LazyCWL AutoPing] Snapshot {snapshot_id} not found, cancelling job")
+        try:
+            scheduler.remove_job(f"autopings_{snapshot_id}")
+        except:
+            pass
+        return True
+
+    # Check if still active and enabled
+    if not snapshot.get("active") or not snapshot.get("auto_ping_enabled"):
+        print(f"[LazyCWL AutoPing] Snapshot {snapshot_id} no longer active/enabled, cancelling job")
+        if not snapshot.get("active") and snapshot.get("auto_ping_enabled"):
+            await mongo_client.lazy_cwl_snapshots.update_one(
+                {"_id": snapshot_id},
+                {"$set": {"auto_ping_enabled": False}},
+            )
+        note_snapshot(snapshot_id, active=snapshot.get("active"), auto_ping_enabled=False)
+        try:
+            scheduler.remove_job(f"autopings_{snapshot_id}")
+        except:
+            pass
+        return True
 
-                # Cancel job
-                try:
-                    scheduler.remove_job(f"autopings_{snapshot_id}")
-                except:
-                    pass
+    # Check 7-day limit
+    started_at = _as_utc(snapshot.get("auto_ping_started_at"))
+    if not started_at or now - started_at <= timedelta(days=7):
+        return False
 
-                # Send expiry notification to hardcoded ping channel
-                try:
-                    ping_count = snapshot.get("auto_ping_count", 0)
-                    expiry_components = [
-                        Container(
-                            accent_color=RED_ACCENT,
-                            components=[
-                                Text(content="## ⏰ Auto-Ping Expired"),
-                                Separator(),
-                                Text(content=(
-                                    f"The automated ping for **{snapshot['clan_name']}** has expired after 7 days.\n\n"
-                                    f"**Snapshot Date:** {snapshot['snapshot_date'].strftime('%B %d, %Y at %I:%M %p UTC')}\n"
-                                    f"**Total Pings Sent:** {ping_count}\n\n"
-                                    f"Use `/fwa lazycwl-autopings-start` to restart if needed."
-                                ))
-                            ]
-                        )
-                    ]
-                    await bot_instance.rest.create_message(
-                        channel=1424256751913668770,
-                        components=expiry_components
-                    )
-                except Exception as e:
-                    print(f"[LazyCWL AutoPing] Failed to send expiry notification: {e}")
+    print(f"[LazyCWL AutoPing] 7-day limit reached for {snapshot['clan_name']}, disabling")
 
-                return
+    # Disable auto-ping
+    await mongo_client.lazy_cwl_snapshots.update_one(
+        {"_id": snapshot_id},
+        {
+            "$set": {
+                "auto_ping_enabled": False,
+            }
+        }
+    )
+    note_snapshot(snapshot_id, auto_ping_enabled=False)
 
-        # Ping missing players
-        print(f"[LazyCWL AutoPing] Running auto-ping for {snapshot['clan_name']}")
-        result = await process_single_snapshot_ping(snapshot, bot_instance, coc_client, mongo_client)
+    # Cancel job
+    try:
+        scheduler.remove_job(f"autopings_{snapshot_id}")
+    except:
+        pass
 
-        if result['success']:
-            # Persist every successful check for cadence restoration, but only
-            # count a ping when a Discord message was actually sent.
-            update = {
-                "$set": {
-                    "last_auto_ping_at": datetime.now(timezone.utc)
-                }
-            }
-            if not result.get('all_present'):
-                update["$inc"] = {"auto_ping_count": 1}
+    # Send expiry notification to hardcoded ping channel
+    try:
+        ping_count = snapshot.get("auto_ping_count", 0)
+        expiry_components = [
+            Container(
+                accent_color=RED_ACCENT,
+                components=[
+                    Text(content="## ⏰ Auto-Ping Expired"),
+                    Separator(),
+                    Text(content=(
+                        f"The automated ping for **{snapshot['clan_name']}** has expired after 7 days.\n\n"
+                        f"**Snapshot Date:** {snapshot['snapshot_date'].strftime('%B %d, %Y at %I:%M %p UTC')}\n"
+                        f"**Total Pings Sent:** {ping_count}\n\n"
+                        f"Use `/fwa lazycwl-autopings-start` to restart if needed."
+                    ))
+                ]
+            )
+        ]
+        await bot_instance.rest.create_message(
+            channel=1424256751913668770,
+            components=expiry_components
+        )
+    except Exception as e:
+        print(f"[LazyCWL AutoPing] Failed to send expiry notification: {e}")
 
-            await mongo_client.lazy_cwl_snapshots.update_one(
-                {"_id": snapshot_id},
-                update,
+    return True
+
+
+def fetch_clans_once(client: coc.Client, clan_tags) -> dict:
+    """Start one fetch per distinct clan, at most AUTOPING_FETCH_CONCURRENCY at a time.
+
+    Returns {tag: task}; snapshots of the same clan await the same task.
+    """
+    semaphore = asyncio.Semaphore(AUTOPING_FETCH_CONCURRENCY)
+
+    async def fetch(tag):
+        async with semaphore:
+            return await client.get_clan(tag)
+
+    return {
+        tag: asyncio.create_task(fetch(tag))
+        for tag in dict.fromkeys(clan_tags)
+    }
+
+
+async def run_autoping_batch(snapshot_ids: list) -> dict:
+    """Run one auto-ping tick for every snapshot whose job fired in the window.
+
+    One `$in` read loads the snapshots and one more the clans' role ids; each
+    distinct clan is fetched from the CoC API once, concurrently, and each
+    roster is diffed as soon as its clan arrives. The pings themselves go out
+    one at a time since they all share the hardcoded channel's message
+    bucket. A snapshot whose own checks fail is logged and skipped; the rest
+    of the window still pings. Returns counts for logging and benchmarks.
+    """
+    started = time.perf_counter()
+    snapshot_ids = list(dict.fromkeys(snapshot_ids))
+    snapshots = await mongo_client.lazy_cwl_snapshots.find(
+        {"_id": {"$in": snapshot_ids}}
+    ).to_list(length=None)
+    by_id = {snapshot["_id"]: snapshot for snapshot in snapshots}
+
+    now = datetime.now(timezone.utc)
+    due = []
+    failed = 0
+    for snapshot_id in snapshot_ids:
+        snapshot = by_id.get(snapshot_id)
+        # Each snapshot on its own, as when every job ran separately: one
+        # bad row or failed write must not cost the other clans their ping.
+        try:
+            if await _retire_autoping(snapshot_id, snapshot, now):
+                continue
+        except Exception as e:
+            failed += 1
+            print(f"[LazyCWL AutoPing] Skipping snapshot {snapshot_id}: {type(e).__name__}: {e}")
+            continue
+        if not snapshot.get("clan_tag"):
+            failed += 1
+            print(f"[LazyCWL AutoPing] Skipping snapshot {snapshot_id}: no clan tag")
+            continue
+        due.append(snapshot)
+
+    # Read the role ids before starting any CoC fetch, so a failed read
+    # leaves no fetch running unawaited.
+    tags = list(dict.fromkeys(snapshot["clan_tag"] for snapshot in due))
+    clan_docs = await mongo_client.clans.find(
+        {"tag": {"$in": tags}}
+    ).to_list(length=None)
+    role_docs = {doc["tag"]: doc for doc in clan_docs}
+    fetches = fetch_clans_once(coc_client, tags)
+    send_lock = asyncio.Lock()
+
+    async def check(snapshot: dict) -> dict:
+        clan_name = snapshot.get('clan_name', 'Unknown')
+        print(f"[LazyCWL AutoPing] Running auto-ping for {clan_name}")
+        try:
+            clan = await fetches[snapshot["clan_tag"]]
+        except Exception as e:
+            return {'success': False, 'clan_name': clan_name, 'error': str(e)}
+        if not clan:
+            return {
+                'success': False,
+                'clan_name': clan_name,
+                'error': "Clan not found in CoC API"
+            }
+        async with send_lock:
+            return await process_single_snapshot_ping(
+                snapshot, bot_instance, coc_client, mongo_client,
+                clan=clan, clan_data=role_docs.get(snapshot["clan_tag"], {}),
             )
 
-            if result.get('all_present'):
-                print(f"[LazyCWL AutoPing] All players present for {snapshot['clan_name']}")
-            else:
-                print(f"[LazyCWL AutoPing] Pinged {result['missing_count']}/{result['total_count']} missing players for {snapshot['clan_name']}")
-        else:
-            print(f"[LazyCWL AutoPing] Ping failed for {snapshot['clan_name']}: {result.get('error', 'Unknown error')}")
+    results = await asyncio.gather(*(check(snapshot) for snapshot in due))
+
+    # Persist every successful check for cadence restoration, but only count
+    # a ping when a Discord message was actually sent. One `now` for the whole
+    # batch keeps restored jobs firing together.
+    checked = [s["_id"] for s, r in zip(due, results) if r['success']]
+    pinged = [s["_id"] for s, r in zip(due, results) if r['success'] and not r.get('all_present')]
+    if checked:
+        await mongo_client.lazy_cwl_snapshots.update_many(
+            {"_id": {"$in": checked}},
+            {"$set": {"last_auto_ping_at": now}},
+        )
+    if pinged:
+        await mongo_client.lazy_cwl_snapshots.update_many(
+            {"_id": {"$in": pinged}},
+            {"$inc": {"auto_ping_count": 1}},
+        )
+    for snapshot, result in zip(due, results):
+        if result['success']:
+            remember_snapshot({
+                **snapshot,
+                "last_auto_ping_at": now,
+                "auto_ping_count": snapshot.get("auto_ping_count", 0)
+                + (0 if result.get('all_present') else 1),
+            })
 
-    except Exception as e:
-        print(f"[LazyCWL AutoPing] Error in job {snapshot_id}: {e}")
-        import traceback
-        traceback.print_exc()
+    for result in results:
+        if not result['success']:
+            failed += 1
+            print(f"[LazyCWL AutoPing] Ping failed for {result['clan_name']}: {result.get('error', 'Unknown error')}")
+        elif result.get('all_present'):
+            print(f"[LazyCWL AutoPing] All players present for {result['clan_name']}")
+        else:
+            print(f"[LazyCWL AutoPing] Pinged {result['missing_count']}/{result['total_count']} missing players for {result['clan_name']}")
+
+    summary = {
+        "snapshots": len(snapshot_ids),
+        "checked": len(due),
+        "clan_fetches": len(fetches),
+        "pinged": len(pinged),
+        "failed": failed,
+        "seconds": time.perf_counter() - started,
+    }
+    print(
+        f"[LazyCWL AutoPing] Batch of {summary['snapshots']} job(s): "
+        f"{summary['checked']} checked, {summary['clan_fetches']} clan fetch(es), "
+        f"{summary['pinged']} ping(s), {summary['failed']} failed in {summary['seconds']:.1f}s"
+    )
+    return summary
 
 
 async def restore_autopings():
@@ -1846,6 +2079,7 @@ async def restore_autopings():
                 {"_id": snapshot_id},
                 {"$set": {"auto_ping_enabled": False}}
             )
+            note_snapshot(snapshot_id, auto_ping_enabled=False)
             expired += 1
             continue
 
@@ -2293,6 +2527,7 @@ async def handle_confirm_reset(
             {"active": True},
             {"$set": {"active": False, "auto_ping_enabled": False}}
         )
+        forget_active_snapshots()
 
         components = [
             Container(
@@ -2467,13 +2702,7 @@ async def handle_autopings_select_interval(
         # not something to fire off a single dropdown pick. The per-clan path
         # below keeps its existing no-confirm behaviour untouched.
         if snapshot_id == "ALL":
-            pending = await mongo.lazy_cwl_snapshots.find({
-                "active": True,
-                "$or": [
-                    {"auto_ping_enabled": {"$exists": False}},
-                    {"auto_ping_enabled": False}
-                ]
-            }).to_list(length=None)
+            pending = await active_snapshot_headers(mongo, auto_ping=False)
 
             confirm_action_id = str(uuid.uuid4())
             await insert_state(mongo, {
@@ -2560,6 +2789,14 @@ async def handle_autopings_select_interval(
                 }
             }
         )
+        note_snapshot(
+            snapshot_id,
+            auto_ping_enabled=True,
+            auto_ping_started_at=now,
+            auto_ping_interval_minutes=interval_minutes,
+            last_auto_ping_at=None,
+            auto_ping_count=0,
+        )
 
         # Create APScheduler job
         try:
@@ -2634,10 +2871,7 @@ async def handle_autopings_stop_select(
         # panel looks the same as one where nothing was running - so it gets a
         # confirm. The per-clan path below is untouched.
         if snapshot_id == "ALL":
-            running = await mongo.lazy_cwl_snapshots.find({
-                "active": True,
-                "auto_ping_enabled": True
-            }).to_list(length=None)
+            running = await active_snapshot_headers(mongo, auto_ping=True)
 
             confirm_action_id = str(uuid.uuid4())
             await insert_state(mongo, {
@@ -2704,6 +2938,7 @@ async def handle_autopings_stop_select(
                 }
             }
         )
+        note_snapshot(snapshot_id, auto_ping_enabled=False)
 
         # Cancel APScheduler job
         if scheduler:
@@ -2830,9 +3065,9 @@ async def handle_autopings_start_all_confirm(
             return
 
         results = []
-        for index, snapshot in enumerate(snapshots):
+        for snapshot in snapshots:
             results.append(await process_single_autoping_start(
-                snapshot, interval_minutes, index, mongo, scheduler
+                snapshot, interval_minutes, mongo, scheduler
             ))
 
         components = _bulk_autoping_summary(
@@ -3261,6 +3496,7 @@ async def handle_remove_player_confirm(
 
         # Fetch updated snapshot to get new count
         updated_snapshot = await mongo.lazy_cwl_snapshots.find_one({"_id": snapshot_id})
+        remember_snapshot(updated_snapshot)
         new_count = len(updated_snapshot.get("players", []))
         removed_count = original_count - new_count
 
@@ -3438,6 +3674,7 @@ async def handle_remove_player_cancel(ctx, action_id: str, **kwargs) -> None:
 
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
+@profile_hook
 async def on_bot_started(
     event: hikari.StartedEvent,
     bot: hikari.GatewayBot = lightbulb.di.INJECTED,
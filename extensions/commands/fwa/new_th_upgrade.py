@@ -3,6 +3,7 @@ import hikari
 import lightbulb
 
 from extensions.components import register_action
+from utils import discord_lookup
 from utils.component_state import insert_state
 from utils.mongo import MongoClient
 from extensions.commands.fwa import loader, fwa
@@ -169,7 +170,7 @@ async def fwa_new_th_upgrade_th_select(
 
         # Get the user from the user_id that was stored in MongoDB
         print(f"[FWA New TH Upgrade] Fetching member...")
-        user = await bot.rest.fetch_member(ctx.guild_id, user_id)
+        user = await discord_lookup.fetch_member(bot, ctx.guild_id, user_id)
         print(f"[FWA New TH Upgrade] Got user: {user.username}")
 
         # Get the selected TH level
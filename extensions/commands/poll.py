@@ -6,6 +6,7 @@ import asyncio
 import logging
 import re
 import uuid
+from collections import deque
 from datetime import datetime, timedelta, timezone
 
 import hikari
@@ -18,6 +19,7 @@ from utils import poll_store
 from utils.component_state import delete_state, insert_state
 from utils.constants import BLUE_ACCENT, GOLD_ACCENT, RED_ACCENT
 from utils.mongo import MongoClient
+from utils.startup import profile_hook
 from utils.startup_reconciler import StartupReconciler
 
 from hikari.impl import (
@@ -45,6 +47,11 @@ _bot: hikari.GatewayBot | None = None
 _mongo: MongoClient | None = None
 _startup_reconciler: StartupReconciler | None = None
 _poll_locks: dict[str, asyncio.Lock] = {}
+# Votes recorded since the poll message was last rendered, and the one
+# coalescing render task per poll that will absorb them.
+_pending_render_votes: dict[str, int] = {}
+_render_tasks: dict[str, asyncio.Task] = {}
+_render_absorbed: deque[int] = deque(maxlen=200)
 
 POLL_DURATION_SUGGESTIONS = (
     ("1h — 1 hour", "1h"),
@@ -63,6 +70,9 @@ POLL_MODAL_TTL = timedelta(minutes=10)
 POLL_JOB_PREFIX = "discord_poll_end:"
 POLL_SYNC_JOB_PREFIX = "discord_poll_sync:"
 POLL_SYNC_RETRY_DELAY = timedelta(minutes=5)
+# A vote burst is rendered at most once per window, with the tallies as they
+# stand when the window closes.
+POLL_RENDER_WINDOW_SECONDS = 1.5
 POLL_JOB_OPTIONS = {
     # Mongo is the clock. A suspended event loop must still run a late close.
     "misfire_grace_time": None,
@@ -188,6 +198,12 @@ def _modal_value(ctx, custom_id: str) -> str:
 
 def _option_counts(document: dict) -> tuple[dict[int, int], int]:
     counts = {int(option["id"]): 0 for option in document.get("options", ())}
+    tallies = document.get("tallies")
+    if isinstance(tallies, dict):
+        # Maintained by record_vote; O(options) instead of O(voters).
+        for option_id in counts:
+            counts[option_id] = max(int(tallies.get(str(option_id)) or 0), 0)
+        return counts, sum(counts.values())
     for raw_choice in (document.get("votes") or {}).values():
         try:
             choice = int(raw_choice)
@@ -506,6 +522,70 @@ async def _sync_poll_message(
     return False
 
 
+def _request_poll_render(
+    mongo: MongoClient,
+    bot: hikari.GatewayBot,
+    document: dict,
+) -> None:
+    """Queue one coalesced public re-render for a just-recorded vote.
+
+    The vote itself already set ``message_sync_pending`` in the same write, so
+    a render that never happens - shutdown, crash - is recovered at startup.
+    """
+    poll_id = str(document["_id"])
+    _pending_render_votes[poll_id] = _pending_render_votes.get(poll_id, 0) + 1
+    if poll_id in _render_tasks:
+        return
+    _render_tasks[poll_id] = asyncio.create_task(
+        _render_poll_when_quiet(
+            mongo, bot, guild_id=int(document["guild_id"]), poll_id=poll_id,
+        ),
+        name=f"poll-render:{poll_id}",
+    )
+
+
+async def _render_poll_when_quiet(
+    mongo: MongoClient,
+    bot: hikari.GatewayBot,
+    *,
+    guild_id: int,
+    poll_id: str,
+) -> None:
+    """Edit the poll message once per window for as long as votes keep coming."""
+    try:
+        while _pending_render_votes.get(poll_id):
+            await asyncio.sleep(POLL_RENDER_WINDOW_SECONDS)
+            async with _lock_for(poll_id):
+                absorbed = _pending_render_votes.pop(poll_id, 0)
+                document = await poll_store.get_poll(
+                    mongo, guild_id=guild_id, poll_id=poll_id, include_votes=False,
+                )
+                # Ending the poll renders its own final state.
+                if document is None or not document.get("message_sync_pending"):
+                    continue
+                await _sync_poll_message(mongo, bot, document)
+            _render_absorbed.append(absorbed)
+            _log.info(
+                "poll message rendered poll=%s votes_absorbed=%s",
+                poll_id, absorbed,
+            )
+    except Exception:
+        _log.exception("coalesced poll render failed poll=%s guild=%s", poll_id, guild_id)
+        _schedule_sync_retry({"_id": poll_id, "guild_id": guild_id})
+    finally:
+        _render_tasks.pop(poll_id, None)
+
+
+def render_stats() -> dict[str, int]:
+    """Coalesced edits and the votes they absorbed, over the recent window."""
+    absorbed = list(_render_absorbed)
+    return {
+        "edits": len(absorbed),
+        "votes": sum(absorbed),
+        "max_absorbed": max(absorbed, default=0),
+    }
+
+
 async def _finalize_poll(
     mongo: MongoClient,
     bot: hikari.GatewayBot,
@@ -524,7 +604,7 @@ async def _finalize_poll(
         changed = ended is not None
         if ended is None:
             ended = await poll_store.get_poll(
-                mongo, guild_id=guild_id, poll_id=poll_id,
+                mongo, guild_id=guild_id, poll_id=poll_id, include_votes=False,
             )
         if ended is not None:
             await _sync_poll_message(mongo, bot, ended)
@@ -554,7 +634,7 @@ async def _recover_pending_sync(
     """Reload and render a pending message under the vote/end serialization lock."""
     async with _lock_for(poll_id):
         document = await poll_store.get_poll(
-            mongo, guild_id=guild_id, poll_id=poll_id,
+            mongo, guild_id=guild_id, poll_id=poll_id, include_votes=False,
         )
         if document is None or not document.get("message_sync_pending"):
             _remove_sync_job(poll_id)
@@ -589,6 +669,10 @@ async def _reconcile_poll_startup() -> None:
     if not getattr(_scheduler, "running", False):
         _scheduler.start()
 
+    # Renders read counters rather than ballots, so polls stored before the
+    # counters existed get them before anything is rendered.
+    await poll_store.backfill_tallies(_mongo)
+
     while True:
         due = await poll_store.list_due_polls(_mongo, limit=100)
         if not due:
@@ -620,6 +704,7 @@ async def _reconcile_poll_startup() -> None:
 
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
+@profile_hook
 async def on_poll_started(
     event: hikari.StartedEvent,
     mongo: MongoClient = lightbulb.di.INJECTED,
@@ -643,6 +728,12 @@ async def on_poll_stopping(_: hikari.StoppingEvent) -> None:
     if getattr(_scheduler, "running", False):
         _scheduler.shutdown(wait=False)
         await asyncio.sleep(0)
+    # Unrendered votes stay marked message_sync_pending and are rendered by
+    # the next startup's recovery pass.
+    for task in list(_render_tasks.values()):
+        task.cancel()
+    _render_tasks.clear()
+    _pending_render_votes.clear()
     _poll_locks.clear()
     _bot = None
     _mongo = None
@@ -970,24 +1061,43 @@ async def poll_vote(
         return
 
     document = None
+    contended = False
     async with _lock_for(poll_id):
-        current = await poll_store.get_poll(mongo, guild_id=guild_id, poll_id=poll_id)
+        current = await poll_store.get_poll(
+            mongo, guild_id=guild_id, poll_id=poll_id, include_votes=False,
+        )
         valid_choices = {
             int(option["id"]) for option in (current or {}).get("options", ())
         }
         if current is not None and choice in valid_choices:
-            document = await poll_store.record_vote(
-                mongo,
-                guild_id=guild_id,
-                poll_id=poll_id,
-                user_id=int(ctx.user.id),
-                choice=choice,
-            )
-            if document is not None:
-                await _sync_poll_message(mongo, bot, document)
+            try:
+                document = await poll_store.record_vote(
+                    mongo,
+                    guild_id=guild_id,
+                    poll_id=poll_id,
+                    user_id=int(ctx.user.id),
+                    choice=choice,
+                )
+            except poll_store.VoteContendedError:
+                contended = True
+    # The voter is answered as soon as the vote is durable; the public message
+    # catches up in the next coalesced render.
+    if document is not None:
+        _request_poll_render(mongo, bot, document)
+
+    if contended:
+        # The poll is open; the ballot changed under every attempt.
+        await ctx.respond(
+            "Your vote did not go through because it changed at the same time "
+            "from somewhere else. Press the button again.",
+            ephemeral=True,
+        )
+        return
 
     if document is None:
-        current = await poll_store.get_poll(mongo, guild_id=guild_id, poll_id=poll_id)
+        current = await poll_store.get_poll(
+            mongo, guild_id=guild_id, poll_id=poll_id, include_votes=False,
+        )
         if current is not None and current.get("active") and _as_utc(current["ends_at"]) <= _utcnow():
             await _finalize_poll(
                 mongo, bot, guild_id=guild_id, poll_id=poll_id, reason="expired",
@@ -26,6 +26,7 @@ from hikari.impl import (
 
 from extensions.commands.recruit import loader, recruit
 from extensions.commands.fwa.helpers import get_fwa_base_object
+from utils import discord_lookup
 from utils.component_state import insert_state
 from utils.constants import (
     GOLDENROD_ACCENT,
@@ -39,6 +40,7 @@ from utils.constants import (
 from utils.emoji import emojis
 from utils.mongo import MongoClient
 from extensions.components import register_action
+from utils.startup import profile_hook
 
 _log = logging.getLogger(__name__)
 
@@ -189,7 +191,7 @@ async def primary_questions(
 
     ctx: lightbulb.components.MenuContext = kwargs.get("ctx")
     choice = ctx.interaction.values[0]
-    user = await bot.rest.fetch_member(ctx.guild_id, user_id)
+    user = await discord_lookup.fetch_member(bot, ctx.guild_id, user_id)
     mention_allowed = {
         # don’t auto-parse @everyone or @here
         "parse": [],
@@ -484,7 +486,7 @@ async def on_age_button(
     ctx: lightbulb.components.MenuContext = kwargs["ctx"]
     bracket, user_id = action_id.rsplit("_", 1)
     user_id = int(user_id)
-    user = await bot.rest.fetch_member(ctx.guild_id, user_id)
+    user = await discord_lookup.fetch_member(bot, ctx.guild_id, user_id)
 
     if int(ctx.user.id) != user_id:
         await ctx.respond(
@@ -591,8 +593,8 @@ async def on_shield_basics_button(
     parts = action_id.split(":")
     user_id = int(parts[0])
     original_recruiter_id = int(parts[1]) if len(parts) > 1 else ctx.member.id
-    user = await bot.rest.fetch_member(ctx.guild_id, user_id)
-    original_recruiter = await bot.rest.fetch_member(ctx.guild_id, original_recruiter_id)
+    user = await discord_lookup.fetch_member(bot, ctx.guild_id, user_id)
+    original_recruiter = await discord_lookup.fetch_member(bot, ctx.guild_id, original_recruiter_id)
 
     if int(ctx.user.id) != user_id:
         await ctx.respond(
@@ -702,7 +704,7 @@ async def fwa_questions(
 
     ctx: lightbulb.components.MenuContext = kwargs.get("ctx")
     choice = ctx.interaction.values[0]
-    user = await bot.rest.fetch_member(ctx.guild_id, user_id)
+    user = await discord_lookup.fetch_member(bot, ctx.guild_id, user_id)
 
     if choice == "fwa_clan_chat":
         components = [
@@ -1032,7 +1034,7 @@ async def th_select(
 
     ctx: lightbulb.components.MenuContext = kwargs.get("ctx")
     choice = ctx.interaction.values[0]
-    user = await bot.rest.fetch_member(ctx.guild_id, user_id)
+    user = await discord_lookup.fetch_member(bot, ctx.guild_id, user_id)
     fwa = await get_fwa_base_object(mongo)
     
     # Check if FWA data exists
@@ -1142,7 +1144,7 @@ async def explanations(
 
     ctx: lightbulb.components.MenuContext = kwargs.get("ctx")
     choice = ctx.interaction.values[0]
-    user = await bot.rest.fetch_member(ctx.guild_id, user_id)
+    user = await discord_lookup.fetch_member(bot, ctx.guild_id, user_id)
 
     if choice == "what_is_fwa":
         components = [
@@ -1349,7 +1351,7 @@ async def keep_it_moving(
 
     ctx: lightbulb.components.MenuContext = kwargs.get("ctx")
     choice = ctx.interaction.values[0]
-    user = await bot.rest.fetch_member(ctx.guild_id, user_id)
+    user = await discord_lookup.fetch_member(bot, ctx.guild_id, user_id)
 
     if choice == "waiting_response":
         components = [
@@ -1699,6 +1701,7 @@ async def migrate_legacy_family_codes(
 
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
+@profile_hook
 async def prepare_family_code_storage(
         _: hikari.StartedEvent,
         mongo: MongoClient = lightbulb.di.INJECTED,
@@ -1902,7 +1905,7 @@ async def on_family_code_response(
         moderator_name = "Unknown"
         if moderator_id is not None:
             try:
-                moderator = await bot.rest.fetch_member(event.guild_id, moderator_id)
+                moderator = await discord_lookup.fetch_member(bot, event.guild_id, moderator_id)
                 moderator_name = moderator.display_name
             except Exception:
                 _log.warning(
@@ -1,8 +1,12 @@
 import hikari
 import lightbulb
-from PIL import Image
 from io import BytesIO
 
+from utils.lazy_imports import lazy_import
+
+# Only /steal's resize needs Pillow; registering the command should not.
+Image = lazy_import("PIL.Image")
+
 loader = lightbulb.Loader()
 
 
@@ -1,7 +1,10 @@
 # extensions/commands/tickets/__init__.py
+import asyncio
+
 import lightbulb
 from utils.mongo import MongoClient
 import hikari
+from utils.startup import profile_hook
 
 loader = lightbulb.Loader()
 ticket = lightbulb.Group("ticket", "Warriors United ticket system commands")
@@ -9,23 +12,29 @@ ticket = lightbulb.Group("ticket", "Warriors United ticket system commands")
 # Store config globally for all ticket modules
 ticket_config = None
 _config_loaded = False  # Guard flag
+routing_task = None
 
 
 # Single startup listener for ALL ticket modules
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
+@profile_hook
 async def on_started(
         event: hikari.StartedEvent,
         mongo: MongoClient = lightbulb.di.INJECTED,
 ) -> None:
     """Load ticket configuration from database on startup - ONCE"""
-    global ticket_config, _config_loaded
+    global ticket_config, _config_loaded, routing_task
 
     # Guard against multiple loads
     if _config_loaded:
         return
     _config_loaded = True
 
+    # Hold the ticket_store routing flag in memory from here on.
+    from . import store
+    routing_task = asyncio.create_task(store.watch_routing(mongo), name="ticket-routing")
+
     config = await mongo.ticket_setup.find_one({"_id": "config"})
     if config:
         ticket_config = config
@@ -40,6 +49,19 @@ async def on_started(
         print(f"[Tickets] No configuration found in database, using defaults")
 
 
+@loader.listener(hikari.StoppingEvent)
+async def on_stopping(event: hikari.StoppingEvent) -> None:
+    global routing_task
+
+    if routing_task and not routing_task.done():
+        routing_task.cancel()
+        try:
+            await routing_task
+        except asyncio.CancelledError:
+            pass
+    routing_task = None
+
+
 # Import all ticket modules.
 # Order matters: migrate imports a helper from manage, so manage must land first.
 from . import setup
@@ -16,6 +16,7 @@ from hikari.impl import (
 )
 
 from utils.mongo import MongoClient
+from utils import discord_lookup
 from utils.constants import GREEN_ACCENT
 from extensions.commands.tickets import loader, ticket
 
@@ -186,7 +187,7 @@ class ChangeCategory(
             category_id = int(self.new_category)  # Changed from ctx.options.new_category
 
             # Verify the category exists and is accessible
-            category = await bot.rest.fetch_channel(category_id)
+            category = await discord_lookup.fetch_channel(bot, category_id)
             if category.type != hikari.ChannelType.GUILD_CATEGORY:
                 await ctx.respond(
                     "❌ That's not a valid category channel!",
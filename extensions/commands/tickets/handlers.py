@@ -23,6 +23,7 @@ from pymongo.errors import DuplicateKeyError
 
 from utils.mongo import MongoClient
 from utils.constants import RED_ACCENT, GOLD_ACCENT
+from utils import discord_lookup
 from extensions.components import register_action
 from extensions.commands.tickets import loader
 from extensions.commands.tickets import store
@@ -405,7 +406,7 @@ async def check_category_space(bot: hikari.GatewayBot, category_id: int, ticket_
     """Check how many more channels can be created in a category and notify admin if low"""
     try:
         # Get all channels in the guild
-        guild_channels = await bot.rest.fetch_guild_channels(guild_id)
+        guild_channels = await discord_lookup.fetch_guild_channels(bot, guild_id)
 
         # Count channels in this specific category
         # int() on both sides: parent_id is a Snowflake and category_id may arrive as
@@ -418,7 +419,7 @@ async def check_category_space(bot: hikari.GatewayBot, category_id: int, ticket_
 
         # Get category info for better logging
         try:
-            category = await bot.rest.fetch_channel(category_id)
+            category = await discord_lookup.fetch_channel(bot, category_id)
             category_name = category.name
         except:
             category_name = "Unknown"
@@ -434,6 +435,7 @@ async def check_category_space(bot: hikari.GatewayBot, category_id: int, ticket_
         print(f"  - Channels Used: {used_slots}/50")
         print(f"  - Remaining Slots: {remaining_slots}")
         print(f"  - Guild Channels Total: {len(guild_channels)}/500")  # free, already fetched above
+        print(f"  - Discord lookups: {discord_lookup.summary()}")
 
         # Show first 5 channel names as examples
         if channels_in_category:
@@ -3,6 +3,7 @@
 Ticket management commands - list, dashboard, etc.
 """
 
+import asyncio
 import hikari
 import lightbulb
 import re
@@ -311,11 +312,12 @@ class Diagnostics(
 
         await ctx.defer(ephemeral=True)
 
-        # Three round trips regardless of ticket count. Deliberately NOT a
-        # per-ticket fetch_channel loop - that is what got the startup orphan sweep
-        # disabled in close.py for causing rate limits.
+        # A fixed number of round trips regardless of ticket count, and no
+        # ticket history loaded into Python: counts are grouped server-side and
+        # only open rows are read, a page at a time. Deliberately NOT a
+        # per-ticket fetch_channel loop - that is what got the startup orphan
+        # sweep disabled in close.py for causing rate limits.
         guild_channels = await bot.rest.fetch_guild_channels(ctx.guild_id)
-        docs = await store.find(mongo, {"type": "ticket", **CHANNEL_ERA_ONLY})
 
         live_ids = {_as_int(ch.id) for ch in guild_channels}
         live_ids |= await _active_thread_ids(bot, ctx.guild_id)
@@ -332,21 +334,27 @@ class Diagnostics(
             if getattr(ch, "parent_id", None)
         )
 
-        by_status = Counter(d.get("status") or "(missing)" for d in docs)
-        open_docs = [d for d in docs if d.get("status") == "open"]
+        by_status = await store.counts(mongo, CHANNEL_ERA_ONLY)
 
-        ghost_rows = [d for d in open_docs if _as_int(d.get("channel_id")) not in live_ids]
-        live_open = [d for d in open_docs if _as_int(d.get("channel_id")) in live_ids]
-        closed_name_open_status = [
-            d for d in live_open
-            if live_names.get(_as_int(d.get("channel_id")), "").startswith(CLOSED_EMOJI)
-        ]
-
-        tracked_ids = {_as_int(d.get("channel_id")) for d in docs}
-        untracked = [
-            ch for ch in guild_channels
-            if TICKET_NAME_RE.match(ch.name or "") and _as_int(ch.id) not in tracked_ids
-        ]
+        open_count = ghost_rows = live_open = closed_name_open_status = 0
+        async for page in store.pages(
+            mongo,
+            {"type": "ticket", "status": "open", **CHANNEL_ERA_ONLY},
+            projection={"channel_id": 1},
+        ):
+            for d in page:
+                open_count += 1
+                channel_id = _as_int(d.get("channel_id"))
+                if channel_id not in live_ids:
+                    ghost_rows += 1
+                    continue
+                live_open += 1
+                if live_names.get(channel_id, "").startswith(CLOSED_EMOJI):
+                    closed_name_open_status += 1
+
+        ticket_named = [ch for ch in guild_channels if TICKET_NAME_RE.match(ch.name or "")]
+        tracked_ids = await store.tracked_channel_ids(mongo, [ch.id for ch in ticket_named])
+        untracked = [ch for ch in ticket_named if _as_int(ch.id) not in tracked_ids]
 
         total = len(guild_channels)
         lines = [
@@ -365,8 +373,22 @@ class Diagnostics(
         # transition. This is the instrument for verifying every migration step:
         # the two lines should be identical, and "divergence" is the single word
         # that says whether the dual-write is holding.
-        bs_counts = await store.status_counts(mongo.button_store)
-        tk_counts = await store.status_counts(mongo.tickets)
+        # The per-document count matters as well as the per-status one: equal
+        # totals can hide two documents that diverged in opposite directions.
+        bs_counts, tk_counts, mismatched = await asyncio.gather(
+            store.status_counts(mongo.button_store),
+            store.status_counts(mongo.tickets),
+            store.mirror_mismatch_count(mongo),
+        )
+        mismatch_sample = []
+        if mismatched:
+            first_page = store.mirror_mismatches(mongo, page_size=5)
+            mismatch_sample = [
+                f"`{row['_id']}` "
+                + ", ".join(f"{side['side']}={side['status']}" for side in row["sides"])
+                for row in await anext(first_page, [])
+            ]
+            await first_page.aclose()
         divergence = [
             f"`{k}` {bs_counts.get(k, 0)}/{tk_counts.get(k, 0)}"
             for k in sorted(set(bs_counts) | set(tk_counts))
@@ -382,17 +404,20 @@ class Diagnostics(
             f"• `button_store` (type=ticket): **{sum(bs_counts.values())}** — {_fmt(bs_counts)}",
             f"• `tickets`: **{sum(tk_counts.values())}** — {_fmt(tk_counts)}",
             "• Divergence: " + ("none ✅" if not divergence else "⚠️ " + ", ".join(divergence)),
+            f"• Documents that differ: **{mismatched}**"
+            + "".join(f"\n  ◦ {row}" for row in mismatch_sample),
             f"• Reading from: **`{await store.active_store(mongo)}`**",
+            f"• Routing flag: {store.routing_summary()}",
             "",
             "**Reconciled set (channel-era only)**",
-            f"• Documents: {len(docs)}",
+            f"• Documents: {sum(by_status.values())}",
             "• By status: " + ", ".join(f"`{k}`={v}" for k, v in sorted(by_status.items())),
             "",
             "**Open-ticket reconciliation**",
-            f"• Marked open: **{len(open_docs)}**",
-            f"• ├ channel still exists: {len(live_open)}",
-            f"• ├ channel gone (ghost rows): **{len(ghost_rows)}**",
-            f"• └ live but name shows ✅/❌ while status is open: **{len(closed_name_open_status)}**",
+            f"• Marked open: **{open_count}**",
+            f"• ├ channel still exists: {live_open}",
+            f"• ├ channel gone (ghost rows): **{ghost_rows}**",
+            f"• └ live but name shows ✅/❌ while status is open: **{closed_name_open_status}**",
             "",
             f"**Ticket-like channels with no Mongo document:** {len(untracked)}",
         ]
@@ -464,27 +489,36 @@ class CleanupGhosts(
             )
             return
 
-        open_docs = await store.find(
-            mongo, {"type": "ticket", "status": "open", **CHANNEL_ERA_ONLY}
-        )
-
-        ghosts = [d for d in open_docs if _as_int(d.get("channel_id")) not in live_ids]
-
-        if not ghosts:
+        # Paged, keeping only the ids to write and ten rows to show.
+        open_count, ghost_ids, shown = 0, [], []
+        async for page in store.pages(
+            mongo,
+            {"type": "ticket", "status": "open", **CHANNEL_ERA_ONLY},
+            projection={"channel_id": 1, "ticket_type": 1, "ticket_number": 1, "username": 1},
+        ):
+            open_count += len(page)
+            for d in page:
+                if _as_int(d.get("channel_id")) in live_ids:
+                    continue
+                ghost_ids.append(d["_id"])
+                if len(shown) < 10:
+                    shown.append(d)
+
+        if not ghost_ids:
             await ctx.respond(
-                f"✅ Nothing to clean up — all {len(open_docs)} open ticket(s) still "
+                f"✅ Nothing to clean up — all {open_count} open ticket(s) still "
                 f"have a live channel."
             )
             return
 
-        header = f"👻 **{len(ghosts)} ghost row(s)** of {len(open_docs)} open tickets"
+        header = f"👻 **{len(ghost_ids)} ghost row(s)** of {open_count} open tickets"
         sample = [
             f"• `{d.get('_id')}` — {d.get('ticket_type', '?')} #{d.get('ticket_number', '?')} "
             f"({d.get('username', 'unknown')})"
-            for d in ghosts[:10]
+            for d in shown
         ]
-        if len(ghosts) > 10:
-            sample.append(f"• …and {len(ghosts) - 10} more")
+        if len(ghost_ids) > 10:
+            sample.append(f"• …and {len(ghost_ids) - 10} more")
 
         if not self.confirm:
             body = "\n".join([
@@ -518,7 +552,7 @@ class CleanupGhosts(
         # between the read above and this write is not clobbered.
         result = await store.update_many(
             mongo,
-            {"_id": {"$in": [d["_id"] for d in ghosts]}, "status": "open"},
+            {"_id": {"$in": ghost_ids}, "status": "open"},
             {"$set": {
                 "status": "denied",
                 "denied_at": datetime.now(timezone.utc),
@@ -589,19 +623,20 @@ class FixMismatched(
         live_names = {_as_int(ch.id): (ch.name or "") for ch in guild_channels}
         # Thread-era rows are excluded explicitly rather than relying on the
         # `name is None` skip below to drop them by accident.
-        open_docs = await store.find(
-            mongo, {"type": "ticket", "status": "open", **CHANNEL_ERA_ONLY}
-        )
-
         mismatched, legacy_open = [], 0
-        for doc in open_docs:
-            name = live_names.get(_as_int(doc.get("channel_id")))
-            if name is None:
-                continue  # ghost row - /ticket cleanup-ghosts owns those
-            if name.startswith(DENIED_PREFIX):
-                mismatched.append((doc, name))
-            elif name.startswith(LEGACY_OPEN_PREFIX):
-                legacy_open += 1
+        async for page in store.pages(
+            mongo,
+            {"type": "ticket", "status": "open", **CHANNEL_ERA_ONLY},
+            projection={"channel_id": 1},
+        ):
+            for doc in page:
+                name = live_names.get(_as_int(doc.get("channel_id")))
+                if name is None:
+                    continue  # ghost row - /ticket cleanup-ghosts owns those
+                if name.startswith(DENIED_PREFIX):
+                    mismatched.append((doc, name))
+                elif name.startswith(LEGACY_OPEN_PREFIX):
+                    legacy_open += 1
 
         if not mismatched:
             await ctx.respond(
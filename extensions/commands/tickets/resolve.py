@@ -21,6 +21,7 @@ import asyncio
 
 import hikari
 import lightbulb
+from utils import discord_lookup
 from utils.component_state import delete_state, get_state, insert_state
 
 from hikari.impl import (
@@ -112,7 +113,7 @@ async def _clear_monitor_flag(mongo: MongoClient, channel_id) -> None:
 
 async def _rename(bot: hikari.GatewayBot, channel_id, emoji: str, actor_name: str) -> None:
     try:
-        channel = await bot.rest.fetch_channel(channel_id)
+        channel = await discord_lookup.fetch_channel(bot, channel_id)
         await bot.rest.edit_channel(
             channel_id,
             name=get_channel_name_with_new_emoji(channel.name, emoji),
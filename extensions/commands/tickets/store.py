@@ -18,17 +18,26 @@ means the backfill and the code repoint cannot land in the wrong order. The code
 can ship first and change nothing, and the moment of risk becomes a single Mongo
 write that reverses in a second.
 
+The flag is held in memory while `watch_routing` runs (started with the ticket
+extension), so a button click does not pay a config read before its real work.
+A change stream on the config document keeps it current; on a deployment without
+change streams the watcher polls instead. Either way a flip lands within seconds
+and no restart is needed.
+
 DO NOT ADD A TTL INDEX TO `tickets`. Ticket history is permanent and referred
 back to. The pruning problem that motivated part of this move belongs to the
 ephemeral collection, not this one - see docs/ticket-data-model.md.
 """
 
+import asyncio
 import dataclasses
 import logging
+import time
 from collections import Counter
 from datetime import datetime, timezone
 
 from pymongo import ReturnDocument
+from pymongo.errors import OperationFailure
 
 from utils.mongo import MongoClient
 
@@ -43,6 +52,18 @@ STORE_BUTTON = "button_store"
 STORE_TICKETS = "tickets"
 DEFAULT_STORE = STORE_BUTTON
 
+# A change stream reports in at least this often even when nothing changes, and
+# the polling fallback re-reads the flag on the same beat.
+ROUTING_POLL_SECONDS = 5
+# A held flag older than this is not trusted; reads go back to Mongo until the
+# watcher catches up. Covers a watcher that has died or lost the server.
+ROUTING_MAX_AGE_SECONDS = 30
+
+_routing: str | None = None
+_routing_fresh_at = 0.0
+_routing_mode = "off"
+_routing_counts: Counter = Counter()
+
 
 def utcnow() -> datetime:
     """One source of truth for resolution timestamps."""
@@ -63,16 +84,103 @@ def as_int(value) -> int:
 async def active_store(mongo: MongoClient) -> str:
     """Which collection reads currently come from.
 
-    Read fresh every call rather than cached at startup. The `ticket_config`
-    global in __init__.py is the cautionary tale: it is loaded once on
-    StartedEvent and read by nothing, while every real consumer re-queries. A
-    cached flag here would mean a flip needed a restart, which defeats the point
-    of it being a flag.
+    Never cached at startup. The `ticket_config` global in __init__.py is the
+    cautionary tale: it is loaded once on StartedEvent and read by nothing, and
+    a flag loaded that way would need a restart to flip, which defeats the point
+    of it being a flag. The value held here is the one `watch_routing` keeps
+    current, and it is only used while that watcher has confirmed it recently;
+    otherwise this reads the config document.
     """
+    if _routing is not None and time.monotonic() - _routing_fresh_at < ROUTING_MAX_AGE_SECONDS:
+        _routing_counts["held"] += 1
+        return _routing
+    _routing_counts["read"] += 1
+    return await _read_routing(mongo)
+
+
+async def _read_routing(mongo: MongoClient) -> str:
     config = await mongo.ticket_setup.find_one({"_id": "config"}, {"ticket_store": 1})
     return (config or {}).get("ticket_store", DEFAULT_STORE)
 
 
+def _hold_routing(value: str) -> None:
+    global _routing, _routing_fresh_at
+    if _routing is not None and value != _routing:
+        print(f"[Tickets] ticket_store flag is now {value!r}")
+    _routing = value
+    _routing_fresh_at = time.monotonic()
+
+
+async def _follow_routing_changes(mongo: MongoClient) -> None:
+    """Hold the flag from a change stream on the config document.
+
+    The stream is opened before the first read so a flip between the two is
+    not missed. Returns or raises only when the stream does.
+    """
+    global _routing_mode
+    pipeline = [{"$match": {"documentKey._id": "config"}}]
+    async with await mongo.ticket_setup.watch(
+        pipeline,
+        full_document="updateLookup",
+        max_await_time_ms=ROUTING_POLL_SECONDS * 1000,
+    ) as stream:
+        _hold_routing(await _read_routing(mongo))
+        _routing_mode = "change stream"
+        while stream.alive:
+            change = await stream.try_next()
+            if change is None:
+                # An empty batch still proves the stream is alive.
+                _hold_routing(_routing or DEFAULT_STORE)
+                continue
+            # A deleted config document means the default, as a read would.
+            document = change.get("fullDocument") or {}
+            _hold_routing(document.get("ticket_store", DEFAULT_STORE))
+
+
+async def watch_routing(mongo: MongoClient) -> None:
+    """Keep the routing flag in memory until cancelled.
+
+    Tries a change stream first. A standalone mongod refuses one with an
+    OperationFailure, and from then on the flag is polled instead. Any other
+    failure leaves the held value to age out, so reads fall back to Mongo
+    rather than trusting a flag nobody is watching.
+    """
+    global _routing_mode
+    streams = True
+    while True:
+        try:
+            if streams:
+                await _follow_routing_changes(mongo)
+            else:
+                _hold_routing(await _read_routing(mongo))
+                _routing_mode = "polling"
+        except OperationFailure as exc:
+            if streams:
+                print(f"[Tickets] change streams unavailable ({exc.code}); "
+                      f"polling ticket_store every {ROUTING_POLL_SECONDS}s")
+            streams = False
+        except Exception as exc:
+            print(f"[Tickets] ticket_store watcher error: {type(exc).__name__}: {exc}")
+        await asyncio.sleep(ROUTING_POLL_SECONDS)
+
+
+def routing_summary() -> str:
+    """How the flag is being kept, and the config reads that avoided."""
+    return (
+        f"{_routing_mode}, {_routing_counts['held']} lookup(s) served from memory, "
+        f"{_routing_counts['read']} read from Mongo"
+    )
+
+
+def reset_routing() -> None:
+    """Forget the held flag (tests)."""
+    global _routing, _routing_fresh_at, _routing_mode
+    _routing = None
+    _routing_fresh_at = 0.0
+    _routing_mode = "off"
+    _routing_counts.clear()
+
+
 async def _reader(mongo: MongoClient):
     return mongo.tickets if await active_store(mongo) == STORE_TICKETS else mongo.button_store
 
@@ -114,6 +222,7 @@ async def insert_one(mongo: MongoClient, doc: dict) -> None:
     primary, secondary = await _both(mongo)
     ticket_id = doc["_id"]
     await primary.replace_one({"_id": ticket_id}, dict(doc), upsert=True)
+    _signal_ready(doc)
     try:
         await secondary.replace_one({"_id": ticket_id}, dict(doc), upsert=True)
     except Exception:
@@ -143,6 +252,85 @@ async def update_many(mongo: MongoClient, filt: dict, update: dict):
     return result
 
 
+# --- ticket-ready signal ----------------------------------------------------
+#
+# A new ticket's channel-create event reaches ticket_channel_monitor before the
+# ticket document exists: handlers.py creates the channel, then the thread, then
+# writes the document. The monitor used to poll for it. Now insert_one tells it
+# directly, and a document written moments before anyone asked is remembered
+# briefly so a late waiter does not have to read it back. Mongo is still read -
+# once up front, then occasionally - for a writer in another process, which
+# cannot reach this signal.
+
+READY_MEMORY_SECONDS = 60
+
+_ready_waiters: dict[int, list[asyncio.Future]] = {}
+_ready_recent: dict[int, tuple[float, dict]] = {}
+
+
+def _signal_ready(doc: dict) -> None:
+    channel_id = as_int(doc.get("channel_id"))
+    if not channel_id:
+        return
+    now = time.monotonic()
+    for key, (at, _) in list(_ready_recent.items()):
+        if now - at > READY_MEMORY_SECONDS:
+            del _ready_recent[key]
+    _ready_recent[channel_id] = (now, dict(doc))
+    for waiter in _ready_waiters.pop(channel_id, []):
+        if not waiter.done():
+            waiter.set_result(dict(doc))
+
+
+async def wait_for_ticket(
+        mongo: MongoClient,
+        channel_id,
+        *,
+        timeout: float,
+        poll_every: float,
+) -> dict | None:
+    """The ticket document for `channel_id`, once it exists, or None after `timeout`.
+
+    Returns as soon as insert_one writes it in this process. Mongo is read when
+    the wait starts and then every `poll_every` seconds, which only matters
+    for a document written by another process.
+    """
+    channel_id = as_int(channel_id)
+    recent = _ready_recent.get(channel_id)
+    if recent is not None:
+        return dict(recent[1])
+
+    waiter = asyncio.get_running_loop().create_future()
+    _ready_waiters.setdefault(channel_id, []).append(waiter)
+    give_up = time.monotonic() + timeout
+    try:
+        while True:
+            doc = await find_one(mongo, {"_id": f"ticket_{channel_id}"})
+            if doc:
+                return doc
+            remaining = give_up - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                return await asyncio.wait_for(
+                    asyncio.shield(waiter), timeout=min(poll_every, remaining)
+                )
+            except asyncio.TimeoutError:
+                continue
+    finally:
+        waiters = _ready_waiters.get(channel_id, [])
+        if waiter in waiters:
+            waiters.remove(waiter)
+        if not waiters:
+            _ready_waiters.pop(channel_id, None)
+
+
+def reset_ready() -> None:
+    """Forget waiters and remembered tickets (tests)."""
+    _ready_waiters.clear()
+    _ready_recent.clear()
+
+
 # --- conditional writes ------------------------------------------------------
 #
 # Everything below exists because an unconditional $set loses updates. Two
@@ -325,12 +513,128 @@ async def release(
 
 
 # --- reconciliation helpers --------------------------------------------------
+#
+# /ticket diagnostics, cleanup-ghosts and fix-mismatched run inside an
+# interaction deadline against the whole ticket history. Nothing here loads that
+# history into Python: counts are $group on the server, the two-collection diff
+# is one $unionWith pipeline, and anything that must be looked at per document
+# arrives in pages from a cursor.
 
-async def status_counts(collection) -> dict[str, int]:
+PAGE_SIZE = 500
+
+
+async def status_counts(collection, filt: dict | None = None) -> dict[str, int]:
     """{status: count} for ticket documents in one collection.
 
     Takes a collection rather than the client because both /ticket diagnostics
     and the backfill need to compare the two sides directly.
     """
-    docs = await collection.find(TICKET_FILTER, {"status": 1}).to_list(length=None)
-    return dict(Counter(d.get("status") or "(missing)" for d in docs))
+    cursor = await collection.aggregate([
+        {"$match": {**TICKET_FILTER, **(filt or {})}},
+        {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+    ])
+    counts: Counter = Counter()
+    async for row in cursor:
+        # Missing, null and "" all meant "(missing)" when this was counted in Python.
+        counts[row["_id"] or "(missing)"] += row["count"]
+    return dict(counts)
+
+
+async def counts(mongo: MongoClient, filt: dict | None = None) -> dict[str, int]:
+    """`status_counts` on whichever collection reads come from."""
+    return await status_counts(await _reader(mongo), filt)
+
+
+async def pages(
+        mongo: MongoClient,
+        filt: dict,
+        *,
+        projection: dict | None = None,
+        page_size: int = PAGE_SIZE,
+):
+    """Matching ticket documents from the read side, at most `page_size` at a time."""
+    cursor = (await _reader(mongo)).find(filt, projection, batch_size=page_size)
+    page = []
+    async for doc in cursor:
+        page.append(doc)
+        if len(page) >= page_size:
+            yield page
+            page = []
+    if page:
+        yield page
+
+
+async def tracked_channel_ids(mongo: MongoClient, channel_ids) -> set[int]:
+    """Which of `channel_ids` some ticket document points at.
+
+    Asks about the handful of live ticket-named channels instead of reading every
+    historical channel_id to find out. Both int and str forms are matched because
+    both have been stored (see `as_int`).
+    """
+    ids = [as_int(cid) for cid in channel_ids]
+    if not ids:
+        return set()
+    cursor = (await _reader(mongo)).find(
+        {**TICKET_FILTER, "channel_id": {"$in": ids + [str(cid) for cid in ids]}},
+        {"channel_id": 1},
+    )
+    return {as_int(doc.get("channel_id")) async for doc in cursor}
+
+
+def _mirror_diff(mongo: MongoClient) -> list[dict]:
+    """Aggregation stages, run on button_store: every _id the two sides disagree on.
+
+    Disagreement is either side missing the document or the two statuses
+    differing - the things the dual-write is supposed to prevent.
+    """
+    def side(name: str) -> list[dict]:
+        return [
+            {"$match": TICKET_FILTER},
+            {"$project": {
+                "status": {"$ifNull": ["$status", "(missing)"]},
+                "side": {"$literal": name},
+            }},
+        ]
+
+    return [
+        *side(STORE_BUTTON),
+        {"$unionWith": {"coll": mongo.tickets.name, "pipeline": side(STORE_TICKETS)}},
+        {"$group": {
+            "_id": "$_id",
+            "sides": {"$push": {"side": "$side", "status": "$status"}},
+            "statuses": {"$addToSet": "$status"},
+        }},
+        {"$match": {"$expr": {"$or": [
+            {"$ne": [{"$size": "$sides"}, 2]},
+            {"$gt": [{"$size": "$statuses"}, 1]},
+        ]}}},
+    ]
+
+
+async def mirror_mismatch_count(mongo: MongoClient) -> int:
+    """How many ticket ids the two collections disagree on. One round trip."""
+    cursor = await mongo.button_store.aggregate(
+        [*_mirror_diff(mongo), {"$count": "count"}], allowDiskUse=True
+    )
+    rows = await cursor.to_list(length=1)
+    return rows[0]["count"] if rows else 0
+
+
+async def mirror_mismatches(mongo: MongoClient, *, page_size: int = PAGE_SIZE):
+    """Every disagreeing id with what each side holds, in pages of `page_size`.
+
+    Each item is `{"_id": ..., "sides": [{"side": ..., "status": ...}, ...]}`.
+    """
+    cursor = await mongo.button_store.aggregate(
+        [*_mirror_diff(mongo), {"$sort": {"_id": 1}}, {"$project": {"sides": 1}}],
+        allowDiskUse=True,
+        batchSize=page_size,
+    )
+    page = []
+    async for row in cursor:
+        page.append(row)
+        if len(page) >= page_size:
+            yield page
+            page = []
+    if page:
+        yield page
@@ -88,6 +88,7 @@ from utils.clash_links import resolve_tags
 from utils.constants import BLUE_ACCENT, GOLD_ACCENT, RED_ACCENT
 from utils.emoji import emojis
 from utils.mongo import MongoClient
+from utils.startup import profile_hook
 
 loader = lightbulb.Loader()
 
@@ -2110,6 +2111,7 @@ async def _auto_refresh_loop(bot, coc_client, mongo) -> None:
 
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
+@profile_hook
 async def start_auto_refresh(
         _: hikari.StartedEvent,
         bot: hikari.GatewayBot = lightbulb.di.INJECTED,
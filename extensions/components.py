@@ -16,6 +16,7 @@ from hikari.events.interaction_events import ComponentInteractionCreateEvent
 from utils.constants import RED_ACCENT
 from utils.mongo import MongoClient
 from utils.component_state import get_state, prepare_storage
+from utils.startup import profile_hook
 
 loader = lightbulb.Loader()
 
@@ -324,6 +325,7 @@ async def _dispatch(
 
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
+@profile_hook
 async def prepare_component_state(
     _: hikari.StartedEvent,
     mongo: MongoClient = lightbulb.di.INJECTED,
@@ -12,6 +12,8 @@ from utils.mongo import MongoClient
 from extensions.commands.tickets import store
 from utils.constants import RED_ACCENT, GOLD_ACCENT, GOLDENROD_ACCENT
 from utils.emoji import emojis
+from utils import discord_lookup
+from utils.startup import profile_hook
 
 # Import Components V2
 from hikari.impl import (
@@ -42,8 +44,10 @@ PATTERNS = {
 # Define which patterns are currently active
 ACTIVE_PATTERNS = ["MAIN", "FWA"]
 
-TICKET_LOOKUP_ATTEMPTS = 20
-TICKET_LOOKUP_DELAY_SECONDS = 0.5
+# The ticket writer signals this process the moment the document lands, so
+# these only bound the wait and pace the read-back for a writer elsewhere.
+TICKET_READY_TIMEOUT_SECONDS = 10
+TICKET_FALLBACK_POLL_SECONDS = 2
 DELIVERY_ATTEMPTS = 3
 DELIVERY_RETRY_DELAY_SECONDS = 1
 DELIVERY_LEASE = timedelta(minutes=2)
@@ -53,18 +57,13 @@ async def wait_for_ticket_data(
         mongo: MongoClient,
         channel_id: int,
         *,
-        attempts: int = TICKET_LOOKUP_ATTEMPTS,
-        delay: float = TICKET_LOOKUP_DELAY_SECONDS,
+        timeout: float = TICKET_READY_TIMEOUT_SECONDS,
+        poll_every: float = TICKET_FALLBACK_POLL_SECONDS,
 ):
-    """Poll briefly for the ticket row created after the channel event fires."""
-    lookup_id = f"ticket_{channel_id}"
-    for attempt in range(max(1, attempts)):
-        ticket_data = await store.find_one(mongo, {"_id": lookup_id})
-        if ticket_data:
-            return ticket_data
-        if attempt + 1 < attempts:
-            await asyncio.sleep(delay)
-    return None
+    """Wait for the ticket row that is written after the channel event fires."""
+    return await store.wait_for_ticket(
+        mongo, channel_id, timeout=timeout, poll_every=poll_every
+    )
 
 
 async def claim_automation_delivery(
@@ -170,6 +169,7 @@ async def send_with_retries(rest, **kwargs) -> None:
 
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
+@profile_hook
 async def on_bot_started(
         event: hikari.StartedEvent,
         mongo: MongoClient = lightbulb.di.INJECTED,
@@ -230,7 +230,7 @@ async def on_channel_create(event: hikari.GuildChannelCreateEvent) -> None:
             else:
                 print(
                     f"[ERROR] No ticket data found for channel {channel_id} after "
-                    f"{TICKET_LOOKUP_ATTEMPTS} attempts"
+                    f"{TICKET_READY_TIMEOUT_SECONDS}s"
                 )
                 return
         except Exception as e:
@@ -244,15 +244,11 @@ async def on_channel_create(event: hikari.GuildChannelCreateEvent) -> None:
     # If we didn't get thread_id from MongoDB, try to find it
     if not thread_id:
         try:
-            # Fetch active threads for the guild
-            active_threads = await event.app.rest.fetch_active_threads(event.guild_id)
-
-            # Look for a thread in our channel
-            for thread in active_threads:
-                if thread.parent_id == channel_id:
-                    thread_id = thread.id
-                    print(f"[DEBUG] Found thread {thread_id} in channel {channel_id}")
-                    break
+            # Cached threads first; a REST fetch only when the thread is not cached yet
+            thread = await discord_lookup.find_active_thread(event.app, event.guild_id, channel_id)
+            if thread is not None:
+                thread_id = thread.id
+                print(f"[DEBUG] Found thread {thread_id} in channel {channel_id}")
 
         except Exception as e:
             print(f"[DEBUG] Error fetching threads: {e}")
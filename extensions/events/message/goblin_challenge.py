@@ -10,6 +10,7 @@ from typing import Optional
 from datetime import datetime, timezone
 
 from utils.mongo import MongoClient
+from utils import discord_lookup
 from hikari.impl import (
     ContainerComponentBuilder as Container,
     TextDisplayComponentBuilder as Text,
@@ -171,7 +172,7 @@ async def send_success_message(channel_id: int, user_id: int, recruiter_id: int)
             )
         ]
         
-        channel = await bot_instance.rest.fetch_channel(channel_id)
+        channel = await discord_lookup.fetch_channel(bot_instance, channel_id)
         await channel.send(
             components=components,
             user_mentions=[user_id, recruiter_id]
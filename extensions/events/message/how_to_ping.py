@@ -15,6 +15,7 @@ from hikari.impl import (
     MediaGalleryItemBuilder as MediaItem,
 )
 from utils.constants import BLUE_ACCENT
+from utils import discord_lookup
 from utils.mongo import MongoClient
 
 # Global instances
@@ -114,7 +115,7 @@ async def send_ping_explanation(channel_id: int, user_id: int):
             )
         ]
         
-        channel = await bot_instance.rest.fetch_channel(channel_id)
+        channel = await discord_lookup.fetch_channel(bot_instance, channel_id)
         await channel.send(
             components=components,
             user_mentions=[user_id]
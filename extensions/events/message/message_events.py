@@ -9,6 +9,7 @@ from typing import Optional
 
 from utils.mongo import MongoClient
 from utils import bot_data
+from utils.startup import profile_hook
 
 from . import goblin_challenge
 from . import how_to_ping
@@ -41,6 +42,7 @@ def _initialize_from_bot_data():
 
 
 @loader.listener(hikari.StartedEvent)
+@profile_hook
 async def on_started(event: hikari.StartedEvent):
     """Initialize on bot startup."""
     _initialize_from_bot_data()
@@ -27,6 +27,7 @@ from utils.mongo import MongoClient
 from utils.startup_reconciler import StartupReconciler
 from utils.constants import RED_ACCENT, GREEN_ACCENT
 from utils.emoji import emojis
+from utils.startup import profile_hook
 
 loader = lightbulb.Loader()
 
@@ -617,6 +618,7 @@ async def _reconcile_band_startup() -> None:
 
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
+@profile_hook
 async def on_bot_started(
         event: hikari.StartedEvent,
         mongo: MongoClient = lightbulb.di.INJECTED
@@ -26,6 +26,7 @@ import lightbulb
 from pymongo.errors import DuplicateKeyError
 
 from utils.mongo import MongoClient
+from utils.startup import profile_hook
 from utils.startup_reconciler import StartupReconciler
 from utils.band_ical_parser import (
     DISCOVERY_OFFSET,
@@ -772,6 +773,7 @@ async def _reconcile_ical_startup() -> None:
 
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
+@profile_hook
 async def on_bot_started(
         event: hikari.StartedEvent,
         mongo: MongoClient = lightbulb.di.INJECTED,
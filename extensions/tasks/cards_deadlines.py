@@ -30,22 +30,39 @@ Standing-post edits across one pass are capped by SWEEP_CHANNEL_EDIT_BUDGET.
 A state transition is never deferred for a cosmetic edit: an over-budget doc
 still changes state and carries a channel_edit_pending marker that the next
 pass drains first, under the same cap.
+
+WHEN A PASS RUNS
+----------------
+Passes are woken by `utils.cards_deadline_queue` at the earliest deadline
+cards.py has written, so each transition lands on time. The queue is hydrated
+from Mongo when the loop starts. Because the queue only decides WHEN to look,
+never WHAT is due, a deadline it missed is still handled - by the
+SWEEP_INTERVAL_SECONDS safety-net pass.
 """
 
 import asyncio
-from datetime import datetime, timezone
+from collections import Counter
+from datetime import datetime, timedelta, timezone
 
 import hikari
 import lightbulb
+from pymongo import UpdateOne
 
 from extensions.commands import cards as cards_command
+from utils import cards_deadline_queue
 from utils.mongo import MongoClient
+from utils.startup import profile_hook
 
 loader = lightbulb.Loader()
 
-# Deadlines are hours and days apart, so a minute of granularity is plenty and
-# a slow pass never overlaps the next one.
-SWEEP_INTERVAL_SECONDS = 5 * 60
+# The safety-net pass. Deadlines normally wake the sweep themselves through
+# the deadline queue; this only bounds how late a deadline the queue never
+# heard of can be, and keeps the deadline-less jobs (confirmed-side
+# settlement) ticking.
+SWEEP_INTERVAL_SECONDS = 30 * 60
+# A pass that left work behind - deferred post edits, a full batch - is
+# followed up this soon rather than waiting for the safety net.
+FOLLOW_UP_SECONDS = 5 * 60
 # A bot that was down for a week could have thousands due at once; a bounded
 # batch keeps one pass short and the rest are picked up next time.
 BATCH = 200
@@ -54,6 +71,15 @@ BATCH = 200
 # transitions all land immediately, and over-budget posts are corrected on
 # following passes via the channel_edit_pending marker.
 SWEEP_CHANNEL_EDIT_BUDGET = 25
+# Per-document follow-up work (slot release, reservation cleanup, DMs and
+# post edits) after a bulk transition runs this many documents at a time.
+# Post edits are still capped per pass by the edit budget above.
+DELIVERY_CONCURRENCY = 8
+# The re-read after a bulk transition is the only record of which docs moved;
+# losing it would strand their follow-ups, since the next pass no longer sees
+# them as due. It is idempotent, so a transient failure is simply retried.
+REREAD_ATTEMPTS = 3
+REREAD_RETRY_SECONDS = 0.5
 
 sweep_task = None
 bot_instance = None
@@ -119,6 +145,56 @@ class _EditBudget:
         return True
 
 
+async def _bulk_transition(collection, due, *, fence, update, moved, label):
+    """Apply every doc's compare-and-swap in one unordered bulk_write.
+
+    Returns the docs - as read, in read order - whose CAS actually landed.
+    bulk_write only reports a count, so they are identified by re-reading
+    the batch for the ``moved`` stamp this pass wrote (``expired_at: now``
+    and the like); a doc somebody else changed between the read and the
+    write does not carry it. The re-read runs even after a write error,
+    because an unordered batch applies everything it can, and is retried
+    REREAD_ATTEMPTS times before the batch's follow-ups are given up.
+    """
+    if not due:
+        return []
+    try:
+        await collection.bulk_write(
+            [UpdateOne(fence(doc), update(doc)) for doc in due],
+            ordered=False,
+        )
+    except Exception as exc:
+        print(f"[Cards Deadlines] {label} bulk write failed: "
+              f"{type(exc).__name__}: {exc}")
+    for attempt in range(1, REREAD_ATTEMPTS + 1):
+        try:
+            landed = await collection.find(
+                {"_id": {"$in": [doc["_id"] for doc in due]}, **moved},
+                projection={"_id": 1},
+            ).to_list(length=None)
+            break
+        except Exception as exc:
+            print(f"[Cards Deadlines] {label} re-read failed "
+                  f"(attempt {attempt}/{REREAD_ATTEMPTS}): "
+                  f"{type(exc).__name__}: {exc}")
+            if attempt == REREAD_ATTEMPTS:
+                return []
+            await asyncio.sleep(REREAD_RETRY_SECONDS * attempt)
+    landed_ids = {doc["_id"] for doc in landed}
+    return [doc for doc in due if doc["_id"] in landed_ids]
+
+
+async def _run_limited(jobs) -> None:
+    """Await per-document follow-ups, DELIVERY_CONCURRENCY at a time."""
+    semaphore = asyncio.Semaphore(DELIVERY_CONCURRENCY)
+
+    async def _one(job):
+        async with semaphore:
+            await job
+
+    await asyncio.gather(*(_one(job) for job in jobs))
+
+
 async def _mark_channel_edit_pending(mongo, doc_id) -> None:
     """Defer a standing-post edit to the next pass's drain job."""
     try:
@@ -144,39 +220,40 @@ async def _expire_unanswered_proposals(mongo, bot, *, now, edit_budget) -> int:
               f"{type(exc).__name__}: {exc}")
         return 0
 
-    closed = 0
-    for trade in due:
-        result = await mongo.card_trades.update_one(
-            {"_id": trade["_id"], "status": "pending"},
-            {
-                "$set": {
-                    "status": "expired",
-                    "expired_at": now,
-                    "updated_at": now,
-                },
-                "$unset": {"open_proposal_key": ""},
+    expired = await _bulk_transition(
+        mongo.card_trades,
+        due,
+        fence=lambda trade: {"_id": trade["_id"], "status": "pending"},
+        update=lambda _trade: {
+            "$set": {
+                "status": "expired",
+                "expired_at": now,
+                "updated_at": now,
             },
-        )
-        if not getattr(result, "modified_count", 0):
-            continue          # somebody answered between the read and the write
-        closed += 1
-        await cards_command._release_proposal_slots(mongo, trade)
+            "$unset": {"open_proposal_key": ""},
+        },
+        # A proposal somebody answered between the read and the write keeps
+        # its own status and never gets this pass's stamp.
+        moved={"status": "expired", "expired_at": now},
+        label="proposal",
+    )
+    if not expired:
+        return 0
 
-        # Nothing was ever reserved by a pending proposal, so there is no
-        # inventory to put back - only the count of requests this holder has
-        # let run out, which is what the check-in keys on.
-        holder_tag = cards_command._normalize_tag(trade.get("holder_tag"))
-        ignored = 0
-        try:
-            document = await mongo.card_inventories.find_one_and_update(
-                {"_id": holder_tag},
-                {"$inc": {"ignored_requests": 1}},
-                return_document=True,
-            )
-            ignored = int((document or {}).get("ignored_requests") or 0)
-        except Exception:
-            pass
+    # Nothing was ever reserved by a pending proposal, so there is no
+    # inventory to put back - only the count of requests each holder has
+    # let run out, which is what the check-in keys on. One $inc per holder,
+    # however many of their proposals expired in this pass.
+    ignored = await _count_ignored_requests(
+        mongo,
+        Counter(
+            cards_command._normalize_tag(trade.get("holder_tag"))
+            for trade in expired
+        ),
+    )
 
+    async def _follow_up(trade):
+        await cards_command._release_proposal_slots(mongo, trade)
         # The "expired" policy row: the standing post silently collapses to
         # its closed form and NOBODY is DMed - before this, the post kept
         # looking open forever while both players got a DM about a proposal
@@ -195,9 +272,48 @@ async def _expire_unanswered_proposals(mongo, bot, *, now, edit_budget) -> int:
                 bot, mongo, expired_trade, event="expired"
             )
 
-        if ignored >= cards_command.IGNORED_BEFORE_CHECKIN:
-            await _send_checkin(mongo, bot, trade, holder_tag, now=now)
-    return closed
+    await _run_limited(_follow_up(trade) for trade in expired)
+
+    # One check-in per holder: two concurrent sends for the same member
+    # would both see checkin_sent_at unset and ask twice.
+    last_trade_for = {
+        cards_command._normalize_tag(trade.get("holder_tag")): trade
+        for trade in expired
+    }
+    await _run_limited(
+        _send_checkin(mongo, bot, trade, holder_tag, now=now)
+        for holder_tag, trade in last_trade_for.items()
+        if ignored.get(holder_tag, 0) >= cards_command.IGNORED_BEFORE_CHECKIN
+    )
+    return len(expired)
+
+
+async def _count_ignored_requests(mongo, expired_by_holder) -> dict:
+    """Add each holder's newly ignored requests; return the new totals."""
+    holders = [tag for tag in expired_by_holder if tag]
+    if not holders:
+        return {}
+    try:
+        await mongo.card_inventories.bulk_write(
+            [
+                UpdateOne(
+                    {"_id": tag},
+                    {"$inc": {"ignored_requests": expired_by_holder[tag]}},
+                )
+                for tag in holders
+            ],
+            ordered=False,
+        )
+        documents = await mongo.card_inventories.find(
+            {"_id": {"$in": holders}},
+            projection={"ignored_requests": 1},
+        ).to_list(length=None)
+    except Exception:
+        return {}
+    return {
+        document["_id"]: int(document.get("ignored_requests") or 0)
+        for document in documents
+    }
 
 
 async def _send_checkin(mongo, bot, trade, holder_tag, *, now) -> None:
@@ -225,6 +341,9 @@ async def _send_checkin(mongo, bot, trade, holder_tag, *, now) -> None:
         {"_id": holder_tag},
         {"$set": {"checkin_sent_at": now, "checkin_delivered": bool(sent)}},
     )
+    cards_deadline_queue.note(
+        now + cards_command.CHECKIN_ANSWER_FOR, key=holder_tag
+    )
 
 
 async def _pause_silent_members(mongo, bot, *, now) -> int:
@@ -240,21 +359,23 @@ async def _pause_silent_members(mongo, bot, *, now) -> int:
               f"{type(exc).__name__}: {exc}")
         return 0
 
-    paused = 0
-    for inventory in due:
-        result = await mongo.card_inventories.update_one(
-            {"_id": inventory["_id"], "trading_paused": {"$ne": True}},
-            {"$set": {
-                "trading_paused": True,
-                "trading_paused_at": now,
-                "trading_paused_reason": "no answer to check-in",
-                "checkin_sent_at": None,
-                "updated_at": now,
-            }},
-        )
-        if getattr(result, "modified_count", 0):
-            paused += 1
-    return paused
+    paused = await _bulk_transition(
+        mongo.card_inventories,
+        due,
+        fence=lambda inventory: {
+            "_id": inventory["_id"], "trading_paused": {"$ne": True},
+        },
+        update=lambda _inventory: {"$set": {
+            "trading_paused": True,
+            "trading_paused_at": now,
+            "trading_paused_reason": "no answer to check-in",
+            "checkin_sent_at": None,
+            "updated_at": now,
+        }},
+        moved={"trading_paused": True, "trading_paused_at": now},
+        label="check-in",
+    )
+    return len(paused)
 
 
 async def _recover_interrupted_completions(mongo, bot, *, now) -> int:
@@ -426,26 +547,27 @@ async def _close_abandoned_swaps(mongo, bot, *, now) -> int:
               f"{type(exc).__name__}: {exc}")
         return 0
 
-    closed = 0
-    for trade in due:
-        result = await mongo.card_trades.update_one(
-            {
-                "_id": trade["_id"],
-                "status": {"$in": list(cards_command.SWAP_LIVE_STATUSES)},
-            },
-            {
-                "$set": {
-                    "status": "expired",
-                    "expired_at": now,
-                    "updated_at": now,
-                    **cards_command._cleanup_fields(trade),
-                },
-                "$unset": {"open_proposal_key": ""},
+    closed = await _bulk_transition(
+        mongo.card_trades,
+        due,
+        fence=lambda trade: {
+            "_id": trade["_id"],
+            "status": {"$in": list(cards_command.SWAP_LIVE_STATUSES)},
+        },
+        update=lambda trade: {
+            "$set": {
+                "status": "expired",
+                "expired_at": now,
+                "updated_at": now,
+                **cards_command._cleanup_fields(trade),
             },
-        )
-        if not getattr(result, "modified_count", 0):
-            continue
-        closed += 1
+            "$unset": {"open_proposal_key": ""},
+        },
+        moved={"status": "expired", "expired_at": now},
+        label="backstop",
+    )
+
+    async def _follow_up(trade):
         await cards_command._release_proposal_slots(mongo, trade)
         await cards_command._finish_trade_cleanup(
             mongo, trade, owner=cards_command._reservation_owner(trade)
@@ -462,7 +584,9 @@ async def _close_abandoned_swaps(mongo, bot, *, now) -> int:
                         "changed."
                     ),
                 )
-    return closed
+
+    await _run_limited(_follow_up(trade) for trade in closed)
+    return len(closed)
 
 
 async def _expire_open_requests(mongo, bot, *, now, edit_budget) -> int:
@@ -484,28 +608,32 @@ async def _expire_open_requests(mongo, bot, *, now, edit_budget) -> int:
               f"{type(exc).__name__}: {exc}")
         return 0
 
-    expired = 0
-    for request in due:
-        result = await mongo.card_trades.update_one(
-            {"_id": request["_id"], "kind": "open_request", "status": "open"},
-            {
-                "$set": {
-                    "status": "expired",
-                    "expired_at": now,
-                    "updated_at": now,
-                },
-                # Terminal transitions free the one-request-per-card key.
-                "$unset": {"open_request_key": ""},
+    expired = await _bulk_transition(
+        mongo.card_trades,
+        due,
+        fence=lambda request: {
+            "_id": request["_id"], "kind": "open_request", "status": "open",
+        },
+        update=lambda _request: {
+            "$set": {
+                "status": "expired",
+                "expired_at": now,
+                "updated_at": now,
             },
-        )
-        if not getattr(result, "modified_count", 0):
-            continue      # claimed or closed between the read and the write
-        expired += 1
+            # Terminal transitions free the one-request-per-card key.
+            "$unset": {"open_request_key": ""},
+        },
+        # Claimed or closed between the read and the write: no stamp.
+        moved={"status": "expired", "expired_at": now},
+        label="open request",
+    )
+
+    async def _follow_up(request):
         if not request.get("channel_message_id"):
-            continue      # never reached the board; nothing to edit
+            return        # never reached the board; nothing to edit
         if not edit_budget.take():
             await _mark_channel_edit_pending(mongo, request["_id"])
-            continue
+            return
         # The request is not trade-shaped, so the kind-aware trade edit
         # cannot render it; flip the post directly to its terminal form.
         await cards_command._channel_edit(
@@ -520,7 +648,9 @@ async def _expire_open_requests(mongo, bot, *, now, edit_budget) -> int:
             ),
             key=request.get("_id"),
         )
-    return expired
+
+    await _run_limited(_follow_up(request) for request in expired)
+    return len(expired)
 
 
 async def _recover_stalled_claims(mongo, bot, *, now) -> int:
@@ -545,29 +675,29 @@ async def _recover_stalled_claims(mongo, bot, *, now) -> int:
               f"{type(exc).__name__}: {exc}")
         return 0
 
-    recovered = 0
-    for request in due:
-        result = await mongo.card_trades.update_one(
-            {
-                "_id": request["_id"],
-                "kind": "open_request",
-                "status": "claiming",
-                "claim_until": {"$lte": now},
-            },
-            {
-                "$set": {"status": "open", "updated_at": now},
-                "$unset": {
-                    "claim_token": "",
-                    "claim_until": "",
-                    "claimed_by_discord_id": "",
-                    "claimed_by_tag": "",
-                    "claimed_at": "",
-                },
+    recovered = await _bulk_transition(
+        mongo.card_trades,
+        due,
+        fence=lambda request: {
+            "_id": request["_id"],
+            "kind": "open_request",
+            "status": "claiming",
+            "claim_until": {"$lte": now},
+        },
+        update=lambda _request: {
+            "$set": {"status": "open", "updated_at": now},
+            "$unset": {
+                "claim_token": "",
+                "claim_until": "",
+                "claimed_by_discord_id": "",
+                "claimed_by_tag": "",
+                "claimed_at": "",
             },
-        )
-        if getattr(result, "modified_count", 0):
-            recovered += 1
-    return recovered
+        },
+        moved={"status": "open", "updated_at": now},
+        label="stalled claim",
+    )
+    return len(recovered)
 
 
 async def _drain_pending_channel_edits(mongo, bot, *, edit_budget) -> int:
@@ -646,6 +776,13 @@ async def sweep_once() -> None:
     reclaimed = await _recover_stalled_claims(
         mongo_client, bot_instance, now=now
     )
+    if (edit_budget.remaining <= 0
+            or max(expired, paused, recovered, settled, closed,
+                   requests_expired, reclaimed) >= BATCH):
+        # Deferred edits or a capped batch: come back soon, not in half an hour.
+        cards_deadline_queue.note(
+            now + timedelta(seconds=FOLLOW_UP_SECONDS), key="follow-up"
+        )
     if (expired or paused or recovered or sides_settled or settled or closed
             or requests_expired or reclaimed or drained):
         print(f"[Cards Deadlines] expired={expired} paused={paused} "
@@ -655,19 +792,64 @@ async def sweep_once() -> None:
               f"claims_reclaimed={reclaimed} edits_drained={drained}")
 
 
+# Statuses whose documents still have a deadline ahead of them. Terminal
+# trades keep their old timestamps forever and must not be loaded.
+_DEADLINE_STATUSES = (
+    "pending", "completing", "open", "claiming",
+    *cards_command.SWAP_LIVE_STATUSES,
+)
+
+
+async def hydrate_deadline_queue(mongo) -> int:
+    """Load every outstanding deadline into the in-process queue."""
+    projection = {field: 1 for field in cards_deadline_queue.DEADLINE_FIELDS}
+    trades = await mongo.card_trades.find(
+        {"status": {"$in": list(_DEADLINE_STATUSES)}},
+        projection=projection,
+    ).to_list(length=None)
+    for trade in trades:
+        cards_deadline_queue.note_document(trade)
+    checkins = await mongo.card_inventories.find(
+        {"checkin_sent_at": {"$ne": None}, "trading_paused": {"$ne": True}},
+        projection={"checkin_sent_at": 1},
+    ).to_list(length=None)
+    for inventory in checkins:
+        sent_at = inventory.get("checkin_sent_at")
+        if isinstance(sent_at, datetime):
+            cards_deadline_queue.note(
+                sent_at + cards_command.CHECKIN_ANSWER_FOR,
+                key=inventory.get("_id"),
+            )
+    return len(trades) + len(checkins)
+
+
 async def sweep_loop() -> None:
+    if mongo_client:
+        try:
+            loaded = await hydrate_deadline_queue(mongo_client)
+            print(f"[Cards Deadlines] deadline queue hydrated: {loaded} document(s), "
+                  f"{cards_deadline_queue.summary()}")
+        except Exception as exc:
+            # The safety-net pass still covers everything; only punctuality
+            # is lost until the queue fills from new writes.
+            print(f"[Cards Deadlines] deadline queue hydrate failed: "
+                  f"{type(exc).__name__}: {exc}")
     while True:
+        # This pass covers everything already due, including whatever the
+        # hydrate just loaded, so none of it should wake a second pass.
+        cards_deadline_queue.pop_due(datetime.now(timezone.utc))
         try:
             await sweep_once()
         except asyncio.CancelledError:
             raise
         except Exception as exc:
             print(f"[Cards Deadlines] sweep error: {type(exc).__name__}: {exc}")
-        await asyncio.sleep(SWEEP_INTERVAL_SECONDS)
+        await cards_deadline_queue.wait_for_due(max_seconds=SWEEP_INTERVAL_SECONDS)
 
 
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
+@profile_hook
 async def on_bot_started(
     event: hikari.StartedEvent,
     bot: hikari.GatewayBot = lightbulb.di.INJECTED,
@@ -681,7 +863,8 @@ async def on_bot_started(
         print("[Cards Deadlines] sweep already running; start skipped")
         return
     sweep_task = asyncio.create_task(sweep_loop(), name="cards-deadlines")
-    print(f"[Cards Deadlines] sweeping every {SWEEP_INTERVAL_SECONDS // 60}m")
+    print(f"[Cards Deadlines] sweeping on deadline, safety net every "
+          f"{SWEEP_INTERVAL_SECONDS // 60}m")
 
 
 @loader.listener(hikari.StoppingEvent)
@@ -7,10 +7,11 @@ Three things have to be true before it moves. The notice has to be buried -
 reposting one that is already last marks the channel unread for no visible
 change. Enough time has to have passed since the last repost. And the channel
 has to have been quiet for a few minutes, because dropping the notice into a
-live conversation every ten minutes was worse than it being buried. The loop
-looks every minute so it can post shortly after people stop talking rather than
-on the next multiple of ten. It posts silently, so no repost ever notifies
-anyone.
+live conversation every ten minutes was worse than it being buried. Every
+message in the channel arrives over the gateway anyway, so the newest one is
+tracked in memory and the loop sleeps until exactly the moment both gates
+open, rather than asking Discord once a minute whether anyone has spoken. It
+posts silently, so no repost ever notifies anyone.
 """
 
 import asyncio
@@ -36,6 +37,7 @@ from utils import cards_config
 from utils.constants import BLUE_ACCENT
 from utils.emoji import emojis
 from utils.mongo import MongoClient
+from utils.startup import profile_hook
 
 loader = lightbulb.Loader()
 
@@ -45,9 +47,9 @@ loader = lightbulb.Loader()
 # The stored message id is keyed by channel, so if this resolves somewhere new
 # the old notice is cleaned up on the next cycle.
 STICKY_CHANNEL_ID = cards_config.cards_channel_id()
-# The shortest gap between two reposts. Not how often the loop looks: it wakes
-# every minute so that it can post soon after a conversation ends rather than
-# on the next interval boundary. Raised from 10 on 2026-08-17: the channel now
+# The shortest gap between two reposts. Not how often the loop looks: it is
+# armed for the moment the channel goes quiet, so that it can post soon after
+# a conversation ends rather than on the next interval boundary. Raised from 10 on 2026-08-17: the channel now
 # also carries every trade post, want-ad and spare board, so a notice that
 # reappeared every ten minutes was competing with the traffic it exists to
 # explain.
@@ -58,14 +60,29 @@ REPOST_INTERVAL_MINUTES = 30
 # the interval: with trades flowing through the same channel, five quiet
 # minutes no longer meant the conversation was over.
 QUIET_PERIOD_MINUTES = 10
-CHECK_INTERVAL_SECONDS = 60
+# The longest the loop sleeps without a pass. Gateway messages are the real
+# trigger; this pass re-reads the channel over REST, so a message missed while
+# the shard was reconnecting cannot leave the notice buried for good.
+SAFETY_NET_SECONDS = 15 * 60
+# A pass that fails leaves the gates exactly where they were, so the loop
+# would find the repost due again at once and spin on Mongo and REST. Each
+# failure in a row holds the next pass back twice as long as the last, from
+# RETRY_BASE_SECONDS up to the safety net.
+RETRY_BASE_SECONDS = 30
 CONFIG_ID = "cards_sticky_message"
+BANNER_CONFIG_ID = "cards_sticky_banner"
 
 COLLECTION_LINK = "https://link.clashofclans.com/en/?action=OpenCollection"
 
-# Re-uploaded on every repost, so it is stored at the size Discord actually
-# renders rather than the 1536px original: 157KB instead of 1.8MB.
+# Stored at the size Discord actually renders rather than the 1536px
+# original: 157KB instead of 1.8MB. With an asset channel configured it is
+# uploaded there once and every repost links to it; without one it is
+# re-uploaded with each repost.
 STICKY_BANNER = "assets/cards/sticky_banner.jpg"
+# Discord signs attachment URLs and they stop resolving after about a day, so
+# a linked banner is re-read from its hosting message - a fetch, not an
+# upload - well before that.
+BANNER_URL_MAX_AGE = timedelta(hours=12)
 
 # Who to ask about the command. Rendered as a mention so it is tappable, but
 # posted with user_mentions=False: this message reposts all day, and a real
@@ -124,8 +141,35 @@ sticky_task = None
 bot_instance = None
 mongo_client = None
 
+# Newest message id per channel, as seen on the gateway. Absent until the
+# first message or the first REST read, whichever comes first.
+_newest_seen: dict[int, int] = {}
+# Set by every message in the sticky channel, so the sleeping loop re-arms its
+# quiet timer from the new message.
+_activity: asyncio.Event | None = None
+# What the last pass learned about the standing notice: its id and when it
+# was posted. Lets the loop work out when the next repost can be due without
+# reading Mongo on every message. After a failed pass it also carries the
+# failure count and when the next attempt may run.
+_standing: dict = {}
+# The hosted banner URL and when it was last read from its message.
+_banner: dict = {}
+
+
+class _LinkedMediaItem(MediaItem):
+    """A gallery item that links to its media instead of uploading it.
+
+    hikari hands every gallery resource to the upload form, URLs included -
+    it downloads the URL and uploads the bytes again. Returning no resources
+    sends just the link, which is the whole point of hosting the banner.
+    """
+
+    def build(self):
+        payload, _resources = super().build()
+        return payload, ()
+
 
-def _sticky_components() -> list[Container]:
+def _sticky_components(banner: str = STICKY_BANNER) -> list[Container]:
     """The notice itself, as three numbered steps.
 
     Somebody read the previous version and still asked how to send a trade,
@@ -149,7 +193,11 @@ def _sticky_components() -> list[Container]:
             # Full width, above everything. An emoji cannot carry this art at
             # 22px, and the notice is the one place in the whole command where
             # the vertical space is worth spending.
-            Media(items=[MediaItem(media=STICKY_BANNER)]),
+            Media(items=[
+                MediaItem(media=banner)
+                if banner == STICKY_BANNER
+                else _LinkedMediaItem(media=banner)
+            ]),
             # No title here: the banner above already says CLASH OF CARDS, and
             # a heading repeating it put the same words on screen twice.
             Text(content=(
@@ -316,6 +364,9 @@ async def cards_help(ctx, action_id: str, **_kwargs) -> None:
 def _content_key() -> str:
     """Fingerprint of the wording, so a reworded notice can be spotted.
 
+    Always taken over the uploaded form of the banner: where the bytes come
+    from is not wording, and the hosted URL changes every time it is re-read.
+
     Burial is not the only reason to act. Without this, editing the text and
     restarting changed nothing in a quiet channel: the notice was still the
     newest message, so the burial check returned early and the old wording sat
@@ -350,7 +401,7 @@ async def _rewrite_in_place(
         await bot.rest.edit_message(
             channel=channel_id,
             message=message_id,
-            components=_sticky_components(),
+            components=_sticky_components(await _banner_media(bot)),
             user_mentions=False,
             role_mentions=False,
             mentions_everyone=False,
@@ -370,14 +421,32 @@ async def _stored_sticky(mongo: MongoClient) -> dict:
         return {}
 
 
-async def _newest_message_id(bot: hikari.GatewayBot, channel_id: int):
+def note_channel_message(channel_id: int, message_id: int) -> None:
+    """Record a message seen on the gateway; wakes the loop for its channel."""
+    channel_id, message_id = int(channel_id), int(message_id)
+    # Snowflakes only grow, so a late or replayed event cannot move this back.
+    if message_id > _newest_seen.get(channel_id, 0):
+        _newest_seen[channel_id] = message_id
+    if channel_id == int(STICKY_CHANNEL_ID) and _activity is not None:
+        _activity.set()
+
+
+async def _newest_message_id(
+    bot: hikari.GatewayBot, channel_id: int, *, reread: bool = False
+):
     """Newest message id, None when the channel is empty, UNKNOWN on failure.
 
+    The gateway answer when there is one. Discord is only asked when nothing
+    has been seen yet - straight after startup - or when ``reread`` is set for
+    the safety-net pass.
+
     Reads the channel rather than its messages. hikari's message iterator asks
     Discord for a 100-message page no matter what limit is applied afterwards,
     so `fetch_messages(...).limit(1)` downloads and deserializes a hundred
     messages every cycle to learn one snowflake.
     """
+    if not reread and channel_id in _newest_seen:
+        return _newest_seen[channel_id]
     try:
         channel = await bot.rest.fetch_channel(channel_id)
     except PERMANENT_DISCORD_ERRORS as exc:
@@ -387,7 +456,10 @@ async def _newest_message_id(bot: hikari.GatewayBot, channel_id: int):
         print(f"[Cards Sticky] channel fetch failed: {type(exc).__name__}: {exc}")
         return UNKNOWN
     latest = getattr(channel, "last_message_id", None)
-    return int(latest) if latest else None
+    if not latest:
+        return _newest_seen.get(channel_id)
+    note_channel_message(channel_id, int(latest))
+    return _newest_seen[channel_id]
 
 
 def _snowflake_time(value: object) -> datetime | None:
@@ -415,15 +487,57 @@ def _channel_is_quiet(newest: object, *, now: datetime) -> bool:
     return (now - spoke_at) >= timedelta(minutes=QUIET_PERIOD_MINUTES)
 
 
-def _interval_elapsed(stored: dict, *, now: datetime) -> bool:
-    """Whether enough time has passed since the notice was last posted."""
+def _repost_allowed_at(stored: dict) -> datetime | None:
+    """When the interval gate opens; None when it already stands open."""
     posted_at = stored.get("posted_at")
     if not isinstance(posted_at, datetime):
         # Never posted, or a document written before this field existed.
-        return True
+        return None
     if posted_at.tzinfo is None:
         posted_at = posted_at.replace(tzinfo=timezone.utc)
-    return (now - posted_at) >= timedelta(minutes=REPOST_INTERVAL_MINUTES)
+    return posted_at + timedelta(minutes=REPOST_INTERVAL_MINUTES)
+
+
+def _interval_elapsed(stored: dict, *, now: datetime) -> bool:
+    """Whether enough time has passed since the notice was last posted."""
+    allowed_at = _repost_allowed_at(stored)
+    return allowed_at is None or now >= allowed_at
+
+
+def _seconds_until_due(*, now: datetime) -> float:
+    """How long the loop can sleep before a repost could be due.
+
+    Nothing is due while the notice is still the newest message, so that
+    sleeps the full safety net. Otherwise it is the later of the two gates:
+    quiet for QUIET_PERIOD_MINUTES after the newest message, and the repost
+    interval since the last post.
+    """
+    newest = _newest_seen.get(int(STICKY_CHANNEL_ID))
+    if newest is None or newest == _standing.get("message_id"):
+        return SAFETY_NET_SECONDS
+    due = now
+    spoke_at = _snowflake_time(newest)
+    if spoke_at is not None:
+        due = max(due, spoke_at + timedelta(minutes=QUIET_PERIOD_MINUTES))
+    allowed_at = _standing.get("allowed_at")
+    if allowed_at is not None:
+        due = max(due, allowed_at)
+    retry_at = _standing.get("retry_at")
+    if retry_at is not None:
+        due = max(due, retry_at)
+    return min(max((due - now).total_seconds(), 0.0), SAFETY_NET_SECONDS)
+
+
+def _back_off(*, now: datetime) -> None:
+    """Hold the next pass back after one that failed."""
+    failures = _standing.get("failures", 0) + 1
+    delay = min(RETRY_BASE_SECONDS * 2 ** (failures - 1), SAFETY_NET_SECONDS)
+    _standing.update(failures=failures, retry_at=now + timedelta(seconds=delay))
+
+
+def _recovered() -> None:
+    _standing.pop("failures", None)
+    _standing.pop("retry_at", None)
 
 
 async def _delete_previous(
@@ -447,8 +561,66 @@ async def _delete_previous(
     return True
 
 
-async def refresh_sticky() -> None:
-    """Move the notice back to the bottom, if something has been said under it."""
+async def _banner_media(bot: hikari.GatewayBot) -> str:
+    """The banner as a hosted URL, or the local file when there is none.
+
+    The first call with an asset channel configured uploads the file there
+    once and records the hosting message. After that the URL is re-read from
+    that message when it gets old, which costs a fetch and no upload. Any
+    failure falls back to the file, so the notice always has its banner.
+    """
+    asset_channel = cards_config.cards_asset_channel_id()
+    if not asset_channel or not mongo_client:
+        return STICKY_BANNER
+    now = datetime.now(timezone.utc)
+    if _banner.get("url") and now - _banner["read_at"] < BANNER_URL_MAX_AGE:
+        return _banner["url"]
+    try:
+        host = await mongo_client.bot_config.find_one(
+            {"_id": BANNER_CONFIG_ID}
+        ) or {}
+        message = None
+        if (
+            host.get("message_id")
+            and int(host.get("channel_id") or 0) == int(asset_channel)
+        ):
+            try:
+                message = await bot.rest.fetch_message(
+                    asset_channel, int(host["message_id"])
+                )
+            except hikari.NotFoundError:
+                message = None     # somebody deleted it; upload a new one
+        if message is None:
+            message = await bot.rest.create_message(
+                channel=asset_channel,
+                content="Cards sticky banner - linked from the notice, "
+                        "please keep.",
+                attachment=STICKY_BANNER,
+            )
+            await mongo_client.bot_config.update_one(
+                {"_id": BANNER_CONFIG_ID},
+                {"$set": {
+                    "channel_id": int(asset_channel),
+                    "message_id": int(message.id),
+                }},
+                upsert=True,
+            )
+            print(f"[Cards Sticky] banner uploaded to #{asset_channel}")
+        url = str(message.attachments[0].url)
+    except Exception as exc:
+        print(f"[Cards Sticky] banner link unavailable, uploading instead: "
+              f"{type(exc).__name__}: {exc}")
+        return STICKY_BANNER
+    _banner.update(url=url, read_at=now)
+    return url
+
+
+async def refresh_sticky(*, reread: bool = False) -> None:
+    """Move the notice back to the bottom, if something has been said under it.
+
+    ``reread`` asks Discord for the newest message instead of trusting the
+    gateway's answer; the loop sets it on its safety-net pass.
+    """
     if not bot_instance or not mongo_client:
         print("[Cards Sticky] bot or MongoDB not initialized")
         return
@@ -458,12 +630,17 @@ async def refresh_sticky() -> None:
     previous_id = stored.get("message_id")
     previous_channel = stored.get("channel_id")
     owed = [int(value) for value in (stored.get("pending_deletes") or ())]
+    _standing.update(
+        message_id=int(previous_id) if previous_id else None,
+        allowed_at=_repost_allowed_at(stored),
+    )
 
-    newest = await _newest_message_id(bot_instance, channel_id)
+    newest = await _newest_message_id(bot_instance, channel_id, reread=reread)
     if newest is UNKNOWN:
         # Do not repost on a guess. If the channel cannot be read, posting
         # into it is unlikely to work either, and a wrong guess repeats
         # every cycle for as long as the failure lasts.
+        _back_off(now=datetime.now(timezone.utc))
         return
 
     if previous_id and int(previous_channel or 0) == channel_id:
@@ -476,6 +653,7 @@ async def refresh_sticky() -> None:
                     bot_instance, channel_id, int(previous_id)
                 ):
                     await _remember_content_key(_content_key())
+            _recovered()
             await _drain_pending(owed, channel_id)
             return
 
@@ -483,8 +661,8 @@ async def refresh_sticky() -> None:
     # timer dropped the notice into the middle of whatever people were saying,
     # over and over, for as long as they kept talking. Both gates have to be
     # open: long enough since the last post, and long enough since anyone
-    # spoke. The loop looks every minute, so the notice lands shortly after a
-    # conversation ends rather than in the middle of the next one.
+    # spoke. The loop is armed for the moment both open, so the notice lands
+    # shortly after a conversation ends rather than in the middle of the next.
     now = datetime.now(timezone.utc)
     if not _interval_elapsed(stored, now=now):
         return
@@ -494,7 +672,7 @@ async def refresh_sticky() -> None:
     try:
         message = await bot_instance.rest.create_message(
             channel=channel_id,
-            components=_sticky_components(),
+            components=_sticky_components(await _banner_media(bot_instance)),
             # Two separate controls, both needed. allowed_mentions below stops
             # the support mention pinging that one person; SUPPRESS_NOTIFICATIONS
             # is the "silent message" flag, which stops the post itself
@@ -511,9 +689,11 @@ async def refresh_sticky() -> None:
     except PERMANENT_DISCORD_ERRORS as exc:
         print(f"[Cards Sticky] cannot post in #{channel_id}: "
               f"{type(exc).__name__}: {exc}")
+        _back_off(now=now)
         return
     except Exception as exc:
         print(f"[Cards Sticky] post failed: {type(exc).__name__}: {exc}")
+        _back_off(now=now)
         return
 
     # Record the new message, and hand the old one over as owed work, in the
@@ -522,13 +702,20 @@ async def refresh_sticky() -> None:
     if previous_id:
         owed.append(int(previous_id))
     owed = owed[-MAX_PENDING_DELETES:]
+    posted_at = datetime.now(timezone.utc)
+    _recovered()
+    _standing.update(
+        message_id=int(message.id),
+        allowed_at=_repost_allowed_at({"posted_at": posted_at}),
+    )
+    note_channel_message(channel_id, int(message.id))
     try:
         await mongo_client.bot_config.update_one(
             {"_id": CONFIG_ID},
             {"$set": {
                 "channel_id": channel_id,
                 "message_id": int(message.id),
-                "posted_at": datetime.now(timezone.utc),
+                "posted_at": posted_at,
                 "pending_deletes": owed,
                 "content_key": _content_key(),
             }},
@@ -568,19 +755,52 @@ async def _drain_pending(owed: list[int], channel_id: int) -> None:
         print(f"[Cards Sticky] pending write failed: {type(exc).__name__}: {exc}")
 
 
+async def _wait_for_due() -> bool:
+    """Sleep until a repost could be due; True when it was the safety net.
+
+    Each message in the channel wakes the wait only to re-arm it from the new
+    message, so a conversation pushes the pass back instead of running one.
+    """
+    global _activity
+    if _activity is None:
+        _activity = asyncio.Event()
+    started = asyncio.get_running_loop().time()
+    while True:
+        delay = _seconds_until_due(now=datetime.now(timezone.utc))
+        elapsed = asyncio.get_running_loop().time() - started
+        if elapsed >= SAFETY_NET_SECONDS:
+            return True
+        delay = min(delay, SAFETY_NET_SECONDS - elapsed)
+        _activity.clear()
+        try:
+            await asyncio.wait_for(_activity.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            return delay >= SAFETY_NET_SECONDS - elapsed
+
+
 async def sticky_loop() -> None:
+    reread = False
     while True:
         try:
-            await refresh_sticky()
+            await refresh_sticky(reread=reread)
         except asyncio.CancelledError:
             raise
         except Exception as exc:
             print(f"[Cards Sticky] loop error: {type(exc).__name__}: {exc}")
-        await asyncio.sleep(CHECK_INTERVAL_SECONDS)
+            _back_off(now=datetime.now(timezone.utc))
+        reread = await _wait_for_due()
+
+
+@loader.listener(hikari.GuildMessageCreateEvent)
+async def on_cards_channel_message(event: hikari.GuildMessageCreateEvent) -> None:
+    """Feed the quiet timer; answers nothing and costs no API call."""
+    if int(event.channel_id) == int(STICKY_CHANNEL_ID):
+        note_channel_message(event.channel_id, event.message_id)
 
 
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
+@profile_hook
 async def on_bot_started(
     event: hikari.StartedEvent,
     bot: hikari.GatewayBot = lightbulb.di.INJECTED,
@@ -598,10 +818,10 @@ async def on_bot_started(
         return
     await _learn_cards_mention(bot)
     sticky_task = asyncio.create_task(sticky_loop(), name="cards-sticky")
-    print(f"[Cards Sticky] task started for #{STICKY_CHANNEL_ID}: checks "
-          f"every {CHECK_INTERVAL_SECONDS}s, reposts at most every "
-          f"{REPOST_INTERVAL_MINUTES}m and only after "
-          f"{QUIET_PERIOD_MINUTES}m of quiet")
+    print(f"[Cards Sticky] task started for #{STICKY_CHANNEL_ID}: reposts at "
+          f"most every {REPOST_INTERVAL_MINUTES}m and only after "
+          f"{QUIET_PERIOD_MINUTES}m of quiet, re-reading the channel every "
+          f"{SAFETY_NET_SECONDS // 60}m")
 
 
 @loader.listener(hikari.StoppingEvent)
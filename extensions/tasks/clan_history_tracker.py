@@ -21,9 +21,10 @@ import coc
 import hikari
 import lightbulb
 
-from utils import clan_history, todo_data
+from utils import clan_history, coc_models, todo_data
 from utils.clash_links import resolve_family_linked_tags
 from utils.mongo import MongoClient
+from utils.startup import profile_hook
 
 
 loader = lightbulb.Loader()
@@ -153,11 +154,16 @@ async def run_scan(mongo: MongoClient, coc_client: coc.Client) -> dict[str, int]
         }
         clan_metadata[clan.tag.upper()] = (getattr(clan, "name", None), _badge(clan))
 
-    previous_rosters = await clan_history.load_roster_snapshots(
-        mongo, current_rosters
+    # Unchanged rosters (same member fingerprint as the last durable snapshot)
+    # skip diffing and writing; Mongo is read only after a restart or mismatch.
+    roster_diff = await clan_history.diff_rosters(
+        mongo, current_rosters, observed_at=now
     )
+    previous_rosters = roster_diff.previous
     changed_roster_tags: set[tuple[str, str]] = set()
     for clan_tag, members in current_rosters.items():
+        if clan_tag in roster_diff.unchanged:
+            continue
         previous = previous_rosters.get(clan_tag)
         changed = members if previous is None else members.symmetric_difference(previous)
         changed_roster_tags.update((player_tag, clan_tag) for player_tag in changed)
@@ -189,14 +195,14 @@ async def run_scan(mongo: MongoClient, coc_client: coc.Client) -> dict[str, int]
             "link_retry_count": 0,
         }
 
+    # Presence, war-roster and snapshot writes are buffered for the whole scan
+    # and flushed once at the end: one unordered bulk_write per collection.
+    writes = clan_history.ScanWriteBuffer()
+
     # Do not advance roster snapshots past a departure we failed to queue;
     # leaving the prior snapshot intact makes the next scan detect it again.
-    snapshot_write = (
-        asyncio.create_task(clan_history.save_roster_snapshots(
-            mongo, current_rosters, observed_at=now
-        ))
-        if queue_ok else None
-    )
+    if queue_ok:
+        writes.add_roster_snapshots(roster_diff.to_write, observed_at=now)
 
     due_expansions = sorted(
         (
@@ -275,7 +281,7 @@ async def run_scan(mongo: MongoClient, coc_client: coc.Client) -> dict[str, int]
             presence = _player_presence(player)
             if presence is not None:
                 presences.append(presence)
-    await clan_history.record_presence(mongo, presences, observed_at=now)
+    writes.add_presence(presences, observed_at=now)
 
     war_roster: list[clan_history.ClanPresence] = []
     for clan_tag, result in zip(clan_tags, wars):
@@ -289,8 +295,7 @@ async def run_scan(mongo: MongoClient, coc_client: coc.Client) -> dict[str, int]
         if clan_roster:
             # Each clan's roster expires with its own war. Using one maximum end
             # across every clan kept earlier wars falsely active.
-            await clan_history.record_active_war_roster(
-                mongo,
+            writes.add_war_roster(
                 clan_roster,
                 kind="war",
                 active_until=_war_end(war, now + timedelta(days=2)),
@@ -309,15 +314,16 @@ async def run_scan(mongo: MongoClient, coc_client: coc.Client) -> dict[str, int]
         clan_roster = _war_roster(war, clan_tag)
         cwl_roster.extend(clan_roster)
         if clan_roster:
-            await clan_history.record_active_war_roster(
-                mongo,
+            writes.add_war_roster(
                 clan_roster,
                 kind="cwl",
                 active_until=_war_end(war, now + timedelta(days=2)),
                 observed_at=now,
             )
-    if snapshot_write is not None:
-        await snapshot_write
+    write_ops = writes.pending()
+    await writes.flush(mongo)
+    if queue_ok and "clan_roster_snapshots" not in writes.failed:
+        clan_history.remember_rosters(roster_diff.to_write, observed_at=now)
 
     return {
         "clans": len(clan_tags),
@@ -325,12 +331,16 @@ async def run_scan(mongo: MongoClient, coc_client: coc.Client) -> dict[str, int]
         "cwl_active": active_cwl_clans,
         "family_players": len(set(family_roster_tags)),
         "roster_changes": len(changed_roster_tags),
+        "rosters_unchanged": len(roster_diff.unchanged),
+        "roster_reads": roster_diff.mongo_reads,
         "departed_players": len(departed_tags),
         "movement_players": len(movement_watches),
         "watched_players": len(watched_tags),
         "presences": len(presences),
         "war_roster": len(war_roster),
         "cwl_roster": len(cwl_roster),
+        "write_ops": write_ops,
+        "write_ms": round(writes.elapsed_seconds * 1000),
     }
 
 
@@ -341,6 +351,7 @@ async def tracker_loop(mongo: MongoClient, coc_client: coc.Client) -> None:
             print("[clan-history] scan complete " + " ".join(
                 f"{key}={value}" for key, value in counts.items()
             ))
+            print(f"[clan-history] coc models reused unchanged {coc_models.summary()}")
         except asyncio.CancelledError:
             raise
         except Exception as exc:  # noqa: BLE001 - retry on the next interval
@@ -350,6 +361,7 @@ async def tracker_loop(mongo: MongoClient, coc_client: coc.Client) -> None:
 
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
+@profile_hook
 async def on_bot_started(
     event: hikari.StartedEvent,
     mongo: MongoClient = lightbulb.di.INJECTED,
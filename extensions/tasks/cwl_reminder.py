@@ -20,6 +20,7 @@ from hikari.impl import (
 from utils.mongo import MongoClient
 from utils.startup_reconciler import StartupReconciler
 from utils.constants import GOLDENROD_ACCENT, GREEN_ACCENT, RED_ACCENT, BLUE_ACCENT
+from utils.startup import profile_hook
 
 loader = lightbulb.Loader()
 
@@ -588,27 +589,46 @@ async def send_cwl_reminder(
             if key in PRODUCTION_CHANNELS
         ]
 
-    failures: list[tuple[str, Exception]] = []
-    for channel_info in channels:
+    # Every channel of one type gets the same components, so each type is
+    # built once and the sends go out together: the last channel is pinged one
+    # round trip after the first, and a slow channel holds up nobody else.
+    payloads: dict[str, list[Container] | Exception] = {}
+    for channel_type in dict.fromkeys(channel["type"] for channel in channels):
         try:
-            components = create_cwl_reminder_message(reminder_number, channel_info["type"])
+            payloads[channel_type] = create_cwl_reminder_message(reminder_number, channel_type)
+        except Exception as exc:
+            payloads[channel_type] = exc
+
+    async def deliver(channel_info: dict) -> Exception | None:
+        try:
+            components = payloads[channel_info["type"]]
+            if isinstance(components, Exception):
+                raise components
             await bot_instance.rest.create_message(
                 channel=channel_info["id"],
                 components=components,
                 role_mentions=[ROLE_TO_PING],
             )
-            print(
-                f"[CWL Reminder] Sent {reminder_type} reminder to "
-                f"{channel_info['name']} channel at {datetime.now()}"
-            )
         except Exception as exc:
-            failures.append((channel_info["key"], exc))
             print(
                 f"[CWL Reminder] delivery_failed reminder={reminder_number} "
                 f"channel={channel_info['key']} channel_id={channel_info['id']} "
                 f"error={type(exc).__name__} retryable={str(not _is_permanent_delivery_error(exc)).lower()} "
                 f"detail={_delivery_error_detail(exc)}"
             )
+            return exc
+        print(
+            f"[CWL Reminder] Sent {reminder_type} reminder to "
+            f"{channel_info['name']} channel at {datetime.now()}"
+        )
+        return None
+
+    outcomes = await asyncio.gather(*(deliver(channel) for channel in channels))
+    failures: list[tuple[str, Exception]] = [
+        (channel["key"], exc)
+        for channel, exc in zip(channels, outcomes)
+        if exc is not None
+    ]
 
     # Tests are deliberately delivery-only. They never update the schedule,
     # pending reminders, or the production APScheduler.
@@ -945,6 +965,7 @@ async def _reconcile_cwl_startup() -> None:
 
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
+@profile_hook
 async def on_bot_started(
     event: hikari.StartedEvent,
     mongo: MongoClient = lightbulb.di.INJECTED
@@ -14,6 +14,7 @@
 
 import asyncio
 import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 
 import aiohttp
@@ -25,6 +26,7 @@ from utils import coc_maintenance
 from utils.mongo import MongoClient
 from utils.fwa_points_parser import parse_clan_points, sanitize_tag, is_newer_war, FwaPointsParseError
 from utils.startup_reconciler import StartupReconciler
+from utils.startup import profile_hook
 
 loader = lightbulb.Loader()
 
@@ -35,6 +37,8 @@ GIVE_UP_SECONDS = 45 * 60             # bounded catch-up deadline
 MAX_CONSECUTIVE_FAILURES = 5          # stop early if the SITE is down (~10 min) vs merely stale
 FAILURE_COOLDOWN_SECONDS = GIVE_UP_SECONDS  # do not launch another retry burst for this same war immediately
 HTTP_TIMEOUT_SECONDS = 20
+SWEEP_CONCURRENCY = 8                 # war lookups in flight at once during one detector sweep
+WAR_LOOKUP_TIMEOUT_SECONDS = 15       # per-clan deadline; a slow proxy reply skips only that clan
 LOG_CHANNEL_ID = 947166650321494067
 POINTS_URL = "https://points.fwafarm.com/clan?tag={tag}"
 
@@ -62,6 +66,7 @@ coc_client = None
 detector_task = None
 startup_reconciler = None
 active_catchups = {}   # our_tag -> asyncio.Task
+last_sweep = None      # SweepStats of the most recent detector sweep, for /fwapoints status
 
 
 # ---- Config helpers ----
@@ -333,33 +338,102 @@ async def run_catchup(clan_entry, coc_opponent_tag, war_key):
 
 
 # ---- Detector loop (CoC only, cheap) ----
+@dataclass
+class SweepStats:
+    started_at: datetime
+    duration_seconds: float = 0.0
+    clans: int = 0
+    timed_out: list = field(default_factory=list)
+    started_catchups: list = field(default_factory=list)
+    latencies: dict = field(default_factory=dict)   # our_tag -> seconds for the war lookup
+
+    def summary(self):
+        slowest = max(self.latencies.items(), key=lambda item: item[1], default=None)
+        slow_text = f", slowest {slowest[0]} {slowest[1]:.2f}s" if slowest else ""
+        return (
+            f"{self.clans} clan(s) in {self.duration_seconds:.2f}s{slow_text}, "
+            f"{len(self.timed_out)} timed out, {len(self.started_catchups)} catch-up(s) started"
+        )
+
+
+async def _timed_war_lookup(our_tag, semaphore, stats):
+    """Run one war lookup under the sweep semaphore and its own deadline.
+
+    A timeout is treated exactly like an API error: the clan is skipped for this
+    cycle and picked up again on the next one.
+    """
+    async with semaphore:
+        started = time.monotonic()
+        try:
+            return await asyncio.wait_for(
+                get_current_war_info(our_tag), timeout=WAR_LOOKUP_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            stats.timed_out.append(our_tag)
+            print(f"[FWA Points] {our_tag}: war lookup exceeded {WAR_LOOKUP_TIMEOUT_SECONDS}s, retry next cycle")
+            return None
+        finally:
+            stats.latencies[our_tag] = time.monotonic() - started
+
+
+async def sweep_watch_list(watch_list):
+    """Check every watched clan once and start catch-ups for new wars.
+
+    War lookups fan out concurrently (bounded by SWEEP_CONCURRENCY), and every
+    stored record is read with a single ``$in`` query instead of one find_one per
+    clan, so a sweep costs roughly one request latency regardless of list size.
+    """
+    stats = SweepStats(started_at=datetime.now(timezone.utc))
+    started = time.monotonic()
+
+    clans = {}
+    for clan in watch_list:
+        our_tag = sanitize_tag(clan.get("tag", ""))
+        if not our_tag or our_tag in clans:
+            continue
+        existing = active_catchups.get(our_tag)
+        if existing and not existing.done():
+            continue
+        clans[our_tag] = clan
+    stats.clans = len(clans)
+
+    if clans:
+        semaphore = asyncio.Semaphore(SWEEP_CONCURRENCY)
+        tags = list(clans)
+        infos = await asyncio.gather(
+            *(_timed_war_lookup(tag, semaphore, stats) for tag in tags)
+        )
+        at_war = {tag: info for tag, info in zip(tags, infos) if info is not None}
+        records = {}
+        if at_war:
+            async for rec in mongo_client.fwa_points.find({"_id": {"$in": list(at_war)}}):
+                records[rec["_id"]] = rec
+        for our_tag, (_state, coc_opp, war_key) in at_war.items():
+            rec = records.get(our_tag)
+            if rec and rec.get("status") == "caught_up" and rec.get("coc_war_key") == war_key:
+                continue   # already have this exact war's verdict
+            if retry_is_deferred(rec, war_key):
+                continue   # same failed war is cooling down; a new war key bypasses this
+            task = asyncio.create_task(
+                run_catchup(clans[our_tag], coc_opp, war_key),
+                name=f"fwa-points-catchup:{our_tag}",
+            )
+            active_catchups[our_tag] = task
+            stats.started_catchups.append(our_tag)
+
+    stats.duration_seconds = time.monotonic() - started
+    return stats
+
+
 async def detector_loop():
+    global last_sweep
     print("[FWA Points] Detector loop started")
     while True:
         try:
             config = await load_config()
             if config["enabled"]:
-                for clan in config["watch_list"]:
-                    our_tag = sanitize_tag(clan.get("tag", ""))
-                    if not our_tag:
-                        continue
-                    existing = active_catchups.get(our_tag)
-                    if existing and not existing.done():
-                        continue
-                    info = await get_current_war_info(our_tag)
-                    if info is None:
-                        continue
-                    _state, coc_opp, war_key = info
-                    rec = await mongo_client.fwa_points.find_one({"_id": our_tag})
-                    if rec and rec.get("status") == "caught_up" and rec.get("coc_war_key") == war_key:
-                        continue   # already have this exact war's verdict
-                    if retry_is_deferred(rec, war_key):
-                        continue   # same failed war is cooling down; a new war key bypasses this
-                    task = asyncio.create_task(
-                        run_catchup(clan, coc_opp, war_key),
-                        name=f"fwa-points-catchup:{our_tag}",
-                    )
-                    active_catchups[our_tag] = task
+                last_sweep = await sweep_watch_list(config["watch_list"])
+                print(f"[FWA Points] Sweep: {last_sweep.summary()}")
         except Exception as e:
             print(f"[FWA Points] Detector loop error: {type(e).__name__}: {e}")
         await asyncio.sleep(DETECTOR_INTERVAL_SECONDS)
@@ -387,6 +461,7 @@ async def _reconcile_points_startup() -> None:
 
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
+@profile_hook
 async def on_bot_started(event: hikari.StartedEvent,
                          mongo: MongoClient = lightbulb.di.INJECTED,
                          coc_api: coc.Client = lightbulb.di.INJECTED) -> None:
@@ -525,7 +600,10 @@ class Status(lightbulb.SlashCommand, name="status", description="Show monitor st
         lines = [f"**Enabled:** {'yes' if config['enabled'] else 'no'}",
                  f"**Detector:** {'✅ Running' if detector_running else '❌ Not running'}",
                  f"**Startup recovery:** {recovery_status}",
-                 f"**Active retries:** {active}", "**Watch list:**"]
+                 f"**Active retries:** {active}"]
+        if last_sweep is not None:
+            lines.append(f"**Last sweep:** {last_sweep.summary()}")
+        lines.append("**Watch list:**")
         if not config["watch_list"]:
             lines.append("_(empty)_")
         for clan in config["watch_list"]:
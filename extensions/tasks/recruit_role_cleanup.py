@@ -9,6 +9,7 @@ from datetime import datetime, timedelta, timezone
 from utils.mongo import MongoClient
 import time
 from pymongo import ReturnDocument
+from utils.startup import profile_hook
 
 loader = lightbulb.Loader()
 
@@ -16,8 +17,14 @@ loader = lightbulb.Loader()
 NEW_RECRUIT_ROLE_ID = 779277305671319572
 CHECK_INTERVAL_MINUTES = 30  # Check every 30 minutes (reduced from 5 to avoid rate limits)
 ROLE_REMOVAL_HOURS = 2  # Remove role after 2 hours
-MAX_BATCH_SIZE = 20  # Maximum number of roles to remove in one batch to avoid rate limits
+MAX_BATCH_SIZE = 100  # Due rows read per page
+MAX_PAGES_PER_CYCLE = 20
+# Members cleaned at once. Pacing itself is hikari's: every call waits on its
+# route's rate-limit bucket, so this only bounds how many are queued there.
+REMOVAL_CONCURRENCY = 4
 LEASE_DURATION = timedelta(minutes=10)
+# Stop starting pages well inside the lease, so no claimed row outlives it.
+CYCLE_BUDGET = timedelta(minutes=8)
 RETRY_DELAYS = (
     timedelta(hours=1),
     timedelta(hours=3),
@@ -111,173 +118,188 @@ async def _record_cleanup_failure(collection, walkthrough, stage, exc, now):
     return terminal_reason is not None
 
 
+def _due_filter(now: datetime) -> dict:
+    """Rows nobody holds a lease on and whose retry backoff has passed."""
+    return {
+        "new_recruit_role_removed": False,
+        "cleanup_terminal": {"$ne": True},
+        "$and": [
+            {"$or": [
+                {"cleanup_next_attempt_at": {"$exists": False}},
+                {"cleanup_next_attempt_at": {"$lte": now}},
+            ]},
+            {"$or": [
+                {"cleanup_lease_until": {"$exists": False}},
+                {"cleanup_lease_until": {"$lte": now}},
+            ]},
+        ],
+    }
+
+
+async def _mark_done(collection, rows, status, now) -> None:
+    for row in rows:
+        await collection.update_one(
+            {"_id": row["_id"]},
+            {
+                "$set": {
+                    "new_recruit_role_removed": True,
+                    "cleanup_status": status,
+                    "cleanup_completed_at": now,
+                },
+                "$unset": {
+                    "cleanup_lease_until": "",
+                    "cleanup_next_attempt_at": "",
+                },
+            },
+        )
+
+
+async def _clean_member(guild_id, user_id, rows, now, tally: dict) -> None:
+    """Every due walkthrough for one member, for at most one role removal.
+
+    A member who restarted the walkthrough has several rows; they share the one
+    Discord call. A failure is recorded against each row claimed here, so each
+    keeps its own backoff exactly as before.
+    """
+    collection = mongo_client.recruit_onboarding
+    claimed = []
+    for row in rows:
+        won = await collection.find_one_and_update(
+            {"_id": row["_id"], **_due_filter(now)},
+            {"$set": {"cleanup_lease_until": now + LEASE_DURATION}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if won:
+            claimed.append(won)
+    if not claimed:
+        return
+
+    guild = bot_instance.cache.get_guild(guild_id)
+    member = guild.get_member(user_id) if guild else None
+    stage = "member_fetch"
+    try:
+        if not member:
+            tally["api_calls"] += 1
+            try:
+                member = await bot_instance.rest.fetch_member(guild_id, user_id)
+            except hikari.NotFoundError:
+                await _mark_done(collection, claimed, "member_left_guild", now)
+                tally["processed"] += len(claimed)
+                return
+
+        stage = "role_removal"
+        if NEW_RECRUIT_ROLE_ID in member.role_ids:
+            tally["api_calls"] += 1
+            await bot_instance.rest.remove_role_from_member(
+                guild_id,
+                user_id,
+                NEW_RECRUIT_ROLE_ID,
+                reason="Auto-removal after 2 hours from walkthrough start",
+            )
+            print(f"[Recruit Role Cleanup] Removed New Recruit role from "
+                  f"{member.display_name} ({user_id})")
+    except hikari.RateLimitTooLongError:
+        # Not this member's fault. Their leases lapse and the next cycle
+        # retries them without spending a failure.
+        raise
+    except Exception as e:
+        for row in claimed:
+            await _record_cleanup_failure(collection, row, stage, e, now)
+        return
+
+    await _mark_done(collection, claimed, "complete", now)
+    tally["processed"] += len(claimed)
+
+
 async def remove_expired_recruit_roles():
-    """Check for expired new recruit roles and remove them"""
+    """Check for expired new recruit roles and remove them.
+
+    Due rows are read a page at a time and grouped by member, and members are
+    cleaned REMOVAL_CONCURRENCY at a time until the backlog or CYCLE_BUDGET runs
+    out. There are no fixed sleeps: hikari queues each call behind its route's
+    rate-limit bucket using the limits Discord reports, so the pace is whatever
+    Discord allows. A wait longer than hikari will sit through ends the cycle.
+    """
     if not bot_instance or not mongo_client:
         print("[Recruit Role Cleanup] Bot or MongoDB not initialized")
         return
-    
+
     start_time = time.time()
     print(f"[Recruit Role Cleanup] Starting cleanup check at {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}")
-    
+
+    tally = {"found": 0, "processed": 0, "api_calls": 0}
+    gate = asyncio.Semaphore(REMOVAL_CONCURRENCY)
+
+    halted = asyncio.Event()
+
+    async def limited(guild_id, user_id, rows, now):
+        async with gate:
+            if halted.is_set():
+                return
+            try:
+                await _clean_member(guild_id, user_id, rows, now, tally)
+            except hikari.RateLimitTooLongError:
+                halted.set()   # queued members wait for the next check
+                raise
+
     try:
-        # Calculate the cutoff time (2 hours ago)
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=ROLE_REMOVAL_HOURS)
-        
-        now = datetime.now(timezone.utc)
-        # Failed rows are deferred before the next scan, so a poison row cannot
-        # permanently occupy one of the first 20 slots and starve later recruits.
-        query = {
-            "walkthrough_started_at": {"$lt": cutoff_time},
-            "new_recruit_role_removed": False,
-            "cleanup_terminal": {"$ne": True},
-            "$and": [
-                {"$or": [
-                    {"cleanup_next_attempt_at": {"$exists": False}},
-                    {"cleanup_next_attempt_at": {"$lte": now}},
-                ]},
-                {"$or": [
-                    {"cleanup_lease_until": {"$exists": False}},
-                    {"cleanup_lease_until": {"$lte": now}},
-                ]},
-            ],
-        }
-        cursor = mongo_client.recruit_onboarding.find(query).sort(
-            "walkthrough_started_at", 1
-        ).limit(MAX_BATCH_SIZE)
-        expired_walkthroughs = await cursor.to_list(length=MAX_BATCH_SIZE)
-        
-        print(f"[Recruit Role Cleanup] Found {len(expired_walkthroughs)} expired walkthroughs")
-        
-        if len(expired_walkthroughs) == 0:
-            print(f"[Recruit Role Cleanup] No expired walkthroughs to process. Check completed in {time.time() - start_time:.2f}s")
-            return
-        
-        processed = 0
-        api_calls = 0
-        
-        for i, walkthrough in enumerate(expired_walkthroughs):
-            user_id = walkthrough.get("user_id")
-            guild_id = walkthrough.get("guild_id")
-            
-            if not user_id or not guild_id:
-                await mongo_client.recruit_onboarding.update_one(
-                    {"_id": walkthrough["_id"]},
-                    {"$set": {
-                        "new_recruit_role_removed": True,
-                        "cleanup_status": "invalid_record",
-                        "cleanup_completed_at": now,
-                    }},
-                )
-                processed += 1
-                continue
-
-            claimed = await mongo_client.recruit_onboarding.find_one_and_update(
-                {
-                    "_id": walkthrough["_id"],
-                    "new_recruit_role_removed": False,
-                    "cleanup_terminal": {"$ne": True},
-                    "$and": [
-                        {"$or": [
-                            {"cleanup_next_attempt_at": {"$exists": False}},
-                            {"cleanup_next_attempt_at": {"$lte": now}},
-                        ]},
-                        {"$or": [
-                            {"cleanup_lease_until": {"$exists": False}},
-                            {"cleanup_lease_until": {"$lte": now}},
-                        ]},
-                    ],
-                },
-                {"$set": {"cleanup_lease_until": now + LEASE_DURATION}},
-                return_document=ReturnDocument.AFTER,
-            )
-            if not claimed:
-                continue
-            
-            # Add delay between processing to avoid rate limits
-            if i > 0 and i % 5 == 0:
-                print(f"[Recruit Role Cleanup] Processed {i}/{len(expired_walkthroughs)}, adding 2s delay to avoid rate limits")
-                await asyncio.sleep(2)
-            
-            # Get guild and member
-            guild = bot_instance.cache.get_guild(guild_id)
-            member = guild.get_member(user_id) if guild else None
-            if not member:
-                try:
-                    api_calls += 1
-                    member = await bot_instance.rest.fetch_member(guild_id, user_id)
-                except hikari.NotFoundError:
+        for _ in range(MAX_PAGES_PER_CYCLE):
+            now = datetime.now(timezone.utc)
+            cutoff_time = now - timedelta(hours=ROLE_REMOVAL_HOURS)
+            # Failed rows are deferred before the next scan, so a poison row
+            # cannot keep a place in every page and starve later recruits.
+            cursor = mongo_client.recruit_onboarding.find({
+                "walkthrough_started_at": {"$lt": cutoff_time},
+                **_due_filter(now),
+            }).sort("walkthrough_started_at", 1).limit(MAX_BATCH_SIZE)
+            expired_walkthroughs = await cursor.to_list(length=MAX_BATCH_SIZE)
+            tally["found"] += len(expired_walkthroughs)
+
+            by_member: dict[tuple, list] = {}
+            for walkthrough in expired_walkthroughs:
+                user_id = walkthrough.get("user_id")
+                guild_id = walkthrough.get("guild_id")
+                if not user_id or not guild_id:
                     await mongo_client.recruit_onboarding.update_one(
                         {"_id": walkthrough["_id"]},
                         {"$set": {
                             "new_recruit_role_removed": True,
-                            "cleanup_status": "member_left_guild",
+                            "cleanup_status": "invalid_record",
                             "cleanup_completed_at": now,
-                        }, "$unset": {"cleanup_lease_until": ""}},
-                    )
-                    processed += 1
-                    continue
-                except Exception as e:
-                    await _record_cleanup_failure(
-                        mongo_client.recruit_onboarding,
-                        claimed,
-                        "member_fetch",
-                        e,
-                        now,
-                    )
-                    continue
-            
-            # Check if member has the New Recruit role
-            if NEW_RECRUIT_ROLE_ID in member.role_ids:
-                try:
-                    # Add a small delay before role removal to avoid rate limits
-                    await asyncio.sleep(0.5)
-                    
-                    # Remove the role
-                    api_calls += 1  # Role removal is an API call
-                    await bot_instance.rest.remove_role_from_member(
-                        guild_id,
-                        user_id,
-                        NEW_RECRUIT_ROLE_ID,
-                        reason="Auto-removal after 2 hours from walkthrough start",
-                    )
-                    print(f"[Recruit Role Cleanup] Removed New Recruit role from {member.display_name} ({user_id})")
-                    
-                    # Log the removal in a channel if desired (optional)
-                    # You can add notification logic here if needed
-                    
-                except Exception as e:
-                    await _record_cleanup_failure(
-                        mongo_client.recruit_onboarding,
-                        claimed,
-                        "role_removal",
-                        e,
-                        now,
+                        }},
                     )
+                    tally["processed"] += 1
                     continue
-            
-            # Mark as processed in database
-            await mongo_client.recruit_onboarding.update_one(
-                {"_id": walkthrough["_id"]},
-                {
-                    "$set": {
-                        "new_recruit_role_removed": True,
-                        "cleanup_status": "complete",
-                        "cleanup_completed_at": now,
-                    },
-                    "$unset": {
-                        "cleanup_lease_until": "",
-                        "cleanup_next_attempt_at": "",
-                    },
-                }
+                by_member.setdefault((guild_id, user_id), []).append(walkthrough)
+
+            results = await asyncio.gather(
+                *(limited(guild_id, user_id, rows, now)
+                  for (guild_id, user_id), rows in by_member.items()),
+                return_exceptions=True,
             )
-            processed += 1
-        
-        # Print summary
+            stopped = next(
+                (r for r in results if isinstance(r, hikari.RateLimitTooLongError)), None
+            )
+            for result in results:
+                if isinstance(result, Exception) and result is not stopped:
+                    print(f"[Recruit Role Cleanup] Member cleanup error: {result}")
+            if stopped is not None:
+                print(f"[Recruit Role Cleanup] Stopping this cycle: Discord asked for a "
+                      f"{stopped.retry_after:.0f}s wait")
+                break
+            if len(expired_walkthroughs) < MAX_BATCH_SIZE:
+                break
+            if time.time() - start_time > CYCLE_BUDGET.total_seconds():
+                print("[Recruit Role Cleanup] Cycle budget spent; the rest waits for the next check")
+                break
+
         elapsed = time.time() - start_time
-        print(f"[Recruit Role Cleanup] Cleanup completed: processed {processed}/{len(expired_walkthroughs)} walkthroughs, "
-              f"made {api_calls} API calls in {elapsed:.2f}s")
-            
+        if tally["found"] == 0:
+            print(f"[Recruit Role Cleanup] No expired walkthroughs to process. Check completed in {elapsed:.2f}s")
+            return
+        print(f"[Recruit Role Cleanup] Cleanup completed: processed {tally['processed']}/{tally['found']} walkthroughs, "
+              f"made {tally['api_calls']} API calls in {elapsed:.2f}s")
+
     except Exception as e:
         print(f"[Recruit Role Cleanup] Error during cleanup: {e}")
 
@@ -296,6 +318,7 @@ async def cleanup_loop():
 
 @loader.listener(hikari.StartedEvent)
 @lightbulb.di.with_di
+@profile_hook
 async def on_bot_started(
         event: hikari.StartedEvent,
         bot: hikari.GatewayBot = lightbulb.di.INJECTED,
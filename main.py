@@ -36,12 +36,15 @@ if sys.version_info < (3, 12, 3):
 import asyncio
 import logging
 import os
+import time
 import hikari
 import lightbulb
 from dotenv import load_dotenv
 from utils.mongo import MongoClient
 import coc
-from utils.startup import create_clash_client, load_cogs, unique_extensions
+from utils import startup
+from utils.concurrency import run_concurrently
+from utils.startup import create_clash_client
 from utils.cloudinary_client import CloudinaryClient
 from extensions.autocomplete import preload_autocomplete_cache
 from utils import bot_data
@@ -79,6 +82,9 @@ logging.getLogger("coc.http").setLevel(logging.WARNING)
 
 mongo_client = MongoClient(uri=os.getenv("MONGODB_URI"))
 clash_client: coc.Client | None = None
+# Reset by on_starting; the startup profile's phases are measured from here.
+starting_at = time.perf_counter()
+startup_profile_task: asyncio.Task | None = None
 
 cloudinary_client = CloudinaryClient()
 
@@ -94,45 +100,59 @@ registry.register_value(hikari.GatewayBot, bot)
 @bot.listen(hikari.StartingEvent)
 async def on_starting(_: hikari.StartingEvent) -> None:
     """Bot starting event"""
-    global clash_client
+    global clash_client, starting_at
 
+    starting_at = time.perf_counter()
     # Build coc.py only after Hikari has installed and started its event loop.
     clash_client = create_clash_client(loop=asyncio.get_running_loop())
     bot_data.data["coc_client"] = clash_client
     registry.register_value(coc.Client, clash_client)
 
-    explicit_extensions = [
-        "extensions.components",
-        "extensions.commands.clan",
-        "extensions.commands.fwa",
-        "extensions.commands.recruit",
-        "extensions.commands.recruit.dashboard.server_walkthrough",
-        "extensions.commands.setup",
-        "extensions.context_menus.get_message_id",
-        "extensions.context_menus.get_user_id",
-        "extensions.tasks.band_monitor",
-        "extensions.tasks.recruit_role_cleanup",
-        "extensions.tasks.cwl_reminder",
-        "extensions.tasks.fwa_points_monitor",
-        "extensions.tasks.clan_history_tracker",
-        "extensions.tasks.band_sync_ical",
-        "extensions.tasks.cards_sticky",
-        "extensions.tasks.cards_deadlines",
-        "extensions.commands.tickets",
-        "extensions.events.channel.ticket_channel_monitor",
-        "extensions.events.message.message_events",  # Add message events handler
-    ]
-    all_extensions = unique_extensions(
-        explicit_extensions,
-        load_cogs(
-            disallowed={"example"},
-            disallowed_folders={"clan", "fwa", "recruit", "setup", "tickets"},
-        ),
+    with startup.timed("phase", "discover"):
+        all_extensions = startup.boot_extensions(
+            manifest_path=startup.MANIFEST_PATH
+        )
+
+    # One at a time, exactly as a single load_extensions call would, but
+    # timed per extension. An extension's figure includes any module it is
+    # first to import, so a heavy shared import is charged to its first user.
+    with startup.timed("phase", "extensions"):
+        for extension in all_extensions:
+            with startup.timed("extension", extension):
+                await client.load_extensions(extension)
+
+    # Syncing commands and logging coc.py in are independent round trips.
+    await run_concurrently(
+        _timed_phase("commands", client.start()),
+        _timed_phase("coc_login", clash_client.login_with_tokens("")),
+    )
+    startup.record_timing(
+        "phase", "ready", time.perf_counter() - starting_at
     )
 
-    await client.load_extensions(*all_extensions)
-    await client.start()
-    await clash_client.login_with_tokens("")
+
+async def _timed_phase(name: str, awaitable) -> None:
+    with startup.timed("phase", name):
+        await awaitable
+
+
+async def _report_startup_profile() -> None:
+    """Log the startup profile once every StartedEvent hook has returned.
+
+    hikari runs each listener as its own task and names it after the event,
+    which is the only handle on "all the hooks are done".
+    """
+    current = asyncio.current_task()
+    hooks = [
+        task for task in asyncio.all_tasks()
+        if task is not current and task.get_name().endswith("for 'StartedEvent'")
+    ]
+    if hooks:
+        await asyncio.wait(hooks)
+    startup.record_timing(
+        "phase", "hooks_settled", time.perf_counter() - starting_at
+    )
+    print(f"[startup] {startup.profile_summary()}")
 
 
 @bot.listen(hikari.StoppingEvent)
@@ -144,6 +164,10 @@ async def on_stopping(_: hikari.StoppingEvent) -> None:
 @bot.listen(hikari.StartedEvent)
 async def on_bot_start(event: hikari.StartedEvent):
     """Load FWA URLs from database on startup"""
+    global startup_profile_task
+    startup_profile_task = asyncio.create_task(
+        _report_startup_profile(), name="startup-profile"
+    )
     fwa_data = await mongo_client.fwa_data.find_one({"_id": "fwa_config"})
 
     if fwa_data:
@@ -159,6 +183,12 @@ async def on_bot_start(event: hikari.StartedEvent):
             FWA_ACTIVE_WAR_BASE.update(fwa_data["active_base_images"])
             print(f"[INFO] Loaded {len(fwa_data['active_base_images'])} FWA active base URLs")
 
+    try:
+        await preload_autocomplete_cache(mongo_client)
+    except Exception as e:
+        # Autocomplete loads the index on its first use instead.
+        print(f"[Autocomplete] Preload failed: {e}")
+
     # Check for reboot notification
     try:
         reboot_status = await mongo_client.bot_config.find_one({"_id": "reboot_status"})
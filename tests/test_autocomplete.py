@@ -0,0 +1,100 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from extensions import autocomplete
+
+
+@pytest.fixture(autouse=True)
+def empty_index():
+    autocomplete.reset_index()
+    yield
+    autocomplete.reset_index()
+
+
+class _Clans:
+    def __init__(self, docs):
+        self.docs = docs
+        self.finds = 0
+
+    def find(self, *_args):
+        self.finds += 1
+        return SimpleNamespace(to_list=self._to_list)
+
+    async def _to_list(self, length=None):
+        return [dict(doc) for doc in self.docs]
+
+
+class _Ctx:
+    def __init__(self, value):
+        self.focused = SimpleNamespace(value=value)
+        self.choices = None
+
+    async def respond(self, choices):
+        self.choices = choices
+
+
+def _complete(handler, mongo, value):
+    ctx = _Ctx(value)
+    asyncio.run(handler._func(ctx, mongo))
+    return ctx.choices
+
+
+DOCS = [
+    {"tag": "#2QV8YRJ", "name": "Warriors United", "type": "FWA", "role_id": 1},
+    {"tag": "#8PUC09", "name": "United Kingdom", "type": "Competitive"},
+    {"tag": "#YRJ22", "name": "Cat Warriors", "type": "FWA", "th_attribute": "TH13+"},
+]
+
+
+def test_keystrokes_are_answered_from_the_index_built_at_startup():
+    clans = _Clans(DOCS)
+    mongo = SimpleNamespace(clans=clans)
+    asyncio.run(autocomplete.preload_autocomplete_cache(mongo))
+
+    assert _complete(autocomplete.clans, mongo, "warr") == [
+        "Warriors United | #2QV8YRJ", "Cat Warriors | #YRJ22",
+    ]
+    assert _complete(autocomplete.clans, mongo, "w") == [
+        "Warriors United | #2QV8YRJ", "Cat Warriors | #YRJ22",
+    ]
+    assert _complete(autocomplete.fwa_clans, mongo, "yrj") == [
+        ("Cat Warriors", "Cat Warriors|#YRJ22|"),
+        ("Warriors United", "Warriors United|#2QV8YRJ|1"),
+    ]
+    assert _complete(autocomplete.clan_types, mongo, "") == [
+        "Competitive", "FWA", "Demo", "Stuff",
+    ]
+    assert _complete(autocomplete.th_attribute, mongo, "th") == ["TH13+"]
+    assert _complete(autocomplete.clans, mongo, "zzz") == []
+    assert clans.finds == 1
+
+
+def test_clan_writes_update_the_index_in_place():
+    clans = _Clans(DOCS)
+    mongo = SimpleNamespace(clans=clans)
+    autocomplete.load_index(clans.docs)
+
+    autocomplete.update_clan("#8PUC09", {"name": "Kingdom Come", "type": "FWA"})
+    autocomplete.index_clan({"tag": "#NEW1", "name": "Fresh Clan", "type": ""})
+    autocomplete.drop_clan("#YRJ22")
+
+    assert _complete(autocomplete.clans, mongo, "united") == ["Warriors United | #2QV8YRJ"]
+    assert _complete(autocomplete.clans, mongo, "king") == ["Kingdom Come | #8PUC09"]
+    assert _complete(autocomplete.clans, mongo, "fresh") == ["Fresh Clan | #NEW1"]
+    assert [value for _, value in _complete(autocomplete.fwa_clans, mongo, "")] == [
+        "Kingdom Come|#8PUC09|", "Warriors United|#2QV8YRJ|1",
+    ]
+    assert _complete(autocomplete.clans, mongo, "cat") == []
+    assert clans.finds == 0
+
+
+def test_an_index_startup_never_built_is_loaded_on_first_use():
+    clans = _Clans(DOCS)
+    mongo = SimpleNamespace(clans=clans)
+
+    _complete(autocomplete.clans, mongo, "u")
+    _complete(autocomplete.fwa_clans, mongo, "u")
+
+    assert clans.finds == 1
@@ -437,3 +437,89 @@ def test_category_strip_highlight_does_not_change_the_accounting():
     assert plain.duplicate_card_ids == ringed.duplicate_card_ids
     assert plain.collected_count == ringed.collected_count
     assert plain.png_bytes != ringed.png_bytes
+
+
+def _mixed_states():
+    states = [MISSING, OWNED, DUPLICATE, 5, OWNED_SPARE_UNVERIFIED, "spare_floor", "unknown"]
+    return {card.id: states[index % len(states)] for index, card in enumerate(CARDS)}
+
+
+def _pixels(png_bytes):
+    with Image.open(io.BytesIO(png_bytes)) as image:
+        return image.convert("RGB").tobytes()
+
+
+def test_atlas_board_is_pixel_identical_to_drawing_every_tile():
+    values = _mixed_states()
+    card_board._atlas_tile.cache_clear()
+
+    atlas = render_card_board(values)
+    # A distinct mapping of the same images bypasses the atlas entirely.
+    direct = render_card_board(values, dict(card_board._bundled_artwork()))
+
+    assert _pixels(atlas.png_bytes) == _pixels(direct.png_bytes)
+    assert card_board._atlas_tile.cache_info().currsize == len(CARDS)
+
+
+def test_atlas_category_strip_keeps_the_highlight_ring_and_pixels():
+    values = _mixed_states()
+    category_id = CARDS[0].category
+    highlight = CATEGORY_CARDS[category_id][6].id
+
+    first = card_board.render_category_strip(
+        category_id, values, highlight_card_id=highlight
+    )
+    card_board._atlas_tile.cache_clear()
+    # Rendering again from a cold atlas must produce the same image.
+    second = card_board.render_category_strip(
+        category_id, values, highlight_card_id=highlight
+    )
+
+    assert _pixels(first.png_bytes) == _pixels(second.png_bytes)
+
+
+def test_warm_atlas_draws_no_tiles(monkeypatch):
+    values = _mixed_states()
+    render_card_board(values)
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("a warm atlas must paste, not draw")
+
+    monkeypatch.setattr(card_board, "_draw_card_tile", fail)
+    result = render_card_board(values)
+
+    assert result.collected_count == render_card_board(values).collected_count
+
+
+def test_a_warm_render_builds_no_fonts_and_measures_no_text(monkeypatch):
+    values = _mixed_states()
+    render_card_board(values)
+    card_board.render_trade_strip("barbarian", "archer")
+
+    calls = []
+    load_default = card_board.ImageFont.load_default
+    monkeypatch.setattr(
+        card_board.ImageFont, "load_default",
+        lambda *args, **kwargs: calls.append(args) or load_default(*args, **kwargs),
+    )
+    monkeypatch.setattr(
+        card_board._MEASURE, "textbbox",
+        lambda *args, **kwargs: calls.append(args) or pytest.fail("measured again"),
+    )
+
+    render_card_board(values)
+    card_board.render_trade_strip("barbarian", "archer")
+
+    assert calls == []
+
+
+def test_cached_text_fit_matches_fitting_on_the_canvas():
+    draw = ImageDraw.Draw(Image.new("RGB", (400, 100)))
+    text = "An unreasonably long category heading for a strip"
+
+    label, font = card_board._fit_text(draw, text, 180, max_size=30, min_size=14)
+
+    assert font is card_board._font(font.size)
+    assert card_board._text_width(draw, label, font) <= 180
+    assert label.endswith("...")
+    assert font.size == 14
@@ -985,7 +985,7 @@ def test_trade_visual_failure_still_delivers_accessible_text(monkeypatch):
     def broken_renderer(*_args, **_kwargs):
         raise RuntimeError("renderer unavailable")
 
-    monkeypatch.setattr(cards_command, "render_trade_strip", broken_renderer)
+    monkeypatch.setattr(cards_command.card_board, "render_trade_strip", broken_renderer)
     rest = Rest()
     trade = _trade_document()
     trade.update({
@@ -1586,7 +1586,7 @@ class _FakeInventoryUpdates:
 
 
 def test_a_shared_spares_board_replaces_the_previous_one_and_pings_nobody(
-    monkeypatch,
+    monkeypatch, caplog,
 ):
     """The screenshot habit, served from recorded data.
 
@@ -1607,11 +1607,13 @@ def test_a_shared_spares_board_replaces_the_previous_one_and_pings_nobody(
         card_inventories=_FakeInventoryUpdates([inventory]),
     )
 
-    posted = asyncio.run(cards_command._post_spares_channel(
-        SimpleNamespace(rest=rest), mongo, inventory
-    ))
+    with caplog.at_level("INFO", logger=cards_command._log.name):
+        posted = asyncio.run(cards_command._post_spares_channel(
+            SimpleNamespace(rest=rest), mongo, inventory
+        ))
 
     assert posted is True
+    assert "board/optimized_png=" in caplog.text, "encode cost is reported"
     assert rest.deletes == [(999, 424242)], "the old share is removed first"
     assert len(rest.messages) == 1
     sent = rest.messages[0]
@@ -4995,7 +4997,7 @@ def test_runtime_dashboard_renders_the_board_off_the_event_loop(monkeypatch):
         account, inventory, account_count=1
     ))
 
-    assert calls == [cards_command.render_inventory_card_board]
+    assert calls == [cards_command.card_board.render_inventory_card_board]
     assert any(node.get("type") == 12 for node in _view_nodes(view))
     _assert_discord_payload(view)
 
@@ -5170,7 +5172,7 @@ def test_possible_spare_board_state_keeps_proven_ownership():
     values = cards_command._inventory_board_values(inventory)
 
     assert values["wizard"] == "owned_spare_unverified"
-    board = cards_command.render_inventory_card_board(values, player_name="Member")
+    board = cards_command.card_board.render_inventory_card_board(values, player_name="Member")
     assert board.collected_count == 60
     assert board.spare_unverified_card_ids == ("wizard",)
 
@@ -439,7 +439,7 @@ def test_an_explicit_two_confirms_a_scanner_two_plus():
 
     assert "wizard" in cards_command._trusted_card_ids(source)
     assert cards_command._inventory_board_values(source)["wizard"] == (
-        cards_command.SPARE_FLOOR
+        cards_command.card_board.SPARE_FLOOR
     )
 
     updated = asyncio.run(cards_command._write_exact_card_batch(
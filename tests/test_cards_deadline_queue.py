@@ -0,0 +1,67 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from utils import cards_deadline_queue as queue
+
+
+@pytest.fixture(autouse=True)
+def empty_queue():
+    queue.reset()
+    yield
+    queue.reset()
+
+
+def _soon(seconds):
+    return datetime.now(timezone.utc) + timedelta(seconds=seconds)
+
+
+def test_wakes_at_the_earliest_deadline_not_the_safety_net():
+    queue.note(_soon(60), key="later")
+    queue.note(_soon(0.05), key="sooner")
+
+    async def scenario():
+        started = asyncio.get_running_loop().time()
+        reason = await queue.wait_for_due(max_seconds=5)
+        return reason, asyncio.get_running_loop().time() - started
+
+    reason, waited = asyncio.run(scenario())
+
+    assert reason == "deadline"
+    assert waited < 1
+    assert queue.next_deadline() > datetime.now(timezone.utc)
+
+
+def test_a_newly_noted_earlier_deadline_wakes_a_sleeping_wait():
+    queue.note(_soon(60), key="far")
+
+    async def scenario():
+        waiter = asyncio.create_task(queue.wait_for_due(max_seconds=5))
+        await asyncio.sleep(0.02)
+        queue.note_document({"_id": "trade", "accept_deadline_at": _soon(0.05)})
+        return await asyncio.wait_for(waiter, timeout=2)
+
+    assert asyncio.run(scenario()) == "deadline"
+
+
+def test_nothing_due_falls_back_to_the_safety_net():
+    queue.note(_soon(60))
+
+    assert asyncio.run(queue.wait_for_due(max_seconds=0.05)) == "safety_net"
+    assert "1 safety-net pass(es)" in queue.summary()
+
+
+def test_documents_contribute_every_deadline_field_and_ignore_the_rest():
+    now = datetime(2026, 8, 14, 12, tzinfo=timezone.utc)
+    queue.note_document({
+        "_id": "t1",
+        "accept_deadline_at": now + timedelta(hours=12),
+        "backstop_at": now + timedelta(days=7),
+        "claim_until": None,
+        "created_at": now,
+    })
+
+    assert queue.next_deadline() == now + timedelta(hours=12)
+    assert queue.pop_due(now + timedelta(days=1)) == 1
+    assert queue.next_deadline() == now + timedelta(days=7)
@@ -4,13 +4,15 @@ from types import SimpleNamespace
 
 from extensions.commands import cards as cards_command
 from extensions.tasks import cards_deadlines as sweeper
+from utils import cards_deadline_queue
 
 
 class _Trades:
     def __init__(self, documents):
         self.docs = {d["_id"]: d for d in documents}
+        self.bulk_writes = []
 
-    def find(self, query):
+    def find(self, query, projection=None):
         return _Cursor(list(self._matching(query)))
 
     def _matching(self, query):
@@ -30,12 +32,21 @@ class _Trades:
             doc.pop(key, None)
         return SimpleNamespace(modified_count=1)
 
+    async def bulk_write(self, operations, ordered=True):
+        self.bulk_writes.append(len(operations))
+        modified = 0
+        for operation in operations:
+            result = await self.update_one(operation._filter, operation._doc)
+            modified += result.modified_count
+        return SimpleNamespace(modified_count=modified)
+
 
 class _Inventories:
     def __init__(self, documents):
         self.docs = {d["_id"]: d for d in documents}
+        self.bulk_writes = []
 
-    def find(self, query):
+    def find(self, query, projection=None):
         return _Cursor([
             dict(d) for d in self.docs.values() if _matches(d, query)
         ])
@@ -71,6 +82,14 @@ class _Inventories:
                 doc.pop(head, None)
         return SimpleNamespace(modified_count=1)
 
+    async def bulk_write(self, operations, ordered=True):
+        self.bulk_writes.append(len(operations))
+        modified = 0
+        for operation in operations:
+            result = await self.update_one(operation._filter, operation._doc)
+            modified += result.modified_count
+        return SimpleNamespace(modified_count=modified)
+
 
 class _Cursor:
     def __init__(self, rows):
@@ -199,6 +218,30 @@ def test_an_unanswered_proposal_expires_and_counts_against_the_holder(monkeypatc
     assert rest.dms == []
 
 
+def test_a_transient_re_read_failure_does_not_strand_the_follow_ups(monkeypatch):
+    trades = _Trades([_pending("t1", overdue=True)])
+    inventories = _Inventories([{"_id": "#HOLDER", "player_name": "Holder"}])
+    _install(monkeypatch, trades, inventories)
+    monkeypatch.setattr(sweeper, "REREAD_RETRY_SECONDS", 0)
+    find = trades.find
+    failures = []
+
+    def flaky_find(query, projection=None):
+        # The first re-read after the bulk write fails once.
+        if projection == {"_id": 1} and not failures:
+            failures.append(query)
+            raise RuntimeError("connection reset")
+        return find(query, projection)
+
+    trades.find = flaky_find
+
+    asyncio.run(sweeper.sweep_once())
+
+    assert failures
+    assert trades.docs["t1"]["status"] == "expired"
+    assert inventories.docs["#HOLDER"]["ignored_requests"] == 1
+
+
 def test_a_proposal_inside_its_window_is_left_alone(monkeypatch):
     trades = _Trades([_pending("t1", overdue=False)])
     inventories = _Inventories([{"_id": "#HOLDER"}])
@@ -225,6 +268,31 @@ def test_the_second_ignored_request_triggers_the_check_in(monkeypatch):
     assert "still trading" in text.lower()
 
 
+def test_a_batch_of_expiries_is_one_write_and_one_check_in(monkeypatch):
+    """Every overdue proposal moves in one bulk write, the holder's ignored
+    count is bumped once by the batch size, and they are asked only once."""
+    trades = _Trades([
+        _pending("t1", overdue=True),
+        _pending("t2", overdue=True),
+        _pending("t3", overdue=True, holder="#OTHER"),
+    ])
+    inventories = _Inventories([
+        {"_id": "#HOLDER", "player_name": "Holder", "ignored_requests": 0},
+        {"_id": "#OTHER", "player_name": "Other", "ignored_requests": 0},
+    ])
+    rest = _install(monkeypatch, trades, inventories)
+
+    asyncio.run(sweeper.sweep_once())
+
+    assert {doc["status"] for doc in trades.docs.values()} == {"expired"}
+    assert trades.bulk_writes[0] == 3
+    assert inventories.bulk_writes[0] == 2
+    assert inventories.docs["#HOLDER"]["ignored_requests"] == 2
+    assert inventories.docs["#OTHER"]["ignored_requests"] == 1
+    text = " ".join(str(dm) for dm in rest.dms).lower()
+    assert text.count("still trading") == 1
+
+
 def test_the_check_in_is_only_ever_sent_once(monkeypatch):
     """Otherwise every later expiry would ask again and never resolve."""
     trades = _Trades([_pending("t1", overdue=True)])
@@ -636,7 +704,7 @@ def test_a_claim_refreshed_between_read_and_write_survives():
     past = datetime.now(timezone.utc) - timedelta(seconds=30)
 
     class _StaleRead(_Trades):
-        def find(self, _query):
+        def find(self, _query, projection=None):
             return _Cursor([
                 dict(doc, claim_until=past) for doc in self.docs.values()
             ])
@@ -753,3 +821,27 @@ def test_sweep_once_wires_every_job_through_one_shared_budget(monkeypatch):
         "_expire_unanswered_proposals",
         "_expire_open_requests",
     ], "exactly the jobs that edit standing posts share the cap"
+
+
+def test_hydrate_queues_outstanding_deadlines_but_not_finished_trades():
+    now = datetime.now(timezone.utc)
+    pending = _pending("p1", overdue=False)
+    finished = dict(_pending("done", overdue=False), status="completed")
+    finished["accept_deadline_at"] = now - timedelta(days=30)
+    asked_at = now - timedelta(hours=2)
+    trades = _Trades([pending, finished])
+    inventories = _Inventories([
+        {"_id": "#ASKED", "checkin_sent_at": asked_at},
+        {"_id": "#PAUSED", "checkin_sent_at": asked_at, "trading_paused": True},
+    ])
+    cards_deadline_queue.reset()
+
+    loaded = asyncio.run(sweeper.hydrate_deadline_queue(SimpleNamespace(
+        card_trades=trades, card_inventories=inventories,
+    )))
+
+    assert loaded == 2
+    assert cards_deadline_queue.next_deadline() == pending["accept_deadline_at"]
+    assert cards_deadline_queue.pop_due(now + timedelta(days=1)) == 2
+    assert cards_deadline_queue.next_deadline() is None
+    cards_deadline_queue.reset()
@@ -10,6 +10,20 @@ from extensions.tasks import cards_sticky as sticky
 from utils.emoji import emojis
 
 
+@pytest.fixture(autouse=True)
+def _fresh_channel_state():
+    """The gateway view is module state; one test's messages are not another's."""
+    sticky._newest_seen.clear()
+    sticky._standing.clear()
+    sticky._banner.clear()
+    sticky._activity = None
+    yield
+    sticky._newest_seen.clear()
+    sticky._standing.clear()
+    sticky._banner.clear()
+    sticky._activity = None
+
+
 class _Rest:
     def __init__(self, *, newest_id=None, post_id=999, fetch_error=None):
         self.newest_id = newest_id
@@ -28,10 +42,19 @@ class _Rest:
             raise self.fetch_error
         return SimpleNamespace(id=channel_id, last_message_id=self.newest_id)
 
-    async def create_message(self, channel, components, flags=None, **kwargs):
+    async def create_message(self, channel, components=None, flags=None, **kwargs):
         self.created.append((channel, components, flags))
         self.create_kwargs = kwargs
-        return SimpleNamespace(id=self.post_id)
+        attachments = []
+        if kwargs.get("attachment"):
+            attachments = [SimpleNamespace(url="https://cdn.test/banner.jpg?ex=1")]
+        return SimpleNamespace(id=self.post_id, attachments=attachments)
+
+    async def fetch_message(self, channel, message):
+        return SimpleNamespace(
+            id=message,
+            attachments=[SimpleNamespace(url="https://cdn.test/banner.jpg?ex=2")],
+        )
 
     async def delete_message(self, channel_id, message_id):
         if self.delete_error:
@@ -717,8 +740,208 @@ def test_reworded_notice_is_still_edited_while_people_talk(monkeypatch):
     assert rest.created == []
 
 
-def test_the_loop_looks_far_more_often_than_it_posts():
-    """It has to, or a conversation ending at 09:01 waits until 09:10."""
-    assert sticky.CHECK_INTERVAL_SECONDS <= 60
-    assert sticky.CHECK_INTERVAL_SECONDS < sticky.REPOST_INTERVAL_MINUTES * 60
+def test_the_timer_is_armed_for_exactly_the_quiet_period():
+    """A conversation ending at 09:01 gets its notice at 09:11, not on the
+    next poll after that."""
     assert sticky.QUIET_PERIOD_MINUTES < sticky.REPOST_INTERVAL_MINUTES
+    sticky._standing.update(message_id=555, allowed_at=None)
+    sticky.note_channel_message(sticky.STICKY_CHANNEL_ID, _spoke_at(3))
+
+    wait = sticky._seconds_until_due(now=datetime.now(timezone.utc))
+
+    assert abs(wait - (sticky.QUIET_PERIOD_MINUTES - 3) * 60) < 2
+
+
+def test_an_unburied_notice_sleeps_until_the_safety_net():
+    sticky._standing.update(message_id=555, allowed_at=None)
+    sticky.note_channel_message(sticky.STICKY_CHANNEL_ID, 555)
+
+    wait = sticky._seconds_until_due(now=datetime.now(timezone.utc))
+
+    assert wait == sticky.SAFETY_NET_SECONDS
+
+
+def test_the_interval_gate_can_hold_the_timer_past_quiet():
+    now = datetime.now(timezone.utc)
+    sticky._standing.update(message_id=555, allowed_at=now + timedelta(minutes=12))
+    sticky.note_channel_message(sticky.STICKY_CHANNEL_ID, _spoke_at(30))
+
+    assert abs(sticky._seconds_until_due(now=now) - 12 * 60) < 2
+
+
+def test_gateway_messages_replace_the_channel_fetch(monkeypatch):
+    rest = _Rest(newest_id=_spoke_at(1))
+    config = _Config({
+        "_id": sticky.CONFIG_ID,
+        "channel_id": sticky.STICKY_CHANNEL_ID,
+        "message_id": 555,
+        "content_key": sticky._content_key(),
+        "posted_at": datetime.now(timezone.utc) - timedelta(hours=3),
+    })
+    _install(monkeypatch, rest, config)
+    event = SimpleNamespace(
+        channel_id=sticky.STICKY_CHANNEL_ID,
+        message_id=_spoke_at(sticky.QUIET_PERIOD_MINUTES + 1),
+    )
+    asyncio.run(sticky.on_cards_channel_message(event))
+
+    asyncio.run(sticky.refresh_sticky())
+
+    assert rest.channel_fetches == 0
+    assert len(rest.created) == 1
+
+    # The safety-net pass still asks Discord, in case the gateway missed one.
+    asyncio.run(sticky.refresh_sticky(reread=True))
+    assert rest.channel_fetches == 1
+
+
+def test_a_message_wakes_the_loop_only_to_re_arm(monkeypatch):
+    monkeypatch.setattr(sticky, "SAFETY_NET_SECONDS", 0.3)
+    sticky._standing.update(message_id=555, allowed_at=None)
+    sticky.note_channel_message(sticky.STICKY_CHANNEL_ID, 555)
+
+    async def scenario():
+        waiter = asyncio.create_task(sticky._wait_for_due())
+        await asyncio.sleep(0.05)
+        # Buried by somebody still talking: the pass moves to their quiet
+        # deadline (capped here by the shortened safety net), not to now.
+        sticky.note_channel_message(sticky.STICKY_CHANNEL_ID, _spoke_at(0))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        return await asyncio.wait_for(waiter, timeout=2)
+
+    assert asyncio.run(scenario()) is True
+
+
+def _run_loop_for(seconds):
+    async def scenario():
+        loop = asyncio.create_task(sticky.sticky_loop())
+        await asyncio.sleep(seconds)
+        loop.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await loop
+
+    asyncio.run(scenario())
+
+
+def test_a_post_that_keeps_failing_backs_off_instead_of_spinning(monkeypatch):
+    monkeypatch.setattr(sticky, "RETRY_BASE_SECONDS", 0.02)
+    monkeypatch.setattr(sticky, "SAFETY_NET_SECONDS", 5)
+    rest = _Rest(newest_id=_spoke_at(sticky.QUIET_PERIOD_MINUTES + 1))
+    attempts = []
+
+    async def _down(channel, components=None, flags=None, **kwargs):
+        attempts.append(channel)
+        raise _http_error(hikari.InternalServerError)
+
+    rest.create_message = _down
+    config = _Config({
+        "_id": sticky.CONFIG_ID,
+        "channel_id": sticky.STICKY_CHANNEL_ID,
+        "message_id": 555,
+        "content_key": sticky._content_key(),
+        "posted_at": datetime.now(timezone.utc) - timedelta(hours=3),
+    })
+    _install(monkeypatch, rest, config)
+
+    _run_loop_for(0.3)
+
+    # 0.02 + 0.04 + 0.08 + 0.16 s between attempts: five fit, not thousands.
+    assert 2 <= len(attempts) <= 6
+    assert config.writes == []
+    assert sticky._standing["failures"] == len(attempts)
+
+
+def test_a_pass_that_raises_backs_off_too(monkeypatch):
+    monkeypatch.setattr(sticky, "RETRY_BASE_SECONDS", 0.02)
+    monkeypatch.setattr(sticky, "SAFETY_NET_SECONDS", 5)
+    sticky.note_channel_message(sticky.STICKY_CHANNEL_ID, _spoke_at(60))
+    passes = []
+
+    async def _broken(_mongo):
+        passes.append(_mongo)
+        raise RuntimeError("unexpected")
+
+    monkeypatch.setattr(sticky, "_stored_sticky", _broken)
+    _install(monkeypatch, _Rest(), _Config())
+
+    _run_loop_for(0.3)
+
+    assert 2 <= len(passes) <= 6
+
+
+def test_a_successful_post_clears_the_back_off(monkeypatch):
+    now = datetime.now(timezone.utc)
+    sticky._back_off(now=now)
+    sticky._back_off(now=now)
+    assert sticky._standing["retry_at"] == now + timedelta(seconds=2 * sticky.RETRY_BASE_SECONDS)
+
+    rest = _Rest(newest_id=_spoke_at(sticky.QUIET_PERIOD_MINUTES + 1))
+    _install(monkeypatch, rest, _Config({
+        "_id": sticky.CONFIG_ID,
+        "channel_id": sticky.STICKY_CHANNEL_ID,
+        "message_id": 555,
+        "content_key": sticky._content_key(),
+        "posted_at": now - timedelta(hours=3),
+    }))
+    asyncio.run(sticky.refresh_sticky())
+
+    assert len(rest.created) == 1
+    assert "retry_at" not in sticky._standing
+    assert "failures" not in sticky._standing
+
+
+class _Configs:
+    """bot_config with more than one document in it."""
+
+    def __init__(self, *documents):
+        self.documents = {d["_id"]: dict(d) for d in documents}
+
+    async def find_one(self, query):
+        document = self.documents.get(query["_id"])
+        return dict(document) if document else None
+
+    async def update_one(self, query, update, upsert=False):
+        self.documents.setdefault(query["_id"], {"_id": query["_id"]}).update(
+            update.get("$set", {})
+        )
+
+
+def test_the_banner_is_uploaded_once_and_linked_after(monkeypatch):
+    asset_channel = 4242
+    monkeypatch.setenv("CARDS_ASSET_CHANNEL_ID", str(asset_channel))
+    rest = _Rest(newest_id=_spoke_at(sticky.QUIET_PERIOD_MINUTES + 1), post_id=888)
+    configs = _Configs({
+        "_id": sticky.CONFIG_ID,
+        "channel_id": sticky.STICKY_CHANNEL_ID,
+        "message_id": 555,
+        "content_key": sticky._content_key(),
+    })
+    _install(monkeypatch, rest, configs)
+
+    asyncio.run(sticky.refresh_sticky())
+    uploads = [c for c in rest.created if c[0] == asset_channel]
+    notices = [c for c in rest.created if c[0] == sticky.STICKY_CHANNEL_ID]
+    assert len(uploads) == 1 and len(notices) == 1
+    assert configs.documents[sticky.BANNER_CONFIG_ID]["message_id"] == 888
+
+    # The notice links to the hosted copy and hands hikari nothing to upload.
+    container = notices[0][1][0]
+    _payload, resources = container.build()
+    assert list(resources) == []
+    gallery = container.components[0]
+    assert str(gallery.items[0].media).startswith("https://cdn.test/")
+
+    # A stale link is re-read from the hosting message, not re-uploaded.
+    sticky._banner["read_at"] -= sticky.BANNER_URL_MAX_AGE
+    media = asyncio.run(sticky._banner_media(SimpleNamespace(rest=rest)))
+    assert media == "https://cdn.test/banner.jpg?ex=2"
+    assert len([c for c in rest.created if c[0] == asset_channel]) == 1
+
+
+def test_without_an_asset_channel_the_banner_is_uploaded_with_the_post(monkeypatch):
+    monkeypatch.delenv("CARDS_ASSET_CHANNEL_ID", raising=False)
+
+    media = asyncio.run(sticky._banner_media(SimpleNamespace(rest=_Rest())))
+
+    assert media == sticky.STICKY_BANNER
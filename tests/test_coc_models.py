@@ -0,0 +1,101 @@
+import asyncio
+
+import coc
+
+from utils import coc_models, startup
+
+
+def _client():
+    async def create():
+        return startup.create_clash_client()
+
+    return asyncio.run(create())
+
+
+def _clan_body(members, *, timestamp):
+    return {
+        "tag": "#FAMILY",
+        "name": "Family",
+        "members": len(members),
+        "memberList": [
+            {"tag": tag, "name": tag, "trophies": 0, "builderBaseTrophies": 0}
+            for tag in members
+        ],
+        "status_code": 200,
+        "timestamp": timestamp,
+        "_response_retry": 120,
+    }
+
+
+def test_identical_body_returns_the_already_parsed_model():
+    coc_models.reset()
+    client = _client()
+    clan_cls = client.objects_cls["Clan"]
+
+    first = clan_cls(data=_clan_body(["#A", "#B"], timestamp=1.0), client=client)
+    again = clan_cls(data=_clan_body(["#A", "#B"], timestamp=2.0), client=client)
+    changed = clan_cls(data=_clan_body(["#A"], timestamp=3.0), client=client)
+
+    assert isinstance(first, coc.Clan)
+    assert again is first
+    assert changed is not first
+    assert [member.tag for member in changed.members] == ["#A"]
+    assert coc_models.stats()["clan"] == {"requests": 3, "unchanged": 1, "ratio": 1 / 3}
+
+
+def test_war_models_are_keyed_by_requested_clan_side():
+    coc_models.reset()
+    client = _client()
+    war_cls = client.objects_cls["ClanWar"]
+    body = {
+        "state": "inWar",
+        "teamSize": 5,
+        "clan": {"tag": "#HOME", "name": "Home", "members": []},
+        "opponent": {"tag": "#AWAY", "name": "Away", "members": []},
+    }
+
+    home = war_cls(data=dict(body), client=client, clan_tag="#HOME")
+    away = war_cls(data=dict(body), client=client, clan_tag="#AWAY")
+    league = war_cls(data=dict(body, tag="#WAR"), client=client)
+
+    assert home is not away
+    assert home.clan.tag == "#HOME"
+    assert away.clan.tag == "#AWAY"
+    assert war_cls(data=dict(body), client=client, clan_tag="#HOME") is home
+    assert "league_war" in coc_models.stats()
+    assert league.war_tag == "#WAR"
+    assert coc_models.summary() == "league_war=0/1 war=1/3"
+
+
+def test_a_reused_war_takes_the_league_group_and_client_of_this_call():
+    coc_models.reset()
+    client, other_client = _client(), _client()
+    war_cls = client.objects_cls["ClanWar"]
+    body = {
+        "state": "inWar",
+        "teamSize": 5,
+        "tag": "#WAR",
+        "clan": {"tag": "#HOME", "name": "Home", "members": []},
+        "opponent": {"tag": "#AWAY", "name": "Away", "members": []},
+    }
+    first_group, second_group = object(), object()
+
+    first = war_cls(data=dict(body), client=client, league_group=first_group)
+    again = war_cls(data=dict(body), client=other_client, league_group=second_group)
+
+    assert again is first
+    assert again.league_group is second_group
+    assert again._client is other_client
+    assert war_cls(data=dict(body), client=client).league_group is None
+
+
+def test_memo_is_bounded(monkeypatch):
+    coc_models.reset()
+    monkeypatch.setattr(coc_models, "MAX_MODELS", 2)
+    client = _client()
+    clan_cls = client.objects_cls["Clan"]
+
+    for index in range(5):
+        clan_cls(data=_clan_body([f"#{index}"], timestamp=0.0), client=client)
+
+    assert len(coc_models._models) == 2
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from copy import deepcopy
 from types import SimpleNamespace
 
@@ -615,3 +616,47 @@ def test_scheduler_failure_leaves_followup_durable(monkeypatch):
         raise AssertionError("scheduler failure should be reported")
 
     assert "cwl_followup_1" in mongo.database.cwl_pending_reminders.documents
+
+
+def test_channels_are_sent_together_from_payloads_built_once(monkeypatch):
+    round_trip = 0.2
+    channels = {
+        f"channel{n}": {"id": 1000 + n, "type": ("main", "lazy")[n % 2], "name": str(n)}
+        for n in range(6)
+    }
+    mongo, _, _ = configure(monkeypatch, schedule={"_id": "schedule"})
+    monkeypatch.setattr(cwl, "PRODUCTION_CHANNELS", channels)
+    built = []
+    real_build = cwl.create_cwl_reminder_message
+
+    def counting_build(reminder_number=0, channel_type="main"):
+        built.append(channel_type)
+        return real_build(reminder_number, channel_type)
+
+    monkeypatch.setattr(cwl, "create_cwl_reminder_message", counting_build)
+
+    class SlowRest:
+        def __init__(self):
+            self.arrived = {}
+            self.payloads = {}
+
+        async def create_message(self, **kwargs):
+            await asyncio.sleep(round_trip)
+            if kwargs["channel"] == 1003:
+                raise RuntimeError("delivery failed")
+            self.arrived[kwargs["channel"]] = time.perf_counter()
+            self.payloads[kwargs["channel"]] = kwargs["components"]
+
+    rest = SlowRest()
+    monkeypatch.setattr(cwl, "bot_instance", SimpleNamespace(rest=rest))
+
+    started = time.perf_counter()
+    delivered = asyncio.run(cwl.send_cwl_reminder(1))
+
+    assert delivered is False
+    assert sorted(built) == ["lazy", "main"]
+    assert set(rest.arrived) == {1000, 1001, 1002, 1004, 1005}
+    assert max(rest.arrived.values()) - started < 2 * round_trip
+    assert rest.payloads[1000] is rest.payloads[1002]
+    pending = mongo.database.cwl_pending_reminders.documents["cwl_followup_1"]
+    assert pending["channel_keys"] == ["channel3"]
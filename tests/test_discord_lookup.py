@@ -0,0 +1,129 @@
+import asyncio
+from types import SimpleNamespace
+
+from hikari.api.config import CacheComponents
+
+from utils import discord_lookup
+
+
+class _Rest:
+    def __init__(self):
+        self.calls = []
+
+    async def fetch_channel(self, channel_id):
+        self.calls.append(("channel", channel_id))
+        return SimpleNamespace(id=channel_id, name="from-rest")
+
+    async def fetch_guild_channels(self, guild_id):
+        self.calls.append(("guild_channels", guild_id))
+        return [SimpleNamespace(id=1, parent_id=100)]
+
+    async def fetch_member(self, guild_id, user_id):
+        self.calls.append(("member", user_id))
+        return SimpleNamespace(id=user_id, display_name="from-rest")
+
+    async def fetch_active_threads(self, guild_id):
+        self.calls.append(("threads", guild_id))
+        return [SimpleNamespace(id=55, parent_id=300)]
+
+
+class _View(dict):
+    pass
+
+
+class _Cache:
+    def __init__(self, *, guilds=(), channels=None, members=None, threads=None,
+                 components=CacheComponents.ALL):
+        self.settings = SimpleNamespace(components=components)
+        self.guilds = set(guilds)
+        self.channels = channels or {}
+        self.members = members or {}
+        self.threads = threads or {}
+
+    def get_guild(self, guild_id):
+        return object() if guild_id in self.guilds else None
+
+    def get_guild_channel(self, channel_id):
+        return self.channels.get(channel_id)
+
+    def get_thread(self, thread_id):
+        return self.threads.get(thread_id)
+
+    def get_guild_channels_view_for_guild(self, _guild_id):
+        return _View(self.channels)
+
+    def get_threads_view_for_guild(self, _guild_id):
+        return _View(self.threads)
+
+    def get_member(self, guild_id, user_id):
+        return self.members.get((guild_id, user_id))
+
+
+def _app(cache=None):
+    return SimpleNamespace(rest=_Rest(), cache=cache)
+
+
+def test_cached_guild_answers_channel_queries_without_rest():
+    discord_lookup.reset_stats()
+    channels = {
+        1: SimpleNamespace(id=1, parent_id=100, name="🆕main-1"),
+        2: SimpleNamespace(id=2, parent_id=None, name="Tickets"),
+    }
+    app = _app(_Cache(guilds={11}, channels=channels))
+
+    listed = asyncio.run(discord_lookup.fetch_guild_channels(app, 11))
+    category = asyncio.run(discord_lookup.fetch_channel(app, 2))
+
+    assert {channel.id for channel in listed} == {1, 2}
+    assert category.name == "Tickets"
+    assert app.rest.calls == []
+    assert discord_lookup.stats()["guild_channels"] == {"avoided": 1, "rest": 0}
+    assert discord_lookup.stats()["channel"] == {"avoided": 1, "rest": 0}
+
+
+def test_uncached_guild_and_missing_objects_fall_back_to_rest():
+    discord_lookup.reset_stats()
+    app = _app(_Cache(guilds=set()))
+
+    asyncio.run(discord_lookup.fetch_guild_channels(app, 11))
+    member = asyncio.run(discord_lookup.fetch_member(app, 11, 22))
+
+    assert member.display_name == "from-rest"
+    assert [kind for kind, _ in app.rest.calls] == ["guild_channels", "member"]
+    assert discord_lookup.summary() == "0 REST call(s) avoided, 2 REST fallback(s)"
+
+
+def test_disabled_cache_component_is_never_trusted():
+    discord_lookup.reset_stats()
+    app = _app(_Cache(
+        guilds={11},
+        channels={},
+        components=CacheComponents.GUILDS,
+    ))
+
+    asyncio.run(discord_lookup.fetch_guild_channels(app, 11))
+
+    assert app.rest.calls == [("guild_channels", 11)]
+
+
+def test_app_without_cache_uses_rest():
+    discord_lookup.reset_stats()
+    app = SimpleNamespace(rest=_Rest())
+
+    channel = asyncio.run(discord_lookup.fetch_channel(app, 9))
+
+    assert channel.name == "from-rest"
+
+
+def test_thread_lookup_falls_back_only_when_not_cached():
+    discord_lookup.reset_stats()
+    cached = SimpleNamespace(id=44, parent_id=200, is_archived=False)
+    app = _app(_Cache(guilds={11}, threads={44: cached}))
+
+    hit = asyncio.run(discord_lookup.find_active_thread(app, 11, 200))
+    fresh = asyncio.run(discord_lookup.find_active_thread(app, 11, 300))
+
+    assert hit is cached
+    assert fresh.id == 55
+    assert app.rest.calls == [("threads", 11)]
+    assert discord_lookup.stats()["thread"] == {"avoided": 1, "rest": 1}
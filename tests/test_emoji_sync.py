@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import io
+from types import SimpleNamespace
 
 import hikari
 import pytest
@@ -80,3 +83,130 @@ def test_prime_replaces_rather_than_merges():
 
     assert troop_emoji.markup("barbarian") == ""
     assert troop_emoji.known() == 1
+
+
+def test_encoding_off_the_loop_matches_the_serial_encoding():
+    assert asyncio.run(emoji_sync.encode_sources()) == emoji_sync.collect_sources()
+
+
+def test_the_plan_diffs_by_content_hash_and_refuses_foreign_names():
+    sources = {"archer": b"a", "barbarian": b"b", "giant": b"g", "goblin": b"o"}
+    live = {
+        troop_emoji.managed_name("archer"): SimpleNamespace(id=1),
+        troop_emoji.managed_name("barbarian"): SimpleNamespace(id=2),
+        troop_emoji.managed_name("goblin"): SimpleNamespace(id=4),
+    }
+    registry = {
+        "archer": {"emoji_id": 1, "digest": hashlib.sha256(b"a").hexdigest()},
+        "barbarian": {"emoji_id": 2, "digest": "stale-art"},
+    }
+
+    plan = emoji_sync.plan_sync(sources, live, registry)
+
+    assert plan.skipped == 1
+    assert [upload[0] for upload in plan.uploads] == ["barbarian", "giant"]
+    assert plan.uploads[0][3] is live[troop_emoji.managed_name("barbarian")]
+    assert plan.foreign == [troop_emoji.managed_name("goblin")]
+
+
+class _Registry:
+    def __init__(self):
+        self.rows = {}
+
+    async def update_one(self, query, update, upsert=False):
+        self.rows[query["_id"]] = update["$set"]
+
+
+class _EmojiRest:
+    def __init__(self, *, too_long_after=None):
+        self.in_flight = 0
+        self.peak = 0
+        self.created = []
+        self.deleted = []
+        self.too_long_after = too_long_after
+
+    async def delete_application_emoji(self, application, emoji):
+        self.deleted.append(emoji)
+
+    async def create_application_emoji(self, application, name, image):
+        if self.too_long_after is not None and len(self.created) >= self.too_long_after:
+            raise hikari.RateLimitTooLongError(
+                route="POST /applications/{application}/emojis",
+                is_global=False,
+                retry_after=300.0,
+                max_retry_after=120.0,
+                reset_at=0.0,
+                limit=None,
+                period=None,
+            )
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.created.append(name)
+        return SimpleNamespace(id=1000 + len(self.created))
+
+
+def _uploads(count):
+    slugs = [card.id for card in CARDS][:count]
+    return [
+        (slug, b"x", "d", SimpleNamespace(id=9) if index == 0 else None)
+        for index, slug in enumerate(slugs)
+    ]
+
+
+def test_the_sync_uploads_concurrently_and_reports_progress():
+    rest, registry = _EmojiRest(), _Registry()
+    reports = []
+
+    async def progress(tally, total):
+        reports.append((tally.done, total))
+
+    tally = asyncio.run(emoji_sync.run_sync(
+        rest, SimpleNamespace(emoji_registry=registry), 1, _uploads(25),
+        on_progress=progress,
+    ))
+
+    assert (tally.created, tally.replaced, tally.failed) == (24, 1, 0)
+    assert tally.stopped is None
+    assert 1 < rest.peak <= emoji_sync.UPLOAD_CONCURRENCY
+    assert rest.deleted == [9]
+    assert len(registry.rows) == 25
+    assert reports == [(10, 25), (20, 25)]
+
+
+def test_a_long_rate_limit_stops_new_uploads_and_keeps_what_landed():
+    rest, registry = _EmojiRest(too_long_after=6), _Registry()
+
+    tally = asyncio.run(emoji_sync.run_sync(
+        rest, SimpleNamespace(emoji_registry=registry), 1, _uploads(25),
+    ))
+
+    assert tally.stopped and "300s" in tally.stopped
+    assert tally.done < 25
+    assert len(registry.rows) == len(rest.created) == tally.created + tally.replaced
+
+
+def test_a_worker_that_raises_stops_its_siblings():
+    rest = _EmojiRest()
+
+    class _BrokenRegistry(_Registry):
+        async def update_one(self, query, update, upsert=False):
+            if not self.rows:
+                self.rows[query["_id"]] = None
+                raise RuntimeError("mongo blipped")
+            await super().update_one(query, update, upsert)
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await emoji_sync.run_sync(
+                rest, SimpleNamespace(emoji_registry=_BrokenRegistry()), 1, _uploads(25),
+            )
+        uploaded = len(rest.created)
+        await asyncio.sleep(0.05)
+        return uploaded
+
+    uploaded = asyncio.run(scenario())
+
+    assert len(rest.created) == uploaded
+    assert uploaded <= emoji_sync.UPLOAD_CONCURRENCY
@@ -170,3 +170,87 @@ def test_startup_recovers_from_mongo_failure_and_starts_one_detector(monkeypatch
     assert reconciler.health.state == "healthy"
     assert reconciler.health.attempts == 2
     assert loop_calls == 1
+
+
+class _SweepCollection(_PointsCollection):
+    def __init__(self, records):
+        super().__init__()
+        self.records = records
+        self.find_queries = []
+
+    def find(self, query, *args, **kwargs):
+        self.find_queries.append(query)
+        wanted = set(query["_id"]["$in"])
+        rows = [rec for rec in self.records if rec["_id"] in wanted]
+
+        async def iterate():
+            for rec in rows:
+                yield rec
+
+        return iterate()
+
+    async def find_one(self, *args, **kwargs):
+        raise AssertionError("the sweep must not read records one clan at a time")
+
+
+def test_sweep_runs_war_lookups_concurrently_and_reads_records_once(monkeypatch):
+    tags = [f"CLAN{i:02d}" for i in range(24)]
+    collection = _SweepCollection([
+        {"_id": "CLAN00", "status": "caught_up", "coc_war_key": "OPP:CLAN00"},
+    ])
+    started = []
+
+    async def slow_war_info(tag):
+        await asyncio.sleep(0.05)
+        return "inWar", "OPP", f"OPP:{tag}"
+
+    async def fake_catchup(clan, opp, war_key):
+        started.append(war_key)
+
+    monkeypatch.setattr(monitor, "mongo_client", _Mongo(collection))
+    monkeypatch.setattr(monitor, "get_current_war_info", slow_war_info)
+    monkeypatch.setattr(monitor, "run_catchup", fake_catchup)
+    monkeypatch.setattr(monitor, "SWEEP_CONCURRENCY", len(tags))
+    monkeypatch.setattr(monitor, "active_catchups", {})
+
+    async def scenario():
+        stats = await monitor.sweep_watch_list([{"tag": f"#{t}", "name": t} for t in tags])
+        await asyncio.sleep(0)
+        return stats
+
+    stats = asyncio.run(scenario())
+
+    assert stats.clans == 24
+    # 24 serial lookups would take ~1.2s; a concurrent sweep takes about one.
+    assert stats.duration_seconds < 0.5
+    assert set(stats.latencies) == set(tags)
+    assert len(collection.find_queries) == 1
+    assert sorted(stats.started_catchups) == tags[1:]
+    assert len(started) == 23
+
+
+def test_sweep_deadline_skips_only_the_slow_clan(monkeypatch):
+    collection = _SweepCollection([])
+
+    async def war_info(tag):
+        if tag == "SLOW":
+            await asyncio.sleep(10)
+        return "preparation", "OPP", f"OPP:{tag}"
+
+    async def fake_catchup(clan, opp, war_key):
+        return None
+
+    monkeypatch.setattr(monitor, "mongo_client", _Mongo(collection))
+    monkeypatch.setattr(monitor, "get_current_war_info", war_info)
+    monkeypatch.setattr(monitor, "run_catchup", fake_catchup)
+    monkeypatch.setattr(monitor, "WAR_LOOKUP_TIMEOUT_SECONDS", 0.05)
+    monkeypatch.setattr(monitor, "active_catchups", {})
+
+    stats = asyncio.run(monitor.sweep_watch_list([
+        {"tag": "SLOW", "name": "Slow"},
+        {"tag": "FAST", "name": "Fast"},
+    ]))
+
+    assert stats.timed_out == ["SLOW"]
+    assert stats.started_catchups == ["FAST"]
+    assert "1 timed out" in stats.summary()
@@ -0,0 +1,51 @@
+import io
+
+from PIL import Image
+
+from utils import card_board, image_encoding
+
+
+def _image():
+    image = Image.new("RGB", (64, 48), (240, 228, 205))
+    image.paste((30, 27, 26), (8, 8, 40, 30))
+    return image
+
+
+def test_policies_are_lossless_and_record_cost_per_site():
+    image_encoding.reset_stats()
+    source = _image()
+
+    fast = image_encoding.encode(source, image_encoding.FAST_PNG, site="a")
+    webp = image_encoding.encode(source, image_encoding.LOSSLESS_WEBP, site="b")
+    image_encoding.encode(source, image_encoding.FAST_PNG, site="a")
+
+    for data in (fast, webp):
+        with Image.open(io.BytesIO(data)) as decoded:
+            assert decoded.convert("RGB").tobytes() == source.tobytes()
+    stats = image_encoding.stats()
+    assert stats["a/fast_png"]["calls"] == 2
+    assert stats["a/fast_png"]["avg_bytes"] == len(fast)
+    assert stats["b/lossless_webp"]["calls"] == 1
+    assert "a/fast_png=2x" in image_encoding.summary()
+
+
+def test_interactive_policy_is_fast_png_unless_webp_is_enabled(monkeypatch):
+    monkeypatch.delenv("CARD_IMAGES_WEBP", raising=False)
+    assert image_encoding.interactive_policy() is image_encoding.FAST_PNG
+
+    monkeypatch.setenv("CARD_IMAGES_WEBP", "true")
+    assert image_encoding.interactive_policy() is image_encoding.LOSSLESS_WEBP
+
+
+def test_board_labels_follow_the_policy(monkeypatch):
+    monkeypatch.setenv("CARD_IMAGES_WEBP", "true")
+    webp = card_board.render_card_board({})
+    optimized = card_board.render_card_board(
+        {}, encoding=image_encoding.OPTIMIZED_PNG
+    )
+
+    assert webp.filename == "clash-cards-board.webp"
+    assert webp.content_type == "image/webp"
+    assert webp.png_bytes.startswith(b"RIFF")
+    assert optimized.filename == "clash-cards-board.png"
+    assert optimized.content_type == "image/png"
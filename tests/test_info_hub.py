@@ -0,0 +1,139 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from extensions.commands.clan.info_hub import handlers, helpers
+
+LATENCY = 0.05
+
+
+@pytest.fixture(autouse=True)
+def empty_summaries():
+    helpers.reset_clan_summaries()
+    yield
+    helpers.reset_clan_summaries()
+
+
+class _Coc:
+    def __init__(self, leagues, failing=()):
+        self.leagues = leagues
+        self.failing = set(failing)
+        self.calls = 0
+        self.in_flight = 0
+        self.most_in_flight = 0
+
+    async def get_clan(self, tag):
+        self.calls += 1
+        self.in_flight += 1
+        self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(LATENCY)
+            if tag in self.failing:
+                raise RuntimeError("maintenance")
+            return SimpleNamespace(
+                tag=tag,
+                member_count=50,
+                war_league=SimpleNamespace(name=self.leagues[tag]),
+                capital_districts=[SimpleNamespace(name="Capital Peak", hall_level=9)],
+            )
+        finally:
+            self.in_flight -= 1
+
+
+class _Cursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def to_list(self, length=None):
+        return [dict(row) for row in self.rows]
+
+
+def _mongo(clans):
+    return SimpleNamespace(clans=SimpleNamespace(find=lambda _query: _Cursor(clans)))
+
+
+def _clans(count, type_="Competitive"):
+    return [{"tag": f"#C{n}", "name": f"Clan {n}", "type": type_} for n in range(count)]
+
+
+def _leagues(clans):
+    names = ("Crystal League I", "Champion League I", "Gold League II")
+    return {clan["tag"]: names[n % len(names)] for n, clan in enumerate(clans)}
+
+
+def _render(clans, coc_client):
+    ctx = SimpleNamespace(guild_id=1)
+
+    async def scenario():
+        started = time.perf_counter()
+        components = await handlers.build_clan_list_components(
+            ctx, "Competitive", 0xFF0000, _mongo(clans), coc_client, None
+        )
+        return components, time.perf_counter() - started
+
+    return asyncio.run(scenario())
+
+
+def _texts(components):
+    return [c.content for c in components[1].components if hasattr(c, "content")]
+
+
+def test_render_time_does_not_grow_with_the_clan_count():
+    small, large = _clans(5), _clans(40)
+    _, small_time = _render(small, _Coc(_leagues(small)))
+    helpers.reset_clan_summaries()
+    coc_client = _Coc(_leagues(large))
+    _, large_time = _render(large, coc_client)
+
+    # 40 serial fetches would take 2 s; 5 rounds of 8 take 0.25 s.
+    assert coc_client.calls == 40
+    assert coc_client.most_in_flight == helpers.CLAN_FETCH_CONCURRENCY
+    assert large_time < 40 * LATENCY / 4
+    assert large_time < small_time + 6 * LATENCY
+
+
+def test_a_repeat_opening_within_the_ttl_costs_no_api_calls():
+    clans = _clans(12)
+    first = _Coc(_leagues(clans))
+    components, _ = _render(clans, first)
+    second = _Coc(_leagues(clans))
+    again, elapsed = _render(clans, second)
+
+    assert first.calls == 12
+    assert second.calls == 0
+    assert elapsed < LATENCY
+    assert _texts(again) == _texts(components)
+    assert "Champion League I" in _texts(components)[0]
+
+
+def test_expired_and_failed_summaries_are_fetched_again(monkeypatch):
+    clans = _clans(3)
+    _render(clans, _Coc(_leagues(clans), failing={"#C1"}))
+
+    coc_client = _Coc(_leagues(clans))
+    components, _ = _render(clans, coc_client)
+    assert coc_client.calls == 1
+    assert not any("Unranked" in text for text in _texts(components))
+
+    monkeypatch.setattr(helpers, "CLAN_SUMMARY_TTL_SECONDS", 0)
+    coc_client = _Coc(_leagues(clans))
+    _render(clans, coc_client)
+    assert coc_client.calls == 3
+
+
+def test_concurrent_openings_share_one_fetch_per_clan():
+    clans = _clans(6)
+    coc_client = _Coc(_leagues(clans))
+
+    async def scenario():
+        return await asyncio.gather(*(
+            helpers.get_clan_summaries(coc_client, [c["tag"] for c in clans]) for _ in range(4)
+        ))
+
+    results = asyncio.run(scenario())
+
+    assert coc_client.calls == 6
+    assert all(result == results[0] for result in results)
+    assert results[0]["#C0"] == helpers.ClanSummary(50, "Crystal League I", 9)
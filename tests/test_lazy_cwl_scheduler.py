@@ -3,15 +3,26 @@ from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 
+import pytest
+
 from extensions.commands.fwa import lazy_cwl
 
 
+@pytest.fixture(autouse=True)
+def empty_snapshot_registry():
+    lazy_cwl.reset_snapshot_registry()
+    yield
+    lazy_cwl.reset_snapshot_registry()
+
+
 def _matches(document, query):
     for key, expected in query.items():
         actual = document.get(key)
         if isinstance(expected, dict):
             if "$ne" in expected and actual == expected["$ne"]:
                 return False
+            if "$in" in expected and actual not in expected["$in"]:
+                return False
             if expected.get("$type") == "string" and not isinstance(actual, str):
                 return False
         elif actual != expected:
@@ -66,6 +77,8 @@ class FakeCollection:
         for document in self.documents.values():
             if _matches(document, query):
                 document.update(deepcopy(update.get("$set", {})))
+                for key, amount in update.get("$inc", {}).items():
+                    document[key] = document.get(key, 0) + amount
                 modified += 1
         return SimpleNamespace(modified_count=modified)
 
@@ -264,11 +277,12 @@ def test_auto_ping_count_increments_only_when_a_message_was_sent(monkeypatch):
     snapshot = {
         "_id": "snapshot",
         "clan_name": "Clan",
+        "clan_tag": "#TAG",
         "active": True,
         "auto_ping_enabled": True,
     }
     collection = FakeCollection([snapshot])
-    mongo = SimpleNamespace(lazy_cwl_snapshots=collection)
+    mongo = SimpleNamespace(lazy_cwl_snapshots=collection, clans=FakeCollection())
     scheduler = FakeScheduler()
     results = iter([
         {
@@ -287,13 +301,17 @@ def test_auto_ping_count_increments_only_when_a_message_was_sent(monkeypatch):
         },
     ])
 
-    async def fake_ping(*args):
+    async def fake_ping(*args, **kwargs):
         return next(results)
 
+    async def get_clan(tag):
+        return SimpleNamespace(tag=tag, members=[])
+
+    monkeypatch.setattr(lazy_cwl, "AUTOPING_BATCH_WINDOW_SECONDS", 0)
     monkeypatch.setattr(lazy_cwl, "mongo_client", mongo)
     monkeypatch.setattr(lazy_cwl, "scheduler", scheduler)
     monkeypatch.setattr(lazy_cwl, "bot_instance", SimpleNamespace())
-    monkeypatch.setattr(lazy_cwl, "coc_client", SimpleNamespace())
+    monkeypatch.setattr(lazy_cwl, "coc_client", SimpleNamespace(get_clan=get_clan))
     monkeypatch.setattr(lazy_cwl, "process_single_snapshot_ping", fake_ping)
 
     asyncio.run(lazy_cwl.auto_ping_job("snapshot"))
@@ -312,10 +330,11 @@ def test_autoping_job_clears_stale_enabled_flag_on_inactive_snapshot(monkeypatch
         "auto_ping_enabled": True,
     }])
     scheduler = FakeScheduler()
+    monkeypatch.setattr(lazy_cwl, "AUTOPING_BATCH_WINDOW_SECONDS", 0)
     monkeypatch.setattr(
         lazy_cwl,
         "mongo_client",
-        SimpleNamespace(lazy_cwl_snapshots=collection),
+        SimpleNamespace(lazy_cwl_snapshots=collection, clans=FakeCollection()),
     )
     monkeypatch.setattr(lazy_cwl, "scheduler", scheduler)
     monkeypatch.setattr(lazy_cwl, "bot_instance", SimpleNamespace())
@@ -376,7 +395,6 @@ def test_failed_scheduler_registration_rolls_back_enabled_flag():
         30,
         mongo,
         FakeScheduler(fail_add=True),
-        0,
     ))
 
     assert result["success"] is False
@@ -474,3 +492,210 @@ def test_duplicate_loader_start_events_create_one_scheduler(monkeypatch):
         "active": True,
         "auto_ping_enabled": True,
     }) == 1
+
+
+def test_jobs_due_together_share_one_read_and_one_fetch_per_clan(monkeypatch):
+    now = datetime.now(timezone.utc)
+    snapshots = [
+        {
+            "_id": f"snapshot{n}",
+            "clan_name": f"Clan {n}",
+            "clan_tag": f"#TAG{n}",
+            "active": True,
+            "auto_ping_enabled": True,
+            "auto_ping_started_at": now - timedelta(hours=1),
+            "players": [{"tag": f"#P{n}"}],
+        }
+        for n in range(24)
+    ]
+    collection = FakeCollection(snapshots)
+    mongo = SimpleNamespace(lazy_cwl_snapshots=collection, clans=FakeCollection())
+    fetched = []
+    in_flight = 0
+    most_in_flight = 0
+
+    async def get_clan(tag):
+        nonlocal in_flight, most_in_flight
+        fetched.append(tag)
+        in_flight += 1
+        most_in_flight = max(most_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if tag == "#TAG3":
+            raise RuntimeError("maintenance")
+        # Even-numbered clans still have their player; odd ones lost them.
+        index = int(tag[4:])
+        members = [SimpleNamespace(tag=f"#P{index}")] if index % 2 == 0 else []
+        return SimpleNamespace(tag=tag, members=members)
+
+    sent = []
+
+    async def create_message(**kwargs):
+        sent.append(kwargs)
+
+    monkeypatch.setattr(lazy_cwl, "AUTOPING_BATCH_WINDOW_SECONDS", 0.05)
+    monkeypatch.setattr(lazy_cwl, "mongo_client", mongo)
+    monkeypatch.setattr(lazy_cwl, "scheduler", FakeScheduler())
+    monkeypatch.setattr(
+        lazy_cwl, "bot_instance",
+        SimpleNamespace(rest=SimpleNamespace(create_message=create_message)),
+    )
+    monkeypatch.setattr(lazy_cwl, "coc_client", SimpleNamespace(get_clan=get_clan))
+
+    async def fire_together():
+        await asyncio.gather(*(
+            lazy_cwl.auto_ping_job(snapshot["_id"]) for snapshot in snapshots
+        ))
+
+    asyncio.run(fire_together())
+
+    assert collection.find_queries == [
+        {"_id": {"$in": [snapshot["_id"] for snapshot in snapshots]}}
+    ]
+    assert sorted(fetched) == sorted(snapshot["clan_tag"] for snapshot in snapshots)
+    assert most_in_flight == lazy_cwl.AUTOPING_FETCH_CONCURRENCY
+    # 12 odd clans lost a player; #TAG3's fetch failed and is skipped.
+    assert len(sent) == 11
+    assert "last_auto_ping_at" not in collection.documents["snapshot3"]
+    assert collection.documents["snapshot1"]["auto_ping_count"] == 1
+    assert collection.documents["snapshot0"].get("auto_ping_count", 0) == 0
+    assert len({
+        document["last_auto_ping_at"] for document in collection.documents.values()
+        if "last_auto_ping_at" in document
+    }) == 1
+    assert lazy_cwl._autoping_window is None
+
+
+def _batch_setup(monkeypatch, snapshots, clans=None):
+    collection = FakeCollection(snapshots)
+    mongo = SimpleNamespace(lazy_cwl_snapshots=collection, clans=clans or FakeCollection())
+    fetched, sent = [], []
+
+    async def get_clan(tag):
+        fetched.append(tag)
+        return SimpleNamespace(tag=tag, members=[])
+
+    async def create_message(**kwargs):
+        sent.append(kwargs)
+
+    monkeypatch.setattr(lazy_cwl, "mongo_client", mongo)
+    monkeypatch.setattr(lazy_cwl, "scheduler", FakeScheduler())
+    monkeypatch.setattr(
+        lazy_cwl, "bot_instance",
+        SimpleNamespace(rest=SimpleNamespace(create_message=create_message)),
+    )
+    monkeypatch.setattr(lazy_cwl, "coc_client", SimpleNamespace(get_clan=get_clan))
+    return collection, fetched, sent
+
+
+def _due_snapshot(n, **fields):
+    return {
+        "_id": f"snapshot{n}",
+        "clan_name": f"Clan {n}",
+        "clan_tag": f"#TAG{n}",
+        "active": True,
+        "auto_ping_enabled": True,
+        "auto_ping_started_at": datetime.now(timezone.utc) - timedelta(hours=1),
+        "players": [{"tag": f"#P{n}"}],
+        **fields,
+    }
+
+
+def test_one_snapshot_failing_its_checks_does_not_cost_the_others_their_ping(monkeypatch):
+    snapshots = [
+        _due_snapshot(0),
+        # Expired, and its disable write will fail.
+        _due_snapshot(1, auto_ping_started_at=datetime.now(timezone.utc) - timedelta(days=8)),
+        _due_snapshot(2, clan_tag=None),
+        _due_snapshot(3),
+    ]
+    collection, fetched, sent = _batch_setup(monkeypatch, snapshots)
+
+    async def failing_update(query, update):
+        raise RuntimeError("write failed")
+
+    collection.update_one = failing_update
+
+    summary = asyncio.run(lazy_cwl.run_autoping_batch([s["_id"] for s in snapshots]))
+
+    assert sorted(fetched) == ["#TAG0", "#TAG3"]
+    assert len(sent) == 2
+    assert summary["failed"] == 2
+    assert "last_auto_ping_at" in collection.documents["snapshot0"]
+
+
+def test_a_failed_role_read_starts_no_clan_fetch(monkeypatch):
+    class FailingClans(FakeCollection):
+        def find(self, query):
+            raise RuntimeError("mongo unavailable")
+
+    _collection, fetched, sent = _batch_setup(
+        monkeypatch, [_due_snapshot(0)], clans=FailingClans()
+    )
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(lazy_cwl.run_autoping_batch(["snapshot0"]))
+
+    assert fetched == []
+    assert sent == []
+
+
+def test_menus_read_headers_that_the_write_paths_keep_in_step():
+    snapshot_date = datetime(2026, 8, 4, tzinfo=timezone.utc)
+    collection = FakeCollection([
+        {
+            "_id": f"snapshot{n}",
+            "clan_name": f"Clan {n}",
+            "clan_tag": f"#tag{n}",
+            "snapshot_date": snapshot_date + timedelta(hours=n),
+            "active": True,
+            "auto_ping_enabled": False,
+            "players": [{"tag": "#P1", "discord_id": "1"}, {"tag": "#P2"}],
+        }
+        for n in range(3)
+    ])
+    mongo = SimpleNamespace(lazy_cwl_snapshots=collection)
+
+    async def scenario():
+        await lazy_cwl.ensure_snapshot_invariants(mongo)
+        reads = len(collection.find_queries)
+        await lazy_cwl.process_single_autoping_start(
+            collection.documents["snapshot1"], 30, mongo, FakeScheduler()
+        )
+        await lazy_cwl.process_single_snapshot_reset("snapshot2", mongo, FakeScheduler())
+        menus = (
+            await lazy_cwl.active_snapshot_headers(mongo),
+            await lazy_cwl.active_snapshot_headers(mongo, auto_ping=True),
+            await lazy_cwl.active_snapshot_headers(mongo, auto_ping=False),
+        )
+        return menus, len(collection.find_queries) - reads
+
+    (everything, running, idle), menu_reads = asyncio.run(scenario())
+
+    assert menu_reads == 0
+    assert [header["_id"] for header in everything] == ["snapshot1", "snapshot0"]
+    assert [header["_id"] for header in running] == ["snapshot1"]
+    assert running[0]["auto_ping_interval_minutes"] == 30
+    assert [header["_id"] for header in idle] == ["snapshot0"]
+    assert idle[0]["clan_tag"] == "#TAG0"
+    assert "players" not in idle[0]
+    assert (idle[0]["player_count"], idle[0]["linked_count"]) == (2, 1)
+
+
+def test_menus_load_the_registry_once_if_startup_did_not():
+    collection = FakeCollection([{
+        "_id": "snapshot",
+        "clan_name": "Clan",
+        "clan_tag": "#TAG",
+        "active": True,
+        "players": [],
+    }])
+    mongo = SimpleNamespace(lazy_cwl_snapshots=collection)
+
+    async def open_menus():
+        for _ in range(3):
+            await lazy_cwl.active_snapshot_headers(mongo)
+
+    asyncio.run(open_menus())
+
+    assert collection.find_queries == [{"active": True}]
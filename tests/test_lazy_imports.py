@@ -0,0 +1,60 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from utils import lazy_imports
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_the_module_runs_on_first_attribute_read(tmp_path, monkeypatch):
+    (tmp_path / "lazy_probe_module.py").write_text(
+        "import builtins\nbuiltins.lazy_probe_ran = True\nVALUE = 7\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_probe_module", raising=False)
+    import builtins
+
+    monkeypatch.setattr(builtins, "lazy_probe_ran", False, raising=False)
+
+    module = lazy_imports.lazy_import("lazy_probe_module")
+
+    assert builtins.lazy_probe_ran is False
+    assert lazy_imports.deferred()["lazy_probe_module"] is False
+    assert module.VALUE == 7
+    assert builtins.lazy_probe_ran is True
+    assert lazy_imports.is_loaded("lazy_probe_module")
+    assert module.__loader__.get_filename("lazy_probe_module").endswith("lazy_probe_module.py")
+    assert lazy_imports.lazy_import("lazy_probe_module") is module
+
+
+def test_registering_the_heavy_commands_defers_their_dependencies():
+    script = (
+        "import sys\n"
+        "import extensions.commands.cards, extensions.commands.steal\n"
+        "import utils.fwa_points_parser, utils.band_ical_parser\n"
+        "import utils.cloudinary_client\n"
+        "heavy = ('utils.card_board', 'PIL.Image', 'bs4', 'icalendar', 'cloudinary')\n"
+        "from utils.lazy_imports import is_loaded\n"
+        "print([name for name in heavy if is_loaded(name)])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_ensure_loaded_runs_the_deferred_import(tmp_path, monkeypatch):
+    (tmp_path / "lazy_probe_eager.py").write_text("VALUE = 3\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_probe_eager", raising=False)
+
+    module = lazy_imports.lazy_import("lazy_probe_eager")
+    assert not lazy_imports.is_loaded("lazy_probe_eager")
+
+    lazy_imports.ensure_loaded(module)
+
+    assert lazy_imports.is_loaded("lazy_probe_eager")
+    assert module.VALUE == 3
@@ -42,6 +42,10 @@ def _poll(
     }
 
 
+async def _no_backfill(_mongo):
+    return 0
+
+
 def _walk_payload(value):
     if isinstance(value, dict):
         yield value
@@ -222,6 +226,18 @@ def test_vote_counts_ignore_unknown_choices_and_results_cover_all_outcomes():
     )
 
 
+def test_vote_counts_come_from_stored_tallies_when_ballots_are_not_loaded():
+    document = _poll()
+    del document["votes"]
+    document["tallies"] = {"1": 4, "3": 1, "99": 7, "2": -1}
+
+    counts, total = poll_command._option_counts(document)
+
+    assert counts == {1: 4, 2: 0, 3: 1}
+    assert total == 5
+    assert "**80% · 4**" in _payload_text(poll_command.build_poll_components(document))
+
+
 @pytest.mark.parametrize(
     ("votes", "expected"),
     [
@@ -768,11 +784,13 @@ def test_public_vote_is_guild_scoped_and_records_the_clicker(monkeypatch):
     ctx = _InteractionContext(user_id=456)
     document = _poll()
     updated = _poll(votes={"456": 2})
+    updated["message_sync_pending"] = True
     calls = []
 
     async def get_poll(_mongo, **kwargs):
         calls.append(("get", kwargs))
-        return document
+        recorded = any(call[0] == "vote" for call in calls)
+        return updated if recorded else document
 
     async def record_vote(_mongo, **kwargs):
         calls.append(("vote", kwargs))
@@ -785,14 +803,21 @@ def test_public_vote_is_guild_scoped_and_records_the_clicker(monkeypatch):
     monkeypatch.setattr(poll_command.poll_store, "get_poll", get_poll)
     monkeypatch.setattr(poll_command.poll_store, "record_vote", record_vote)
     monkeypatch.setattr(poll_command, "_sync_poll_message", sync)
+    monkeypatch.setattr(poll_command, "POLL_RENDER_WINDOW_SECONDS", 0)
     poll_command._poll_locks.clear()
 
-    asyncio.run(poll_command.poll_vote(
-        ctx=ctx,
-        action_id=f"{document['_id']}|2",
-        mongo=object(),
-        bot=object(),
-    ))
+    async def scenario():
+        await poll_command.poll_vote(
+            ctx=ctx,
+            action_id=f"{document['_id']}|2",
+            mongo=object(),
+            bot=object(),
+        )
+        responded_before_sync = not any(call[0] == "sync" for call in calls)
+        await poll_command._render_tasks[document["_id"]]
+        return responded_before_sync
+
+    responded_before_sync = asyncio.run(scenario())
 
     vote_call = next(call[1] for call in calls if call[0] == "vote")
     assert vote_call == {
@@ -801,10 +826,85 @@ def test_public_vote_is_guild_scoped_and_records_the_clicker(monkeypatch):
         "user_id": 456,
         "choice": 2,
     }
+    assert responded_before_sync
     assert any(call[0] == "sync" for call in calls)
     assert ctx.responses[-1][1]["ephemeral"] is True
 
 
+def test_a_contended_vote_asks_the_voter_to_try_again(monkeypatch):
+    ctx = _InteractionContext(user_id=456)
+    rendered = []
+
+    async def get_poll(_mongo, **_kwargs):
+        return _poll()
+
+    async def record_vote(_mongo, **_kwargs):
+        raise poll_command.poll_store.VoteContendedError(_poll()["_id"])
+
+    monkeypatch.setattr(poll_command.poll_store, "get_poll", get_poll)
+    monkeypatch.setattr(poll_command.poll_store, "record_vote", record_vote)
+    monkeypatch.setattr(poll_command, "_request_poll_render", lambda *args: rendered.append(args))
+    poll_command._poll_locks.clear()
+
+    asyncio.run(poll_command.poll_vote(
+        ctx=ctx, action_id=f"{_poll()['_id']}|2", mongo=object(), bot=object(),
+    ))
+
+    (args, kwargs), = ctx.responses
+    assert "Press the button again" in args[0]
+    assert "closed" not in args[0]
+    assert kwargs["ephemeral"] is True
+    assert rendered == []
+
+
+def test_vote_burst_is_rendered_once_with_the_latest_tallies(monkeypatch):
+    votes = {}
+    synced = []
+
+    async def get_poll(_mongo, **_kwargs):
+        document = _poll(votes=votes)
+        document["message_sync_pending"] = bool(votes)
+        return document
+
+    async def record_vote(_mongo, *, user_id, choice, **_kwargs):
+        votes[str(user_id)] = choice
+        return _poll(votes=votes)
+
+    async def sync(_mongo, _bot, document):
+        synced.append(dict(document["votes"]))
+        return True
+
+    monkeypatch.setattr(poll_command.poll_store, "get_poll", get_poll)
+    monkeypatch.setattr(poll_command.poll_store, "record_vote", record_vote)
+    monkeypatch.setattr(poll_command, "_sync_poll_message", sync)
+    monkeypatch.setattr(poll_command, "POLL_RENDER_WINDOW_SECONDS", 0.01)
+    poll_command._poll_locks.clear()
+    poll_command._render_absorbed.clear()
+
+    async def scenario():
+        contexts = [_InteractionContext(user_id=100 + index) for index in range(20)]
+        await asyncio.gather(*(
+            poll_command.poll_vote(
+                ctx=ctx,
+                action_id=f"{_poll()['_id']}|{1 + index % 3}",
+                mongo=object(),
+                bot=object(),
+            )
+            for index, ctx in enumerate(contexts)
+        ))
+        assert all(ctx.responses for ctx in contexts)
+        assert synced == []
+        await poll_command._render_tasks[_poll()["_id"]]
+
+    asyncio.run(scenario())
+
+    assert len(synced) == 1
+    assert len(synced[0]) == 20
+    assert poll_command.render_stats() == {
+        "edits": 1, "votes": 20, "max_absorbed": 20,
+    }
+
+
 def test_end_button_rechecks_admin_and_uses_manual_reason(monkeypatch):
     ctx = _InteractionContext(admin=True)
     document = _poll(active=False)
@@ -977,6 +1077,7 @@ def test_restart_recovery_reschedules_the_exact_minute_deadline(monkeypatch):
     )
     monkeypatch.setattr(poll_command.poll_store, "list_open_polls", list_open)
     monkeypatch.setattr(poll_command.poll_store, "ensure_indexes", ensure_indexes)
+    monkeypatch.setattr(poll_command.poll_store, "backfill_tallies", _no_backfill)
 
     asyncio.run(poll_command._reconcile_poll_startup())
 
@@ -1142,6 +1243,7 @@ def test_startup_reconcile_ends_all_due_batches_and_schedules_open_polls(
     monkeypatch.setattr(poll_command, "_bot", bot)
     monkeypatch.setattr(poll_command, "_scheduler", scheduler)
     monkeypatch.setattr(poll_command.poll_store, "ensure_indexes", ensure_indexes)
+    monkeypatch.setattr(poll_command.poll_store, "backfill_tallies", _no_backfill)
     monkeypatch.setattr(poll_command.poll_store, "list_due_polls", list_due)
     monkeypatch.setattr(
         poll_command.poll_store, "list_pending_message_sync", list_pending,
@@ -1195,6 +1297,7 @@ def test_index_failure_does_not_block_deadline_recovery(monkeypatch):
     )
     monkeypatch.setattr(poll_command.poll_store, "list_open_polls", open_polls)
     monkeypatch.setattr(poll_command.poll_store, "ensure_indexes", indexes_fail)
+    monkeypatch.setattr(poll_command.poll_store, "backfill_tallies", _no_backfill)
     monkeypatch.setattr(poll_command, "_schedule_poll", scheduled.append)
 
     with pytest.raises(RuntimeError, match="index permissions"):
@@ -3,15 +3,35 @@ from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 
+import pytest
+
 from utils import poll_store
 
 
 NOW = datetime(2026, 8, 14, 12, 0, tzinfo=timezone.utc)
 
 
+_ABSENT = object()
+
+
+def _get_path(document, path):
+    current = document
+    for part in path.split("."):
+        if not isinstance(current, dict) or part not in current:
+            return _ABSENT
+        current = current[part]
+    return current
+
+
 def _matches(document, query):
     for key, expected in query.items():
-        actual = document.get(key)
+        actual = _get_path(document, key)
+        if isinstance(expected, dict) and "$exists" in expected:
+            if (actual is not _ABSENT) != expected["$exists"]:
+                return False
+            continue
+        if actual is _ABSENT:
+            actual = None
         if not isinstance(expected, dict):
             if actual != expected:
                 return False
@@ -31,6 +51,31 @@ def _set_path(document, path, value):
     current[parts[-1]] = deepcopy(value)
 
 
+def _apply(document, update):
+    for path, value in update.get("$set", {}).items():
+        _set_path(document, path, value)
+    for path, amount in update.get("$inc", {}).items():
+        current = _get_path(document, path)
+        _set_path(document, path, (0 if current is _ABSENT else current) + amount)
+
+
+def _project(document, projection):
+    if not projection:
+        return deepcopy(document)
+    if all(not value for value in projection.values()):
+        return {
+            key: deepcopy(value)
+            for key, value in document.items()
+            if key not in projection
+        }
+    projected = {"_id": document["_id"]}
+    for path in projection:
+        value = _get_path(document, path)
+        if value is not _ABSENT:
+            _set_path(projected, path, value)
+    return projected
+
+
 class _Cursor:
     def __init__(self, documents):
         self.documents = [deepcopy(document) for document in documents]
@@ -60,6 +105,7 @@ class _Collection:
         }
         self.index_calls = []
         self.atomic_calls = []
+        self.projections = []
 
     async def create_index(self, keys, **kwargs):
         self.index_calls.append((deepcopy(keys), deepcopy(kwargs)))
@@ -69,29 +115,37 @@ class _Collection:
         self.documents[document["_id"]] = deepcopy(document)
         return SimpleNamespace(inserted_id=document["_id"])
 
-    async def find_one(self, query):
+    async def find_one(self, query, projection=None):
+        self.projections.append(deepcopy(projection))
         for document in self.documents.values():
             if _matches(document, query):
-                return deepcopy(document)
+                return _project(document, projection)
         return None
 
-    def find(self, query):
+    def find(self, query, projection=None):
+        self.projections.append(deepcopy(projection))
         return _Cursor(
-            document
+            _project(document, projection)
             for document in self.documents.values()
             if _matches(document, query)
         )
 
-    async def find_one_and_update(self, query, update, **kwargs):
+    async def update_one(self, query, update):
+        for document in self.documents.values():
+            if _matches(document, query):
+                _apply(document, update)
+                return SimpleNamespace(matched_count=1)
+        return SimpleNamespace(matched_count=0)
+
+    async def find_one_and_update(self, query, update, projection=None, **kwargs):
         self.atomic_calls.append((
             deepcopy(query), deepcopy(update), deepcopy(kwargs)
         ))
         for document in self.documents.values():
             if not _matches(document, query):
                 continue
-            for path, value in update.get("$set", {}).items():
-                _set_path(document, path, value)
-            return deepcopy(document)
+            _apply(document, update)
+            return _project(document, projection)
         return None
 
 
@@ -267,7 +321,8 @@ def test_record_vote_is_one_atomic_active_unexpired_guild_scoped_write():
         observed_at=NOW,
     ))
 
-    assert voted["votes"] == {"42": 2}
+    assert "votes" not in voted
+    assert voted["tallies"] == {"2": 1}
     assert voted["message_sync_pending"] is True
     assert voted["updated_at"] == NOW
     assert wrong_guild is None
@@ -280,8 +335,11 @@ def test_record_vote_is_one_atomic_active_unexpired_guild_scoped_write():
         "guild_id": 1,
         "active": True,
         "ends_at": {"$gt": NOW},
+        "tallies": {"$exists": True},
+        "votes.42": {"$exists": False},
     }
     assert first_update["$set"]["votes.42"] == 2
+    assert first_update["$inc"] == {"tallies.2": 1}
     assert first_update["$set"]["message_sync_pending"] is True
 
 
@@ -305,8 +363,81 @@ def test_record_vote_replaces_one_users_choice_without_adding_a_second_ballot():
         observed_at=NOW + timedelta(seconds=1),
     ))
 
-    assert changed["votes"] == {"42": 3}
+    same_again = asyncio.run(poll_store.record_vote(
+        mongo,
+        guild_id=1,
+        poll_id="live",
+        user_id=42,
+        choice=3,
+        observed_at=NOW + timedelta(seconds=2),
+    ))
+
+    assert changed["tallies"] == {"1": 0, "3": 1}
+    assert same_again["tallies"] == {"1": 0, "3": 1}
     assert mongo.discord_polls.documents["live"]["votes"] == {"42": 3}
+    _query, last_update, _kwargs = mongo.discord_polls.atomic_calls[-1]
+    assert "$inc" not in last_update
+
+
+def test_record_vote_reports_a_lost_race_apart_from_a_closed_poll():
+    mongo = _Mongo([_poll("live", guild_id=1)])
+    mongo.discord_polls.documents["live"]["tallies"] = {}
+    collection = mongo.discord_polls
+
+    async def always_raced(query, update, projection=None, **kwargs):
+        # Another click lands between every read and its conditional write.
+        collection.documents["live"]["votes"]["42"] = len(collection.atomic_calls) + 1
+        collection.atomic_calls.append((query, update, kwargs))
+        return None
+
+    collection.find_one_and_update = always_raced
+
+    with pytest.raises(poll_store.VoteContendedError):
+        asyncio.run(poll_store.record_vote(
+            mongo, guild_id=1, poll_id="live", user_id=42, choice=1, observed_at=NOW,
+        ))
+    assert len(collection.atomic_calls) == poll_store.VOTE_WRITE_ATTEMPTS
+
+    closed = asyncio.run(poll_store.record_vote(
+        mongo, guild_id=2, poll_id="live", user_id=42, choice=1, observed_at=NOW,
+    ))
+    assert closed is None
+
+
+def test_record_vote_backfills_tallies_for_polls_stored_before_them():
+    legacy = _poll("legacy", guild_id=1)
+    legacy["votes"] = {"7": 1, "8": 1, "9": 2, "10": "not-a-choice"}
+    mongo = _Mongo([legacy])
+
+    voted = asyncio.run(poll_store.record_vote(
+        mongo,
+        guild_id=1,
+        poll_id="legacy",
+        user_id=9,
+        choice=1,
+        observed_at=NOW,
+    ))
+
+    assert voted["tallies"] == {"1": 3, "2": 0}
+    assert asyncio.run(poll_store.backfill_tallies(mongo)) == 0
+
+
+def test_count_only_reads_leave_the_ballot_map_behind():
+    document = _poll("live", guild_id=1)
+    document["votes"] = {"42": 1}
+    mongo = _Mongo([document])
+
+    counts_only = asyncio.run(poll_store.get_poll(
+        mongo, guild_id=1, poll_id="live", include_votes=False,
+    ))
+    named = asyncio.run(poll_store.get_poll(mongo, guild_id=1, poll_id="live"))
+    listed = asyncio.run(poll_store.list_active_polls(
+        mongo, guild_id=1, observed_at=NOW,
+    ))
+
+    assert "votes" not in counts_only
+    assert named["votes"] == {"42": 1}
+    assert "votes" not in listed[0]
 
 
 def test_end_poll_is_atomic_and_starts_retention_only_once():
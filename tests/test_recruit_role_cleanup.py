@@ -157,3 +157,81 @@ def test_permanent_cleanup_failure_is_terminal_immediately():
     assert terminal is True
     assert document["cleanup_attempts"] == 1
     assert document["cleanup_terminal_reason"] == "permanent_discord_error"
+
+
+class _BucketRest:
+    """Discord-style: a shared bucket per guild that makes callers wait."""
+
+    def __init__(self, *, limit=5, window=0.02, too_long_after=None):
+        self.limit, self.window = limit, window
+        self.used, self.resets_at = 0, None
+        self.in_flight = self.peak = 0
+        self.removed = []
+        self.started = 0
+        self.too_long_after = too_long_after
+
+    async def _bucket(self):
+        loop = asyncio.get_running_loop()
+        if self.resets_at is None or loop.time() >= self.resets_at:
+            self.used, self.resets_at = 0, loop.time() + self.window
+        if self.used >= self.limit:
+            await asyncio.sleep(self.resets_at - loop.time())
+            self.used, self.resets_at = 0, loop.time() + self.window
+        self.used += 1
+
+    async def fetch_member(self, guild_id, user_id):
+        return SimpleNamespace(
+            id=user_id, role_ids=(cleanup.NEW_RECRUIT_ROLE_ID,), display_name=str(user_id)
+        )
+
+    async def remove_role_from_member(self, guild_id, user_id, role_id, **_kwargs):
+        self.started += 1
+        if self.too_long_after is not None and self.started > self.too_long_after:
+            raise cleanup.hikari.RateLimitTooLongError(
+                route="PUT /guilds/{guild}/members/{user}/roles/{role}",
+                is_global=False, retry_after=600.0, max_retry_after=300.0,
+                reset_at=0.0, limit=None, period=None,
+            )
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await self._bucket()
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        self.removed.append(user_id)
+
+
+def _backlog(members, *, repeats=()):
+    old = datetime.now(timezone.utc) - timedelta(hours=3)
+    rows = [
+        {"_id": f"row{n}", "user_id": 100 + n, "guild_id": 10,
+         "walkthrough_started_at": old, "new_recruit_role_removed": False}
+        for n in range(members)
+    ]
+    rows += [dict(rows[n], _id=f"row{n}-again") for n in repeats]
+    return rows
+
+
+def test_a_backlog_drains_in_one_check_paced_by_the_bucket(monkeypatch):
+    collection = _Collection(_backlog(60, repeats=(0, 1, 2)))
+    rest = _BucketRest()
+    monkeypatch.setattr(cleanup, "mongo_client", SimpleNamespace(recruit_onboarding=collection))
+    monkeypatch.setattr(cleanup, "bot_instance", SimpleNamespace(cache=_Cache(), rest=rest))
+
+    asyncio.run(cleanup.remove_expired_recruit_roles())
+
+    assert sorted(rest.removed) == list(range(100, 160))   # one call per member
+    assert 1 < rest.peak <= cleanup.REMOVAL_CONCURRENCY
+    assert all(row["new_recruit_role_removed"] for row in collection.documents)
+
+
+def test_a_long_rate_limit_ends_the_check_without_spending_failures(monkeypatch):
+    collection = _Collection(_backlog(20))
+    rest = _BucketRest(too_long_after=3)
+    monkeypatch.setattr(cleanup, "mongo_client", SimpleNamespace(recruit_onboarding=collection))
+    monkeypatch.setattr(cleanup, "bot_instance", SimpleNamespace(cache=_Cache(), rest=rest))
+
+    asyncio.run(cleanup.remove_expired_recruit_roles())
+
+    assert len(rest.removed) == 3
+    assert not any("cleanup_attempts" in row for row in collection.documents)
+    assert sum(row["new_recruit_role_removed"] for row in collection.documents) == 3
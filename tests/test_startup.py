@@ -1,7 +1,12 @@
 import asyncio
+import json
+import subprocess
+import sys
 import warnings
+from pathlib import Path
 
 from utils import startup
+from utils.concurrency import run_concurrently
 
 
 def test_extension_discovery_only_returns_loader_entry_points():
@@ -83,3 +88,111 @@ def test_clash_client_is_created_on_running_loop_without_deprecation_warning():
 
     assert client.loop is loop
     assert not any("There is no current event loop" in str(item.message) for item in caught)
+
+
+def test_the_manifest_reuses_unchanged_files_and_reparses_edited_ones(
+    tmp_path, monkeypatch
+):
+    manifest = tmp_path / "manifest.json"
+    first = startup.load_cogs(
+        disallowed={"example"}, disallowed_folders={"tickets"},
+        manifest_path=manifest,
+    )
+    assert manifest.is_file()
+
+    parsed = []
+    real = startup._binds_loader
+    monkeypatch.setattr(
+        startup, "_binds_loader",
+        lambda path: parsed.append(path) or real(path),
+    )
+    second = startup.load_cogs(
+        disallowed={"example"}, disallowed_folders={"tickets"},
+        manifest_path=manifest,
+    )
+
+    assert second == first
+    assert parsed == []
+
+    # A stamp that no longer matches the file is parsed again.
+    stale = json.loads(manifest.read_text())
+    cards = str(startup.COMMANDS_ROOT / "cards.py")
+    stale[cards]["stamp"] = [0, 0]
+    manifest.write_text(json.dumps(stale))
+    startup.load_cogs(
+        disallowed={"example"}, disallowed_folders={"tickets"},
+        manifest_path=manifest,
+    )
+    assert [str(path) for path in parsed] == [cards]
+
+
+def test_an_unreadable_manifest_just_means_parsing_again(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text("{not json")
+
+    discovered = startup.load_cogs(
+        disallowed={"example"}, disallowed_folders={"tickets"},
+        manifest_path=manifest,
+    )
+
+    assert "extensions.commands.cards" in discovered
+
+
+def test_profiled_hooks_and_phases_are_recorded_by_name():
+    startup.reset_profile()
+
+    @startup.profile_hook
+    async def warm_cache(_event):
+        await asyncio.sleep(0.01)
+        return "warm"
+
+    with startup.timed("extension", "extensions.commands.cards"):
+        pass
+    assert asyncio.run(warm_cache(None)) == "warm"
+
+    recorded = startup.profile()
+    assert recorded["hook"][f"{__name__}.warm_cache"] >= 0.01
+    assert "extensions.commands.cards" in recorded["extension"]
+    assert "hook: 1 in" in startup.profile_summary()
+    startup.reset_profile()
+
+
+def test_concurrent_steps_all_settle_before_the_first_failure_is_raised():
+    finished = []
+
+    async def step(name, delay, fail=False):
+        await asyncio.sleep(delay)
+        finished.append(name)
+        if fail:
+            raise RuntimeError(name)
+
+    async def scenario():
+        started = asyncio.get_running_loop().time()
+        try:
+            await run_concurrently(
+                step("a", 0.05), step("b", 0.01, fail=True), step("c", 0.05),
+            )
+        except RuntimeError as exc:
+            return str(exc), asyncio.get_running_loop().time() - started
+        return None, 0
+
+    failed, took = asyncio.run(scenario())
+
+    assert failed == "b"
+    assert sorted(finished) == ["a", "b", "c"]
+    assert took < 0.1
+
+
+def test_the_storage_modules_do_not_pull_in_the_coc_client():
+    script = (
+        "import sys\n"
+        "import utils.poll_store, utils.clan_history\n"
+        "print(sorted(m for m in ('coc', 'utils.startup') if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True, text=True, check=True,
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "[]"
@@ -1,6 +1,9 @@
 import asyncio
+from collections import Counter
 from datetime import datetime, timezone
+from types import SimpleNamespace
 
+import pytest
 from pymongo.errors import DuplicateKeyError
 
 from extensions.events.channel import ticket_channel_monitor as monitor
@@ -10,25 +13,27 @@ class _TicketStoreMongo:
     pass
 
 
-def test_wait_for_ticket_data_polls_until_persisted(monkeypatch):
+@pytest.fixture(autouse=True)
+def no_remembered_tickets():
+    monitor.store.reset_ready()
+    yield
+    monitor.store.reset_ready()
+
+
+def test_wait_for_ticket_data_polls_for_another_process(monkeypatch):
     responses = [None, None, {"_id": "ticket_42", "user_id": 7}]
-    sleeps = []
 
     async def fake_find_one(_mongo, _query):
         return responses.pop(0)
 
-    async def fake_sleep(delay):
-        sleeps.append(delay)
-
     monkeypatch.setattr(monitor.store, "find_one", fake_find_one)
-    monkeypatch.setattr(monitor.asyncio, "sleep", fake_sleep)
 
     result = asyncio.run(monitor.wait_for_ticket_data(
-        _TicketStoreMongo(), 42, attempts=5, delay=0.25,
+        _TicketStoreMongo(), 42, timeout=1, poll_every=0.01,
     ))
 
     assert result["user_id"] == 7
-    assert sleeps == [0.25, 0.25]
+    assert responses == []
 
 
 def test_wait_for_ticket_data_stops_at_bound(monkeypatch):
@@ -39,18 +44,68 @@ def test_wait_for_ticket_data_stops_at_bound(monkeypatch):
         calls += 1
         return None
 
-    async def fake_sleep(_delay):
-        return None
-
     monkeypatch.setattr(monitor.store, "find_one", fake_find_one)
-    monkeypatch.setattr(monitor.asyncio, "sleep", fake_sleep)
 
     result = asyncio.run(monitor.wait_for_ticket_data(
-        _TicketStoreMongo(), 42, attempts=3, delay=0,
+        _TicketStoreMongo(), 42, timeout=0.05, poll_every=0.02,
     ))
 
     assert result is None
-    assert calls == 3
+    assert 2 <= calls <= 4
+    assert monitor.store._ready_waiters == {}
+
+
+class _CountingTickets:
+    def __init__(self):
+        self.docs = {}
+        self.reads = Counter()
+
+    async def find_one(self, query, _projection=None):
+        self.reads[query["_id"]] += 1
+        doc = self.docs.get(query["_id"])
+        return dict(doc) if doc else None
+
+    async def replace_one(self, query, doc, upsert=False):
+        await asyncio.sleep(0)
+        self.docs[query["_id"]] = dict(doc)
+
+
+def test_a_burst_of_new_tickets_is_signalled_not_polled():
+    setup = SimpleNamespace(find_one=_config)
+    mongo = SimpleNamespace(
+        ticket_setup=setup, button_store=_CountingTickets(), tickets=_CountingTickets()
+    )
+    channels = range(1000, 1050)
+
+    async def create(channel_id):
+        await asyncio.sleep(0.01)
+        await monitor.store.insert_one(mongo, {
+            "_id": f"ticket_{channel_id}", "type": "ticket",
+            "channel_id": channel_id, "user_id": channel_id + 1,
+        })
+
+    async def burst():
+        started = asyncio.get_running_loop().time()
+        waits = [
+            monitor.wait_for_ticket_data(mongo, channel_id, timeout=5, poll_every=5)
+            for channel_id in channels
+        ]
+        results = await asyncio.gather(*waits, *(create(c) for c in channels))
+        return results[:len(channels)], asyncio.get_running_loop().time() - started
+
+    found, elapsed = asyncio.run(burst())
+
+    assert [doc["user_id"] for doc in found] == [c + 1 for c in channels]
+    assert elapsed < 1
+    assert max(mongo.button_store.reads.values()) == 1
+    # A waiter arriving after the write does not read at all.
+    late = asyncio.run(monitor.wait_for_ticket_data(mongo, 1000, timeout=5, poll_every=5))
+    assert late["user_id"] == 1001
+    assert mongo.button_store.reads["ticket_1000"] == 1
+
+
+async def _config(_query, _projection=None):
+    return {"_id": "config"}
 
 
 class _ClaimCollection:
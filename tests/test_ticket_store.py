@@ -0,0 +1,236 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from pymongo.errors import OperationFailure
+
+from extensions.commands.tickets import store
+
+
+@pytest.fixture(autouse=True)
+def unwatched_routing():
+    store.reset_routing()
+    yield
+    store.reset_routing()
+
+
+class _Setup:
+    def __init__(self, *, flag=store.STORE_BUTTON, streams=True):
+        self.config = {"_id": "config", "ticket_store": flag}
+        self.reads = 0
+        self.streams = streams
+        self.changes = asyncio.Queue()
+
+    async def find_one(self, _query, _projection=None):
+        self.reads += 1
+        return dict(self.config)
+
+    async def watch(self, pipeline, **kwargs):
+        if not self.streams:
+            raise OperationFailure(
+                "The $changeStream stage is only supported on replica sets", 40573
+            )
+        return _Stream(self.changes)
+
+
+class _Stream:
+    alive = True
+
+    def __init__(self, changes):
+        self.changes = changes
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        return False
+
+    async def try_next(self):
+        try:
+            return await asyncio.wait_for(self.changes.get(), timeout=0.01)
+        except asyncio.TimeoutError:
+            return None
+
+
+class _Tickets:
+    def __init__(self):
+        self.docs = {}
+
+    async def replace_one(self, query, doc, upsert=False):
+        self.docs[query["_id"]] = dict(doc)
+
+    async def find_one(self, query):
+        doc = self.docs.get(query["_id"])
+        return dict(doc) if doc else None
+
+    async def find_one_and_update(self, query, update, **_kwargs):
+        doc = self.docs.get(query["_id"])
+        if doc is None or any(
+            doc.get(key) != value for key, value in query.items() if key != "_id"
+        ):
+            return None
+        doc.update(update["$set"])
+        doc.setdefault("audit", []).extend([update["$push"]["audit"]])
+        return dict(doc)
+
+
+def _mongo(setup):
+    return SimpleNamespace(ticket_setup=setup, button_store=_Tickets(), tickets=_Tickets())
+
+
+async def _lifecycle(mongo):
+    await store.insert_one(
+        mongo, {"_id": "ticket_1", "type": "ticket", "status": "open", "claimed_by": None}
+    )
+    await store.claim(mongo, "ticket_1", 7, "Recruiter")
+    return await store.transition(
+        mongo, "ticket_1", to_status="closed", actor_id=7, actor_name="Recruiter"
+    )
+
+
+def test_a_watched_flag_saves_every_config_read_in_a_ticket_lifecycle():
+    unwatched = _Setup()
+    asyncio.run(_lifecycle(_mongo(unwatched)))
+
+    async def watched_lifecycle(setup):
+        mongo = _mongo(setup)
+        watcher = asyncio.create_task(store.watch_routing(mongo))
+        await asyncio.sleep(0.05)
+        before = setup.reads
+        result = await _lifecycle(mongo)
+        watcher.cancel()
+        return result, setup.reads - before
+
+    watched = _Setup()
+    result, reads = asyncio.run(watched_lifecycle(watched))
+
+    # open 1, claim 2 (write + mirror), close 2.
+    assert unwatched.reads == 5
+    assert reads == 0
+    assert result.won
+    assert "change stream, 5 lookup(s) served from memory" in store.routing_summary()
+
+
+def test_a_flip_on_the_stream_reroutes_without_a_read():
+    setup = _Setup()
+
+    async def scenario():
+        mongo = _mongo(setup)
+        watcher = asyncio.create_task(store.watch_routing(mongo))
+        await asyncio.sleep(0.05)
+        await setup.changes.put({"fullDocument": {"ticket_store": store.STORE_TICKETS}})
+        await asyncio.sleep(0.05)
+        reads = setup.reads
+        active = await store.active_store(mongo)
+        watcher.cancel()
+        return active, setup.reads - reads
+
+    assert asyncio.run(scenario()) == (store.STORE_TICKETS, 0)
+
+
+def test_without_change_streams_the_flag_is_polled(monkeypatch):
+    monkeypatch.setattr(store, "ROUTING_POLL_SECONDS", 0.01)
+    setup = _Setup(streams=False)
+
+    async def scenario():
+        mongo = _mongo(setup)
+        watcher = asyncio.create_task(store.watch_routing(mongo))
+        await asyncio.sleep(0.05)
+        setup.config["ticket_store"] = store.STORE_TICKETS
+        await asyncio.sleep(0.05)
+        active = await store.active_store(mongo)
+        watcher.cancel()
+        return active
+
+    assert asyncio.run(scenario()) == store.STORE_TICKETS
+    assert store.routing_summary().startswith("polling")
+
+
+def test_a_flag_nobody_is_watching_is_read_from_mongo(monkeypatch):
+    setup = _Setup()
+    mongo = _mongo(setup)
+    store._hold_routing(store.STORE_TICKETS)
+    monkeypatch.setattr(store, "ROUTING_MAX_AGE_SECONDS", 0)
+
+    assert asyncio.run(store.active_store(mongo)) == store.STORE_BUTTON
+    assert setup.reads == 1
+
+
+class _Cursor:
+    def __init__(self, rows):
+        self.rows = list(rows)
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for row in self.rows:
+            yield row
+
+    async def to_list(self, length=None):
+        return self.rows[:length]
+
+
+class _Aggregating:
+    name = "tickets"
+
+    def __init__(self, rows=(), docs=()):
+        self.rows = rows
+        self.docs = list(docs)
+        self.pipelines = []
+        self.finds = []
+
+    async def aggregate(self, pipeline, **kwargs):
+        self.pipelines.append(pipeline)
+        return _Cursor(self.rows)
+
+    def find(self, filt, projection=None, **kwargs):
+        self.finds.append((filt, kwargs))
+        return _Cursor(self.docs)
+
+
+def test_status_counts_are_grouped_on_the_server():
+    collection = _Aggregating(rows=[
+        {"_id": "open", "count": 3}, {"_id": None, "count": 2}, {"_id": "", "count": 1},
+    ])
+
+    counts = asyncio.run(store.status_counts(collection, {"venue": {"$ne": "thread"}}))
+
+    assert counts == {"open": 3, "(missing)": 3}
+    match, group = collection.pipelines[0]
+    assert match == {"$match": {"type": "ticket", "venue": {"$ne": "thread"}}}
+    assert "$group" in group
+
+
+def test_open_rows_arrive_in_pages_from_one_cursor():
+    reader = _Aggregating(docs=[{"_id": n} for n in range(7)])
+    mongo = SimpleNamespace(ticket_setup=_Setup(), button_store=reader, tickets=_Tickets())
+
+    async def collect():
+        return [page async for page in store.pages(mongo, {"status": "open"}, page_size=3)]
+
+    assert [len(page) for page in asyncio.run(collect())] == [3, 3, 1]
+    assert reader.finds == [({"status": "open"}, {"batch_size": 3})]
+
+
+def test_the_mirror_diff_is_one_pipeline_over_both_collections():
+    button_store = _Aggregating(rows=[{"count": 4}])
+    mongo = SimpleNamespace(button_store=button_store, tickets=_Aggregating())
+
+    assert asyncio.run(store.mirror_mismatch_count(mongo)) == 4
+    (pipeline,) = button_store.pipelines
+    stages = [next(iter(stage)) for stage in pipeline]
+    assert stages.count("$unionWith") == 1
+    assert pipeline[stages.index("$unionWith")]["$unionWith"]["coll"] == "tickets"
+    assert stages[-1] == "$count"
+
+
+def test_untracked_channels_are_checked_by_id_not_by_reading_history():
+    reader = _Aggregating(docs=[{"channel_id": "42"}])
+    mongo = SimpleNamespace(ticket_setup=_Setup(), button_store=reader, tickets=_Tickets())
+
+    tracked = asyncio.run(store.tracked_channel_ids(mongo, [42, 43]))
+
+    assert tracked == {42}
+    (filt, _), = reader.finds
+    assert filt["channel_id"] == {"$in": [42, 43, "42", "43"]}
@@ -19,18 +19,30 @@ def default_no_active_cwl(monkeypatch):
     monkeypatch.setattr(todo_data, "_get_cwl_round", no_cwl)
 
 
+@pytest.fixture(autouse=True)
+def fresh_roster_memory():
+    """Every test starts as a freshly restarted process."""
+    clan_history.forget_rosters()
+    yield
+    clan_history.forget_rosters()
+
+
 class _Collection:
     def __init__(self, documents=None):
         self.operations = []
+        self.batches = []
+        self.projections = []
         self.documents = documents or []
         self.query = None
 
     async def bulk_write(self, operations, ordered=False):
         self.operations.extend(operations)
+        self.batches.append((len(operations), ordered))
         return SimpleNamespace()
 
     def find(self, query, projection=None):
         self.query = query
+        self.projections.append(projection)
         return _Cursor(self.documents)
 
 
@@ -499,3 +511,149 @@ def test_tracker_retries_link_expansion_after_roster_is_already_stable(monkeypat
         if "$unset" in operation._doc
     ]
     assert len(completion_updates) == 1
+
+
+def test_scan_flushes_presence_and_war_rosters_as_one_batch(monkeypatch):
+    monkeypatch.setattr(clan_history, "_indexes_ready", True)
+    monkeypatch.setattr(clan_history, "_indexes_failed", False)
+    mongo = _Mongo(clan_documents=[{"tag": "#ONE"}, {"tag": "#TWO"}])
+    wars = {
+        "#ONE": _War("#ONE", "One", [_Member("#A"), _Member("#B")], 2),
+        "#TWO": _War("#TWO", "Two", [_Member("#C")], 2),
+    }
+
+    class _Client:
+        async def get_clan(self, clan_tag):
+            return _Side(clan_tag, clan_tag, [_Member(f"{clan_tag}-M")])
+
+        async def get_player(self, player_tag):
+            raise AssertionError(f"unexpected watched player {player_tag}")
+
+    async def active_war(_client, clan_tag):
+        return "war", wars[clan_tag]
+
+    async def active_cwl(_client, clan_tag):
+        return "war", wars[clan_tag]
+
+    monkeypatch.setattr(todo_data, "_get_war", active_war)
+    monkeypatch.setattr(todo_data, "_get_cwl_round", active_cwl)
+
+    counts = asyncio.run(clan_history_tracker.run_scan(mongo, _Client()))
+
+    # Two new roster members, three war-roster rows, three CWL-roster rows.
+    assert counts["write_ops"] == 8 + 2
+    assert "write_ms" in counts
+    assert mongo.player_clan_candidates.batches == [(8, False)]
+    assert mongo.clan_roster_snapshots.batches == [(2, False)]
+
+
+def test_scan_write_buffer_chunks_large_families(monkeypatch):
+    monkeypatch.setattr(clan_history, "_indexes_ready", True)
+    monkeypatch.setattr(clan_history.ScanWriteBuffer, "CHUNK_SIZE", 4)
+    mongo = _Mongo()
+    writes = clan_history.ScanWriteBuffer()
+
+    writes.add_presence(
+        [clan_history.ClanPresence(f"#P{i}", "#CLAN") for i in range(10)]
+    )
+    assert writes.pending("player_clan_candidates") == 10
+
+    assert asyncio.run(writes.flush(mongo)) is True
+    assert mongo.player_clan_candidates.batches == [(4, False), (4, False), (2, False)]
+    assert writes.pending() == 0
+
+
+def _stable_family_client(members):
+    family_clan = _Side("#FAMILY", "Family", [_Member(tag) for tag in members])
+
+    class _Client:
+        async def get_clan(self, _clan_tag):
+            return family_clan
+
+        async def get_player(self, player_tag):
+            return SimpleNamespace(tag=player_tag, clan=None)
+
+    return family_clan, _Client()
+
+
+def test_steady_state_scan_skips_roster_reads_and_writes(monkeypatch):
+    monkeypatch.setattr(clan_history, "_indexes_ready", True)
+    monkeypatch.setattr(clan_history, "_indexes_failed", False)
+    mongo = _Mongo(clan_documents=[{"tag": "#FAMILY"}])
+    _family, client = _stable_family_client(["#HOME", "#OTHER"])
+
+    async def no_regular_war(_client, _clan_tag):
+        return "none", None
+
+    monkeypatch.setattr(todo_data, "_get_war", no_regular_war)
+
+    first = asyncio.run(clan_history_tracker.run_scan(mongo, client))
+    snapshots = mongo.clan_roster_snapshots
+    reads_after_first = len(snapshots.projections)
+    writes_after_first = len(snapshots.operations)
+    second = asyncio.run(clan_history_tracker.run_scan(mongo, client))
+
+    assert first["roster_changes"] == 2
+    stored = snapshots.operations[0]._doc["$set"]
+    assert stored["fingerprint"] == clan_history.roster_fingerprint(["#OTHER", "#HOME"])
+    assert second["rosters_unchanged"] == 1
+    assert second["roster_reads"] == 0
+    assert second["roster_changes"] == 0
+    assert len(snapshots.projections) == reads_after_first
+    assert len(snapshots.operations) == writes_after_first
+
+
+def test_restart_with_matching_fingerprint_loads_no_members(monkeypatch):
+    monkeypatch.setattr(clan_history, "_indexes_ready", True)
+    monkeypatch.setattr(clan_history, "_indexes_failed", False)
+    now = datetime.now(timezone.utc)
+    mongo = _Mongo(
+        clan_documents=[{"tag": "#FAMILY"}],
+        roster_documents=[{
+            "_id": "#FAMILY",
+            "fingerprint": clan_history.roster_fingerprint(["#HOME"]),
+            "updated_at": now - timedelta(hours=1),
+        }],
+    )
+    _family, client = _stable_family_client(["#HOME"])
+
+    async def no_regular_war(_client, _clan_tag):
+        return "none", None
+
+    monkeypatch.setattr(todo_data, "_get_war", no_regular_war)
+    counts = asyncio.run(clan_history_tracker.run_scan(mongo, client))
+
+    assert counts["rosters_unchanged"] == 1
+    assert counts["roster_reads"] == 1
+    assert mongo.clan_roster_snapshots.projections == [
+        {"fingerprint": 1, "updated_at": 1}
+    ]
+    assert mongo.clan_roster_snapshots.operations == []
+    assert mongo.player_clan_candidates.operations == []
+
+
+def test_departure_is_diffed_from_memory_without_reloading_snapshot(monkeypatch):
+    monkeypatch.setattr(clan_history, "_indexes_ready", True)
+    monkeypatch.setattr(clan_history, "_indexes_failed", False)
+    mongo = _Mongo(clan_documents=[{"tag": "#FAMILY"}])
+    family, client = _stable_family_client(["#HOME", "#LEAVER"])
+
+    async def no_regular_war(_client, _clan_tag):
+        return "none", None
+
+    async def no_links(player_tags):
+        return list(player_tags)
+
+    monkeypatch.setattr(todo_data, "_get_war", no_regular_war)
+    monkeypatch.setattr(clan_history_tracker, "resolve_family_linked_tags", no_links)
+
+    asyncio.run(clan_history_tracker.run_scan(mongo, client))
+    reads_after_first = len(mongo.clan_roster_snapshots.projections)
+    family.members = [_Member("#HOME")]
+    counts = asyncio.run(clan_history_tracker.run_scan(mongo, client))
+
+    assert counts["departed_players"] == 1
+    assert counts["roster_reads"] == 0
+    assert len(mongo.clan_roster_snapshots.projections) == reads_after_first
+    latest = mongo.clan_roster_snapshots.operations[-1]._doc["$set"]
+    assert latest["members"] == ["#HOME"]
@@ -0,0 +1,98 @@
+"""Time clan autocomplete per keystroke against N synthetic clans.
+
+Types a handful of clan names one character at a time and reports the time
+to answer each keystroke two ways:
+
+- before: the old cache - a list of every clan, filtered with a substring
+  test on each keystroke (plus a full collection read whenever the 5-minute
+  TTL had lapsed, which this stub cannot price and is left out);
+- after: `extensions.autocomplete.search` over the gram index built at
+  startup.
+
+Also times building the index and one incremental `update_clan`.
+
+    py tools/autocomplete_benchmark.py            # 1000 clans
+    py tools/autocomplete_benchmark.py 5000
+
+Nothing touches Mongo or Discord.
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from extensions import autocomplete  # noqa: E402
+
+WORDS = (
+    "warriors", "united", "kingdom", "legends", "elite", "royal", "dragons",
+    "titans", "phoenix", "shadow", "empire", "storm", "knights", "clash",
+)
+TYPED = ("warriors", "royal ti", "#2q", "shadow em", "x")
+
+
+def _clans(count: int) -> list[dict]:
+    rng = random.Random(7)
+    clans = []
+    for n in range(count):
+        name = " ".join(rng.choice(WORDS) for _ in range(2)).title()
+        tag = "#" + "".join(rng.choice("0289PYLQGRJCUV") for _ in range(8))
+        clans.append({
+            "tag": tag,
+            "name": f"{name} {n}" if rng.random() < 0.3 else name,
+            "type": rng.choice(("FWA", "Competitive", "Casual")),
+        })
+    return clans
+
+
+def _old_keystroke(clans: list[dict], query: str) -> list[str]:
+    return [f"{c['name']} | {c['tag']}" for c in clans if query.lower() in c['name'].lower()]
+
+
+def _new_keystroke(query: str) -> list[str]:
+    return [f"{c['name']} | {c['tag']}" for c in autocomplete.search(query)]
+
+
+def _per_keystroke(answer) -> list[float]:
+    timings = []
+    for word in TYPED:
+        for end in range(1, len(word) + 1):
+            best = float("inf")
+            for _ in range(20):
+                started = time.perf_counter()
+                answer(word[:end])
+                best = min(best, time.perf_counter() - started)
+            timings.append(best * 1_000_000)
+    return timings
+
+
+def _line(label: str, timings: list[float]) -> str:
+    return (f"{label:<7} median {statistics.median(timings):7.1f} us  "
+            f"max {max(timings):7.1f} us  over {len(timings)} keystrokes")
+
+
+def main(count: int) -> None:
+    clans = _clans(count)
+
+    started = time.perf_counter()
+    autocomplete.load_index(clans)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    autocomplete.update_clan(clans[0]["tag"], {"name": "Renamed " + string.ascii_letters[:6]})
+    update_us = (time.perf_counter() - started) * 1_000_000
+
+    print(f"\n{count} clans; index of {len(autocomplete._grams)} grams built in {build_ms:.0f} ms, "
+          f"one rename re-indexed in {update_us:.0f} us")
+    print(_line("before", _per_keystroke(lambda query: _old_keystroke(clans, query))))
+    print(_line("after", _per_keystroke(_new_keystroke)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,153 @@
+"""Time full-board renders with and without the tile atlas.
+
+`render_card_board` pastes pre-rendered `(card_id, state)` tiles over a cached
+background when it is given the bundled artwork. Passing any other mapping -
+here, a copy of the same images - draws every tile from scratch, which is what
+every board cost before the atlas existed (less the frame, which both paths
+now take from the cached background layer). Both paths produce identical pixels
+(tests/test_card_board.py checks this), so the difference is pure render time.
+
+Each "family" is that many distinct member inventories with realistic state
+mixes, every board different, so the 32-entry PNG cache in front of the
+renderer never hits and each board is a real render.
+
+PNG encoding is timed separately and reported apart from compositing: the
+atlas only changes how the canvas is built, and `optimize=True` encoding of a
+1.3-megapixel board otherwise swamps that difference.
+
+    py tools/card_board_benchmark.py            # families of 20, 60 and 150
+    py tools/card_board_benchmark.py 40 80      # custom sizes
+    py tools/card_board_benchmark.py --profile  # font and text work per board
+
+`--profile` runs one family of 60 under cProfile, first with the font and
+text-fit caches cleared and then warm, and counts font constructions and text
+measurements per board. Warm, both should be zero: every label size and fit is
+cached after the first board.
+
+Nothing is written to disk; results go to stdout.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import random
+import sys
+import time
+from pathlib import Path
+
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from utils import card_board  # noqa: E402
+from utils.cards import CARDS, MISSING, OWNED  # noqa: E402
+
+DEFAULT_FAMILY_SIZES = (20, 60, 150)
+
+
+def _inventory(rng: random.Random) -> dict[str, object]:
+    """A plausible mid-season collection: mostly owned, some gaps and spares."""
+    values: dict[str, object] = {}
+    for card in CARDS:
+        roll = rng.random()
+        if roll < 0.25:
+            values[card.id] = MISSING
+        elif roll < 0.70:
+            values[card.id] = OWNED
+        elif roll < 0.80:
+            values[card.id] = card_board.OWNED_SPARE_UNVERIFIED
+        else:
+            values[card.id] = rng.choice((2, 2, 2, 3, 4))
+    return values
+
+
+_encode_seconds = 0.0
+_original_save = Image.Image.save
+
+
+def _timed_save(self, *args, **kwargs):
+    global _encode_seconds
+    started = time.perf_counter()
+    try:
+        return _original_save(self, *args, **kwargs)
+    finally:
+        _encode_seconds += time.perf_counter() - started
+
+
+def _time_boards(boards, artwork) -> tuple[float, float]:
+    """Average (compose, encode) seconds per board."""
+    global _encode_seconds
+    _encode_seconds = 0.0
+    started = time.perf_counter()
+    for values in boards:
+        card_board.render_card_board(values, artwork)
+    total = time.perf_counter() - started
+    return (total - _encode_seconds) / len(boards), _encode_seconds / len(boards)
+
+
+def _clear_text_caches() -> None:
+    card_board._font.cache_clear()
+    card_board._text_bounds.cache_clear()
+    card_board._fitted.cache_clear()
+
+
+def _profile(family_size: int = 60) -> None:
+    """Font constructions and text measurements per board, cold then warm."""
+    rng = random.Random(family_size)
+    boards = [_inventory(rng) for _ in range(family_size)]
+    artwork = card_board._bundled_artwork()
+    card_board.render_card_board(boards[0], artwork)   # build the atlas first
+    print(f"{'caches':>6} {'fonts built':>12} {'measurements':>13} {'ms':>7}   (per board)")
+    for label in ("cold", "warm"):
+        if label == "cold":
+            _clear_text_caches()
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        for values in boards:
+            card_board.render_card_board(values, artwork)
+        profiler.disable()
+        elapsed = (time.perf_counter() - started) / len(boards)
+        calls = {
+            name: sum(stat[1] for key, stat in pstats.Stats(profiler).stats.items()
+                      if key[2] == name)
+            for name in ("load_default", "textbbox")
+        }
+        print(
+            f"{label:>6} {calls['load_default'] / len(boards):>12.1f} "
+            f"{calls['textbbox'] / len(boards):>13.1f} {elapsed * 1000:>7.1f}"
+        )
+
+
+def main(argv: list[str]) -> None:
+    if "--profile" in argv:
+        _profile()
+        return
+    sizes = [int(arg) for arg in argv] or list(DEFAULT_FAMILY_SIZES)
+    bundled = card_board._bundled_artwork()
+    uncached = dict(bundled)
+
+    Image.Image.save = _timed_save
+    print(
+        f"{'family':>7} {'compose before':>15} {'compose after':>14} "
+        f"{'speedup':>8} {'encode':>8}   (ms per board)"
+    )
+    for size in sizes:
+        rng = random.Random(size)
+        boards = [_inventory(rng) for _ in range(size)]
+        card_board._atlas_tile.cache_clear()
+        card_board._board_background.cache_clear()
+        before, _ = _time_boards(boards, uncached)
+        # Includes building the atlas lazily, exactly as a cold process would.
+        after, encode = _time_boards(boards, bundled)
+        print(
+            f"{size:>7} {before * 1000:>15.1f} {after * 1000:>14.1f} "
+            f"{before / after:>7.1f}x {encode * 1000:>8.1f}"
+        )
+    info = card_board._atlas_tile.cache_info()
+    print(f"atlas tiles: {info.currsize} (hits {info.hits}, misses {info.misses})")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
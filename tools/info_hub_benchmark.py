@@ -0,0 +1,89 @@
+"""Time an info hub clan listing against a CoC stub for N clans.
+
+Renders the Competitive page three ways:
+
+- before: one `get_clan` after another, as the listing used to;
+- after, cold: `build_clan_list_components` with an empty summary cache;
+- after, warm: a second opening inside the summary TTL.
+
+    py tools/info_hub_benchmark.py            # 10, 25 and 50 clans
+    py tools/info_hub_benchmark.py 80
+
+Each stub request costs COC_LATENCY. Nothing touches Mongo, Discord or the
+CoC API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from extensions.commands.clan.info_hub import handlers, helpers  # noqa: E402
+
+COC_LATENCY = 0.15
+
+
+class _Coc:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_clan(self, tag):
+        self.calls += 1
+        await asyncio.sleep(COC_LATENCY)
+        return SimpleNamespace(
+            tag=tag, member_count=50, capital_districts=[],
+            war_league=SimpleNamespace(name="Crystal League I"),
+        )
+
+
+class _Cursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def to_list(self, length=None):
+        return list(self.rows)
+
+
+async def _old_fetch(coc_client, clans):
+    for clan in clans:
+        await coc_client.get_clan(tag=clan["tag"])
+
+
+async def _render(coc_client, mongo):
+    await handlers.build_clan_list_components(
+        SimpleNamespace(guild_id=1), "Competitive", 0xFF0000, mongo, coc_client, None
+    )
+
+
+async def _timed(run) -> tuple[float, int]:
+    coc_client = _Coc()
+    started = time.perf_counter()
+    await run(coc_client)
+    return (time.perf_counter() - started) * 1000, coc_client.calls
+
+
+async def main(counts: list[int]) -> None:
+    print(f"CoC stub at {COC_LATENCY * 1000:.0f} ms per request, "
+          f"{helpers.CLAN_FETCH_CONCURRENCY} in flight")
+    for count in counts:
+        clans = [{"tag": f"#C{n}", "name": f"Clan {n}", "type": "Competitive"} for n in range(count)]
+        mongo = SimpleNamespace(clans=SimpleNamespace(find=lambda _query: _Cursor(clans)))
+        helpers.reset_clan_summaries()
+
+        rows = (
+            ("before", await _timed(lambda coc_client: _old_fetch(coc_client, clans))),
+            ("cold", await _timed(lambda coc_client: _render(coc_client, mongo))),
+            ("warm", await _timed(lambda coc_client: _render(coc_client, mongo))),
+        )
+        print(f"\n{count} clans")
+        for label, (elapsed, calls) in rows:
+            print(f"{label:<7} {elapsed:7.0f} ms  {calls} get_clan")
+
+
+if __name__ == "__main__":
+    asyncio.run(main([int(arg) for arg in sys.argv[1:]] or [10, 25, 50]))
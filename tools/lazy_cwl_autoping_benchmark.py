@@ -0,0 +1,173 @@
+"""Compare LazyCWL auto-ping ticks: one job per clan vs one batched window.
+
+Seeds N active auto-ping snapshots (one per clan, a third of them missing a
+player) in stub Mongo and CoC clients that count calls and add latency, then
+runs the same due set two ways:
+
+- before: every job on its own, as `auto_ping_job` used to - a `find_one` for
+  its snapshot, then `process_single_snapshot_ping` with its own clan-role
+  read and `get_clan` - all N fired in lockstep, as "start all" leaves them;
+- after: `auto_ping_job` for all N, which join one window and run
+  `run_autoping_batch` once.
+
+    py tools/lazy_cwl_autoping_benchmark.py          # 20 clans
+    py tools/lazy_cwl_autoping_benchmark.py 40
+
+The CoC stub allows COC_PER_SECOND requests per second like coc.py's default
+throttler; Mongo round trips cost MONGO_LATENCY each. The batching window is
+set to zero so only the tick's own work is timed. "Start all" used to stagger
+first runs 5 s per clan, so the old sweep also spread over (N - 1) * 5 s;
+that spread is printed alongside. Nothing touches Discord, Mongo or the CoC
+API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from extensions.commands.fwa import lazy_cwl  # noqa: E402
+
+COC_LATENCY = 0.12
+COC_PER_SECOND = 10
+MONGO_LATENCY = 0.004
+DISCORD_LATENCY = 0.05
+OLD_STAGGER_SECONDS = 5
+
+
+class _Calls(Counter):
+    async def mongo(self, kind: str):
+        self[kind] += 1
+        await asyncio.sleep(MONGO_LATENCY)
+
+
+class _Cursor:
+    def __init__(self, calls, rows):
+        self.calls, self.rows = calls, rows
+
+    async def to_list(self, length=None):
+        await self.calls.mongo("mongo reads")
+        return [dict(row) for row in self.rows]
+
+
+class _Collection:
+    def __init__(self, calls, rows, key="_id"):
+        self.calls = calls
+        self.rows = {row[key]: row for row in rows}
+
+    def find(self, query):
+        (field, condition), = query.items()
+        return _Cursor(self.calls, [self.rows[v] for v in condition["$in"] if v in self.rows])
+
+    async def find_one(self, query):
+        await self.calls.mongo("mongo reads")
+        (value,) = query.values()
+        row = self.rows.get(value)
+        return dict(row) if row else None
+
+    async def update_one(self, query, update):
+        await self.calls.mongo("mongo writes")
+
+    async def update_many(self, query, update):
+        await self.calls.mongo("mongo writes")
+
+
+class _Coc:
+    """Pace requests like coc.py's BasicThrottler: one slot per 1/rate s."""
+
+    def __init__(self, calls, rosters):
+        self.calls, self.rosters = calls, rosters
+        self.lock = asyncio.Lock()
+        self.next_slot = 0.0
+
+    async def get_clan(self, tag):
+        async with self.lock:
+            now = time.monotonic()
+            wait = self.next_slot - now
+            self.next_slot = max(now, self.next_slot) + 1 / COC_PER_SECOND
+        if wait > 0:
+            await asyncio.sleep(wait)
+        self.calls["get_clan"] += 1
+        await asyncio.sleep(COC_LATENCY)
+        members = [SimpleNamespace(tag=player) for player in self.rosters[tag]]
+        return SimpleNamespace(tag=tag, members=members)
+
+
+def _seed(count: int):
+    started = datetime.now(timezone.utc) - timedelta(hours=2)
+    snapshots, rosters = [], {}
+    for n in range(count):
+        tag = f"#CLAN{n}"
+        players = [{"tag": f"#P{n}X{p}", "name": f"p{p}"} for p in range(15)]
+        snapshots.append({
+            "_id": f"snapshot{n}", "clan_tag": tag, "clan_name": f"Clan {n}",
+            "active": True, "auto_ping_enabled": True,
+            "auto_ping_started_at": started, "players": players,
+        })
+        present = players[1:] if n % 3 == 0 else players
+        rosters[tag] = [player["tag"] for player in present]
+    return snapshots, rosters
+
+
+def _install(snapshots, rosters) -> _Calls:
+    calls = _Calls()
+
+    async def create_message(**_kwargs):
+        calls["discord messages"] += 1
+        await asyncio.sleep(DISCORD_LATENCY)
+
+    lazy_cwl.mongo_client = SimpleNamespace(
+        lazy_cwl_snapshots=_Collection(calls, snapshots),
+        clans=_Collection(calls, [{"tag": s["clan_tag"], "role_id": 1} for s in snapshots], "tag"),
+    )
+    lazy_cwl.coc_client = _Coc(calls, rosters)
+    lazy_cwl.bot_instance = SimpleNamespace(rest=SimpleNamespace(create_message=create_message))
+    lazy_cwl.scheduler = SimpleNamespace(remove_job=lambda _id: None)
+    return calls
+
+
+async def _old_job(snapshot_id):
+    snapshot = await lazy_cwl.mongo_client.lazy_cwl_snapshots.find_one({"_id": snapshot_id})
+    result = await lazy_cwl.process_single_snapshot_ping(
+        snapshot, lazy_cwl.bot_instance, lazy_cwl.coc_client, lazy_cwl.mongo_client
+    )
+    if result["success"]:
+        await lazy_cwl.mongo_client.lazy_cwl_snapshots.update_one({"_id": snapshot_id}, {})
+
+
+async def _timed(run) -> float:
+    started = time.perf_counter()
+    await run()
+    return time.perf_counter() - started
+
+
+async def main(count: int) -> None:
+    snapshots, rosters = _seed(count)
+    ids = [snapshot["_id"] for snapshot in snapshots]
+    lazy_cwl.AUTOPING_BATCH_WINDOW_SECONDS = 0
+
+    calls = _install(snapshots, rosters)
+    before = await _timed(lambda: asyncio.gather(*(_old_job(i) for i in ids)))
+    before_calls = dict(calls)
+
+    calls = _install(snapshots, rosters)
+    after = await _timed(lambda: asyncio.gather(*(lazy_cwl.auto_ping_job(i) for i in ids)))
+    after_calls = dict(calls)
+
+    print(f"\n{count} clans due together, CoC {COC_PER_SECOND}/s at {COC_LATENCY * 1000:.0f} ms")
+    for label, elapsed, counted in (("before", before, before_calls), ("after", after, after_calls)):
+        detail = ", ".join(f"{counted.get(key, 0)} {key}" for key in (
+            "get_clan", "mongo reads", "mongo writes", "discord messages"))
+        print(f"{label:<7} {elapsed * 1000:7.0f} ms  {detail}")
+    print(f"old start-all stagger: last clan checked {(count - 1) * OLD_STAGGER_SECONDS} s after the first")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20))
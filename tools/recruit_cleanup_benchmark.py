@@ -0,0 +1,143 @@
+"""Drain a recruit-role backlog against a REST stub with Discord-style buckets.
+
+The stub gives every route a bucket of BUCKET_LIMIT calls per BUCKET_WINDOW
+seconds. A call that finds its bucket empty waits for the reset, which is what
+hikari's bucket manager does with the X-RateLimit headers Discord sends. Role
+removal shares one bucket per guild. Time is compressed: the defaults stand in
+for Discord's 10 calls per 10 s with 10 calls per 1 s.
+
+    py tools/recruit_cleanup_benchmark.py               # 300 members, 1 guild
+    py tools/recruit_cleanup_benchmark.py 1000
+
+The old cleanup removed at most 20 roles per 30-minute check, with fixed
+sleeps between them, so its drain time is printed alongside for comparison.
+Nothing touches Discord or Mongo.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from extensions.tasks import recruit_role_cleanup as cleanup  # noqa: E402
+
+BUCKET_LIMIT = 10
+BUCKET_WINDOW = 1.0
+TIME_SCALE = 10          # real Discord seconds per stub second
+OLD_BATCH = 20
+OLD_INTERVAL_MINUTES = 30
+
+
+class _Bucket:
+    def __init__(self):
+        self.remaining = BUCKET_LIMIT
+        self.resets_at = time.monotonic() + BUCKET_WINDOW
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            now = time.monotonic()
+            if now >= self.resets_at:
+                self.remaining, self.resets_at = BUCKET_LIMIT, now + BUCKET_WINDOW
+            if self.remaining == 0:
+                await asyncio.sleep(self.resets_at - now)
+                self.remaining = BUCKET_LIMIT
+                self.resets_at = time.monotonic() + BUCKET_WINDOW
+            self.remaining -= 1
+
+
+class BucketedRest:
+    def __init__(self):
+        self.buckets: dict[str, _Bucket] = {}
+        self.calls = Counter()
+        self.removed: set[int] = set()
+
+    async def _call(self, route: str):
+        await self.buckets.setdefault(route, _Bucket()).acquire()
+        self.calls[route.split(":")[0]] += 1
+        await asyncio.sleep(0.005)   # request latency
+
+    async def fetch_member(self, guild_id, user_id):
+        await self._call(f"fetch_member:{guild_id}")
+        roles = () if user_id in self.removed else (cleanup.NEW_RECRUIT_ROLE_ID,)
+        return SimpleNamespace(id=user_id, role_ids=roles, display_name=str(user_id))
+
+    async def remove_role_from_member(self, guild_id, user_id, role_id, **_kwargs):
+        await self._call(f"member_roles:{guild_id}")
+        self.removed.add(user_id)
+
+
+class _Cursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def sort(self, *_args):
+        return self
+
+    def limit(self, count):
+        self.rows = self.rows[:count]
+        return self
+
+    async def to_list(self, length=None):
+        return list(self.rows)
+
+
+class _Collection:
+    def __init__(self, rows):
+        self.rows = {row["_id"]: row for row in rows}
+
+    def find(self, _query):
+        return _Cursor([r for r in self.rows.values() if not r["new_recruit_role_removed"]])
+
+    async def find_one_and_update(self, query, update, **_kwargs):
+        row = self.rows.get(query["_id"])
+        if row is None or row["new_recruit_role_removed"]:
+            return None
+        row.update(update["$set"])
+        return dict(row)
+
+    async def update_one(self, query, update):
+        self.rows[query["_id"]].update(update.get("$set", {}))
+
+
+async def main(members: int) -> None:
+    started_at = datetime.now(timezone.utc) - timedelta(hours=3)
+    rows = [
+        {"_id": f"row{n}", "user_id": 1000 + n, "guild_id": 1,
+         "walkthrough_started_at": started_at, "new_recruit_role_removed": False}
+        for n in range(members)
+    ]
+    # Some recruits restarted the walkthrough and have a second row.
+    rows += [dict(row, _id=f"{row['_id']}b") for row in rows[: members // 10]]
+    rest = BucketedRest()
+    cleanup.mongo_client = SimpleNamespace(recruit_onboarding=_Collection(rows))
+    cleanup.bot_instance = SimpleNamespace(
+        cache=SimpleNamespace(get_guild=lambda _id: None), rest=rest
+    )
+
+    started = time.perf_counter()
+    cycles = 0
+    while any(not r["new_recruit_role_removed"] for r in rows):
+        cycles += 1
+        await cleanup.remove_expired_recruit_roles()
+    elapsed = time.perf_counter() - started
+
+    old_cycles = math.ceil(len(rows) / OLD_BATCH)
+    print(f"\n{members} members, {len(rows)} rows, bucket {BUCKET_LIMIT}/{BUCKET_WINDOW:g}s")
+    print(f"now: {cycles} check(s), {elapsed:.1f}s stub time "
+          f"(~{elapsed * TIME_SCALE / 60:.1f} min at Discord's pace), "
+          f"{rest.calls['member_roles']} role call(s), {rest.calls['fetch_member']} fetch(es)")
+    print(f"old: {old_cycles} check(s) of {OLD_BATCH}, "
+          f"~{(old_cycles - 1) * OLD_INTERVAL_MINUTES} min")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 300))
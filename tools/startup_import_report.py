@@ -0,0 +1,87 @@
+"""Measure what importing every boot extension costs, and what is deferred.
+
+Imports the framework the bot cannot start without (hikari, lightbulb, coc.py,
+pymongo) first, then times importing every extension `main.py` loads plus the
+Cloudinary client it constructs. The wall time and resident-memory growth of
+that second step is the part the bot's own code controls.
+
+Modules named through `utils.lazy_imports` are listed with whether that import
+actually loaded them. `--eager` forces them all afterwards, along with the
+Cloudinary SDK the client now imports on first use, and reports the extra
+cost, which is what boot paid before they were deferred.
+
+    py tools/startup_import_report.py
+    py tools/startup_import_report.py --eager
+
+Run it in a fresh interpreter each time; a warm `sys.modules` measures nothing.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+
+def _rss_kib() -> int | None:
+    """Resident memory from /proc; None where there is no /proc."""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+def _measure(step) -> tuple[float, int | None]:
+    before = _rss_kib()
+    started = time.perf_counter()
+    step()
+    elapsed = (time.perf_counter() - started) * 1000
+    after = _rss_kib()
+    grown = None if before is None or after is None else after - before
+    return elapsed, grown
+
+
+def _line(label: str, elapsed: float, grown: int | None) -> str:
+    memory = "n/a" if grown is None else f"{grown / 1024:.1f} MB"
+    return f"{label:<22} {elapsed:8.0f} ms  {memory:>9}"
+
+
+def main(argv: list[str]) -> int:
+    import os
+
+    os.chdir(ROOT)   # extension discovery walks relative paths
+    import coc, hikari, lightbulb, pymongo  # noqa: E401,F401
+
+    from utils import lazy_imports, startup
+
+    extensions = startup.boot_extensions()
+
+    def import_boot():
+        importlib.import_module("utils.cloudinary_client")
+        for extension in extensions:
+            importlib.import_module(extension)
+
+    print(f"{len(extensions)} extensions")
+    print(_line("boot imports", *_measure(import_boot)))
+    for name, loaded in lazy_imports.deferred().items():
+        print(f"  {name:<20} {'loaded' if loaded else 'deferred'}")
+
+    def load_deferred():
+        lazy_imports.load_all()
+        importlib.import_module("cloudinary.uploader")
+
+    if "--eager" in argv:
+        print(_line("forcing deferred", *_measure(load_deferred)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,137 @@
+"""Time /ticket diagnostics' Mongo work against a seeded ticket history.
+
+Seeds a scratch database on a local mongod with N ticket documents in both
+`button_store` and `tickets` (a few hundred open, a handful deliberately
+diverged), then times the reads /ticket diagnostics makes two ways:
+
+- before: every ticket document loaded with `to_list(None)` and counted in
+  Python, once per collection and once more for the channel-era set;
+- after: the `store` reconciliation helpers - server-side `$group` counts, one
+  `$unionWith` diff of the two collections, and open rows read in pages.
+
+    py tools/ticket_reconcile_benchmark.py                   # 100k tickets
+    py tools/ticket_reconcile_benchmark.py 250000
+    py tools/ticket_reconcile_benchmark.py 100000 mongodb://localhost:27017
+
+Needs a mongod 4.4+ ($unionWith). The scratch database is dropped afterwards;
+nothing touches the bot's own databases.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from types import SimpleNamespace
+
+from pymongo import AsyncMongoClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from extensions.commands.tickets import store  # noqa: E402
+
+SCRATCH_DB = "ticket_reconcile_benchmark"
+CHANNEL_ERA_ONLY = {"venue": {"$ne": "thread"}}
+STATUSES = ("approved", "denied", "closed")
+OPEN_TICKETS = 300
+DIVERGED = 25
+
+
+def _tickets(count: int) -> list[dict]:
+    rng = random.Random(7)
+    docs = []
+    for number in range(count):
+        docs.append({
+            "_id": f"ticket_{number}",
+            "type": "ticket",
+            "status": "open" if number < OPEN_TICKETS else rng.choice(STATUSES),
+            "channel_id": 10**17 + number,
+            "ticket_type": rng.choice(("main", "fwa")),
+            "ticket_number": number,
+            "username": f"member{number}",
+        })
+    return docs
+
+
+async def _seed(db, count: int) -> None:
+    docs = _tickets(count)
+    for name in (store.STORE_BUTTON, store.STORE_TICKETS):
+        await db[name].drop()
+        for start in range(0, count, 10_000):
+            await db[name].insert_many(docs[start:start + 10_000], ordered=False)
+    await db[store.STORE_TICKETS].create_index([("channel_id", 1)])
+    await db[store.STORE_BUTTON].create_index([("channel_id", 1)])
+    # What a failed mirror write leaves behind.
+    await db[store.STORE_TICKETS].update_many(
+        {"_id": {"$in": [f"ticket_{n}" for n in range(OPEN_TICKETS, OPEN_TICKETS + DIVERGED)]}},
+        {"$set": {"status": "open"}},
+    )
+
+
+async def _before(mongo, live_ids: set[int]) -> None:
+    for collection in (mongo.button_store, mongo.tickets):
+        docs = await collection.find(store.TICKET_FILTER, {"status": 1}).to_list(length=None)
+        Counter(d.get("status") or "(missing)" for d in docs)
+    docs = await mongo.button_store.find(
+        {"type": "ticket", **CHANNEL_ERA_ONLY}
+    ).to_list(length=None)
+    Counter(d.get("status") or "(missing)" for d in docs)
+    [d for d in docs if d.get("status") == "open" and d.get("channel_id") not in live_ids]
+    {d.get("channel_id") for d in docs}
+
+
+async def _after(mongo, live_ids: set[int]) -> None:
+    await asyncio.gather(
+        store.status_counts(mongo.button_store),
+        store.status_counts(mongo.tickets),
+        store.mirror_mismatch_count(mongo),
+    )
+    await store.counts(mongo, CHANNEL_ERA_ONLY)
+    async for page in store.pages(
+        mongo, {"type": "ticket", "status": "open", **CHANNEL_ERA_ONLY},
+        projection={"channel_id": 1},
+    ):
+        [d for d in page if d.get("channel_id") not in live_ids]
+    await store.tracked_channel_ids(mongo, list(live_ids)[:50])
+
+
+async def _best_of(runs: int, step) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        await step()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+async def main(count: int, uri: str) -> None:
+    client = AsyncMongoClient(uri)
+    db = client[SCRATCH_DB]
+    mongo = SimpleNamespace(
+        button_store=db[store.STORE_BUTTON],
+        tickets=db[store.STORE_TICKETS],
+        ticket_setup=db["ticket_setup"],
+    )
+    try:
+        await _seed(db, count)
+        live_ids = {10**17 + n for n in range(0, OPEN_TICKETS, 2)}
+        before = await _best_of(3, lambda: _before(mongo, live_ids))
+        after = await _best_of(3, lambda: _after(mongo, live_ids))
+        mismatched = await store.mirror_mismatch_count(mongo)
+        print(f"{count} tickets per collection, {mismatched} diverged")
+        print(f"before (to_list + Counter): {before:8.0f} ms")
+        print(f"after  (aggregation):       {after:8.0f} ms")
+    finally:
+        await client.drop_database(SCRATCH_DB)
+        await client.close()
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    asyncio.run(main(
+        int(args[0]) if args else 100_000,
+        args[1] if len(args) > 1 else "mongodb://localhost:27017",
+    ))
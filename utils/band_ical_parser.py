@@ -17,7 +17,10 @@ Two things here are easy to get wrong and are the reason this module exists sepa
 
 from datetime import datetime, timedelta, timezone
 
-import icalendar
+from utils.lazy_imports import lazy_import
+
+# Loaded by the first feed parsed rather than at boot.
+icalendar = lazy_import("icalendar")
 
 # Offset label for the "a new sync just appeared in the feed" alert. Distinct from the
 # numeric minute labels ("60", "10") so it can never collide with one.
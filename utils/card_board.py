@@ -15,7 +15,6 @@ checked-in source files.
 
 from __future__ import annotations
 
-import io
 import math
 from dataclasses import dataclass
 from functools import lru_cache
@@ -36,6 +35,12 @@ from utils.cards import (
     MISSING,
     OWNED,
 )
+from utils.image_encoding import (
+    OPTIMIZED_PNG,
+    EncoderPolicy,
+    encode,
+    interactive_policy,
+)
 
 
 UNKNOWN = "unknown"
@@ -71,6 +76,10 @@ TILE_GAP_Y = 13
 GRID_LEFT = 50
 GRID_TOP = 100
 
+# Spare and possible-spare badges sit on the tile's bottom edge and hang up to
+# six pixels below it, into the row gap. Atlas tiles carry that strip too.
+TILE_BADGE_OVERHANG = 7
+
 # One category at a time, for the focused card screen.  Five across keeps the
 # shape close to the media box's own ratio, so it is not scaled down as hard as
 # the full board and lands at roughly twice the tile size.
@@ -119,7 +128,11 @@ CARD_ARTWORK_DIR = Path(__file__).resolve().parents[1] / "assets" / "cards"
 
 @dataclass(frozen=True, slots=True)
 class RenderedCardBoard:
-    """A deterministic PNG and the text needed to make it accessible."""
+    """A deterministic image and the text needed to make it accessible.
+
+    ``png_bytes`` keeps its name from when every render was PNG; with the
+    WebP policy enabled it holds WebP, and ``content_type`` says which.
+    """
 
     png_bytes: bytes
     filename: str
@@ -129,6 +142,7 @@ class RenderedCardBoard:
     duplicate_card_ids: tuple[str, ...]
     spare_unverified_card_ids: tuple[str, ...]
     unknown_card_ids: tuple[str, ...]
+    content_type: str = "image/png"
 
 
 @dataclass(frozen=True, slots=True)
@@ -141,6 +155,7 @@ class RenderedTradeStrip:
     wanted_card_id: str
     offered_card_id: str
     other_offer_ids: tuple[str, ...]
+    content_type: str = "image/png"
 
 
 @dataclass(frozen=True, slots=True)
@@ -150,6 +165,7 @@ class RenderedCardThumbnail:
     png_bytes: bytes
     filename: str
     alt_text: str
+    content_type: str = "image/png"
 
 
 @lru_cache(maxsize=1)
@@ -183,8 +199,13 @@ def load_bundled_card_artwork() -> dict[str, Image.Image]:
     return {card_id: image.copy() for card_id, image in _bundled_artwork().items()}
 
 
+@lru_cache(maxsize=64)
 def _font(size: int):
-    """Use Pillow's bundled font without a host-specific font dependency."""
+    """Use Pillow's bundled font without a host-specific font dependency.
+
+    Cached per size: every call used to build a fresh FreeType face, and one
+    board asks for the same handful of sizes dozens of times.
+    """
     try:
         return ImageFont.load_default(size=size)
     except TypeError:  # pragma: no cover - bridge for older Pillow releases.
@@ -265,30 +286,50 @@ def _text_width(draw: ImageDraw.ImageDraw, text: str, font) -> int:
     return right - left
 
 
-def _fit_text(
-    draw: ImageDraw.ImageDraw,
-    text: str,
-    max_width: int,
-    *,
-    max_size: int,
-    min_size: int,
-):
+# Text is measured here rather than on the canvas being drawn: a width depends
+# only on the text and the font, never on the image, so this lets the fit below
+# be cached across renders.
+_MEASURE = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+
+
+@lru_cache(maxsize=1024)
+def _text_bounds(text: str, font) -> tuple[int, int, int, int]:
+    """Bounding box of `text` drawn at the origin. Fonts come from `_font`,
+    so the same size is the same object and a hashable key."""
+    return _MEASURE.textbbox((0, 0), text, font=font)
+
+
+@lru_cache(maxsize=512)
+def _fitted(text: str, max_width: int, max_size: int, min_size: int) -> tuple[str, int]:
+    """(label, font size) for `_fit_text`. Labels repeat across every board."""
     for size in range(max_size, min_size - 1, -1):
-        font = _font(size)
-        if _text_width(draw, text, font) <= max_width:
-            return text, font
+        bounds = _text_bounds(text, _font(size))
+        if bounds[2] - bounds[0] <= max_width:
+            return text, size
 
     font = _font(min_size)
     lower = 0
     upper = len(text)
     while lower < upper:
         midpoint = (lower + upper + 1) // 2
-        if _text_width(draw, f"{text[:midpoint]}...", font) <= max_width:
+        if _text_width(_MEASURE, f"{text[:midpoint]}...", font) <= max_width:
             lower = midpoint
         else:
             upper = midpoint - 1
     shortened = text[:lower]
-    return (f"{shortened}..." if shortened else "..."), font
+    return (f"{shortened}..." if shortened else "..."), min_size
+
+
+def _fit_text(
+    draw: ImageDraw.ImageDraw,
+    text: str,
+    max_width: int,
+    *,
+    max_size: int,
+    min_size: int,
+):
+    label, size = _fitted(text, max_width, max_size, min_size)
+    return label, _font(size)
 
 
 def _centered_text(
@@ -302,7 +343,7 @@ def _centered_text(
     if not text.isascii():
         raise ValueError("visual board copy requires ASCII or a bundled font")
     left, top, right, bottom = box
-    bounds = draw.textbbox((0, 0), text, font=font)
+    bounds = _text_bounds(text, font)
     width = bounds[2] - bounds[0]
     height = bounds[3] - bounds[1]
     draw.text(
@@ -519,11 +560,10 @@ def _render_card_thumbnail_cached(
         for diagonal in diagonals:
             draw.line(diagonal, fill=(235, 235, 235), width=9)
 
-    output = io.BytesIO()
-    canvas.save(output, format="PNG", optimize=True)
+    # Cached for the life of the process, so the slower encode is paid once.
     slug = _thumbnail_state_slug(state)
     return RenderedCardThumbnail(
-        png_bytes=output.getvalue(),
+        png_bytes=encode(canvas, OPTIMIZED_PNG, site="thumbnail"),
         filename=f"clash-card-{card.id}-{slug}.png",
         alt_text=_thumbnail_alt_text(card, state),
     )
@@ -746,6 +786,93 @@ def _draw_card_tile(
         )
 
 
+@lru_cache(maxsize=len(CARDS) * 4)
+def _atlas_tile(card_id: str, state: int | str) -> Image.Image:
+    """One pre-rendered bundled-art tile on its parchment surround.
+
+    Boards differ only in per-card state, so a tile is drawn once per
+    ``(card_id, state)`` and pasted from here afterwards. The patch is opaque
+    and includes the badge overhang; everything it covers outside the frame is
+    parchment on every board, so a paste is pixel-identical to drawing the
+    tile in place. Shared and never mutated: callers only paste it.
+    """
+    tile = Image.new(
+        "RGB",
+        (TILE_WIDTH + 1, TILE_HEIGHT + 1 + TILE_BADGE_OVERHANG),
+        PARCHMENT,
+    )
+    _draw_card_tile(
+        tile,
+        ImageDraw.Draw(tile),
+        index=0,
+        card=CARD_BY_ID[card_id],
+        state=state,
+        artwork_by_card_id=_bundled_artwork(),
+        origin=(0, 0),
+    )
+    return tile
+
+
+def _place_card_tile(
+    canvas: Image.Image,
+    draw: ImageDraw.ImageDraw,
+    *,
+    card,
+    state: int | str,
+    artwork_by_card_id: Mapping[str, object],
+    origin: tuple[int, int],
+) -> None:
+    """Paste an atlas tile for bundled artwork, or draw caller-supplied art."""
+    if artwork_by_card_id is _bundled_artwork():
+        canvas.paste(_atlas_tile(card.id, state), origin)
+        return
+    _draw_card_tile(
+        canvas,
+        draw,
+        index=0,
+        card=card,
+        state=state,
+        artwork_by_card_id=artwork_by_card_id,
+        origin=origin,
+    )
+
+
+def _board_origin(index: int) -> tuple[int, int]:
+    row, column = divmod(index, BOARD_COLUMNS)
+    return (
+        GRID_LEFT + column * (TILE_WIDTH + TILE_GAP_X),
+        GRID_TOP + row * (TILE_HEIGHT + TILE_GAP_Y),
+    )
+
+
+@lru_cache(maxsize=1)
+def _board_background() -> Image.Image:
+    """The state-independent board layer: frame, footer rule and disclaimer."""
+    canvas = Image.new("RGB", (BOARD_WIDTH, BOARD_HEIGHT), BACKGROUND)
+    draw = ImageDraw.Draw(canvas)
+    draw.rounded_rectangle(
+        (28, 22, BOARD_WIDTH - 28, BOARD_HEIGHT - 24),
+        radius=22,
+        fill=PARCHMENT,
+        outline=(93, 66, 46),
+        width=6,
+    )
+    footer_top = BOARD_HEIGHT - 71
+    draw.line(
+        (48, footer_top, BOARD_WIDTH - 48, footer_top),
+        fill=PARCHMENT_DARK,
+        width=2,
+    )
+    _centered_text(
+        draw,
+        (58, footer_top + 8, BOARD_WIDTH - 58, BOARD_HEIGHT - 31),
+        DISCLAIMER,
+        font=_font(13),
+        fill=TEXT_DARK,
+    )
+    return canvas
+
+
 def _draw_trade_card(
     canvas: Image.Image,
     draw: ImageDraw.ImageDraw,
@@ -813,6 +940,7 @@ def render_trade_strip(
     requester_name: str | None = None,
     holder_name: str | None = None,
     artwork_by_card_id: Mapping[str, object] | None = None,
+    encoding: EncoderPolicy | None = None,
 ) -> RenderedTradeStrip:
     """Render one same-category proposal with up to three alternatives."""
     wanted = CARD_BY_ID.get(str(wanted_card_id))
@@ -916,8 +1044,8 @@ def render_trade_strip(
         fill=TEXT_DARK,
     )
 
-    output = io.BytesIO()
-    canvas.save(output, format="PNG", optimize=True)
+    policy = encoding or interactive_policy()
+    data = encode(canvas, policy, site="trade_strip")
     other_names = [CARD_BY_ID[card_id].name for card_id in compatible]
     alt = (
         f"Card trade: {requester} needs {wanted.name} from {holder} and offers "
@@ -926,12 +1054,13 @@ def render_trade_strip(
     if other_names:
         alt += f" Other compatible offers: {', '.join(other_names)}."
     return RenderedTradeStrip(
-        png_bytes=output.getvalue(),
-        filename=f"card-trade-{wanted.id}-{offered.id}.png",
+        png_bytes=data,
+        filename=f"card-trade-{wanted.id}-{offered.id}.{policy.extension}",
         alt_text=_bound_alt_text(alt),
         wanted_card_id=wanted.id,
         offered_card_id=offered.id,
         other_offer_ids=tuple(compatible),
+        content_type=policy.content_type,
     )
 
 
@@ -971,12 +1100,14 @@ def render_card_board(
     artwork_by_card_id: Mapping[str, object] | None = None,
     *,
     player_name: str | None = None,
+    encoding: EncoderPolicy | None = None,
 ) -> RenderedCardBoard:
     """Return one visual board for all 60 cards.
 
     Missing keys and unrecognized values remain ``unknown``.  Artwork is
     optional, never changes the accounting, and is never written anywhere
-    except into the returned composite PNG.
+    except into the returned composite image.  ``encoding`` defaults to the
+    interactive policy; long-lived posts pass ``OPTIMIZED_PNG``.
     """
     supplied = values or {}
     artwork = (
@@ -999,15 +1130,10 @@ def render_card_board(
         for card in CARDS
     )
 
-    canvas = Image.new("RGB", (BOARD_WIDTH, BOARD_HEIGHT), BACKGROUND)
+    # The frame and footer never change, so each board starts from a copy of
+    # the cached background layer and pastes its 60 tiles from the atlas.
+    canvas = _board_background().copy()
     draw = ImageDraw.Draw(canvas)
-    draw.rounded_rectangle(
-        (28, 22, BOARD_WIDTH - 28, BOARD_HEIGHT - 24),
-        radius=22,
-        fill=PARCHMENT,
-        outline=(93, 66, 46),
-        width=6,
-    )
     # No title and no summary line inside the image.  The Discord message
     # already carries the player name, tag and counts as real text directly
     # underneath, where they are selectable and always legible.  Repeating them
@@ -1016,34 +1142,19 @@ def render_card_board(
     # signature because it still identifies the board in the alt text.
     _draw_category_tabs(draw, states)
     for index, card in enumerate(CARDS):
-        _draw_card_tile(
+        _place_card_tile(
             canvas,
             draw,
-            index=index,
             card=card,
             state=states[card.id],
             artwork_by_card_id=artwork,
+            origin=_board_origin(index),
         )
 
-    footer_top = BOARD_HEIGHT - 71
-    draw.line(
-        (48, footer_top, BOARD_WIDTH - 48, footer_top),
-        fill=PARCHMENT_DARK,
-        width=2,
-    )
-    _centered_text(
-        draw,
-        (58, footer_top + 8, BOARD_WIDTH - 58, BOARD_HEIGHT - 31),
-        DISCLAIMER,
-        font=_font(13),
-        fill=TEXT_DARK,
-    )
-
-    output = io.BytesIO()
-    canvas.save(output, format="PNG", optimize=True)
+    policy = encoding or interactive_policy()
     return RenderedCardBoard(
-        png_bytes=output.getvalue(),
-        filename="clash-cards-board.png",
+        png_bytes=encode(canvas, policy, site="board"),
+        filename=f"clash-cards-board.{policy.extension}",
         alt_text=_alt_text(
             player_name=player_name,
             collected=collected,
@@ -1057,6 +1168,7 @@ def render_card_board(
         duplicate_card_ids=tuple(card.id for card in duplicates),
         spare_unverified_card_ids=tuple(card.id for card in spare_unverified),
         unknown_card_ids=tuple(card.id for card in unknown),
+        content_type=policy.content_type,
     )
 
 
@@ -1134,15 +1246,13 @@ def render_category_strip(
         row, column = divmod(index, columns)
         left = left_margin + column * (TILE_WIDTH + TILE_GAP_X)
         top = top_margin + row * (TILE_HEIGHT + TILE_GAP_Y)
-        _draw_card_tile(
+        _place_card_tile(
             canvas,
             draw,
-            index=index,
             card=card,
             state=states[card.id],
             artwork_by_card_id=artwork,
             origin=(left, top),
-            columns=columns,
         )
         if highlight_card_id == card.id:
             # A ring rather than a fill, so it cannot be read as a state.
@@ -1161,8 +1271,8 @@ def render_category_strip(
         fill=TEXT_DARK,
     )
 
-    output = io.BytesIO()
-    canvas.save(output, format="PNG", optimize=True)
+    policy = interactive_policy()
+    data = encode(canvas, policy, site="category_strip")
     missing = [card for card in definitions if states[card.id] == MISSING]
     duplicates = [card for card in definitions if _is_spare(states[card.id])]
     spare_unverified = [
@@ -1171,8 +1281,8 @@ def render_category_strip(
     ]
     unknown = [card for card in definitions if states[card.id] == UNKNOWN]
     return RenderedCardBoard(
-        png_bytes=output.getvalue(),
-        filename=f"clash-cards-{category_id}.png",
+        png_bytes=data,
+        filename=f"clash-cards-{category_id}.{policy.extension}",
         alt_text=_alt_text(
             player_name=None,
             collected=collected,
@@ -1186,6 +1296,7 @@ def render_category_strip(
         duplicate_card_ids=tuple(card.id for card in duplicates),
         spare_unverified_card_ids=tuple(card.id for card in spare_unverified),
         unknown_card_ids=tuple(card.id for card in unknown),
+        content_type=policy.content_type,
     )
 
 
@@ -1193,12 +1304,14 @@ def render_category_strip(
 def _render_inventory_card_board_cached(
     states: tuple[int | str, ...],
     player_name: str | None,
+    encoding: EncoderPolicy,
 ) -> RenderedCardBoard:
     values = {card.id: state for card, state in zip(CARDS, states)}
     return render_card_board(
         values,
         _bundled_artwork(),
         player_name=player_name,
+        encoding=encoding,
     )
 
 
@@ -1206,6 +1319,7 @@ def render_inventory_card_board(
     values: Mapping[str, BoardState] | None,
     *,
     player_name: str | None = None,
+    encoding: EncoderPolicy | None = None,
 ) -> RenderedCardBoard:
     """Render the common bundled-art dashboard path with a bounded PNG cache.
 
@@ -1217,4 +1331,6 @@ def render_inventory_card_board(
     supplied = values or {}
     states = tuple(_state(supplied.get(card.id)) for card in CARDS)
     normalized_name = None if player_name is None else str(player_name)
-    return _render_inventory_card_board_cached(states, normalized_name)
+    return _render_inventory_card_board_cached(
+        states, normalized_name, encoding or interactive_policy()
+    )
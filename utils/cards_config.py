@@ -53,3 +53,14 @@ def cards_guild_id() -> int | None:
 def cards_channel_id() -> int:
     """The shared trade board, which is also the sticky notice's channel."""
     return parse_snowflake_env("CARDS_CHANNEL_ID") or CARDS_CHANNEL_FALLBACK
+
+
+def cards_asset_channel_id() -> int | None:
+    """Where the sticky notice's banner is uploaded once and kept.
+
+    No fallback. The hosting message has to outlive every notice that links
+    to it, so it cannot sit in the trade board, where each repost deletes the
+    one before. Unset means the banner is re-uploaded with every repost, as it
+    always was.
+    """
+    return parse_snowflake_env("CARDS_ASSET_CHANNEL_ID")
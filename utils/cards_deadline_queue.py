@@ -0,0 +1,131 @@
+"""When the Clash of Cards deadline sweep next has something to do.
+
+`extensions/tasks/cards_deadlines.py` enforces every trade deadline by
+comparing stored timestamps to now. That stays the only place a deadline is
+acted on - it is fenced, idempotent and restart-safe. What used to be a fixed
+five-minute poll is now driven from here: the sweep sleeps until the earliest
+deadline anyone has told this module about, so a proposal closes at its
+twelve-hour mark rather than up to five minutes after it, and an idle bot
+issues no sweep queries at all until something is due.
+
+Nothing here is authoritative. A deadline noted and then cleared (the holder
+answered in time) only costs one pass that finds nothing to do, and a deadline
+never noted is still caught by the sweep's low-frequency safety-net pass.
+The queue is filled from Mongo when the sweep starts and topped up by
+``cards.py`` wherever it writes a deadline.
+
+Like ``utils/cards_config.py``, this module imports nothing from
+``extensions/``, so both the command and the task can use it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Mapping
+
+# Every trade/request timestamp the sweep compares against now.
+DEADLINE_FIELDS = (
+    "accept_deadline_at",
+    "confirm_deadline_at",
+    "backstop_at",
+    "expires_at",
+    "claim_until",
+)
+
+_heap: list[tuple[datetime, str]] = []
+_wake: asyncio.Event | None = None
+_counts: Counter = Counter()
+
+
+def _as_utc(value: object) -> datetime | None:
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def note(when: object, *, key: object = "") -> None:
+    """Make sure the sweep runs at ``when``; non-datetimes are ignored."""
+    deadline = _as_utc(when)
+    if deadline is None:
+        return
+    earlier = not _heap or deadline < _heap[0][0]
+    heapq.heappush(_heap, (deadline, str(key)))
+    _counts["noted"] += 1
+    if earlier and _wake is not None:
+        # A sleeping sweep is waiting for a later deadline; wake it so it can
+        # re-arm for this one.
+        _wake.set()
+
+
+def note_document(document: Mapping | None) -> None:
+    """Note every deadline field a trade or open request carries."""
+    if not document:
+        return
+    for field in DEADLINE_FIELDS:
+        note(document.get(field), key=document.get("_id", ""))
+
+
+def next_deadline() -> datetime | None:
+    return _heap[0][0] if _heap else None
+
+
+def pop_due(now: datetime) -> int:
+    """Drop every deadline at or before ``now``; one pass covers them all."""
+    popped = 0
+    while _heap and _heap[0][0] <= now:
+        heapq.heappop(_heap)
+        popped += 1
+    return popped
+
+
+async def wait_for_due(*, max_seconds: float) -> str:
+    """Sleep until the earliest noted deadline, or ``max_seconds`` at most.
+
+    Returns ``"deadline"`` when a noted deadline came due and
+    ``"safety_net"`` when the cap ran out first.
+    """
+    global _wake
+    if _wake is None:
+        _wake = asyncio.Event()
+    give_up = time.monotonic() + max_seconds
+    while True:
+        now = datetime.now(timezone.utc)
+        if pop_due(now):
+            _counts["deadline_wakes"] += 1
+            return "deadline"
+        remaining = give_up - time.monotonic()
+        if remaining <= 0:
+            _counts["safety_net_wakes"] += 1
+            return "safety_net"
+        head = next_deadline()
+        if head is not None:
+            remaining = min(remaining, (head - now).total_seconds())
+        _wake.clear()
+        try:
+            await asyncio.wait_for(_wake.wait(), timeout=max(remaining, 0))
+        except asyncio.TimeoutError:
+            pass
+
+
+def summary() -> str:
+    head = next_deadline()
+    upcoming = head.strftime("%Y-%m-%d %H:%M:%SZ") if head else "none"
+    return (
+        f"{len(_heap)} queued, next {upcoming}, "
+        f"{_counts['deadline_wakes']} deadline wake(s), "
+        f"{_counts['safety_net_wakes']} safety-net pass(es)"
+    )
+
+
+def reset() -> None:
+    """Forget every deadline (tests)."""
+    global _wake
+    _heap.clear()
+    _counts.clear()
+    _wake = None
@@ -11,13 +11,16 @@ works without this data; only cross-clan discovery degrades.
 
 from __future__ import annotations
 
+import hashlib
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Iterable
 
 from pymongo import UpdateOne
 
+from utils.concurrency import run_concurrently
+
 
 HISTORY_WINDOW = timedelta(hours=48)
 RETENTION = timedelta(days=30)
@@ -26,11 +29,19 @@ RETENTION = timedelta(days=30)
 WATCH_RETENTION = HISTORY_WINDOW
 LINK_RETRY_BASE = timedelta(minutes=10)
 LINK_RETRY_MAX = timedelta(hours=6)
+# Unchanged rosters are not rewritten every scan, but their snapshot rows carry
+# a 30-day TTL. Rewriting a stable roster once a day keeps the row alive.
+SNAPSHOT_REFRESH = timedelta(days=1)
 
 _indexes_ready = False
 _indexes_failed = False
 _index_retry_at = 0.0
 
+# clan tag -> last roster known to be durable in clan_roster_snapshots. Lets a
+# steady-state scan decide "unchanged" without touching Mongo; empty after a
+# restart, when diff_rosters() falls back to the stored fingerprints.
+_known_rosters: dict[str, "_KnownRoster"] = {}
+
 
 @dataclass(frozen=True, slots=True)
 class ClanPresence:
@@ -40,6 +51,28 @@ class ClanPresence:
     clan_badge: str | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class _KnownRoster:
+    fingerprint: str
+    members: frozenset[str]
+    written_at: datetime
+
+
+@dataclass(slots=True)
+class RosterDiff:
+    """What one scan needs to know about its family rosters.
+
+    ``previous`` holds the last durable roster only for clans whose roster
+    changed (or was never seen); ``unchanged`` clans need no diffing at all.
+    ``to_write`` is every roster whose snapshot row must be (re)written.
+    """
+
+    previous: dict[str, set[str]] = field(default_factory=dict)
+    unchanged: set[str] = field(default_factory=set)
+    to_write: dict[str, set[str]] = field(default_factory=dict)
+    mongo_reads: int = 0
+
+
 @dataclass(frozen=True, slots=True)
 class ClanCandidate:
     clan_tag: str
@@ -83,17 +116,19 @@ async def ensure_indexes(mongo) -> bool:
         return False
 
     try:
-        await mongo.player_clan_candidates.create_index(
-            "purge_at", expireAfterSeconds=0, name="ttl_purge_at"
-        )
-        await mongo.player_clan_candidates.create_index(
-            "player_tag", name="player_tag"
-        )
-        await mongo.player_clan_watches.create_index(
-            "expires_at", expireAfterSeconds=0, name="ttl_expires_at"
-        )
-        await mongo.clan_roster_snapshots.create_index(
-            "purge_at", expireAfterSeconds=0, name="ttl_purge_at"
+        await run_concurrently(
+            mongo.player_clan_candidates.create_index(
+                "purge_at", expireAfterSeconds=0, name="ttl_purge_at"
+            ),
+            mongo.player_clan_candidates.create_index(
+                "player_tag", name="player_tag"
+            ),
+            mongo.player_clan_watches.create_index(
+                "expires_at", expireAfterSeconds=0, name="ttl_expires_at"
+            ),
+            mongo.clan_roster_snapshots.create_index(
+                "purge_at", expireAfterSeconds=0, name="ttl_purge_at"
+            ),
         )
         _indexes_ready = True
         _indexes_failed = False
@@ -258,29 +293,27 @@ async def complete_link_expansions(
         return False
 
 
-async def record_presence(
-    mongo,
+def _unique_presences(
     presences: Iterable[ClanPresence],
-    *,
-    observed_at: datetime | None = None,
-) -> bool:
-    """Record actual player-clan observations, coalesced by player and clan."""
-    if mongo is None:
-        return False
+) -> dict[tuple[str, str], ClanPresence]:
     unique: dict[tuple[str, str], ClanPresence] = {}
     for presence in presences:
         player_tag = _tag(presence.player_tag)
         clan_tag = _tag(presence.clan_tag)
         if player_tag and clan_tag:
             unique[(player_tag, clan_tag)] = presence
-    if not unique:
-        return True
+    return unique
 
-    await ensure_indexes(mongo)
+
+def presence_operations(
+    presences: Iterable[ClanPresence],
+    *,
+    observed_at: datetime | None = None,
+) -> list[UpdateOne]:
+    """Upserts for actual player-clan observations, coalesced by player and clan."""
     now = _now(observed_at)
-    operations = []
-    for (player_tag, clan_tag), presence in unique.items():
-        operations.append(UpdateOne(
+    return [
+        UpdateOne(
             {"_id": _candidate_id(player_tag, clan_tag)},
             {
                 "$set": {
@@ -295,7 +328,25 @@ async def record_presence(
                 "$setOnInsert": {"first_seen_at": now},
             },
             upsert=True,
-        ))
+        )
+        for (player_tag, clan_tag), presence in _unique_presences(presences).items()
+    ]
+
+
+async def record_presence(
+    mongo,
+    presences: Iterable[ClanPresence],
+    *,
+    observed_at: datetime | None = None,
+) -> bool:
+    """Record actual player-clan observations, coalesced by player and clan."""
+    if mongo is None:
+        return False
+    operations = presence_operations(presences, observed_at=observed_at)
+    if not operations:
+        return True
+
+    await ensure_indexes(mongo)
     try:
         await mongo.player_clan_candidates.bulk_write(operations, ordered=False)
         return True
@@ -304,41 +355,21 @@ async def record_presence(
         return False
 
 
-async def record_active_war_roster(
-    mongo,
+def war_roster_operations(
     presences: Iterable[ClanPresence],
     *,
     kind: str,
     active_until: datetime,
     observed_at: datetime | None = None,
-) -> bool:
-    """Record exact active-war roster membership for immediate bootstrap.
-
-    This is deliberately separate from ``last_seen_at``: being on a CWL roster
-    proves an attack obligation, but not that the player was physically in that
-    clan during the last 48 hours.
-    """
+) -> list[UpdateOne]:
+    """Upserts for exact active-war roster membership."""
     if kind not in {"war", "cwl"}:
         raise ValueError("kind must be 'war' or 'cwl'")
-    if mongo is None:
-        return False
-
-    unique: dict[tuple[str, str], ClanPresence] = {}
-    for presence in presences:
-        player_tag = _tag(presence.player_tag)
-        clan_tag = _tag(presence.clan_tag)
-        if player_tag and clan_tag:
-            unique[(player_tag, clan_tag)] = presence
-    if not unique:
-        return True
-
-    await ensure_indexes(mongo)
     now = _now(observed_at)
     until = _now(active_until)
     field = f"{kind}_until"
-    operations = []
-    for (player_tag, clan_tag), presence in unique.items():
-        operations.append(UpdateOne(
+    return [
+        UpdateOne(
             {"_id": _candidate_id(player_tag, clan_tag)},
             {
                 "$set": {
@@ -351,7 +382,34 @@ async def record_active_war_roster(
                 "$max": {field: until, "purge_at": now + RETENTION},
             },
             upsert=True,
-        ))
+        )
+        for (player_tag, clan_tag), presence in _unique_presences(presences).items()
+    ]
+
+
+async def record_active_war_roster(
+    mongo,
+    presences: Iterable[ClanPresence],
+    *,
+    kind: str,
+    active_until: datetime,
+    observed_at: datetime | None = None,
+) -> bool:
+    """Record exact active-war roster membership for immediate bootstrap.
+
+    This is deliberately separate from ``last_seen_at``: being on a CWL roster
+    proves an attack obligation, but not that the player was physically in that
+    clan during the last 48 hours.
+    """
+    operations = war_roster_operations(
+        presences, kind=kind, active_until=active_until, observed_at=observed_at
+    )
+    if mongo is None:
+        return False
+    if not operations:
+        return True
+
+    await ensure_indexes(mongo)
     try:
         await mongo.player_clan_candidates.bulk_write(operations, ordered=False)
         return True
@@ -438,23 +496,124 @@ async def load_roster_snapshots(
     }
 
 
-async def save_roster_snapshots(
+def roster_fingerprint(members: Iterable[str]) -> str:
+    """Compact, order-independent identity of a roster: a hash of sorted tags."""
+    tags = sorted({_tag(tag) for tag in members if _tag(tag)})
+    return hashlib.sha1("\n".join(tags).encode()).hexdigest()[:20]
+
+
+async def load_roster_fingerprints(
+    mongo,
+    clan_tags: Iterable[str],
+) -> dict[str, tuple[str | None, datetime | None]] | None:
+    """Stored fingerprint and write time per clan; None when the read failed."""
+    if mongo is None:
+        return None
+    tags = list(dict.fromkeys(_tag(tag) for tag in clan_tags if _tag(tag)))
+    if not tags:
+        return {}
+    try:
+        documents = await mongo.clan_roster_snapshots.find(
+            {"_id": {"$in": tags}}, {"fingerprint": 1, "updated_at": 1}
+        ).to_list(length=None)
+    except Exception as exc:  # noqa: BLE001
+        print(f"[clan-history] roster fingerprint read failed: {type(exc).__name__}: {exc}")
+        return None
+    return {
+        _tag(document.get("_id")): (
+            document.get("fingerprint"),
+            document.get("updated_at") if isinstance(document.get("updated_at"), datetime) else None,
+        )
+        for document in documents
+        if _tag(document.get("_id"))
+    }
+
+
+async def diff_rosters(
     mongo,
     rosters: dict[str, set[str]],
     *,
     observed_at: datetime | None = None,
-) -> bool:
-    """Persist one bounded current-roster row per successfully read clan."""
-    if mongo is None or not rosters:
-        return False
-    await ensure_indexes(mongo)
+) -> RosterDiff:
+    """Split current rosters into unchanged clans and clans that need a diff.
+
+    Steady state is answered from memory with no Mongo I/O. Clans this process
+    has not seen since it started are checked against the stored fingerprint
+    first, and only fingerprint mismatches load the full member list.
+    """
     now = _now(observed_at)
-    operations = [
+    diff = RosterDiff()
+    unknown: dict[str, str] = {}
+    for clan_tag, members in rosters.items():
+        fingerprint = roster_fingerprint(members)
+        known = _known_rosters.get(clan_tag)
+        if known is None:
+            unknown[clan_tag] = fingerprint
+        elif known.fingerprint == fingerprint:
+            diff.unchanged.add(clan_tag)
+            if now - known.written_at >= SNAPSHOT_REFRESH:
+                diff.to_write[clan_tag] = members
+        else:
+            diff.previous[clan_tag] = set(known.members)
+            diff.to_write[clan_tag] = members
+    if not unknown:
+        return diff
+
+    stored = await load_roster_fingerprints(mongo, unknown)
+    diff.mongo_reads += 1
+    mismatched = []
+    for clan_tag, fingerprint in unknown.items():
+        stored_fingerprint, written_at = (stored or {}).get(clan_tag, (None, None))
+        if stored is not None and stored_fingerprint == fingerprint:
+            diff.unchanged.add(clan_tag)
+            written_at = _now(written_at) if written_at else now - SNAPSHOT_REFRESH
+            _known_rosters[clan_tag] = _KnownRoster(
+                fingerprint, frozenset(rosters[clan_tag]), written_at
+            )
+            if now - written_at >= SNAPSHOT_REFRESH:
+                diff.to_write[clan_tag] = rosters[clan_tag]
+        else:
+            mismatched.append(clan_tag)
+            diff.to_write[clan_tag] = rosters[clan_tag]
+    if mismatched:
+        diff.previous.update(await load_roster_snapshots(mongo, mismatched))
+        diff.mongo_reads += 1
+    return diff
+
+
+def remember_rosters(
+    rosters: dict[str, set[str]],
+    *,
+    observed_at: datetime | None = None,
+) -> None:
+    """Record rosters whose snapshot rows were just written successfully."""
+    now = _now(observed_at)
+    for clan_tag, members in rosters.items():
+        if _tag(clan_tag):
+            _known_rosters[_tag(clan_tag)] = _KnownRoster(
+                roster_fingerprint(members), frozenset(members), now
+            )
+
+
+def forget_rosters() -> None:
+    """Drop the in-memory rosters (tests)."""
+    _known_rosters.clear()
+
+
+def roster_snapshot_operations(
+    rosters: dict[str, set[str]],
+    *,
+    observed_at: datetime | None = None,
+) -> list[UpdateOne]:
+    """Upserts of one bounded current-roster row per successfully read clan."""
+    now = _now(observed_at)
+    return [
         UpdateOne(
             {"_id": _tag(clan_tag)},
             {
                 "$set": {
                     "members": sorted({_tag(tag) for tag in members if _tag(tag)}),
+                    "fingerprint": roster_fingerprint(members),
                     "updated_at": now,
                     "purge_at": now + RETENTION,
                 },
@@ -465,6 +624,19 @@ async def save_roster_snapshots(
         for clan_tag, members in rosters.items()
         if _tag(clan_tag)
     ]
+
+
+async def save_roster_snapshots(
+    mongo,
+    rosters: dict[str, set[str]],
+    *,
+    observed_at: datetime | None = None,
+) -> bool:
+    """Persist one bounded current-roster row per successfully read clan."""
+    if mongo is None or not rosters:
+        return False
+    await ensure_indexes(mongo)
+    operations = roster_snapshot_operations(rosters, observed_at=observed_at)
     if not operations:
         return True
     try:
@@ -475,6 +647,84 @@ async def save_roster_snapshots(
         return False
 
 
+class ScanWriteBuffer:
+    """Accumulate one tracker scan's writes and flush them together.
+
+    A scan used to issue one ``bulk_write`` for presence, then one more per
+    active war and per CWL war, serially, plus the snapshot write. The buffer
+    collects the same ``UpdateOne`` operations and sends one unordered
+    ``bulk_write`` per collection at the end, chunked so a large family never
+    builds a single oversized batch. Operations are identical to the direct
+    ``record_*`` helpers; only their grouping changes.
+
+    Failures stay non-fatal, as everywhere in this module: a failed chunk is
+    reported and the remaining chunks and collections are still attempted.
+    """
+
+    CHUNK_SIZE = 1000
+
+    def __init__(self) -> None:
+        self._operations: dict[str, list[UpdateOne]] = {}
+        self.elapsed_seconds = 0.0
+        self.failed: list[str] = []
+
+    def _extend(self, collection: str, operations: list[UpdateOne]) -> None:
+        if operations:
+            self._operations.setdefault(collection, []).extend(operations)
+
+    def add_presence(self, presences, *, observed_at=None) -> None:
+        self._extend(
+            "player_clan_candidates",
+            presence_operations(presences, observed_at=observed_at),
+        )
+
+    def add_war_roster(self, presences, *, kind, active_until, observed_at=None) -> None:
+        self._extend(
+            "player_clan_candidates",
+            war_roster_operations(
+                presences, kind=kind, active_until=active_until,
+                observed_at=observed_at,
+            ),
+        )
+
+    def add_roster_snapshots(self, rosters, *, observed_at=None) -> None:
+        self._extend(
+            "clan_roster_snapshots",
+            roster_snapshot_operations(rosters, observed_at=observed_at),
+        )
+
+    def pending(self, collection: str | None = None) -> int:
+        if collection is not None:
+            return len(self._operations.get(collection, ()))
+        return sum(len(operations) for operations in self._operations.values())
+
+    async def flush(self, mongo) -> bool:
+        """Write everything buffered; True when every chunk succeeded."""
+        started = time.monotonic()
+        operations_by_collection, self._operations = self._operations, {}
+        if mongo is None:
+            return not operations_by_collection
+        if operations_by_collection:
+            await ensure_indexes(mongo)
+        ok = True
+        for collection, operations in operations_by_collection.items():
+            target = getattr(mongo, collection)
+            for start in range(0, len(operations), self.CHUNK_SIZE):
+                try:
+                    await target.bulk_write(
+                        operations[start:start + self.CHUNK_SIZE], ordered=False
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    ok = False
+                    self.failed.append(collection)
+                    print(
+                        f"[clan-history] {collection} batched write failed: "
+                        f"{type(exc).__name__}: {exc}"
+                    )
+        self.elapsed_seconds += time.monotonic() - started
+        return ok
+
+
 def presences_from_accounts(accounts: Iterable[object]) -> list[ClanPresence]:
     """Convert todo Account-like objects without importing todo_data."""
     result = []
@@ -32,6 +32,7 @@ class Clan:
         self.role_id: int = data.get("role_id")
         self.rules_channel_id: int = data.get("rules_channel_id")
         self.th_requirements: int = data.get("th_requirements")
+        self.th_attribute: str = data.get("th_attribute")
         self.thread_id = data.get("thread_id")
         self.thread_message_id: int = data.get("thread_message_id", 0)
         self.type: str = data.get("type")
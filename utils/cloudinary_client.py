@@ -1,6 +1,3 @@
-import cloudinary
-import cloudinary.uploader
-import cloudinary.api
 import os
 from typing import Optional, Dict, Any
 import aiohttp
@@ -11,13 +8,27 @@ class CloudinaryClient:
     """Handles all Cloudinary operations for the bot"""
 
     def __init__(self):
-        # Configure Cloudinary using environment variables
-        cloudinary.config(
-            cloud_name="dxmtzuomk",
-            api_key=os.getenv("CLOUDINARY_API_KEY"),
-            api_secret=os.getenv("CLOUDINARY_API_SECRET"),
-            secure=True
-        )
+        self._configured = False
+
+    def _uploader(self):
+        """The Cloudinary uploader, configured from the environment on first use.
+
+        The SDK pulls in a large dependency tree and is only needed when someone
+        uploads or deletes an image, so it is imported here rather than at boot.
+        Called on the event loop so that import never runs in a worker thread.
+        """
+        import cloudinary
+        from cloudinary import uploader
+
+        if not self._configured:
+            cloudinary.config(
+                cloud_name="dxmtzuomk",
+                api_key=os.getenv("CLOUDINARY_API_KEY"),
+                api_secret=os.getenv("CLOUDINARY_API_SECRET"),
+                secure=True
+            )
+            self._configured = True
+        return uploader
 
     async def upload_image_from_url(self, image_url: str, folder: str, public_id: Optional[str] = None) -> Dict[
         str, Any]:
@@ -34,10 +45,11 @@ class CloudinaryClient:
         """
         try:
             # Run the upload in a thread pool since cloudinary.uploader is synchronous
+            upload = self._uploader().upload
             loop = asyncio.get_event_loop()
             result = await loop.run_in_executor(
                 None,
-                lambda: cloudinary.uploader.upload(
+                lambda: upload(
                     image_url,
                     folder=folder,
                     public_id=public_id,
@@ -64,10 +76,11 @@ class CloudinaryClient:
             Dictionary containing upload results
         """
         try:
+            upload = self._uploader().upload
             loop = asyncio.get_event_loop()
             result = await loop.run_in_executor(
                 None,
-                lambda: cloudinary.uploader.upload(
+                lambda: upload(
                     image_data,
                     folder=folder,
                     public_id=public_id,
@@ -91,10 +104,11 @@ class CloudinaryClient:
             Dictionary containing deletion results
         """
         try:
+            destroy = self._uploader().destroy
             loop = asyncio.get_event_loop()
             result = await loop.run_in_executor(
                 None,
-                lambda: cloudinary.uploader.destroy(public_id)
+                lambda: destroy(public_id)
             )
             return result
         except Exception as e:
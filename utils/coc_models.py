@@ -0,0 +1,150 @@
+"""Reuse parsed coc.py models when the API body has not changed.
+
+The clan-history tracker asks for every family clan, its current war and its
+league group every scan, and /todo asks again on demand. Most of those bodies
+are byte-identical to the previous answer - a clan whose roster and war did
+not move in ten minutes returns the same JSON - yet coc.py builds a fresh
+model tree from it every time.
+
+``install(client)`` swaps the Clan, ClanWar and ClanWarLeagueGroup classes in
+``client.objects_cls`` for memoising subclasses. Construction hashes the body
+first; a body seen before returns the model already built from it instead of
+parsing again. Nothing changes for callers: the object is an instance of the
+same coc.py class, built from identical data.
+
+WHAT IS HASHED
+--------------
+coc.py stamps ``status_code``, ``timestamp`` and ``_response_retry`` onto every
+body it returns (coc/http.py). Those differ on every fetch of identical data,
+so they are excluded; everything else - including the ``tag`` that
+``get_league_war`` adds - is part of the fingerprint. ClanWar also keys on the
+``clan_tag`` it was requested for, because that decides which side is
+``war.clan``.
+
+Shared models are read-only in practice: nothing in this repo assigns to a coc
+model after construction. Do not start doing so on a model that came from
+``get_clan``/``get_clan_war``/``get_league_group``. The one exception is what
+the caller passes alongside the body - the client, and the ``league_group``
+that ``get_league_war`` attaches - which a reused model takes from the current
+call, exactly as a freshly built one would.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import Counter, OrderedDict
+
+import coc
+
+# coc.py's per-response bookkeeping; see the module docstring.
+VOLATILE_KEYS = frozenset({"status_code", "timestamp", "_response_retry"})
+
+# Bounded like todo_data's cache: roughly four models per family clan plus
+# CWL rounds, with generous headroom.
+MAX_MODELS = 1024
+
+_models: OrderedDict[tuple, object] = OrderedDict()
+_requests: Counter = Counter()
+_unchanged: Counter = Counter()
+
+
+def body_fingerprint(data) -> str | None:
+    """Stable hash of an API body, ignoring coc.py's volatile stamps."""
+    if not isinstance(data, dict):
+        return None
+    body = {key: value for key, value in data.items() if key not in VOLATILE_KEYS}
+    try:
+        encoded = json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+def _memoising(base: type, endpoint: str) -> type:
+    class Memoised(base):
+        def __new__(cls, *args, data=None, client=None, **kwargs):
+            label = endpoint
+            if endpoint == "war" and kwargs.get("clan_tag") is None:
+                label = "league_war"
+            fingerprint = body_fingerprint(data)
+            key = (
+                (cls, label, kwargs.get("clan_tag"), fingerprint)
+                if fingerprint is not None else None
+            )
+            _requests[label] += 1
+            if key is not None:
+                cached = _models.get(key)
+                if cached is not None:
+                    _unchanged[label] += 1
+                    _models.move_to_end(key)
+                    return cached
+            model = super().__new__(cls)
+            model._memo_key = key
+            return model
+
+        def __init__(self, *args, **kwargs):
+            # type.__call__ runs __init__ on whatever __new__ returned, so a
+            # reused model would otherwise be parsed again from the same body.
+            if getattr(self, "_memo_ready", False):
+                self._memo_refresh(*args, **kwargs)
+                return
+            super().__init__(*args, **kwargs)
+            self._memo_ready = True
+            key = self._memo_key
+            if key is not None:
+                _models[key] = self
+                while len(_models) > MAX_MODELS:
+                    _models.popitem(last=False)
+
+        def _memo_refresh(self, *_args, data=None, client=None, **kwargs):
+            # Not part of the fingerprint, so not necessarily what the model
+            # was first built with.
+            if hasattr(self, "_client"):
+                self._client = client
+            if hasattr(self, "_response_retry") and isinstance(data, dict):
+                self._response_retry = data.get("_response_retry")
+            if hasattr(self, "league_group"):
+                self.league_group = kwargs.get("league_group")
+
+    Memoised.__name__ = base.__name__
+    Memoised.__qualname__ = base.__qualname__
+    return Memoised
+
+
+def install(client: coc.Client) -> coc.Client:
+    """Route the client's clan, war and league-group models through the memo."""
+    client.objects_cls["Clan"] = _memoising(client.objects_cls["Clan"], "clan")
+    client.objects_cls["ClanWar"] = _memoising(client.objects_cls["ClanWar"], "war")
+    client.objects_cls["ClanWarLeagueGroup"] = _memoising(
+        client.objects_cls["ClanWarLeagueGroup"], "league_group"
+    )
+    return client
+
+
+def stats() -> dict[str, dict[str, float]]:
+    """Per-endpoint construction count and the share served unchanged."""
+    return {
+        endpoint: {
+            "requests": total,
+            "unchanged": _unchanged[endpoint],
+            "ratio": _unchanged[endpoint] / total if total else 0.0,
+        }
+        for endpoint, total in sorted(_requests.items())
+    }
+
+
+def summary() -> str:
+    """One log-friendly line, e.g. ``clan=18/20 war=20/20``."""
+    parts = [
+        f"{endpoint}={values['unchanged']}/{values['requests']}"
+        for endpoint, values in stats().items()
+    ]
+    return " ".join(parts) or "no coc models built"
+
+
+def reset() -> None:
+    """Drop memoised models and counters (tests)."""
+    _models.clear()
+    _requests.clear()
+    _unchanged.clear()
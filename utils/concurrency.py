@@ -0,0 +1,24 @@
+"""Small asyncio helpers with no dependencies beyond the standard library.
+
+Storage modules such as ``utils.poll_store`` and ``utils.clan_history`` use
+these, so they must not import the CoC client stack that ``utils.startup``
+brings in.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+
+async def run_concurrently(*awaitables):
+    """Await independent steps together.
+
+    Every step runs to completion, even after one fails, so nothing is left
+    running unobserved; the first failure is then raised to the caller's
+    existing error handling, exactly as the serial version would have.
+    """
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
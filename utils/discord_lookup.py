@@ -0,0 +1,134 @@
+"""Gateway-cache-first Discord lookups.
+
+The bot runs with the GUILDS and GUILD_MEMBERS intents, so hikari's cache
+already holds every guild channel, thread, role and most members. A REST fetch
+for something the gateway has delivered costs a round trip and a slot in a
+rate-limit bucket - ``fetch_guild_channels`` in particular shares one
+guild-wide bucket with every other channel-list read.
+
+Each helper here answers from the cache first and falls back to REST only on
+a miss, so callers can swap ``bot.rest.fetch_x(...)`` for ``fetch_x(bot, ...)``
+without changing what they receive. Every cache hit is counted as a REST call
+avoided; ``stats()`` exposes the counters for logs and diagnostics.
+
+WHAT A CACHE ANSWER MEANS
+-------------------------
+A cache HIT is conclusive: the gateway told us the object exists. A cache MISS
+is not: the object may be too new for its create event to have arrived, or the
+member may simply never have been chunked. Misses therefore always go to REST,
+and code that has to PROVE something is gone (for example the ticket-creation
+blocker release) must keep asking REST directly.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+
+from hikari.api.config import CacheComponents
+
+_cache_hits: Counter = Counter()
+_rest_calls: Counter = Counter()
+
+
+def _cache_for(app, component: CacheComponents):
+    """The app's cache when it is configured to hold ``component``, else None."""
+    cache = getattr(app, "cache", None)
+    if cache is None:
+        return None
+    settings = getattr(cache, "settings", None)
+    components = getattr(settings, "components", CacheComponents.ALL)
+    if not components & component:
+        return None
+    return cache
+
+
+def _guild_is_cached(cache, guild_id) -> bool:
+    # Guild-scoped views are only complete once GUILD_CREATE has been processed
+    # for that guild; before then an empty view would read as "no channels".
+    return cache.get_guild(guild_id) is not None
+
+
+def _hit(kind: str) -> None:
+    _cache_hits[kind] += 1
+
+
+def _miss(kind: str) -> None:
+    _rest_calls[kind] += 1
+
+
+async def fetch_channel(app, channel_id):
+    """A guild channel or thread by ID, from the cache when present."""
+    cache = _cache_for(app, CacheComponents.GUILD_CHANNELS)
+    if cache is not None:
+        channel = cache.get_guild_channel(channel_id)
+        if channel is None and _cache_for(app, CacheComponents.GUILD_THREADS) is not None:
+            channel = cache.get_thread(channel_id)
+        if channel is not None:
+            _hit("channel")
+            return channel
+    _miss("channel")
+    return await app.rest.fetch_channel(channel_id)
+
+
+async def fetch_guild_channels(app, guild_id):
+    """Every channel in a guild, from the cache when the guild is cached."""
+    cache = _cache_for(app, CacheComponents.GUILD_CHANNELS)
+    if cache is not None and _guild_is_cached(cache, guild_id):
+        _hit("guild_channels")
+        return list(cache.get_guild_channels_view_for_guild(guild_id).values())
+    _miss("guild_channels")
+    return await app.rest.fetch_guild_channels(guild_id)
+
+
+async def fetch_member(app, guild_id, user_id):
+    """A guild member, from the cache when present."""
+    cache = _cache_for(app, CacheComponents.MEMBERS)
+    if cache is not None:
+        member = cache.get_member(guild_id, user_id)
+        if member is not None:
+            _hit("member")
+            return member
+    _miss("member")
+    return await app.rest.fetch_member(guild_id, user_id)
+
+
+async def find_active_thread(app, guild_id, parent_id):
+    """The first active thread under ``parent_id``, or None.
+
+    Scans the cached threads first. A thread created moments ago may not be
+    cached yet, so no match falls back to ``fetch_active_threads``.
+    """
+    cache = _cache_for(app, CacheComponents.GUILD_THREADS)
+    if cache is not None and _guild_is_cached(cache, guild_id):
+        for thread in cache.get_threads_view_for_guild(guild_id).values():
+            if thread.parent_id == parent_id and not thread.is_archived:
+                _hit("thread")
+                return thread
+    _miss("thread")
+    for thread in await app.rest.fetch_active_threads(guild_id):
+        if thread.parent_id == parent_id:
+            return thread
+    return None
+
+
+def stats() -> dict:
+    """Per-kind cache hits (REST calls avoided) and REST fallbacks."""
+    kinds = sorted(set(_cache_hits) | set(_rest_calls))
+    return {
+        kind: {"avoided": _cache_hits[kind], "rest": _rest_calls[kind]}
+        for kind in kinds
+    }
+
+
+def summary() -> str:
+    """One log-friendly line of the counters."""
+    avoided = sum(_cache_hits.values())
+    rest = sum(_rest_calls.values())
+    return f"{avoided} REST call(s) avoided, {rest} REST fallback(s)"
+
+
+def reset_stats() -> None:
+    """Drop all counters (tests)."""
+    _cache_hits.clear()
+    _rest_calls.clear()
+
@@ -6,7 +6,11 @@ the opponent tag cannot be found, we raise so the caller can fail soft.
 """
 
 import re
-from bs4 import BeautifulSoup
+
+from utils.lazy_imports import lazy_import
+
+# Imported on the first page parsed, not when the points monitor registers.
+bs4 = lazy_import("bs4")
 
 
 class FwaPointsParseError(Exception):
@@ -37,7 +41,7 @@ def parse_clan_points(html: str, our_tag: str) -> dict:
     that is not ours. Raises FwaPointsParseError if the block is missing.
     """
     our_tag = sanitize_tag(our_tag)
-    soup = BeautifulSoup(html, "html.parser")
+    soup = bs4.BeautifulSoup(html, "html.parser")
 
     box = soup.select_one("p.winner-box")
     if box is None:
@@ -75,7 +79,7 @@ def parse_clan_points(html: str, our_tag: str) -> dict:
     # Verdict = the last line of the box (after the final <br>), tags stripped.
     segments = re.split(r"<br\s*/?>", box.decode_contents(), flags=re.IGNORECASE)
     verdict_html = segments[-1] if segments else box.decode_contents()
-    raw_verdict = BeautifulSoup(verdict_html, "html.parser").get_text().strip()
+    raw_verdict = bs4.BeautifulSoup(verdict_html, "html.parser").get_text().strip()
 
     point_balance = None
     pb = _field_after_bold(soup, "Point Balance")
@@ -0,0 +1,144 @@
+"""How rendered card images are encoded, and what each encode cost.
+
+Every card renderer used to finish with ``save(format="PNG", optimize=True)``.
+On the 1726x1092 board that zlib search is most of the render - about 0.8 s
+of encode against well under 0.1 s of compositing - and a dashboard click
+pays it before the member sees anything. The extra bytes it saves are a few
+percent.
+
+Call sites pick a policy instead of hardcoding save options:
+
+- ``interactive_policy()`` for anything a member is waiting on. Fast PNG
+  (zlib level 1) by default: roughly six times faster than ``optimize`` for
+  under a tenth more bytes. With ``CARD_IMAGES_WEBP=true`` it is lossless WebP
+  at the fastest effort instead, which is both faster and smaller than any
+  PNG setting. Discord renders WebP in media galleries and thumbnails, but it
+  stays opt-in so an operator can turn it off if a client misbehaves.
+- ``OPTIMIZED_PNG`` for long-lived posts such as the spares board, which stay
+  in the channel for weeks and are rendered off the event loop with nobody
+  waiting on the click.
+- ``OPTIMIZED_PNG`` also for renders that are cached for the life of the
+  process, where the cost is paid once.
+
+``encode`` records bytes and seconds per call site; ``stats()`` exposes them,
+and every spares-board post logs ``summary()``.
+Standard library and Pillow only, like ``utils.card_board``.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping
+
+if TYPE_CHECKING:
+    # Annotations only: callers hand in an image they already made, so
+    # importing this module (and the policy constants) costs no Pillow.
+    from PIL import Image
+
+
+@dataclass(frozen=True, slots=True)
+class EncoderPolicy:
+    """One set of Pillow save options and how the result is labelled."""
+
+    name: str
+    format: str
+    extension: str
+    content_type: str
+    # Left out of equality and hashing (a mapping proxy is unhashable) so a
+    # policy can key lru_caches; ``name`` already identifies it.
+    options: Mapping[str, object] = field(compare=False)
+
+
+FAST_PNG = EncoderPolicy(
+    name="fast_png",
+    format="PNG",
+    extension="png",
+    content_type="image/png",
+    options=MappingProxyType({"compress_level": 1}),
+)
+OPTIMIZED_PNG = EncoderPolicy(
+    name="optimized_png",
+    format="PNG",
+    extension="png",
+    content_type="image/png",
+    options=MappingProxyType({"optimize": True}),
+)
+# For lossless WebP, ``quality`` is encoder effort rather than fidelity; with
+# method 0 it is the fastest setting and still smaller than optimized PNG.
+LOSSLESS_WEBP = EncoderPolicy(
+    name="lossless_webp",
+    format="WEBP",
+    extension="webp",
+    content_type="image/webp",
+    options=MappingProxyType({"lossless": True, "method": 0, "quality": 0}),
+)
+
+
+def webp_enabled() -> bool:
+    return os.getenv("CARD_IMAGES_WEBP", "false").strip().lower() == "true"
+
+
+def interactive_policy() -> EncoderPolicy:
+    """The policy for images a member is waiting on."""
+    return LOSSLESS_WEBP if webp_enabled() else FAST_PNG
+
+
+# Renders run in worker threads via asyncio.to_thread, so the counters are
+# shared between threads.
+_lock = threading.Lock()
+_calls: Counter = Counter()
+_bytes: Counter = Counter()
+_seconds: Counter = Counter()
+
+
+def encode(image: Image.Image, policy: EncoderPolicy, *, site: str) -> bytes:
+    """Encode ``image`` with ``policy`` and record the cost under ``site``."""
+    started = time.perf_counter()
+    output = io.BytesIO()
+    image.save(output, format=policy.format, **policy.options)
+    data = output.getvalue()
+    elapsed = time.perf_counter() - started
+    key = (site, policy.name)
+    with _lock:
+        _calls[key] += 1
+        _bytes[key] += len(data)
+        _seconds[key] += elapsed
+    return data
+
+
+def stats() -> dict[str, dict[str, float]]:
+    """Per ``site/policy``: encodes, average bytes and average milliseconds."""
+    with _lock:
+        keys = sorted(_calls)
+        return {
+            f"{site}/{policy}": {
+                "calls": _calls[(site, policy)],
+                "avg_bytes": _bytes[(site, policy)] / _calls[(site, policy)],
+                "avg_ms": _seconds[(site, policy)] * 1000 / _calls[(site, policy)],
+            }
+            for site, policy in keys
+        }
+
+
+def summary() -> str:
+    """One log-friendly line, e.g. ``board/fast_png=3x 1650KiB 131ms``."""
+    parts = [
+        f"{key}={values['calls']}x {values['avg_bytes'] / 1024:.0f}KiB "
+        f"{values['avg_ms']:.0f}ms"
+        for key, values in stats().items()
+    ]
+    return " ".join(parts) or "no images encoded"
+
+
+def reset_stats() -> None:
+    """Drop all counters (tests)."""
+    with _lock:
+        _calls.clear()
+        _bytes.clear()
+        _seconds.clear()
@@ -0,0 +1,103 @@
+"""Heavy dependencies that load on first use instead of at boot.
+
+Pillow, the card board renderer, BeautifulSoup and icalendar are each needed
+by a handful of commands, but a plain top-level import made every restart pay for all of them before the first interaction could be
+answered. ``lazy_import`` hands back a module object straight away and runs
+the real import the first time an attribute is read from it, so the commands
+that use it register at boot as before and the cost lands on their first
+invocation instead.
+
+Built on ``importlib.util.LazyLoader``. Three rules keep that safe:
+
+- Only name a module here when every use is inside a function. A module-level
+  ``Image.LANCZOS`` would trigger the load at import time and save nothing.
+- Touch the module on the event loop before handing work to a thread
+  (``asyncio.to_thread(card_board.render_x, ...)`` does, by evaluating the
+  attribute first). LazyLoader's first load is not guaranteed thread-safe on
+  every Python this bot has run on.
+- Finding a submodule imports its package for real. ``PIL.Image`` is fine
+  (``PIL`` itself is tiny); ``cloudinary.uploader`` is not, which is why the
+  Cloudinary client imports inside the method that needs it instead.
+
+``tools/startup_import_report.py`` shows what this saves.
+"""
+
+from __future__ import annotations
+
+import importlib.abc
+import importlib.util
+import sys
+from types import ModuleType
+
+# Every module handed out lazily, so the report can tell deferred from loaded.
+_deferred: dict[str, ModuleType] = {}
+# The deferred modules whose real import has run, recorded by _Recording.
+_loaded: set[str] = set()
+
+
+class _Recording(importlib.abc.Loader):
+    """The module's own loader, noting when LazyLoader finally runs it."""
+
+    def __init__(self, name: str, loader: importlib.abc.Loader):
+        self._name = name
+        self._loader = loader
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._loader.exec_module(module)
+        _loaded.add(self._name)
+
+    def __getattr__(self, attribute):
+        # get_data, get_resource_reader and friends, for code that asks the
+        # module's __loader__ for its files.
+        return getattr(self._loader, attribute)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """``import name``, deferred until an attribute is first read."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(_Recording(name, spec.loader))
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    parent, _, child = name.rpartition(".")
+    if parent:
+        # What a real import does, so `from utils import card_board` later
+        # finds the same object instead of a second copy.
+        setattr(sys.modules[parent], child, module)
+    _deferred[name] = module
+    return module
+
+
+def is_loaded(name: str) -> bool:
+    """Whether ``name`` has really been imported, lazily or otherwise."""
+    if name not in sys.modules:
+        return False
+    return name not in _deferred or name in _loaded
+
+
+def deferred() -> dict[str, bool]:
+    """Every lazily imported module and whether it has loaded yet."""
+    return {name: is_loaded(name) for name in sorted(_deferred)}
+
+
+def ensure_loaded(*modules: ModuleType) -> None:
+    """Run the real import of these lazily imported modules now.
+
+    For the event loop to call before handing the modules to worker threads.
+    """
+    for module in modules:
+        getattr(module, "__name__")   # any attribute read is the load
+
+
+def load_all() -> None:
+    """Force every deferred module to load. For the boot report only."""
+    ensure_loaded(*_deferred.values())
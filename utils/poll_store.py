@@ -4,6 +4,13 @@ Active polls intentionally have no TTL field.  Once a poll ends, ``end_poll``
 adds ``purge_at`` and Mongo removes the completed record after the fixed
 retention window. Every user-facing read is scoped by guild; the only global
 reads are the scheduler's startup and due-poll scans.
+
+Each poll keeps ``tallies`` - per-option vote counts keyed by option id -
+next to the ``votes`` ballot map. ``record_vote`` moves one ballot between
+counters in the same write that records it, so rendering a poll reads a
+handful of integers instead of every ballot. Reads that only render counts
+leave ``votes`` out of the returned document; only the named-voter view still
+needs it.
 """
 
 from __future__ import annotations
@@ -16,6 +23,7 @@ from typing import Any
 from pymongo import ReturnDocument
 
 from utils.mongo import MongoClient
+from utils.concurrency import run_concurrently
 
 
 ENDED_RETENTION = timedelta(days=30)
@@ -27,6 +35,16 @@ DUE_END_INDEX = "polls_active_ends_at"
 PURGE_INDEX = "polls_ttl_purge_at"
 SYNC_PENDING_INDEX = "polls_message_sync_pending"
 
+# Drop the ballot map from reads that only need counts.
+WITHOUT_VOTES = {"votes": 0}
+# A conditional vote write only misses when the same user's ballot changed
+# between read and write; the per-poll lock in the command makes that rare.
+VOTE_WRITE_ATTEMPTS = 3
+
+
+class VoteContendedError(Exception):
+    """The ballot kept changing under ``record_vote``; the poll is still open."""
+
 
 def utcnow() -> datetime:
     return datetime.now(timezone.utc)
@@ -43,6 +61,23 @@ def _coll(mongo: MongoClient):
     return mongo.discord_polls
 
 
+def _tally_key(raw_choice: object) -> str | None:
+    try:
+        return str(int(raw_choice))
+    except (TypeError, ValueError):
+        return None
+
+
+def tally_votes(votes: Mapping[str, Any]) -> dict[str, int]:
+    """Per-option counts for a ballot map, keyed like ``tallies``."""
+    tallies: dict[str, int] = {}
+    for raw_choice in votes.values():
+        key = _tally_key(raw_choice)
+        if key is not None:
+            tallies[key] = tallies.get(key, 0) + 1
+    return tallies
+
+
 def _limit(value: int, default: int) -> int:
     try:
         return max(1, int(value))
@@ -53,22 +88,24 @@ def _limit(value: int, default: int) -> int:
 async def ensure_indexes(mongo: MongoClient) -> None:
     """Install indexes for guild views, the deadline worker, and retention."""
     collection = _coll(mongo)
-    await collection.create_index(
-        [("guild_id", 1), ("active", 1), ("ends_at", 1)],
-        name=GUILD_ACTIVE_END_INDEX,
-    )
-    await collection.create_index(
-        [("active", 1), ("ends_at", 1)],
-        name=DUE_END_INDEX,
-    )
-    await collection.create_index(
-        "purge_at",
-        expireAfterSeconds=0,
-        name=PURGE_INDEX,
-    )
-    await collection.create_index(
-        [("message_sync_pending", 1), ("updated_at", 1)],
-        name=SYNC_PENDING_INDEX,
+    await run_concurrently(
+        collection.create_index(
+            [("guild_id", 1), ("active", 1), ("ends_at", 1)],
+            name=GUILD_ACTIVE_END_INDEX,
+        ),
+        collection.create_index(
+            [("active", 1), ("ends_at", 1)],
+            name=DUE_END_INDEX,
+        ),
+        collection.create_index(
+            "purge_at",
+            expireAfterSeconds=0,
+            name=PURGE_INDEX,
+        ),
+        collection.create_index(
+            [("message_sync_pending", 1), ("updated_at", 1)],
+            name=SYNC_PENDING_INDEX,
+        ),
     )
 
 
@@ -102,6 +139,7 @@ async def create_poll(
     poll["created_at"] = _utc(poll.get("created_at") or now)
     poll["updated_at"] = now
     poll.setdefault("votes", {})
+    poll["tallies"] = tally_votes(poll["votes"])
     poll["message_sync_pending"] = False
 
     # A TTL value on an active poll would make restart recovery unreliable.
@@ -118,12 +156,16 @@ async def get_poll(
     *,
     guild_id: int,
     poll_id: str,
+    include_votes: bool = True,
 ) -> dict | None:
-    """Return one poll only when it belongs to the requesting guild."""
-    return await _coll(mongo).find_one({
-        "_id": poll_id,
-        "guild_id": int(guild_id),
-    })
+    """Return one poll only when it belongs to the requesting guild.
+
+    Pass ``include_votes=False`` when only the counts will be rendered.
+    """
+    return await _coll(mongo).find_one(
+        {"_id": poll_id, "guild_id": int(guild_id)},
+        projection=None if include_votes else WITHOUT_VOTES,
+    )
 
 
 async def list_recent_polls(
@@ -136,7 +178,7 @@ async def list_recent_polls(
     length = _limit(limit, ACTIVE_LIST_LIMIT)
     cursor = (
         _coll(mongo)
-        .find({"guild_id": int(guild_id)})
+        .find({"guild_id": int(guild_id)}, projection=WITHOUT_VOTES)
         .sort("created_at", -1)
         .limit(length)
     )
@@ -155,11 +197,14 @@ async def list_active_polls(
     length = _limit(limit, ACTIVE_LIST_LIMIT)
     cursor = (
         _coll(mongo)
-        .find({
-            "guild_id": int(guild_id),
-            "active": True,
-            "ends_at": {"$gt": now},
-        })
+        .find(
+            {
+                "guild_id": int(guild_id),
+                "active": True,
+                "ends_at": {"$gt": now},
+            },
+            projection=WITHOUT_VOTES,
+        )
         .sort("ends_at", 1)
         .limit(length)
     )
@@ -220,6 +265,33 @@ async def list_pending_message_sync(
     return await cursor.limit(length).to_list(length=length)
 
 
+async def _backfill_poll_tallies(mongo: MongoClient, poll_id: str) -> None:
+    document = await _coll(mongo).find_one(
+        {"_id": poll_id, "tallies": {"$exists": False}},
+        projection={"votes": 1},
+    )
+    if document is None:
+        return
+    # Votes never write to a poll without tallies, so the ballots read above
+    # are still current unless another backfill won, which the filter skips.
+    await _coll(mongo).update_one(
+        {"_id": poll_id, "tallies": {"$exists": False}},
+        {"$set": {"tallies": tally_votes(document.get("votes") or {})}},
+    )
+
+
+async def backfill_tallies(mongo: MongoClient) -> int:
+    """Give every poll stored before ``tallies`` existed its counters."""
+    cursor = _coll(mongo).find(
+        {"tallies": {"$exists": False}}, projection={"_id": 1},
+    )
+    filled = 0
+    for document in await cursor.to_list(length=None):
+        await _backfill_poll_tallies(mongo, document["_id"])
+        filled += 1
+    return filled
+
+
 async def record_vote(
     mongo: MongoClient,
     *,
@@ -233,25 +305,61 @@ async def record_vote(
 
     Reasserting the guild, active flag, and deadline in the write filter closes
     the race between a button click and the deadline worker ending the poll.
+    The filter also pins the user's previous ballot, so the counter it
+    decrements is the one that ballot was counted in. The returned poll omits
+    ``votes``.
+
+    Returns None when the poll is closed, expired or not in this guild. Raises
+    VoteContendedError when every attempt lost its race, so the voter can be
+    asked to try again instead of being told the poll is closed.
     """
     now = _utc(observed_at)
-    return await _coll(mongo).find_one_and_update(
-        {
-            "_id": poll_id,
-            "guild_id": int(guild_id),
-            "active": True,
-            "ends_at": {"$gt": now},
-        },
-        {"$set": {
-            f"votes.{int(user_id)}": choice,
+    ballot = f"votes.{int(user_id)}"
+    live = {
+        "_id": poll_id,
+        "guild_id": int(guild_id),
+        "active": True,
+        "ends_at": {"$gt": now},
+    }
+    for _attempt in range(VOTE_WRITE_ATTEMPTS):
+        current = await _coll(mongo).find_one(
+            live, projection={ballot: 1, "tallies": 1},
+        )
+        if current is None:
+            return None
+        if "tallies" not in current:
+            await _backfill_poll_tallies(mongo, poll_id)
+            continue
+        previous = (current.get("votes") or {}).get(str(int(user_id)))
+        increments: dict[str, int] = {}
+        if _tally_key(previous) != _tally_key(choice):
+            increments[f"tallies.{_tally_key(choice)}"] = 1
+            previous_key = _tally_key(previous)
+            if previous_key is not None:
+                increments[f"tallies.{previous_key}"] = -1
+        update: dict[str, Any] = {"$set": {
+            ballot: choice,
             # The vote and its need for a public re-render are one durable
             # transition. A process death after this write is recovered at startup.
             "message_sync_pending": True,
             "message_sync_error": None,
             "updated_at": now,
-        }},
-        return_document=ReturnDocument.AFTER,
-    )
+        }}
+        if increments:
+            update["$inc"] = increments
+        updated = await _coll(mongo).find_one_and_update(
+            {
+                **live,
+                "tallies": {"$exists": True},
+                ballot: {"$exists": False} if previous is None else previous,
+            },
+            update,
+            projection=WITHOUT_VOTES,
+            return_document=ReturnDocument.AFTER,
+        )
+        if updated is not None:
+            return updated
+    raise VoteContendedError(poll_id)
 
 
 async def end_poll(
@@ -283,6 +391,7 @@ async def end_poll(
             "message_sync_error": None,
             "updated_at": ended_at,
         }},
+        projection=WITHOUT_VOTES,
         return_document=ReturnDocument.AFTER,
     )
 
@@ -304,6 +413,7 @@ async def mark_message_sync_pending(
             "message_sync_error": str(error)[:120],
             "updated_at": now,
         }},
+        projection=WITHOUT_VOTES,
         return_document=ReturnDocument.AFTER,
     )
 
@@ -325,6 +435,7 @@ async def mark_message_synced(
             "message_synced_at": now,
             "updated_at": now,
         }},
+        projection=WITHOUT_VOTES,
         return_document=ReturnDocument.AFTER,
     )
 
@@ -347,5 +458,6 @@ async def mark_message_unavailable(
             "message_sync_terminal": True,
             "updated_at": now,
         }},
+        projection=WITHOUT_VOTES,
         return_document=ReturnDocument.AFTER,
     )
@@ -4,13 +4,22 @@ from __future__ import annotations
 
 import ast
 import asyncio
+import functools
+import json
+import time
 from collections.abc import Iterable
+from contextlib import contextmanager
 from pathlib import Path
 
 import coc
 
+from utils import coc_models
 
 COMMANDS_ROOT = Path("extensions/commands")
+# Which command files bind a loader, keyed by each file's mtime and size, so a
+# boot re-parses only what changed since the last one. Purely a cache: a
+# missing, stale or unreadable manifest just means parsing again.
+MANIFEST_PATH = Path(".cache/extension_manifest.json")
 
 # Development-only command modules retained for future visual testing. Removing
 # a module stem here re-enables its normal loader discovery.
@@ -46,10 +55,55 @@ def _binds_loader(module_path: Path) -> bool:
     return False
 
 
-def load_cogs(disallowed: set[str], disallowed_folders: set[str] | None = None) -> list[str]:
-    """Discover command extension entry points, in deterministic order."""
+def _read_manifest(path: Path | None) -> dict:
+    if path is None:
+        return {}
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _write_manifest(path: Path | None, manifest: dict) -> None:
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(manifest, sort_keys=True), encoding="utf-8")
+    except OSError:
+        pass        # a read-only checkout still boots; it just parses again
+
+
+def _cached_binds_loader(module_path: Path, manifest: dict, fresh: dict) -> bool:
+    """`_binds_loader`, answered from the manifest while the file is unchanged."""
+    stat = module_path.stat()
+    key = str(module_path)
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    entry = manifest.get(key)
+    if isinstance(entry, dict) and entry.get("stamp") == stamp:
+        binds = bool(entry.get("loader"))
+    else:
+        binds = _binds_loader(module_path)
+    fresh[key] = {"stamp": stamp, "loader": binds}
+    return binds
+
+
+def load_cogs(
+    disallowed: set[str],
+    disallowed_folders: set[str] | None = None,
+    *,
+    manifest_path: Path | None = None,
+) -> list[str]:
+    """Discover command extension entry points, in deterministic order.
+
+    With ``manifest_path`` the loader check is cached between boots; see
+    MANIFEST_PATH.
+    """
     disallowed_folders = disallowed_folders or set()
     file_list: list[str] = []
+    manifest = _read_manifest(manifest_path)
+    fresh: dict = {}
 
     for full_path in sorted(COMMANDS_ROOT.rglob("*.py")):
         relative = full_path.relative_to(COMMANDS_ROOT)
@@ -62,12 +116,14 @@ def load_cogs(disallowed: set[str], disallowed_folders: set[str] | None = None)
             or full_path.stem in DISABLED_PREVIEW_EXTENSIONS
         ):
             continue
-        if not _binds_loader(full_path):
+        if not _cached_binds_loader(full_path, manifest, fresh):
             continue
 
         module_parts = (*COMMANDS_ROOT.parts, *relative.with_suffix("").parts)
         file_list.append(".".join(module_parts))
 
+    if fresh != manifest:
+        _write_manifest(manifest_path, fresh)
     return file_list
 
 
@@ -76,18 +132,114 @@ def unique_extensions(*groups: Iterable[str]) -> list[str]:
     return list(dict.fromkeys(extension for group in groups for extension in group))
 
 
+# Packages main.py loads as a whole, plus the modules discovery cannot see.
+EXPLICIT_EXTENSIONS = (
+    "extensions.components",
+    "extensions.commands.clan",
+    "extensions.commands.fwa",
+    "extensions.commands.recruit",
+    "extensions.commands.recruit.dashboard.server_walkthrough",
+    "extensions.commands.setup",
+    "extensions.context_menus.get_message_id",
+    "extensions.context_menus.get_user_id",
+    "extensions.tasks.band_monitor",
+    "extensions.tasks.recruit_role_cleanup",
+    "extensions.tasks.cwl_reminder",
+    "extensions.tasks.fwa_points_monitor",
+    "extensions.tasks.clan_history_tracker",
+    "extensions.tasks.band_sync_ical",
+    "extensions.tasks.cards_sticky",
+    "extensions.tasks.cards_deadlines",
+    "extensions.commands.tickets",
+    "extensions.events.channel.ticket_channel_monitor",
+    "extensions.events.message.message_events",
+)
+
+
+def boot_extensions(*, manifest_path: Path | None = None) -> list[str]:
+    """Every extension the bot loads at boot, in load order."""
+    return unique_extensions(
+        EXPLICIT_EXTENSIONS,
+        load_cogs(
+            disallowed={"example"},
+            disallowed_folders={"clan", "fwa", "recruit", "setup", "tickets"},
+            manifest_path=manifest_path,
+        ),
+    )
+
+
 def create_clash_client(*, loop: asyncio.AbstractEventLoop | None = None) -> coc.Client:
     """Create coc.py on the active bot loop.
 
     coc.py 3.10 still falls back to ``asyncio.get_event_loop()`` in its
     constructor.  Python 3.12 warns when that happens before ``bot.run()`` has
     installed a loop, and a future Python release will make it an error.
+
+    Clan, war and league-group models are memoised by response body; see
+    utils/coc_models.py.
     """
     active_loop = loop or asyncio.get_running_loop()
-    return coc.Client(
+    return coc_models.install(coc.Client(
         loop=active_loop,
         base_url="https://proxy.clashk.ing/v1",
         key_count=10,
         load_game_data=coc.LoadGameData(default=False),
         raw_attribute=True,
-    )
+    ))
+
+
+# Startup profile: how long each extension took to load and each StartedEvent
+# hook took to run, in seconds. Printed once the bot is up, so a slow restart
+# names its own culprit instead of needing a profiler attached.
+_profile: dict[str, dict[str, float]] = {}
+
+
+def record_timing(kind: str, name: str, seconds: float) -> None:
+    _profile.setdefault(kind, {})[name] = seconds
+
+
+@contextmanager
+def timed(kind: str, name: str):
+    """Record how long the block took under ``kind``/``name``."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(kind, name, time.perf_counter() - started)
+
+
+def profile_hook(func):
+    """Time a StartedEvent listener. Goes on the function itself, below
+    ``with_di``, so the recorded name is the hook's own module and name.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        with timed("hook", f"{func.__module__}.{func.__name__}"):
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+def profile() -> dict[str, dict[str, float]]:
+    return {kind: dict(entries) for kind, entries in _profile.items()}
+
+
+def profile_summary(limit: int = 5) -> str:
+    """Total and slowest entries per kind, for the startup log line."""
+    parts = []
+    for kind in sorted(_profile):
+        entries = _profile[kind]
+        slowest = sorted(entries.items(), key=lambda item: item[1], reverse=True)
+        top = ", ".join(
+            f"{name.rsplit('.', 1)[-1]}={seconds * 1000:.0f}ms"
+            for name, seconds in slowest[:limit]
+        )
+        parts.append(
+            f"{kind}: {len(entries)} in {sum(entries.values()):.2f}s ({top})"
+        )
+    return "; ".join(parts) or "nothing recorded"
+
+
+def reset_profile() -> None:
+    _profile.clear()